@@ -5,20 +5,23 @@ Provides base agent architecture and specialized agents for different AI models
 with standardized input/output contracts and artifact-based communication.
 """
 
-# Base agent classes and types
-from .base_agent import (
-    BaseAgent,
-    AgentInput,
-    AgentOutput,
-    AgentCapability,
-    AgentType,
-    ProcessingResult,
-)
-
-# Specialized agent implementations
-from .claude_agent import ClaudeAgent
-from .gpt4_agent import GPT4Agent
-from .gemini_agent import GeminiAgent
+import importlib
+
+# Agent classes are imported on first access (PEP 562); the specialized
+# agents pull in provider SDK clients that most callers never need.
+_EXPORTS = {
+    # Base agent classes and types
+    "BaseAgent": ".base_agent",
+    "AgentInput": ".base_agent",
+    "AgentOutput": ".base_agent",
+    "AgentCapability": ".base_agent",
+    "AgentType": ".base_agent",
+    "ProcessingResult": ".base_agent",
+    # Specialized agent implementations
+    "ClaudeAgent": ".claude_agent",
+    "GPT4Agent": ".gpt4_agent",
+    "GeminiAgent": ".gemini_agent",
+}
 
 __version__ = "1.0.0"
 __all__ = [
@@ -35,3 +38,16 @@ __all__ = [
     "AgentType",
     "ProcessingResult",
 ]
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -9,7 +9,7 @@ import asyncio
 import os
 import logging
 from datetime import datetime, timezone
-from typing import Dict, Optional, Any
+from typing import Callable, Dict, Optional, Any, Tuple
 from uuid import uuid4
 import time
 
@@ -22,9 +22,13 @@ from core.event_streaming import StreamEvent, EventType, EventStreamType, Stream
 from schemas.artifacts import ArtifactType
 from schemas.routing import ModelType, TaskType
 from agents.base_agent import AgentOutput, ProcessingResult
+from agents.task_dispatcher import TaskDispatcher
 
 logger = logging.getLogger(__name__)
 
+# Returned by assign_task_to_best_agent when the task waits for a free worker
+TASK_QUEUED = "queued"
+
 
 class LiveAgentMetrics:
     """Tracks real-time metrics for live agents"""
@@ -93,6 +97,11 @@ class LiveAgentMetrics:
 class LiveAgentWorker(StreamConsumer):
     """Base class for live AI agent workers"""
 
+    # Keywords matched against task types by the dispatcher's capability index
+    capabilities: Tuple[str, ...] = ()
+    # Tasks this worker runs at once; the dispatcher queues beyond this
+    max_concurrency = 4
+
     def __init__(
         self,
         event_bus=None,
@@ -106,48 +115,22 @@ class LiveAgentWorker(StreamConsumer):
         self.model_type = model_type
         self.metrics = LiveAgentMetrics()
         self.task_assignments = {}  # Track assigned tasks
+        self.orchestrator: Optional["LiveAgentOrchestrator"] = None
+        self._running_tasks = set()
 
     async def process_event(self, event: StreamEvent):
         """Process events from the task stream"""
 
-        if event.event_type == EventType.TASK_CREATED:
-            # New task available - evaluate if we should handle it
-            await self._evaluate_task_assignment(event)
-
-        elif (
+        # TASK_CREATED is not broadcast-evaluated any more: the orchestrator's
+        # dispatcher assigns tasks directly, within max_concurrency
+        if (
             event.event_type == EventType.TASK_ASSIGNED
             and event.agent_id == self.agent_id
         ):
-            # Task specifically assigned to this agent
-            await self._execute_assigned_task(event)
-
-    async def _evaluate_task_assignment(self, event: StreamEvent):
-        """Evaluate if this agent should handle the task"""
-
-        task_data = event.payload
-        task_type = task_data.get("primary_task_type")
-
-        # Check if this agent can handle the task type
-        if self._can_handle_task_type(task_type):
-            logger.info(f"{self.agent_id} can handle task {event.correlation_id}")
-
-            # Publish interest in the task
-            interest_event = StreamEvent(
-                correlation_id=event.correlation_id,
-                event_type=EventType.AGENT_REGISTERED,
-                agent_id=self.agent_id,
-                task_id=task_data.get("task_id"),
-                payload={
-                    "capability_match": True,
-                    "confidence": self._calculate_task_confidence(task_data),
-                    "estimated_cost": self._estimate_task_cost(task_data),
-                    "estimated_time": self._estimate_completion_time(task_data),
-                },
-            )
-
-            await self.event_bus.publish_event(
-                EventStreamType.AGENT_STATUS, interest_event
-            )
+            # Run concurrently so the consumer loop keeps reading assignments
+            task = asyncio.create_task(self._execute_assigned_task(event))
+            self._running_tasks.add(task)
+            task.add_done_callback(self._running_tasks.discard)
 
     async def _execute_assigned_task(self, event: StreamEvent):
         """Execute a task assigned to this agent"""
@@ -156,6 +139,8 @@ class LiveAgentWorker(StreamConsumer):
         task_id = task_data.get("task_id", f"task_{uuid4().hex[:8]}")
 
         # Record task assignment
+        started = time.monotonic()
+        success = False
         self.task_assignments[task_id] = {
             "start_time": datetime.now(timezone.utc),
             "correlation_id": event.correlation_id,
@@ -226,6 +211,7 @@ class LiveAgentWorker(StreamConsumer):
                 )
 
                 logger.info(f"{self.agent_id} completed task {task_id} successfully")
+                success = True
 
             else:
                 # Handle task failure
@@ -242,6 +228,12 @@ class LiveAgentWorker(StreamConsumer):
             if task_id in self.task_assignments:
                 del self.task_assignments[task_id]
 
+            # Free the dispatcher slot; it may hand this worker a queued task
+            if self.orchestrator is not None:
+                await self.orchestrator.task_finished(
+                    task_id, time.monotonic() - started, success
+                )
+
     async def _handle_task_failure(self, correlation_id: str, task_id: str, error: str):
         """Handle task execution failure"""
 
@@ -260,31 +252,23 @@ class LiveAgentWorker(StreamConsumer):
             success=False, tokens=0, cost=0.0, response_time=0.0
         )
 
-    # Abstract methods to be implemented by specific agent types
-    def _can_handle_task_type(self, task_type: str) -> bool:
-        """Check if this agent can handle the task type"""
-        raise NotImplementedError
-
-    def _calculate_task_confidence(self, task_data: Dict[str, Any]) -> float:
-        """Calculate confidence for handling this task"""
-        raise NotImplementedError
-
-    def _estimate_task_cost(self, task_data: Dict[str, Any]) -> float:
-        """Estimate cost for this task"""
-        raise NotImplementedError
-
-    def _estimate_completion_time(self, task_data: Dict[str, Any]) -> float:
-        """Estimate completion time in minutes"""
-        raise NotImplementedError
-
     async def _execute_ai_task(self, task_data: Dict[str, Any]) -> ProcessingResult:
-        """Execute the actual AI task"""
+        """Execute the actual AI task (implemented by each worker type)"""
         raise NotImplementedError
 
 
 class ClaudeWorker(LiveAgentWorker):
     """Claude agent worker for strategic planning, architecture, and debugging"""
 
+    # Claude specializes in complex reasoning and architecture
+    capabilities = (
+        "reasoning",
+        "architecture",
+        "documentation",
+        "debugging",
+        "analysis",
+    )
+
     def __init__(self, event_bus: EventBus):
         super().__init__(event_bus, "claude_agent", ModelType.CLAUDE_SONNET)
 
@@ -305,44 +289,6 @@ class ClaudeWorker(LiveAgentWorker):
 
         logger.info("Claude worker initialized with real API integration")
 
-    def _can_handle_task_type(self, task_type: str) -> bool:
-        """Claude specializes in complex reasoning and architecture"""
-        claude_tasks = [
-            "reasoning",
-            "architecture",
-            "documentation",
-            "debugging",
-            "analysis",
-        ]
-        return any(specialty in task_type.lower() for specialty in claude_tasks)
-
-    def _calculate_task_confidence(self, task_data: Dict[str, Any]) -> float:
-        """Claude has high confidence for reasoning and architecture tasks"""
-        task_type = task_data.get("primary_task_type", "").lower()
-
-        if "reasoning" in task_type or "architecture" in task_type:
-            return 0.95
-        elif "documentation" in task_type or "analysis" in task_type:
-            return 0.90
-        elif "debugging" in task_type or "review" in task_type:
-            return 0.85
-        else:
-            return 0.60
-
-    def _estimate_task_cost(self, task_data: Dict[str, Any]) -> float:
-        """Estimate Claude API cost (approximate)"""
-        estimated_tokens = task_data.get("estimated_tokens", 5000)
-        # Claude 3 Sonnet pricing: ~$3/1M input tokens, ~$15/1M output tokens
-        input_cost = estimated_tokens * 0.000003
-        output_cost = estimated_tokens * 0.5 * 0.000015  # Assume 50% output ratio
-        return input_cost + output_cost
-
-    def _estimate_completion_time(self, task_data: Dict[str, Any]) -> float:
-        """Estimate completion time based on task complexity"""
-        complexity = task_data.get("complexity", 0.5)
-        base_time = 3.0  # 3 minutes base
-        return base_time * (1 + complexity)
-
     async def _execute_ai_task(self, task_data: Dict[str, Any]) -> ProcessingResult:
         """Execute task using Claude API"""
 
@@ -541,6 +487,16 @@ Please provide a comprehensive solution with clear explanations and practical im
 class GPT4Worker(LiveAgentWorker):
     """GPT-4 agent worker for code generation and creative solutions"""
 
+    # GPT-4 specializes in code generation and implementation
+    capabilities = (
+        "code",
+        "implementation",
+        "programming",
+        "development",
+        "ui",
+        "frontend",
+    )
+
     def __init__(self, event_bus: EventBus):
         super().__init__(event_bus, "gpt4_agent", ModelType.GPT4O)
 
@@ -560,45 +516,6 @@ class GPT4Worker(LiveAgentWorker):
 
         logger.info("GPT-4 worker initialized with real API integration")
 
-    def _can_handle_task_type(self, task_type: str) -> bool:
-        """GPT-4 specializes in code generation and implementation"""
-        gpt4_tasks = [
-            "code",
-            "implementation",
-            "programming",
-            "development",
-            "ui",
-            "frontend",
-        ]
-        return any(specialty in task_type.lower() for specialty in gpt4_tasks)
-
-    def _calculate_task_confidence(self, task_data: Dict[str, Any]) -> float:
-        """GPT-4 has high confidence for coding tasks"""
-        task_type = task_data.get("primary_task_type", "").lower()
-
-        if "code" in task_type or "programming" in task_type:
-            return 0.92
-        elif "implementation" in task_type or "development" in task_type:
-            return 0.88
-        elif "ui" in task_type or "frontend" in task_type:
-            return 0.85
-        else:
-            return 0.65
-
-    def _estimate_task_cost(self, task_data: Dict[str, Any]) -> float:
-        """Estimate GPT-4 API cost"""
-        estimated_tokens = task_data.get("estimated_tokens", 4000)
-        # GPT-4 pricing: ~$10/1M input tokens, ~$30/1M output tokens
-        input_cost = estimated_tokens * 0.00001
-        output_cost = estimated_tokens * 0.6 * 0.00003  # Assume 60% output for code
-        return input_cost + output_cost
-
-    def _estimate_completion_time(self, task_data: Dict[str, Any]) -> float:
-        """Estimate completion time"""
-        complexity = task_data.get("complexity", 0.5)
-        base_time = 4.0  # 4 minutes base for coding tasks
-        return base_time * (1 + complexity * 1.5)
-
     async def _execute_ai_task(self, task_data: Dict[str, Any]) -> ProcessingResult:
         """Execute task using GPT-4 API"""
 
@@ -716,6 +633,9 @@ Please provide the complete implementation with explanations.
 class GeminiWorker(LiveAgentWorker):
     """Gemini agent worker for testing, validation, and quality assurance"""
 
+    # Gemini specializes in testing and validation
+    capabilities = ("test", "validation", "quality", "review", "qa")
+
     def __init__(self, event_bus: EventBus):
         super().__init__(event_bus, "gemini_agent", ModelType.GEMINI_FLASH)
 
@@ -735,36 +655,6 @@ class GeminiWorker(LiveAgentWorker):
 
         logger.info("Gemini worker initialized with real API integration")
 
-    def _can_handle_task_type(self, task_type: str) -> bool:
-        """Gemini specializes in testing and validation"""
-        gemini_tasks = ["test", "validation", "quality", "review", "qa"]
-        return any(specialty in task_type.lower() for specialty in gemini_tasks)
-
-    def _calculate_task_confidence(self, task_data: Dict[str, Any]) -> float:
-        """Gemini confidence for testing tasks"""
-        task_type = task_data.get("primary_task_type", "").lower()
-
-        if "test" in task_type or "validation" in task_type:
-            return 0.90
-        elif "quality" in task_type or "review" in task_type:
-            return 0.86
-        elif "qa" in task_type:
-            return 0.88
-        else:
-            return 0.70
-
-    def _estimate_task_cost(self, task_data: Dict[str, Any]) -> float:
-        """Estimate Gemini API cost (very low cost)"""
-        estimated_tokens = task_data.get("estimated_tokens", 3000)
-        # Gemini Flash is very cost-effective
-        return estimated_tokens * 0.0000005
-
-    def _estimate_completion_time(self, task_data: Dict[str, Any]) -> float:
-        """Estimate completion time (Gemini is fast)"""
-        complexity = task_data.get("complexity", 0.5)
-        base_time = 2.0  # 2 minutes base (fast processing)
-        return base_time * (1 + complexity * 0.8)
-
     async def _execute_ai_task(self, task_data: Dict[str, Any]) -> ProcessingResult:
         """Execute task using Gemini API"""
 
@@ -869,11 +759,19 @@ Format as a detailed test plan with executable test cases.
 class LiveAgentOrchestrator:
     """Orchestrator that manages live AI agent workers"""
 
-    def __init__(self, event_bus: EventBus):
+    def __init__(
+        self,
+        event_bus: EventBus,
+        assignment_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ):
         self.event_bus = event_bus
         self.workers: Dict[str, LiveAgentWorker] = {}
         self.task_assignments = {}
         self.running = False
+        self.dispatcher = TaskDispatcher()
+        # Called with (worker id, task data) whenever a task is assigned,
+        # including queued tasks the dispatcher hands out later
+        self.assignment_callback = assignment_callback
 
         # Initialize workers if API keys are available
         self._initialize_workers()
@@ -902,6 +800,12 @@ class LiveAgentOrchestrator:
         except Exception as e:
             logger.warning(f"Could not initialize Gemini worker: {e}")
 
+        for worker in self.workers.values():
+            worker.orchestrator = self
+            self.dispatcher.register_worker(
+                worker.agent_id, worker.capabilities, worker.max_concurrency
+            )
+
         logger.info(f"Initialized {len(self.workers)} live agent workers")
 
     async def start_workers(self):
@@ -954,69 +858,77 @@ class LiveAgentOrchestrator:
             "total_workers": len(self.workers),
             "active_workers": sum(1 for w in self.workers.values() if w.running),
             "worker_details": metrics,
+            "dispatcher": self.dispatcher.get_stats(),
         }
 
     async def assign_task_to_best_agent(
         self, task_data: Dict[str, Any], correlation_id: str
     ) -> Optional[str]:
-        """Intelligently assign task to the best available agent"""
+        """
+        Assign a task to the best available agent.
+
+        Returns the worker id, TASK_QUEUED if every eligible worker is busy
+        (the task is dispatched when one frees a slot), or None if no worker
+        can handle the task.
+        """
 
         if not self.workers:
             logger.warning("No workers available for task assignment")
             return None
 
-        # Evaluate each worker's capability for this task
-        candidates = []
-
-        for worker_name, worker in self.workers.items():
-            if worker._can_handle_task_type(task_data.get("primary_task_type", "")):
-                confidence = worker._calculate_task_confidence(task_data)
-                cost = worker._estimate_task_cost(task_data)
-                time_est = worker._estimate_completion_time(task_data)
-
-                # Multi-objective scoring: quality - λ·cost - μ·latency
-                score = (
-                    confidence - (0.1 * cost) - (0.05 * time_est / 60)
-                )  # Convert time to hours
-
-                candidates.append(
-                    {
-                        "worker_name": worker_name,
-                        "worker": worker,
-                        "confidence": confidence,
-                        "cost": cost,
-                        "time_estimate": time_est,
-                        "score": score,
-                    }
+        # Queued tasks keep their correlation id until a slot frees up
+        task_data.setdefault("correlation_id", correlation_id)
+        worker_id = self.dispatcher.submit(task_data)
+        if worker_id is None:
+            if self.dispatcher.eligible_workers(task_data.get("primary_task_type")):
+                logger.info(
+                    f"All eligible workers busy, queued task {task_data['task_id']}"
                 )
-
-        if not candidates:
+                return TASK_QUEUED
             logger.warning("No suitable workers found for task")
             return None
 
-        # Select best candidate
-        best_candidate = max(candidates, key=lambda c: c["score"])
-        selected_worker = best_candidate["worker"]
+        self.task_assignments[task_data["task_id"]] = correlation_id
+        await self._publish_assignment(worker_id, task_data, correlation_id)
+        return worker_id
+
+    async def task_finished(self, task_id: str, latency: float, success: bool):
+        """Release a worker slot and dispatch the next queued task to it"""
 
+        self.task_assignments.pop(task_id, None)
+        next_assignment = self.dispatcher.complete(task_id, latency, success)
+        if next_assignment is None:
+            return
+
+        worker_id, task_data = next_assignment
+        correlation_id = task_data.get("correlation_id", task_data["task_id"])
+        self.task_assignments[task_data["task_id"]] = correlation_id
+        await self._publish_assignment(worker_id, task_data, correlation_id)
+
+    async def _publish_assignment(
+        self, worker_id: str, task_data: Dict[str, Any], correlation_id: str
+    ):
+        """Publish a TASK_ASSIGNED event addressed to one worker"""
+
+        worker = self.dispatcher.workers[worker_id]
         logger.info(
-            f"Assigned task to {best_candidate['worker_name']} with score {best_candidate['score']:.3f}"
+            f"Assigned task {task_data['task_id']} to {worker_id} "
+            f"(in flight {worker.in_flight}/{worker.max_concurrency})"
         )
+        if self.assignment_callback:
+            self.assignment_callback(worker_id, task_data)
 
-        # Publish task assignment event
         assignment_event = StreamEvent(
             correlation_id=correlation_id,
             event_type=EventType.TASK_ASSIGNED,
-            agent_id=selected_worker.agent_id,
-            task_id=task_data.get("task_id"),
+            agent_id=worker_id,
+            task_id=task_data["task_id"],
             payload=task_data,
             metadata={
-                "assignment_reason": f"Best score: {best_candidate['score']:.3f}",
-                "confidence": best_candidate["confidence"],
-                "estimated_cost": best_candidate["cost"],
-                "estimated_time": best_candidate["time_estimate"],
+                "assignment_reason": "power-of-two-choices on load and latency",
+                "in_flight": worker.in_flight,
+                "ewma_latency": worker.ewma_latency,
             },
         )
 
         await self.event_bus.publish_event(EventStreamType.TASKS, assignment_event)
-
-        return selected_worker.agent_id
@@ -0,0 +1,211 @@
+"""
+Capability-indexed task dispatcher for live agent workers.
+
+Replaces the broadcast-and-bid flow (every worker evaluating every
+TASK_CREATED event) with direct assignment:
+
+- a capability index maps each task type to its eligible workers, resolved
+  once per task type
+- each worker has a concurrency limit, a live in-flight count and an EWMA of
+  observed latency
+- a task goes to the better of two randomly sampled eligible workers with
+  free capacity (power-of-two-choices)
+- when no eligible worker has capacity the task waits in its task type's
+  stream and is handed to the first eligible worker that frees a slot
+"""
+
+import logging
+import random
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WorkerState:
+    """Dispatcher-side view of one worker"""
+
+    worker_id: str
+    capabilities: Tuple[str, ...]
+    max_concurrency: int = 4
+    ewma_latency: float = 1.0
+    in_flight: int = 0
+    completed: int = 0
+    failed: int = 0
+    streams: Set[str] = field(default_factory=set)
+
+    @property
+    def has_capacity(self) -> bool:
+        return self.in_flight < self.max_concurrency
+
+    @property
+    def load_score(self) -> float:
+        """Expected time to finish a new task: queue depth times latency"""
+        return (self.in_flight + 1) * self.ewma_latency
+
+
+class TaskDispatcher:
+    """Assigns tasks to workers by capability, load and observed latency"""
+
+    def __init__(self, ewma_alpha: float = 0.2, rng: Optional[random.Random] = None):
+        self.ewma_alpha = ewma_alpha
+        self.rng = rng or random.Random()
+        self.workers: Dict[str, WorkerState] = {}
+
+        # task type -> eligible worker ids, filled lazily per task type
+        self._capability_index: Dict[str, List[str]] = {}
+        # task type -> tasks waiting for capacity, as (seq, task)
+        self._streams: Dict[str, Deque[Tuple[int, Dict[str, Any]]]] = {}
+        # task_id -> (worker_id, stream)
+        self._assignments: Dict[str, Tuple[str, str]] = {}
+        self._seq = 0
+
+        self.dispatched = 0
+        self.queued = 0
+
+    def register_worker(
+        self,
+        worker_id: str,
+        capabilities: Iterable[str],
+        max_concurrency: int = 4,
+        expected_latency: float = 1.0,
+    ) -> WorkerState:
+        """Add a worker; capabilities are keywords matched against task types"""
+        state = WorkerState(
+            worker_id=worker_id,
+            capabilities=tuple(c.lower() for c in capabilities),
+            max_concurrency=max_concurrency,
+            ewma_latency=expected_latency,
+        )
+        self.workers[worker_id] = state
+        self._capability_index.clear()
+        # Let the new worker see tasks already waiting on its streams
+        for stream in self._streams:
+            self.eligible_workers(stream)
+        return state
+
+    def unregister_worker(self, worker_id: str):
+        """Remove a worker; its in-flight tasks are forgotten"""
+        self.workers.pop(worker_id, None)
+        self._capability_index.clear()
+        for task_id, (assigned, _) in list(self._assignments.items()):
+            if assigned == worker_id:
+                del self._assignments[task_id]
+
+    def eligible_workers(self, task_type: str) -> List[str]:
+        """Worker ids able to handle a task type, cached per task type"""
+        key = (task_type or "").lower()
+        eligible = self._capability_index.get(key)
+        if eligible is None:
+            eligible = [
+                worker_id
+                for worker_id, state in self.workers.items()
+                if any(cap in key for cap in state.capabilities)
+            ]
+            self._capability_index[key] = eligible
+            for worker_id in eligible:
+                self.workers[worker_id].streams.add(key)
+        return eligible
+
+    def _choose(self, task_type: str) -> Optional[WorkerState]:
+        candidates = [
+            self.workers[w]
+            for w in self.eligible_workers(task_type)
+            if self.workers[w].has_capacity
+        ]
+        if not candidates:
+            return None
+        if len(candidates) == 1:
+            return candidates[0]
+        a, b = self.rng.sample(candidates, 2)
+        return a if a.load_score <= b.load_score else b
+
+    def _assign(self, state: WorkerState, task: Dict[str, Any], stream: str):
+        state.in_flight += 1
+        self.dispatched += 1
+        self._assignments[task["task_id"]] = (state.worker_id, stream)
+
+    def submit(self, task: Dict[str, Any]) -> Optional[str]:
+        """
+        Assign a task, or queue it on its stream when no eligible worker has
+        capacity.
+
+        Returns the assigned worker id, or None if the task was queued or no
+        worker can ever handle it.
+        """
+        task.setdefault("task_id", f"task_{uuid4().hex[:8]}")
+        stream = (task.get("primary_task_type") or "").lower()
+        if not self.eligible_workers(stream):
+            logger.warning(f"No worker can handle task type {stream!r}")
+            return None
+
+        state = self._choose(stream)
+        if state is None:
+            self._seq += 1
+            self._streams.setdefault(stream, deque()).append((self._seq, task))
+            self.queued += 1
+            return None
+
+        self._assign(state, task, stream)
+        return state.worker_id
+
+    def complete(
+        self, task_id: str, latency: float, success: bool = True
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Record a finished task and refill the freed slot.
+
+        Returns (worker_id, task) for the next waiting task handed to that
+        worker, or None if nothing it can handle is waiting.
+        """
+        assignment = self._assignments.pop(task_id, None)
+        if assignment is None:
+            return None
+        worker_id, _ = assignment
+        state = self.workers.get(worker_id)
+        if state is None:
+            return None
+
+        state.in_flight -= 1
+        if success:
+            state.completed += 1
+            state.ewma_latency += self.ewma_alpha * (latency - state.ewma_latency)
+        else:
+            state.failed += 1
+
+        # Oldest waiting task across the streams this worker reads from
+        oldest = None
+        for stream in state.streams:
+            pending = self._streams.get(stream)
+            if pending and (oldest is None or pending[0][0] < oldest[0]):
+                oldest = (pending[0][0], stream)
+        if oldest is None:
+            return None
+
+        _, stream = oldest
+        _, task = self._streams[stream].popleft()
+        self.queued -= 1
+        self._assign(state, task, stream)
+        return worker_id, task
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Dispatcher statistics for monitoring"""
+        return {
+            "dispatched": self.dispatched,
+            "queued": self.queued,
+            "in_flight": len(self._assignments),
+            "streams": {s: len(q) for s, q in self._streams.items() if q},
+            "workers": {
+                worker_id: {
+                    "in_flight": state.in_flight,
+                    "max_concurrency": state.max_concurrency,
+                    "ewma_latency": state.ewma_latency,
+                    "completed": state.completed,
+                    "failed": state.failed,
+                }
+                for worker_id, state in self.workers.items()
+            },
+        }
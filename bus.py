@@ -1,11 +1,14 @@
 from __future__ import annotations
 import asyncio
 import json
+import logging
 import time
 from typing import Any, Dict, Callable
 from dataclasses import dataclass
 from settings import settings
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class Event:
@@ -104,33 +107,59 @@ class MockBus(BaseBus):
             await handler(ev)
 
 
-def get_bus() -> BaseBus:
-    if settings.EVENT_BUS == "redis":
-        if not settings.REDIS_URL:
-            raise RuntimeError("EVENT_BUS=redis but REDIS_URL not set")
+class LazyRedisBus(BaseBus):
+    """Redis Streams bus that connects and probes Redis on first use.
 
-        b = RedisStreamsBus(settings.REDIS_URL)
+    If the probe fails the bus falls back to a MockBus, so an unreachable
+    Redis never blocks or breaks import/startup.
+    """
 
-        # Test connection but don't fail startup if Redis is unreachable
-        import asyncio
+    def __init__(self, url: str):
+        self.url = url
+        self._backend: BaseBus | None = None
+        self._resolving: asyncio.Lock | None = None
+
+    async def _resolve(self) -> BaseBus:
+        if self._backend is not None:
+            return self._backend
+        if self._resolving is None:
+            self._resolving = asyncio.Lock()
+        async with self._resolving:
+            if self._backend is None:
+                candidate: BaseBus = RedisStreamsBus(self.url)
+                try:
+                    await candidate.ping()
+                except Exception as e:
+                    logger.warning(
+                        f"Redis connection failed ({e}), falling back to MockBus"
+                    )
+                    candidate = MockBus()
+                self._backend = candidate
+        return self._backend
 
-        try:
-            try:
-                loop = asyncio.get_running_loop()
-                # Inside a running loop – schedule ping but do not block
-                loop.create_task(b.ping())
-            except RuntimeError:
-                # No running loop – run synchronously
-                asyncio.run(b.ping())
-        except Exception as e:
-            # Redis connection failed - log warning but continue with MockBus
-            import logging
+    async def ensure_topic(self, topic: str):
+        return await (await self._resolve()).ensure_topic(topic)
+
+    async def publish(self, event: Event) -> str:
+        return await (await self._resolve()).publish(event)
+
+    async def subscribe(
+        self,
+        topic: str,
+        group: str,
+        consumer: str,
+        handler: Callable[[Event], asyncio.Future],
+    ):
+        return await (await self._resolve()).subscribe(topic, group, consumer, handler)
 
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Redis connection failed ({e}), falling back to MockBus")
-            return MockBus()
 
-        return b
+def get_bus() -> BaseBus:
+    if settings.EVENT_BUS == "redis":
+        if not settings.REDIS_URL:
+            raise RuntimeError("EVENT_BUS=redis but REDIS_URL not set")
+
+        # Connection is tested on first publish/subscribe, not here
+        return LazyRedisBus(settings.REDIS_URL)
 
     if settings.EVENT_BUS == "mock":
         # Only allow MockBus explicitly in debug mode
@@ -141,5 +170,14 @@ def get_bus() -> BaseBus:
     raise RuntimeError(f"Unknown EVENT_BUS: {settings.EVENT_BUS}")
 
 
-# export singleton
-bus = get_bus()
+# export singleton, created on first `bus` attribute access (PEP 562)
+_bus: BaseBus | None = None
+
+
+def __getattr__(name: str):
+    global _bus
+    if name == "bus":
+        if _bus is None:
+            _bus = get_bus()
+        return _bus
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,3 @@
-import asyncio
 import os
 import json
 import time
@@ -6,8 +5,6 @@ import pathlib
 import typer
 import re
 from typing import Optional
-from services.real_models import real_e2e
-from storage.runs import init, save_run
 
 app = typer.Typer(help="CodeCompanion CLI")
 
@@ -44,6 +41,10 @@ def run(
     outdir: Optional[str] = typer.Option(None, help="Folder to write artifacts"),
 ):
     """Call real models and save artifacts locally + DB."""
+    # Model clients and storage are only needed here; keep `check`/`ping` fast
+    import asyncio
+    from services.real_models import real_e2e
+    from storage.runs import init, save_run
 
     async def go():
         res = await real_e2e(objective)
@@ -5,16 +5,16 @@ import argparse
 import logging
 
 # Suppress Streamlit and other verbose logging early
-logging.getLogger('streamlit').setLevel(logging.ERROR)
-logging.getLogger('streamlit.logger').setLevel(logging.ERROR)
-os.environ['STREAMLIT_LOGGER_LEVEL'] = 'error'
+logging.getLogger("streamlit").setLevel(logging.ERROR)
+logging.getLogger("streamlit.logger").setLevel(logging.ERROR)
+os.environ["STREAMLIT_LOGGER_LEVEL"] = "error"
 
 from .bootstrap import ensure_bootstrap
 from .target import TargetContext
 from . import __version__
-from .repl import chat_repl
-from .runner import run_pipeline, run_single_agent
-from .info_core import gather_all_info
+
+# Agent runners, the REPL and info gathering import the LLM client stack;
+# they are imported where used so --help and --version start instantly.
 
 
 def main():
@@ -43,7 +43,7 @@ Available Agents:
 
 Learn more: https://github.com/AidiJackson/codecompanion
         """,
-        formatter_class=argparse.RawDescriptionHelpFormatter
+        formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument("--version", action="store_true", help="Show version and exit")
     parser.add_argument(
@@ -88,11 +88,10 @@ Learn more: https://github.com/AidiJackson/codecompanion
     )
 
     # Subcommands (detect, etc.)
-    subparsers = parser.add_subparsers(dest='command', help='Subcommands')
+    subparsers = parser.add_subparsers(dest="command", help="Subcommands")
 
     detect_parser = subparsers.add_parser(
-        'detect',
-        help='Detect project type and show recommendations'
+        "detect", help="Detect project type and show recommendations"
     )
 
     args = parser.parse_args()
@@ -107,7 +106,7 @@ Learn more: https://github.com/AidiJackson/codecompanion
             create_workspace_config,
             save_workspace_config,
             is_initialized,
-            get_workspace_summary
+            get_workspace_summary,
         )
         from .target import TargetSecurityError
 
@@ -149,11 +148,14 @@ Learn more: https://github.com/AidiJackson/codecompanion
         except Exception as e:
             print(f"❌ Initialization failed: {e}")
             import traceback
+
             traceback.print_exc()
             return 1
 
     # Handle --info command
     if args.info:
+        from .info_core import gather_all_info
+
         project_root = os.getcwd()
         target = TargetContext(project_root)
         info_data = gather_all_info(str(target.root))
@@ -187,43 +189,75 @@ Learn more: https://github.com/AidiJackson/codecompanion
             provider_table.add_column("Model")
             provider_table.add_column("Status")
 
-            for provider in info_data['providers']:
-                status = "[green]✓ Configured[/green]" if provider['api_key_set'] else "[red]✗ Missing Key[/red]"
-                provider_table.add_row(provider['name'], provider['model'], status)
+            for provider in info_data["providers"]:
+                status = (
+                    "[green]✓ Configured[/green]"
+                    if provider["api_key_set"]
+                    else "[red]✗ Missing Key[/red]"
+                )
+                provider_table.add_row(provider["name"], provider["model"], status)
 
             console.print(provider_table)
 
+            # Completion cache section
+            console.print("\n[bold cyan]Completion Cache[/bold cyan]")
+            llm_cache = info_data["llm_cache"]
+            if not llm_cache["enabled"]:
+                console.print("  Status: disabled")
+            else:
+                mode = "replay" if llm_cache["replay"] else "enabled"
+                console.print(f"  Status: {mode}")
+                console.print(f"  Entries: {llm_cache['entries']}")
+                console.print(
+                    f"  Hits: {llm_cache['hits']}  Misses: {llm_cache['misses']}"
+                )
+                if llm_cache["hit_rate"]:
+                    console.print(f"  Hit Rate: {llm_cache['hit_rate']}")
+
+            # Token calibration section
+            console.print("\n[bold cyan]Token Counting[/bold cyan]")
+            calibration = info_data["token_calibration"]
+            if not calibration:
+                console.print("  Calibration: none yet (recorded from provider usage)")
+            for provider, fit in calibration.items():
+                console.print(
+                    f"  {provider}: x{fit['factor']} from {fit['samples']} responses, "
+                    f"error {fit['mape']}% (len/4: {fit['char_estimate_mape']}%)"
+                )
+
             # Pipeline section
             console.print("\n[bold cyan]Pipeline Status[/bold cyan]")
-            pipeline = info_data['pipeline']
+            pipeline = info_data["pipeline"]
             console.print(f"  Status: {pipeline['status']}")
             console.print(f"  Total Runs: {pipeline['total_runs']}")
-            if pipeline['last_run']:
+            if pipeline["last_run"]:
                 console.print(f"  Last Run: {pipeline['last_run']['timestamp']}")
                 console.print(f"  Last Status: {pipeline['last_run']['status']}")
                 console.print(f"  Summary: {pipeline['last_run']['summary']}")
             else:
                 console.print("  Last Run: Never")
-            if pipeline['success_rate']:
+            if pipeline["success_rate"]:
                 console.print(f"  Success Rate: {pipeline['success_rate']}")
 
             # Errors section
             console.print("\n[bold cyan]Errors & Recovery[/bold cyan]")
-            errors = info_data['errors']
+            errors = info_data["errors"]
             console.print(f"  Total Errors: {errors['total_errors']}")
             console.print(f"  Unrecovered: {errors['unrecovered_errors']}")
-            if errors['recent']:
+            if errors["recent"]:
                 console.print("  Recent Errors:")
-                for err in errors['recent']:
-                    status_marker = "✓" if err['recovered'] else "✗"
-                    console.print(f"    [{status_marker}] {err['timestamp']} - {err['agent']} ({err['stage']}): {err['message']}")
+                for err in errors["recent"]:
+                    status_marker = "✓" if err["recovered"] else "✗"
+                    console.print(
+                        f"    [{status_marker}] {err['timestamp']} - {err['agent']} ({err['stage']}): {err['message']}"
+                    )
             else:
                 console.print("  No errors recorded")
 
             # Recommendations section
-            if info_data['recommendations']:
+            if info_data["recommendations"]:
                 console.print("\n[bold yellow]Recommendations[/bold yellow]")
-                for rec in info_data['recommendations']:
+                for rec in info_data["recommendations"]:
                     console.print(f"  • {rec['message']}")
                     console.print(f"    → {rec['action']}")
             else:
@@ -234,11 +268,12 @@ Learn more: https://github.com/AidiJackson/codecompanion
     # Handle --dashboard command
     if args.dashboard:
         from .dashboard.app import run_dashboard
+
         run_dashboard()
         return 0
 
     # Handle detect subcommand
-    if args.command == 'detect':
+    if args.command == "detect":
         from .project_detector import ProjectDetector
         from rich.console import Console
         from rich.panel import Panel
@@ -251,14 +286,16 @@ Learn more: https://github.com/AidiJackson/codecompanion
         console = Console()
 
         # Project detection panel
-        console.print(Panel.fit(
-            f"[cyan]Type:[/cyan] {info['type']}\n"
-            f"[cyan]Language:[/cyan] {info.get('language', 'unknown')}\n"
-            f"[cyan]Framework:[/cyan] {info.get('framework', 'none')}\n"
-            f"[cyan]Confidence:[/cyan] {info['confidence']:.0%}",
-            title="📦 Project Detection",
-            border_style="blue"
-        ))
+        console.print(
+            Panel.fit(
+                f"[cyan]Type:[/cyan] {info['type']}\n"
+                f"[cyan]Language:[/cyan] {info.get('language', 'unknown')}\n"
+                f"[cyan]Framework:[/cyan] {info.get('framework', 'none')}\n"
+                f"[cyan]Confidence:[/cyan] {info['confidence']:.0%}",
+                title="📦 Project Detection",
+                border_style="blue",
+            )
+        )
 
         # Recommended preset
         console.print("\n[bold cyan]Recommended Agent Preset[/bold cyan]")
@@ -266,10 +303,12 @@ Learn more: https://github.com/AidiJackson/codecompanion
         console.print(f"\n[bold cyan]Focus Areas[/bold cyan]")
         console.print(f"  {preset['focus']}")
         console.print(f"\n[bold cyan]Suggested Agents[/bold cyan]")
-        for i, agent in enumerate(preset['agents'], 1):
+        for i, agent in enumerate(preset["agents"], 1):
             console.print(f"  {i}. {agent}")
 
-        console.print("\n[bold green]💡 Tip:[/bold green] Run [cyan]codecompanion --auto[/cyan] to execute this preset")
+        console.print(
+            "\n[bold green]💡 Tip:[/bold green] Run [cyan]codecompanion --auto[/cyan] to execute this preset"
+        )
 
         return 0
 
@@ -283,6 +322,7 @@ Learn more: https://github.com/AidiJackson/codecompanion
         except Exception as e:
             print(f"❌ Task execution failed: {e}")
             import traceback
+
             traceback.print_exc()
             return 1
 
@@ -300,10 +340,16 @@ Learn more: https://github.com/AidiJackson/codecompanion
         return 0
 
     if args.chat:
+        from .repl import chat_repl
+
         return chat_repl(provider=args.provider)
     if args.auto:
+        from .runner import run_pipeline
+
         return run_pipeline(provider=args.provider, target=target)
     if args.run:
+        from .runner import run_single_agent
+
         return run_single_agent(args.run, provider=args.provider, target=target)
     # default help
     parser.print_help()
@@ -8,6 +8,7 @@ This module provides:
 - Process tree management
 - Thread-safe job management
 """
+
 import os
 import sys
 import uuid
@@ -20,7 +21,15 @@ from pathlib import Path
 from typing import Optional, Dict, Callable
 from contextlib import redirect_stdout, redirect_stderr
 
-from .models import Job, JobStatus, JobMode, JobStore, get_job_store, update_job_metrics, get_budget_store
+from .models import (
+    Job,
+    JobStatus,
+    JobMode,
+    JobStore,
+    get_job_store,
+    update_job_metrics,
+    get_budget_store,
+)
 from .process_manager import ProcessManager, CancellationMode, get_process_manager
 
 
@@ -78,7 +87,7 @@ class JobExecutor:
         self,
         max_workers: int = 4,
         job_store: Optional[JobStore] = None,
-        process_manager: Optional[ProcessManager] = None
+        process_manager: Optional[ProcessManager] = None,
     ):
         """
         Initialize job executor.
@@ -103,7 +112,7 @@ class JobExecutor:
         input_text: str,
         agent_name: Optional[str] = None,
         provider: str = "claude",
-        target_root: Optional[str] = None
+        target_root: Optional[str] = None,
     ) -> Job:
         """
         Submit a new job for async execution.
@@ -146,19 +155,14 @@ class JobExecutor:
 
         # Submit to thread pool
         future = self._executor.submit(
-            self._execute_job,
-            job,
-            cancellation_token,
-            output_capture
+            self._execute_job, job, cancellation_token, output_capture
         )
 
         with self._lock:
             self._futures[job.id] = future
 
         # Add callback to cleanup on completion
-        future.add_done_callback(
-            lambda f: self._cleanup_job(job.id)
-        )
+        future.add_done_callback(lambda f: self._cleanup_job(job.id))
 
         return job
 
@@ -193,7 +197,9 @@ class JobExecutor:
         job = self.job_store.get(job_id)
         return job.output if job else None
 
-    def cancel(self, job_id: str, mode: CancellationMode = CancellationMode.GRACEFUL) -> bool:
+    def cancel(
+        self, job_id: str, mode: CancellationMode = CancellationMode.GRACEFUL
+    ) -> bool:
         """
         Cancel a running job using the specified mode.
 
@@ -230,7 +236,9 @@ class JobExecutor:
             try:
                 success = self.process_manager.cancel_process(job.process_id, mode)
                 if not success:
-                    print(f"[executor] Warning: Could not fully terminate process tree for job {job_id}")
+                    print(
+                        f"[executor] Warning: Could not fully terminate process tree for job {job_id}"
+                    )
             except Exception as e:
                 print(f"[executor] Error killing process tree: {e}")
 
@@ -247,7 +255,7 @@ class JobExecutor:
         self,
         job: Job,
         cancellation_token: CancellationToken,
-        output_capture: OutputCapture
+        output_capture: OutputCapture,
     ):
         """Execute job in background thread."""
         # Import here to avoid circular dependencies
@@ -300,9 +308,7 @@ class JobExecutor:
                     print(f"[executor] Running agent: {job.agent_name}")
                     print(f"[executor] Project root: {job.target_root}")
                     exit_code = run_single_agent(
-                        job.agent_name,
-                        provider=job.provider,
-                        target=target
+                        job.agent_name, provider=job.provider, target=target
                     )
                     print(f"[executor] Agent completed with exit code {exit_code}")
 
@@ -311,9 +317,7 @@ class JobExecutor:
                     print(f"[executor] Running task: {job.input}")
                     print(f"[executor] Project root: {job.target_root}")
                     exit_code = run_task(
-                        job.input,
-                        target=target,
-                        provider=job.provider
+                        job.input, target=target, provider=job.provider
                     )
                     print(f"[executor] Task completed with exit code {exit_code}")
 
@@ -378,16 +382,8 @@ class JobExecutor:
             return  # No cost to track
 
         try:
-            budget_store = get_budget_store()
-            budgets = budget_store.list(enabled_only=True)
-
-            for budget in budgets:
-                # Skip session budgets (handled separately)
-                if budget.period.value == 'session':
-                    continue
-
-                # Add spending to budget
-                budget_store.add_spending(budget.id, job.estimated_cost)
+            # Session budgets are handled separately
+            get_budget_store().add_spending_to_active(job.estimated_cost)
 
         except Exception as e:
             print(f"[executor] Warning: Failed to update budgets: {e}")
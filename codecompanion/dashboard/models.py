@@ -6,32 +6,37 @@ This module provides:
 - SQLite-based persistent storage
 - Thread-safe database operations
 """
+
 import sqlite3
 import json
 import threading
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 from dataclasses import dataclass, asdict
 from contextlib import contextmanager
 
+from codecompanion.tokens import count_tokens
+
 
 class JobStatus(str, Enum):
     """Job execution status."""
-    PENDING = "pending"      # Queued but not started
-    RUNNING = "running"      # Currently executing
+
+    PENDING = "pending"  # Queued but not started
+    RUNNING = "running"  # Currently executing
     COMPLETED = "completed"  # Finished successfully
-    FAILED = "failed"        # Finished with error
+    FAILED = "failed"  # Finished with error
     CANCELLED = "cancelled"  # User cancelled
 
 
 class JobMode(str, Enum):
     """Job execution mode."""
-    CHAT = "chat"          # Single LLM chat turn
-    AUTO = "auto"          # Full 9-agent pipeline
-    AGENT = "agent"        # Single agent execution
-    TASK = "task"          # Natural language task
+
+    CHAT = "chat"  # Single LLM chat turn
+    AUTO = "auto"  # Full 9-agent pipeline
+    AGENT = "agent"  # Single agent execution
+    TASK = "task"  # Natural language task
 
 
 @dataclass
@@ -52,6 +57,7 @@ class Session:
         total_cost: Total estimated cost across all jobs (USD)
         total_tokens: Total tokens used across all jobs
     """
+
     id: str
     name: str
     created_at: str
@@ -66,7 +72,7 @@ class Session:
         return asdict(self)
 
     @staticmethod
-    def from_dict(data: Dict[str, Any]) -> 'Session':
+    def from_dict(data: Dict[str, Any]) -> "Session":
         """Create Session from dictionary."""
         return Session(**data)
 
@@ -100,6 +106,7 @@ class Job:
         process_id: Process ID of running subprocess (if any)
         cancellation_mode: Mode used for cancellation (graceful/forced)
     """
+
     id: str
     mode: JobMode
     input: str
@@ -128,13 +135,13 @@ class Job:
         return asdict(self)
 
     @staticmethod
-    def from_dict(data: Dict[str, Any]) -> 'Job':
+    def from_dict(data: Dict[str, Any]) -> "Job":
         """Create Job from dictionary."""
         # Convert string enums back to enum types
-        if isinstance(data.get('mode'), str):
-            data['mode'] = JobMode(data['mode'])
-        if isinstance(data.get('status'), str):
-            data['status'] = JobStatus(data['status'])
+        if isinstance(data.get("mode"), str):
+            data["mode"] = JobMode(data["mode"])
+        if isinstance(data.get("status"), str):
+            data["status"] = JobStatus(data["status"])
         return Job(**data)
 
 
@@ -243,20 +250,22 @@ class JobStore:
 
         # Add new columns if they don't exist
         new_columns = {
-            'session_id': 'TEXT',
-            'input_tokens': 'INTEGER DEFAULT 0',
-            'output_tokens': 'INTEGER DEFAULT 0',
-            'total_tokens': 'INTEGER DEFAULT 0',
-            'estimated_cost': 'REAL DEFAULT 0.0',
-            'model_used': 'TEXT',
-            'process_id': 'INTEGER',
-            'cancellation_mode': 'TEXT'
+            "session_id": "TEXT",
+            "input_tokens": "INTEGER DEFAULT 0",
+            "output_tokens": "INTEGER DEFAULT 0",
+            "total_tokens": "INTEGER DEFAULT 0",
+            "estimated_cost": "REAL DEFAULT 0.0",
+            "model_used": "TEXT",
+            "process_id": "INTEGER",
+            "cancellation_mode": "TEXT",
         }
 
         for column_name, column_type in new_columns.items():
             if column_name not in existing_columns:
                 try:
-                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {column_name} {column_type}")
+                    conn.execute(
+                        f"ALTER TABLE jobs ADD COLUMN {column_name} {column_type}"
+                    )
                 except sqlite3.OperationalError:
                     # Column might already exist due to race condition
                     pass
@@ -283,7 +292,8 @@ class JobStore:
             Created job
         """
         with self._get_conn() as conn:
-            conn.execute("""
+            conn.execute(
+                """
                 INSERT INTO jobs (
                     id, mode, input, agent_name, provider, target_root,
                     status, created_at, started_at, finished_at,
@@ -291,28 +301,30 @@ class JobStore:
                     session_id, input_tokens, output_tokens, total_tokens,
                     estimated_cost, model_used
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                job.id,
-                job.mode.value,
-                job.input,
-                job.agent_name,
-                job.provider,
-                job.target_root,
-                job.status.value,
-                job.created_at,
-                job.started_at,
-                job.finished_at,
-                job.output,
-                job.error,
-                job.exit_code,
-                1 if job.can_cancel else 0,
-                job.session_id,
-                job.input_tokens,
-                job.output_tokens,
-                job.total_tokens,
-                job.estimated_cost,
-                job.model_used,
-            ))
+            """,
+                (
+                    job.id,
+                    job.mode.value,
+                    job.input,
+                    job.agent_name,
+                    job.provider,
+                    job.target_root,
+                    job.status.value,
+                    job.created_at,
+                    job.started_at,
+                    job.finished_at,
+                    job.output,
+                    job.error,
+                    job.exit_code,
+                    1 if job.can_cancel else 0,
+                    job.session_id,
+                    job.input_tokens,
+                    job.output_tokens,
+                    job.total_tokens,
+                    job.estimated_cost,
+                    job.model_used,
+                ),
+            )
             conn.commit()
 
         return job
@@ -328,10 +340,7 @@ class JobStore:
             Job if found, None otherwise
         """
         with self._get_conn() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM jobs WHERE id = ?",
-                (job_id,)
-            )
+            cursor = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
             row = cursor.fetchone()
 
             if row is None:
@@ -340,10 +349,7 @@ class JobStore:
             return self._row_to_job(row)
 
     def list(
-        self,
-        status: Optional[JobStatus] = None,
-        limit: int = 100,
-        offset: int = 0
+        self, status: Optional[JobStatus] = None, limit: int = 100, offset: int = 0
     ) -> List[Job]:
         """
         List jobs with optional filtering.
@@ -358,18 +364,24 @@ class JobStore:
         """
         with self._get_conn() as conn:
             if status is not None:
-                cursor = conn.execute("""
+                cursor = conn.execute(
+                    """
                     SELECT * FROM jobs
                     WHERE status = ?
                     ORDER BY created_at DESC
                     LIMIT ? OFFSET ?
-                """, (status.value, limit, offset))
+                """,
+                    (status.value, limit, offset),
+                )
             else:
-                cursor = conn.execute("""
+                cursor = conn.execute(
+                    """
                     SELECT * FROM jobs
                     ORDER BY created_at DESC
                     LIMIT ? OFFSET ?
-                """, (limit, offset))
+                """,
+                    (limit, offset),
+                )
 
             rows = cursor.fetchall()
             return [self._row_to_job(row) for row in rows]
@@ -385,7 +397,8 @@ class JobStore:
             Updated job
         """
         with self._get_conn() as conn:
-            conn.execute("""
+            conn.execute(
+                """
                 UPDATE jobs SET
                     mode = ?,
                     input = ?,
@@ -407,28 +420,30 @@ class JobStore:
                     estimated_cost = ?,
                     model_used = ?
                 WHERE id = ?
-            """, (
-                job.mode.value,
-                job.input,
-                job.agent_name,
-                job.provider,
-                job.target_root,
-                job.status.value,
-                job.created_at,
-                job.started_at,
-                job.finished_at,
-                job.output,
-                job.error,
-                job.exit_code,
-                1 if job.can_cancel else 0,
-                job.session_id,
-                job.input_tokens,
-                job.output_tokens,
-                job.total_tokens,
-                job.estimated_cost,
-                job.model_used,
-                job.id,
-            ))
+            """,
+                (
+                    job.mode.value,
+                    job.input,
+                    job.agent_name,
+                    job.provider,
+                    job.target_root,
+                    job.status.value,
+                    job.created_at,
+                    job.started_at,
+                    job.finished_at,
+                    job.output,
+                    job.error,
+                    job.exit_code,
+                    1 if job.can_cancel else 0,
+                    job.session_id,
+                    job.input_tokens,
+                    job.output_tokens,
+                    job.total_tokens,
+                    job.estimated_cost,
+                    job.model_used,
+                    job.id,
+                ),
+            )
             conn.commit()
 
         return job
@@ -444,10 +459,7 @@ class JobStore:
             True if job was deleted, False if not found
         """
         with self._get_conn() as conn:
-            cursor = conn.execute(
-                "DELETE FROM jobs WHERE id = ?",
-                (job_id,)
-            )
+            cursor = conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
             conn.commit()
             return cursor.rowcount > 0
 
@@ -464,8 +476,7 @@ class JobStore:
         with self._get_conn() as conn:
             if status is not None:
                 cursor = conn.execute(
-                    "SELECT COUNT(*) FROM jobs WHERE status = ?",
-                    (status.value,)
+                    "SELECT COUNT(*) FROM jobs WHERE status = ?", (status.value,)
                 )
             else:
                 cursor = conn.execute("SELECT COUNT(*) FROM jobs")
@@ -475,28 +486,32 @@ class JobStore:
     def _row_to_job(self, row: sqlite3.Row) -> Job:
         """Convert database row to Job object."""
         return Job(
-            id=row['id'],
-            mode=JobMode(row['mode']),
-            input=row['input'],
-            agent_name=row['agent_name'],
-            provider=row['provider'],
-            target_root=row['target_root'],
-            status=JobStatus(row['status']),
-            created_at=row['created_at'],
-            started_at=row['started_at'],
-            finished_at=row['finished_at'],
-            output=row['output'],
-            error=row['error'],
-            exit_code=row['exit_code'],
-            can_cancel=bool(row['can_cancel']),
-            session_id=row['session_id'] if 'session_id' in row.keys() else None,
-            input_tokens=row['input_tokens'] if 'input_tokens' in row.keys() else 0,
-            output_tokens=row['output_tokens'] if 'output_tokens' in row.keys() else 0,
-            total_tokens=row['total_tokens'] if 'total_tokens' in row.keys() else 0,
-            estimated_cost=row['estimated_cost'] if 'estimated_cost' in row.keys() else 0.0,
-            model_used=row['model_used'] if 'model_used' in row.keys() else None,
-            process_id=row['process_id'] if 'process_id' in row.keys() else None,
-            cancellation_mode=row['cancellation_mode'] if 'cancellation_mode' in row.keys() else None,
+            id=row["id"],
+            mode=JobMode(row["mode"]),
+            input=row["input"],
+            agent_name=row["agent_name"],
+            provider=row["provider"],
+            target_root=row["target_root"],
+            status=JobStatus(row["status"]),
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+            output=row["output"],
+            error=row["error"],
+            exit_code=row["exit_code"],
+            can_cancel=bool(row["can_cancel"]),
+            session_id=row["session_id"] if "session_id" in row.keys() else None,
+            input_tokens=row["input_tokens"] if "input_tokens" in row.keys() else 0,
+            output_tokens=row["output_tokens"] if "output_tokens" in row.keys() else 0,
+            total_tokens=row["total_tokens"] if "total_tokens" in row.keys() else 0,
+            estimated_cost=row["estimated_cost"]
+            if "estimated_cost" in row.keys()
+            else 0.0,
+            model_used=row["model_used"] if "model_used" in row.keys() else None,
+            process_id=row["process_id"] if "process_id" in row.keys() else None,
+            cancellation_mode=row["cancellation_mode"]
+            if "cancellation_mode" in row.keys()
+            else None,
         )
 
 
@@ -521,6 +536,7 @@ def get_job_store(db_path: Optional[Path] = None) -> JobStore:
 
     return _job_store
 
+
 # ==============================================================================
 # Session Store
 # ==============================================================================
@@ -560,21 +576,24 @@ class SessionStore:
     def create(self, session: Session) -> Session:
         """Create a new session."""
         with self._get_conn() as conn:
-            conn.execute("""
+            conn.execute(
+                """
                 INSERT INTO sessions (
                     id, name, created_at, updated_at,
                     total_jobs, completed_jobs, total_cost, total_tokens
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                session.id,
-                session.name,
-                session.created_at,
-                session.updated_at,
-                session.total_jobs,
-                session.completed_jobs,
-                session.total_cost,
-                session.total_tokens,
-            ))
+            """,
+                (
+                    session.id,
+                    session.name,
+                    session.created_at,
+                    session.updated_at,
+                    session.total_jobs,
+                    session.completed_jobs,
+                    session.total_cost,
+                    session.total_tokens,
+                ),
+            )
             conn.commit()
 
         return session
@@ -582,10 +601,7 @@ class SessionStore:
     def get(self, session_id: str) -> Optional[Session]:
         """Get session by ID."""
         with self._get_conn() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM sessions WHERE id = ?",
-                (session_id,)
-            )
+            cursor = conn.execute("SELECT * FROM sessions WHERE id = ?", (session_id,))
             row = cursor.fetchone()
 
             if row is None:
@@ -596,11 +612,14 @@ class SessionStore:
     def list(self, limit: int = 100, offset: int = 0) -> List[Session]:
         """List sessions sorted by updated_at DESC."""
         with self._get_conn() as conn:
-            cursor = conn.execute("""
+            cursor = conn.execute(
+                """
                 SELECT * FROM sessions
                 ORDER BY updated_at DESC
                 LIMIT ? OFFSET ?
-            """, (limit, offset))
+            """,
+                (limit, offset),
+            )
 
             rows = cursor.fetchall()
             return [self._row_to_session(row) for row in rows]
@@ -608,7 +627,8 @@ class SessionStore:
     def update(self, session: Session) -> Session:
         """Update existing session."""
         with self._get_conn() as conn:
-            conn.execute("""
+            conn.execute(
+                """
                 UPDATE sessions SET
                     name = ?,
                     updated_at = ?,
@@ -617,15 +637,17 @@ class SessionStore:
                     total_cost = ?,
                     total_tokens = ?
                 WHERE id = ?
-            """, (
-                session.name,
-                session.updated_at,
-                session.total_jobs,
-                session.completed_jobs,
-                session.total_cost,
-                session.total_tokens,
-                session.id,
-            ))
+            """,
+                (
+                    session.name,
+                    session.updated_at,
+                    session.total_jobs,
+                    session.completed_jobs,
+                    session.total_cost,
+                    session.total_tokens,
+                    session.id,
+                ),
+            )
             conn.commit()
 
         return session
@@ -633,10 +655,7 @@ class SessionStore:
     def delete(self, session_id: str) -> bool:
         """Delete session by ID."""
         with self._get_conn() as conn:
-            cursor = conn.execute(
-                "DELETE FROM sessions WHERE id = ?",
-                (session_id,)
-            )
+            cursor = conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
             conn.commit()
             return cursor.rowcount > 0
 
@@ -649,14 +668,14 @@ class SessionStore:
     def _row_to_session(self, row: sqlite3.Row) -> Session:
         """Convert database row to Session object."""
         return Session(
-            id=row['id'],
-            name=row['name'],
-            created_at=row['created_at'],
-            updated_at=row['updated_at'],
-            total_jobs=row['total_jobs'],
-            completed_jobs=row['completed_jobs'],
-            total_cost=row['total_cost'],
-            total_tokens=row['total_tokens'],
+            id=row["id"],
+            name=row["name"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            total_jobs=row["total_jobs"],
+            completed_jobs=row["completed_jobs"],
+            total_cost=row["total_cost"],
+            total_tokens=row["total_tokens"],
         )
 
 
@@ -689,44 +708,45 @@ def get_session_store(db_path: Optional[Path] = None) -> SessionStore:
 
 # Provider pricing (USD per 1M tokens)
 PROVIDER_PRICING = {
-    'claude': {
-        'input': 3.0,
-        'output': 15.0,
-        'models': {
-            'claude-3-sonnet-20240229': {'input': 3.0, 'output': 15.0},
-            'claude-3-opus-20240229': {'input': 15.0, 'output': 75.0},
-            'claude-3-haiku-20240307': {'input': 0.25, 'output': 1.25},
-        }
+    "claude": {
+        "input": 3.0,
+        "output": 15.0,
+        "models": {
+            "claude-3-sonnet-20240229": {"input": 3.0, "output": 15.0},
+            "claude-3-opus-20240229": {"input": 15.0, "output": 75.0},
+            "claude-3-haiku-20240307": {"input": 0.25, "output": 1.25},
+        },
     },
-    'gpt4': {
-        'input': 10.0,
-        'output': 30.0,
-        'models': {
-            'gpt-4': {'input': 30.0, 'output': 60.0},
-            'gpt-4-turbo': {'input': 10.0, 'output': 30.0},
-            'gpt-3.5-turbo': {'input': 0.5, 'output': 1.5},
-        }
+    "gpt4": {
+        "input": 10.0,
+        "output": 30.0,
+        "models": {
+            "gpt-4": {"input": 30.0, "output": 60.0},
+            "gpt-4-turbo": {"input": 10.0, "output": 30.0},
+            "gpt-3.5-turbo": {"input": 0.5, "output": 1.5},
+        },
+    },
+    "gemini": {
+        "input": 1.25,
+        "output": 5.0,
+        "models": {
+            "gemini-pro": {"input": 1.25, "output": 5.0},
+            "gemini-ultra": {"input": 2.5, "output": 10.0},
+        },
     },
-    'gemini': {
-        'input': 1.25,
-        'output': 5.0,
-        'models': {
-            'gemini-pro': {'input': 1.25, 'output': 5.0},
-            'gemini-ultra': {'input': 2.5, 'output': 10.0},
-        }
-    }
 }
 
 
-def estimate_tokens(text: str) -> int:
+def estimate_tokens(text: str, provider: Optional[str] = None) -> int:
     """
     Estimate token count for text.
 
-    Uses simple character-based estimation: 1 token ≈ 4 characters.
-    This is a rough approximation for planning purposes.
+    Counts BPE tokens locally and scales them by the provider's calibration
+    factor, fitted against the usage reported by past responses.
 
     Args:
         text: Input text
+        provider: Provider name (claude, gpt4, gemini), if known
 
     Returns:
         Estimated token count
@@ -734,15 +754,11 @@ def estimate_tokens(text: str) -> int:
     if not text:
         return 0
 
-    # Simple estimation: 1 token ≈ 4 characters
-    return max(1, len(text) // 4)
+    return count_tokens(text, provider)
 
 
 def calculate_cost(
-    input_tokens: int,
-    output_tokens: int,
-    provider: str,
-    model: Optional[str] = None
+    input_tokens: int, output_tokens: int, provider: str, model: Optional[str] = None
 ) -> float:
     """
     Calculate estimated cost in USD.
@@ -762,15 +778,15 @@ def calculate_cost(
     pricing = PROVIDER_PRICING[provider]
 
     # Try to use specific model pricing
-    if model and 'models' in pricing:
-        for model_key, model_pricing in pricing['models'].items():
+    if model and "models" in pricing:
+        for model_key, model_pricing in pricing["models"].items():
             if model_key in model.lower() if model else False:
                 pricing = model_pricing
                 break
 
     # Calculate cost per million tokens
-    input_cost = (input_tokens / 1_000_000) * pricing.get('input', 0.0)
-    output_cost = (output_tokens / 1_000_000) * pricing.get('output', 0.0)
+    input_cost = (input_tokens / 1_000_000) * pricing.get("input", 0.0)
+    output_cost = (output_tokens / 1_000_000) * pricing.get("output", 0.0)
 
     return input_cost + output_cost
 
@@ -788,15 +804,10 @@ def estimate_job_cost(job: Job) -> float:
     if job.estimated_cost > 0:
         return job.estimated_cost
 
-    input_tokens = estimate_tokens(job.input)
-    output_tokens = estimate_tokens(job.output or "")
+    input_tokens = estimate_tokens(job.input, job.provider)
+    output_tokens = estimate_tokens(job.output or "", job.provider)
 
-    return calculate_cost(
-        input_tokens,
-        output_tokens,
-        job.provider,
-        job.model_used
-    )
+    return calculate_cost(input_tokens, output_tokens, job.provider, job.model_used)
 
 
 def update_job_metrics(job: Job) -> Job:
@@ -810,19 +821,16 @@ def update_job_metrics(job: Job) -> Job:
         Updated job with calculated metrics
     """
     if job.input_tokens == 0:
-        job.input_tokens = estimate_tokens(job.input)
+        job.input_tokens = estimate_tokens(job.input, job.provider)
 
     if job.output_tokens == 0 and job.output:
-        job.output_tokens = estimate_tokens(job.output)
+        job.output_tokens = estimate_tokens(job.output, job.provider)
 
     job.total_tokens = job.input_tokens + job.output_tokens
 
     if job.estimated_cost == 0.0:
         job.estimated_cost = calculate_cost(
-            job.input_tokens,
-            job.output_tokens,
-            job.provider,
-            job.model_used
+            job.input_tokens, job.output_tokens, job.provider, job.model_used
         )
 
     return job
@@ -830,11 +838,12 @@ def update_job_metrics(job: Job) -> Job:
 
 class BudgetPeriod(str, Enum):
     """Budget period types."""
+
     DAILY = "daily"
     WEEKLY = "weekly"
     MONTHLY = "monthly"
-    SESSION = "session"      # Per-session limit
-    TOTAL = "total"          # Total limit (no reset)
+    SESSION = "session"  # Per-session limit
+    TOTAL = "total"  # Total limit (no reset)
 
 
 @dataclass
@@ -858,6 +867,7 @@ class Budget:
         period_end: ISO timestamp when current period ends (for time-based budgets)
         last_alert_at: ISO timestamp of last alert sent
     """
+
     id: str
     name: str
     period: BudgetPeriod
@@ -875,10 +885,10 @@ class Budget:
         return asdict(self)
 
     @staticmethod
-    def from_dict(data: Dict[str, Any]) -> 'Budget':
+    def from_dict(data: Dict[str, Any]) -> "Budget":
         """Create Budget from dictionary."""
-        if isinstance(data.get('period'), str):
-            data['period'] = BudgetPeriod(data['period'])
+        if isinstance(data.get("period"), str):
+            data["period"] = BudgetPeriod(data["period"])
         return Budget(**data)
 
     def usage_percentage(self) -> float:
@@ -919,6 +929,10 @@ class BudgetStore:
 
         self.db_path = db_path
         self._lock = threading.Lock()
+        # id -> (limit, alert_threshold, current_spending) for enabled
+        # non-session budgets, newest first; None until loaded. Spending
+        # updates refresh entries, other writes invalidate it.
+        self._active_cache: Optional[Dict[str, Tuple[float, float, float]]] = None
         self._init_db()
 
     def _init_db(self):
@@ -971,36 +985,37 @@ class BudgetStore:
             budget.created_at = datetime.utcnow().isoformat() + "Z"
 
         with self._get_conn() as conn:
-            conn.execute("""
+            conn.execute(
+                """
                 INSERT INTO budgets (
                     id, name, period, limit_amount, current_spending,
                     alert_threshold, enabled, created_at, period_start,
                     period_end, last_alert_at
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                budget.id,
-                budget.name,
-                budget.period.value,
-                budget.limit,
-                budget.current_spending,
-                budget.alert_threshold,
-                int(budget.enabled),
-                budget.created_at,
-                budget.period_start,
-                budget.period_end,
-                budget.last_alert_at
-            ))
+            """,
+                (
+                    budget.id,
+                    budget.name,
+                    budget.period.value,
+                    budget.limit,
+                    budget.current_spending,
+                    budget.alert_threshold,
+                    int(budget.enabled),
+                    budget.created_at,
+                    budget.period_start,
+                    budget.period_end,
+                    budget.last_alert_at,
+                ),
+            )
             conn.commit()
+            self._active_cache = None
 
         return budget
 
     def get(self, budget_id: str) -> Optional[Budget]:
         """Get budget by ID."""
         with self._get_conn() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM budgets WHERE id = ?",
-                (budget_id,)
-            )
+            cursor = conn.execute("SELECT * FROM budgets WHERE id = ?", (budget_id,))
             row = cursor.fetchone()
 
             if row:
@@ -1008,9 +1023,7 @@ class BudgetStore:
             return None
 
     def list(
-        self,
-        period: Optional[BudgetPeriod] = None,
-        enabled_only: bool = False
+        self, period: Optional[BudgetPeriod] = None, enabled_only: bool = False
     ) -> List[Budget]:
         """List budgets with optional filters."""
         with self._get_conn() as conn:
@@ -1034,42 +1047,47 @@ class BudgetStore:
     def update(self, budget: Budget) -> Budget:
         """Update existing budget."""
         with self._get_conn() as conn:
-            conn.execute("""
+            conn.execute(
+                """
                 UPDATE budgets
                 SET name = ?, period = ?, limit_amount = ?, current_spending = ?,
                     alert_threshold = ?, enabled = ?, period_start = ?,
                     period_end = ?, last_alert_at = ?
                 WHERE id = ?
-            """, (
-                budget.name,
-                budget.period.value,
-                budget.limit,
-                budget.current_spending,
-                budget.alert_threshold,
-                int(budget.enabled),
-                budget.period_start,
-                budget.period_end,
-                budget.last_alert_at,
-                budget.id
-            ))
+            """,
+                (
+                    budget.name,
+                    budget.period.value,
+                    budget.limit,
+                    budget.current_spending,
+                    budget.alert_threshold,
+                    int(budget.enabled),
+                    budget.period_start,
+                    budget.period_end,
+                    budget.last_alert_at,
+                    budget.id,
+                ),
+            )
             conn.commit()
+            self._active_cache = None
 
         return budget
 
     def delete(self, budget_id: str) -> bool:
         """Delete budget by ID."""
         with self._get_conn() as conn:
-            cursor = conn.execute(
-                "DELETE FROM budgets WHERE id = ?",
-                (budget_id,)
-            )
+            cursor = conn.execute("DELETE FROM budgets WHERE id = ?", (budget_id,))
             conn.commit()
+            self._active_cache = None
             return cursor.rowcount > 0
 
     def add_spending(self, budget_id: str, amount: float) -> Optional[Budget]:
         """
         Add spending to a budget.
 
+        The increment happens in a single UPDATE, so concurrent jobs
+        finishing at once never overwrite each other's spending.
+
         Args:
             budget_id: Budget ID
             amount: Amount to add to current_spending
@@ -1077,12 +1095,47 @@ class BudgetStore:
         Returns:
             Updated budget or None if not found
         """
-        budget = self.get(budget_id)
-        if not budget:
-            return None
+        with self._get_conn() as conn:
+            row = conn.execute(
+                """
+                UPDATE budgets
+                SET current_spending = current_spending + ?
+                WHERE id = ?
+                RETURNING *
+            """,
+                (amount, budget_id),
+            ).fetchone()
+            conn.commit()
+            if row:
+                self._refresh_cached(row)
+
+        return self._row_to_budget(row) if row else None
+
+    def add_spending_to_active(self, amount: float) -> List[Budget]:
+        """
+        Add spending to every enabled non-session budget in one UPDATE.
+
+        Args:
+            amount: Amount to add to current_spending
+
+        Returns:
+            Updated budgets
+        """
+        with self._get_conn() as conn:
+            rows = conn.execute(
+                """
+                UPDATE budgets
+                SET current_spending = current_spending + ?
+                WHERE enabled = 1 AND period != ?
+                RETURNING *
+            """,
+                (amount, BudgetPeriod.SESSION.value),
+            ).fetchall()
+            conn.commit()
+            for row in rows:
+                self._refresh_cached(row)
 
-        budget.current_spending += amount
-        return self.update(budget)
+        return [self._row_to_budget(row) for row in rows]
 
     def reset_period(self, budget_id: str) -> Optional[Budget]:
         """
@@ -1096,33 +1149,48 @@ class BudgetStore:
         Returns:
             Updated budget or None if not found
         """
-        budget = self.get(budget_id)
-        if not budget:
-            return None
+        now = datetime.utcnow()
 
-        budget.current_spending = 0.0
-        budget.period_start = datetime.utcnow().isoformat() + "Z"
-
-        # Calculate period_end based on period type
-        if budget.period == BudgetPeriod.DAILY:
-            from datetime import timedelta
-            end = datetime.utcnow() + timedelta(days=1)
-            budget.period_end = end.isoformat() + "Z"
-        elif budget.period == BudgetPeriod.WEEKLY:
-            from datetime import timedelta
-            end = datetime.utcnow() + timedelta(weeks=1)
-            budget.period_end = end.isoformat() + "Z"
-        elif budget.period == BudgetPeriod.MONTHLY:
-            from datetime import timedelta
-            end = datetime.utcnow() + timedelta(days=30)
-            budget.period_end = end.isoformat() + "Z"
-
-        return self.update(budget)
+        with self._get_conn() as conn:
+            # period_end depends on the period type; total budgets keep theirs
+            row = conn.execute(
+                """
+                UPDATE budgets
+                SET current_spending = 0.0,
+                    period_start = ?,
+                    period_end = CASE period
+                        WHEN ? THEN ?
+                        WHEN ? THEN ?
+                        WHEN ? THEN ?
+                        ELSE period_end
+                    END
+                WHERE id = ?
+                RETURNING *
+            """,
+                (
+                    now.isoformat() + "Z",
+                    BudgetPeriod.DAILY.value,
+                    (now + timedelta(days=1)).isoformat() + "Z",
+                    BudgetPeriod.WEEKLY.value,
+                    (now + timedelta(weeks=1)).isoformat() + "Z",
+                    BudgetPeriod.MONTHLY.value,
+                    (now + timedelta(days=30)).isoformat() + "Z",
+                    budget_id,
+                ),
+            ).fetchone()
+            conn.commit()
+            if row:
+                self._refresh_cached(row)
+
+        return self._row_to_budget(row) if row else None
 
     def check_budgets(self, cost: float) -> Dict[str, Any]:
         """
         Check if adding cost would exceed any active budgets.
 
+        Runs against the in-process cache of enabled budgets, so the
+        per-job check does not touch the database once the cache is warm.
+
         Args:
             cost: Cost to check
 
@@ -1135,40 +1203,74 @@ class BudgetStore:
         exceeded = []
         warnings = []
 
-        budgets = self.list(enabled_only=True)
-
-        for budget in budgets:
-            if budget.period == BudgetPeriod.SESSION:
-                continue  # Session budgets checked separately
+        # Session budgets are checked separately
+        for budget_id, (limit, threshold, spending) in self._active_budgets().items():
+            projected_spending = spending + cost
 
-            projected_spending = budget.current_spending + cost
-
-            if projected_spending > budget.limit:
-                exceeded.append(budget.id)
-            elif (projected_spending / budget.limit * 100.0) >= budget.alert_threshold:
-                if budget.usage_percentage() < budget.alert_threshold:
-                    warnings.append(budget.id)
+            if projected_spending > limit:
+                exceeded.append(budget_id)
+            elif limit > 0 and projected_spending / limit * 100.0 >= threshold:
+                if spending / limit * 100.0 < threshold:
+                    warnings.append(budget_id)
 
         return {
-            'exceeded': exceeded,
-            'warnings': warnings,
-            'allowed': len(exceeded) == 0
+            "exceeded": exceeded,
+            "warnings": warnings,
+            "allowed": len(exceeded) == 0,
         }
 
+    def _active_budgets(self) -> Dict[str, Tuple[float, float, float]]:
+        """Enabled non-session budgets, loaded with one indexed query on a cache miss."""
+        cache = self._active_cache
+        if cache is not None:
+            return cache
+
+        with self._get_conn() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, limit_amount, alert_threshold, current_spending
+                FROM budgets
+                WHERE enabled = 1 AND period != ?
+                ORDER BY created_at DESC
+            """,
+                (BudgetPeriod.SESSION.value,),
+            ).fetchall()
+            cache = {
+                row["id"]: (
+                    row["limit_amount"],
+                    row["alert_threshold"],
+                    row["current_spending"],
+                )
+                for row in rows
+            }
+            self._active_cache = cache
+
+        return cache
+
+    def _refresh_cached(self, row: sqlite3.Row):
+        """Update a cached budget's spending from a row just written (lock held)."""
+        cache = self._active_cache
+        if cache is not None and row["id"] in cache:
+            cache[row["id"]] = (
+                row["limit_amount"],
+                row["alert_threshold"],
+                row["current_spending"],
+            )
+
     def _row_to_budget(self, row: sqlite3.Row) -> Budget:
         """Convert database row to Budget object."""
         return Budget(
-            id=row['id'],
-            name=row['name'],
-            period=BudgetPeriod(row['period']),
-            limit=row['limit_amount'],
-            current_spending=row['current_spending'],
-            alert_threshold=row['alert_threshold'],
-            enabled=bool(row['enabled']),
-            created_at=row['created_at'],
-            period_start=row['period_start'],
-            period_end=row['period_end'],
-            last_alert_at=row['last_alert_at']
+            id=row["id"],
+            name=row["name"],
+            period=BudgetPeriod(row["period"]),
+            limit=row["limit_amount"],
+            current_spending=row["current_spending"],
+            alert_threshold=row["alert_threshold"],
+            enabled=bool(row["enabled"]),
+            created_at=row["created_at"],
+            period_start=row["period_start"],
+            period_end=row["period_end"],
+            last_alert_at=row["last_alert_at"],
         )
 
 
@@ -1,7 +1,8 @@
 import subprocess
 import os
-import hashlib
+from pathlib import Path
 from typing import Optional
+from .file_index import hash_file
 from .target import TargetContext
 
 
@@ -69,17 +70,12 @@ def file_hash(path: str, target: Optional[TargetContext] = None):
     Returns:
         First 8 characters of hex digest
     """
-    h = hashlib.sha256()
-
     if target:
-        content = target.read_file(path)
-        h.update(content.encode('utf-8'))
-    else:
-        # Fallback for backward compatibility
-        with open(path, "rb") as f:
-            h.update(f.read())
+        # Full hash is kept in the target's file index; reused while stat is unchanged
+        return target.file_index.hash(path)[:8]
 
-    return h.hexdigest()[:8]
+    # Fallback for backward compatibility
+    return hash_file(Path(path))[:8]
 
 
 def load_repo_map(target: Optional[TargetContext] = None):
@@ -0,0 +1,192 @@
+"""
+Stat-cached file index for a target repository.
+
+Keeps path, size, mtime_ns and full SHA-256 for each file so repeated
+listings and hashes within (and across) pipeline runs avoid re-running
+`git ls-files` and re-reading unchanged files. Persisted in
+.cc/file_index.db inside the target.
+"""
+
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .target import TargetContext
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: Path) -> str:
+    """Full SHA-256 of a file, read in chunks so large files stay off-heap."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class FileIndex:
+    """
+    Per-target index of file stats and content hashes.
+
+    The tracked-file list is re-read from git only when git's own index file
+    changes (a single stat), and a file is re-hashed only when its size or
+    mtime_ns differs from the recorded entry.
+    """
+
+    def __init__(self, target: "TargetContext"):
+        self.target = target
+        self.db_path = target.cc_dir / "file_index.db"
+        self._entries: Dict[str, Tuple[int, int, str]] = {}
+        self._tracked: Optional[List[str]] = None
+        self._git_index_path: Optional[Path] = None
+        self._git_index_mtime: Optional[int] = None
+        self._git_checked = False
+        self._loaded = False
+
+    def _connect(self) -> sqlite3.Connection:
+        self.target.mkdir(".cc")
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                sha256 TEXT NOT NULL
+            )
+        """)
+        return conn
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.db_path.exists():
+            return
+        try:
+            with self._connect() as conn:
+                for path, size, mtime_ns, sha in conn.execute(
+                    "SELECT path, size, mtime_ns, sha256 FROM files"
+                ):
+                    self._entries[path] = (size, mtime_ns, sha)
+        except sqlite3.Error:
+            # A corrupt index is only a cache; start over
+            self._entries = {}
+
+    def _save(self, changed: Dict[str, Tuple[int, int, str]], removed: List[str] = ()):
+        if not changed and not removed:
+            return
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO files (path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(path) DO UPDATE SET
+                        size = excluded.size,
+                        mtime_ns = excluded.mtime_ns,
+                        sha256 = excluded.sha256
+                    """,
+                    [(path, *entry) for path, entry in changed.items()],
+                )
+                conn.executemany(
+                    "DELETE FROM files WHERE path = ?", [(path,) for path in removed]
+                )
+        except sqlite3.Error:
+            pass
+
+    def _git_index(self) -> Optional[Path]:
+        """Location of git's index file, or None outside a git work tree."""
+        if not self._git_checked:
+            self._git_checked = True
+            result = self.target.safe_cmd("git rev-parse --git-path index")
+            if result["code"] == 0 and result["stdout"].strip():
+                self._git_index_path = self.target.root / result["stdout"].strip()
+        return self._git_index_path
+
+    def tracked_files(self) -> Optional[List[str]]:
+        """Relative paths from `git ls-files`, cached until git's index changes."""
+        git_index = self._git_index()
+        if git_index is None:
+            return None
+
+        try:
+            mtime = git_index.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+
+        if self._tracked is None or mtime != self._git_index_mtime:
+            result = self.target.safe_cmd("git ls-files")
+            if result["code"] != 0:
+                return None
+            self._tracked = [
+                line.strip() for line in result["stdout"].splitlines() if line.strip()
+            ]
+            self._git_index_mtime = mtime
+        return self._tracked
+
+    def list_files(self, pattern: str = "**/*.py") -> List[Path]:
+        """Tracked files when in git, else files matching pattern."""
+        tracked = self.tracked_files()
+        if tracked is not None:
+            return [self.target.root / rel for rel in tracked]
+        return list(self.target.root.glob(pattern))
+
+    def hash(self, rel_path: str) -> str:
+        """Full SHA-256 of a file, reusing the stored hash if its stat is unchanged."""
+        self._load()
+        path = self.target.safe_path(rel_path)
+        key = path.relative_to(self.target.root).as_posix()
+
+        st = path.stat()
+        entry = self._entries.get(key)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+
+        entry = (st.st_size, st.st_mtime_ns, hash_file(path))
+        self._entries[key] = entry
+        self._save({key: entry})
+        return entry[2]
+
+    def refresh(self) -> Dict[str, List[str]]:
+        """
+        Bring every listed file's entry up to date.
+
+        Only files whose size or mtime_ns changed are re-hashed; entries for
+        files that disappeared are dropped.
+        """
+        self._load()
+        changed: Dict[str, Tuple[int, int, str]] = {}
+        seen = set()
+
+        for path in self.list_files():
+            key = path.relative_to(self.target.root).as_posix()
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if not os.path.isfile(path):
+                continue
+            seen.add(key)
+            entry = self._entries.get(key)
+            if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+                continue
+            changed[key] = (st.st_size, st.st_mtime_ns, hash_file(path))
+
+        removed = [key for key in self._entries if key not in seen]
+        for key in removed:
+            del self._entries[key]
+        self._entries.update(changed)
+        self._save(changed, removed)
+
+        return {"changed": sorted(changed), "removed": sorted(removed)}
+
+    def entries(self) -> Dict[str, Dict[str, object]]:
+        """Snapshot of indexed files: {path: {size, mtime_ns, sha256}}."""
+        self._load()
+        return {
+            path: {"size": size, "mtime_ns": mtime_ns, "sha256": sha}
+            for path, (size, mtime_ns, sha) in self._entries.items()
+        }
@@ -2,11 +2,14 @@
 Core information gathering module for CodeCompanion dashboard.
 Provides read-only system status, provider configs, and diagnostics.
 """
+
 import os
 import json
 from pathlib import Path
 from .bootstrap import ensure_bootstrap, AGENT_FILES
 from .llm import PROVIDERS
+from .llm_cache import get_completion_cache
+from .tokens import get_token_counter
 from .history import load_run_history, load_error_timeline
 
 
@@ -19,7 +22,11 @@ def get_project_info(project_root: str = ".") -> dict:
     bootstrap_file = cc_dir / "bootstrap.txt"
     agent_pack_file = cc_dir / "agent_pack.json"
 
-    status = "initialized" if bootstrap_file.exists() and agent_pack_file.exists() else "incomplete"
+    status = (
+        "initialized"
+        if bootstrap_file.exists() and agent_pack_file.exists()
+        else "incomplete"
+    )
 
     return {
         "root": str(Path(project_root).resolve()),
@@ -45,11 +52,13 @@ def get_agent_workflow_info(project_root: str = ".") -> dict:
             # Check if it's still a stub
             content = agent_path.read_text()
             is_stub = "This is a placeholder" in content
-            existing_agents.append({
-                "name": agent_file.replace(".md", "").replace("_", " ").title(),
-                "file": agent_file,
-                "is_stub": is_stub,
-            })
+            existing_agents.append(
+                {
+                    "name": agent_file.replace(".md", "").replace("_", " ").title(),
+                    "file": agent_file,
+                    "is_stub": is_stub,
+                }
+            )
         else:
             missing_agents.append(agent_file)
 
@@ -70,17 +79,29 @@ def get_providers_info() -> list:
         api_key_env = config["api_key_env"]
         api_key_set = bool(os.getenv(api_key_env))
 
-        providers_list.append({
-            "name": provider_name,
-            "model": config["model"],
-            "api_key_env": api_key_env,
-            "api_key_set": api_key_set,
-            "base_url": config["base_url"],
-        })
+        providers_list.append(
+            {
+                "name": provider_name,
+                "model": config["model"],
+                "api_key_env": api_key_env,
+                "api_key_set": api_key_set,
+                "base_url": config["base_url"],
+            }
+        )
 
     return providers_list
 
 
+def get_llm_cache_info() -> dict:
+    """Get completion cache configuration and hit/miss counters."""
+    return get_completion_cache().stats()
+
+
+def get_token_calibration_info() -> dict:
+    """Get per-provider token count factors and their error on past responses."""
+    return get_token_counter().calibration.stats()
+
+
 def get_pipeline_status(project_root: str = ".") -> dict:
     """Get pipeline execution status from run history."""
     bootstrap_info = ensure_bootstrap(project_root)
@@ -144,13 +165,15 @@ def get_errors_and_recovery(project_root: str = ".") -> dict:
     # Get recent errors (last 5)
     recent = []
     for error in errors[-5:]:
-        recent.append({
-            "timestamp": error.timestamp,
-            "agent": error.agent or "unknown",
-            "stage": error.stage or "unknown",
-            "message": error.message,
-            "recovered": error.recovered,
-        })
+        recent.append(
+            {
+                "timestamp": error.timestamp,
+                "agent": error.agent or "unknown",
+                "stage": error.stage or "unknown",
+                "message": error.message,
+                "recovered": error.recovered,
+            }
+        )
 
     return {
         "total_errors": total_errors,
@@ -169,22 +192,26 @@ def get_recommendations(project_root: str = ".") -> list:
 
     if missing_keys:
         for provider in missing_keys:
-            recommendations.append({
-                "level": "warning",
-                "message": f"Set {provider['api_key_env']} to use {provider['name']} provider",
-                "action": f"export {provider['api_key_env']}=your-api-key",
-            })
+            recommendations.append(
+                {
+                    "level": "warning",
+                    "message": f"Set {provider['api_key_env']} to use {provider['name']} provider",
+                    "action": f"export {provider['api_key_env']}=your-api-key",
+                }
+            )
 
     # Check agent stubs
     workflow = get_agent_workflow_info(project_root)
     stub_agents = [a for a in workflow["existing_agents"] if a["is_stub"]]
 
     if stub_agents:
-        recommendations.append({
-            "level": "info",
-            "message": f"{len(stub_agents)} agents are still using default stubs",
-            "action": "Replace stubs in .cc/agents/ with your custom agent prompts",
-        })
+        recommendations.append(
+            {
+                "level": "info",
+                "message": f"{len(stub_agents)} agents are still using default stubs",
+                "action": "Replace stubs in .cc/agents/ with your custom agent prompts",
+            }
+        )
 
     return recommendations
 
@@ -195,6 +222,8 @@ def gather_all_info(project_root: str = ".") -> dict:
         "bootstrap": get_project_info(project_root),
         "agent_workflow": get_agent_workflow_info(project_root),
         "providers": get_providers_info(),
+        "llm_cache": get_llm_cache_info(),
+        "token_calibration": get_token_calibration_info(),
         "pipeline": get_pipeline_status(project_root),
         "errors": get_errors_and_recovery(project_root),
         "recommendations": get_recommendations(project_root),
@@ -1,6 +1,8 @@
 import os
 import time
-import httpx
+
+from .llm_cache import get_completion_cache, make_cache_key
+from .tokens import get_token_counter, prompt_text
 
 
 class LLMError(Exception): ...
@@ -35,16 +37,50 @@ def complete(system: str, messages: list, provider: str = "claude", **kwargs):
         raise LLMError(f"Unknown provider: {provider}. Use: {list(PROVIDERS.keys())}")
 
     config = PROVIDERS[provider]
+
+    # Identical requests are answered from the local completion cache
+    cache = get_completion_cache()
+    cache_key = None
+    options = {"temperature": kwargs.get("temperature", 0.2), **kwargs}
+    if cache.should_cache(options["temperature"]):
+        cache_key = make_cache_key(provider, config["model"], system, messages, options)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+    if cache.replay:
+        raise LLMError(
+            f"No recorded response for {provider} request (CC_LLM_REPLAY is set)"
+        )
+
     key = os.getenv(config["api_key_env"])
     if not key:
         raise LLMError(f"{config['api_key_env']} not set for {provider}")
 
     if provider == "claude":
-        return _call_claude(system, messages, key, config, **kwargs)
+        result = _call_claude(system, messages, key, config, **kwargs)
     elif provider == "gpt4":
-        return _call_openai(system, messages, key, config, **kwargs)
+        result = _call_openai(system, messages, key, config, **kwargs)
     elif provider == "gemini":
-        return _call_gemini(system, messages, key, config, **kwargs)
+        result = _call_gemini(system, messages, key, config, **kwargs)
+
+    _record_usage(provider, system, messages, result)
+    if cache_key:
+        cache.put(cache_key, provider, config["model"], result)
+    return result
+
+
+def _record_usage(provider: str, system: str, messages: list, result: dict):
+    """Calibrate local token counts against the tokens the provider billed"""
+    usage = result.get("usage")
+    if not usage:
+        return
+    counter = get_token_counter()
+    counter.record_usage(
+        provider, prompt_text(system, messages), usage.get("input_tokens")
+    )
+    counter.record_usage(
+        provider, result.get("content") or "", usage.get("output_tokens")
+    )
 
 
 def _call_claude(system: str, messages: list, key: str, config: dict, **kwargs):
@@ -93,6 +129,8 @@ def _call_gemini(system: str, messages: list, key: str, config: dict, **kwargs):
 
 
 def _retry_request(url: str, headers: dict, payload: dict, extract_fn):
+    import httpx  # deferred: ~150ms to import, only needed for real calls
+
     backoff = 1.0
     for attempt in range(5):
         try:
@@ -111,13 +149,34 @@ def _retry_request(url: str, headers: dict, payload: dict, extract_fn):
     raise LLMError(f"All retries failed: {last_error}")
 
 
+def _usage(data, block: str, input_key: str, output_key: str):
+    usage = data.get(block) or {}
+    if input_key not in usage:
+        return {}
+    return {
+        "usage": {
+            "input_tokens": usage[input_key],
+            "output_tokens": usage.get(output_key, 0),
+        }
+    }
+
+
 def extract_claude_content(data):
-    return {"content": data["content"][0]["text"]}
+    return {
+        "content": data["content"][0]["text"],
+        **_usage(data, "usage", "input_tokens", "output_tokens"),
+    }
 
 
 def extract_openai_content(data):
-    return data["choices"][0]["message"]
+    return {
+        **data["choices"][0]["message"],
+        **_usage(data, "usage", "prompt_tokens", "completion_tokens"),
+    }
 
 
 def extract_gemini_content(data):
-    return {"content": data["candidates"][0]["content"]["parts"][0]["text"]}
+    return {
+        "content": data["candidates"][0]["content"]["parts"][0]["text"],
+        **_usage(data, "usageMetadata", "promptTokenCount", "candidatesTokenCount"),
+    }
@@ -0,0 +1,244 @@
+"""
+Content-addressed completion cache for codecompanion.llm.complete.
+
+Responses are stored in a local SQLite database keyed by a SHA-256 of the
+canonical request (provider, model, temperature, system, messages and any
+other generation options). Only deterministic (temperature 0) calls are
+cached unless sampled calls are opted in. Configured through environment
+variables:
+
+    CC_LLM_CACHE                 "0" disables the cache (default: enabled)
+    CC_LLM_CACHE_PATH            database path (default: .cc/llm_cache.db)
+    CC_LLM_CACHE_TTL             entry lifetime in seconds (default: 7 days)
+    CC_LLM_CACHE_MAX_ENTRIES     max cached responses before LRU eviction
+    CC_LLM_CACHE_SAMPLED         "1" also caches calls with temperature > 0
+    CC_LLM_REPLAY                "1" serves only recorded responses (offline CI;
+                                 record sampled calls with CC_LLM_CACHE_SAMPLED)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def make_cache_key(
+    provider: str, model: str, system: str, messages: list, options: dict
+) -> str:
+    """Hash the canonical JSON form of a completion request."""
+    canonical = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "system": system,
+            "messages": messages,
+            "options": options,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CompletionCache:
+    """SQLite-backed response cache with TTL and max-size eviction."""
+
+    def __init__(
+        self,
+        path: Path,
+        enabled: bool = True,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_sampled: bool = False,
+        replay: bool = False,
+    ):
+        self.path = Path(path)
+        # Replay mode needs the cache even if caching was switched off
+        self.enabled = enabled or replay
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.cache_sampled = cache_sampled
+        self.replay = replay
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @classmethod
+    def from_env(cls) -> "CompletionCache":
+        return cls(
+            path=Path(os.getenv("CC_LLM_CACHE_PATH", Path(".cc") / "llm_cache.db")),
+            enabled=_env_flag("CC_LLM_CACHE", True),
+            ttl_seconds=int(os.getenv("CC_LLM_CACHE_TTL", DEFAULT_TTL_SECONDS)),
+            max_entries=int(os.getenv("CC_LLM_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+            cache_sampled=_env_flag("CC_LLM_CACHE_SAMPLED", False),
+            replay=_env_flag("CC_LLM_REPLAY", False),
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS completions (
+                    key TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_completions_last_access ON completions(last_access)"
+            )
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_stats (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def should_cache(self, temperature: float) -> bool:
+        if not self.enabled:
+            return False
+        if self.replay:
+            return True
+        # A sampled call asks for a fresh completion each time
+        return self.cache_sampled or temperature == 0
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return a cached response, or None on miss or expiry."""
+        now = time.time()
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT response, created_at FROM completions WHERE key = ?", (key,)
+                ).fetchone()
+
+                # Recorded responses never expire while replaying
+                if row and (self.replay or now - row[1] <= self.ttl_seconds):
+                    conn.execute(
+                        "UPDATE completions SET last_access = ? WHERE key = ?",
+                        (now, key),
+                    )
+                    self._bump(conn, "hits")
+                    return json.loads(row[0])
+
+                self._bump(conn, "misses")
+                return None
+
+    def put(self, key: str, provider: str, model: str, response: dict):
+        """Store a response and evict expired or least recently used entries."""
+        now = time.time()
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT INTO completions (key, provider, model, response, created_at, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET
+                        response = excluded.response,
+                        created_at = excluded.created_at,
+                        last_access = excluded.last_access
+                    """,
+                    (key, provider, model, json.dumps(response), now, now),
+                )
+                conn.execute(
+                    "DELETE FROM completions WHERE created_at < ?",
+                    (now - self.ttl_seconds,),
+                )
+                conn.execute(
+                    """
+                    DELETE FROM completions WHERE key IN (
+                        SELECT key FROM completions ORDER BY last_access DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_entries,),
+                )
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, name: str):
+        conn.execute(
+            """
+            INSERT INTO cache_stats (name, value) VALUES (?, 1)
+            ON CONFLICT(name) DO UPDATE SET value = value + 1
+            """,
+            (name,),
+        )
+
+    def stats(self) -> dict:
+        """Hit/miss counters and size, for `codecompanion --info`."""
+        info = {
+            "enabled": self.enabled,
+            "replay": self.replay,
+            "cache_sampled": self.cache_sampled,
+            "path": str(self.path),
+            "entries": 0,
+            "hits": 0,
+            "misses": 0,
+            "hit_rate": None,
+        }
+        if not self.path.exists():
+            return info
+
+        try:
+            with self._lock, self._connect() as conn:
+                info["entries"] = conn.execute(
+                    "SELECT COUNT(*) FROM completions"
+                ).fetchone()[0]
+                counters = dict(
+                    conn.execute("SELECT name, value FROM cache_stats").fetchall()
+                )
+        except sqlite3.Error:
+            return info
+
+        info["hits"] = counters.get("hits", 0)
+        info["misses"] = counters.get("misses", 0)
+        lookups = info["hits"] + info["misses"]
+        if lookups:
+            info["hit_rate"] = f"{(info['hits'] / lookups * 100):.1f}%"
+        return info
+
+    def clear(self):
+        if not self.path.exists():
+            return
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM completions")
+            conn.execute("DELETE FROM cache_stats")
+
+
+_cache: Optional[CompletionCache] = None
+
+
+def get_completion_cache() -> CompletionCache:
+    """Process-wide cache configured from the environment."""
+    global _cache
+    if _cache is None:
+        _cache = CompletionCache.from_env()
+    return _cache
+
+
+def reset_completion_cache():
+    """Drop the process-wide cache so the next call re-reads the environment."""
+    global _cache
+    _cache = None
@@ -5,6 +5,7 @@ This module provides the TargetContext class, which ensures all file operations,
 subprocess calls, and git operations stay within a designated target directory.
 This is critical for security when CodeCompanion operates on arbitrary repositories.
 """
+
 import os
 import subprocess
 from pathlib import Path
@@ -13,6 +14,7 @@ from typing import List, Optional, Union
 
 class TargetSecurityError(Exception):
     """Raised when a security boundary would be violated."""
+
     pass
 
 
@@ -57,19 +59,16 @@ class TargetContext:
         """
         self._root = Path(target_root).resolve()
         self._validate_target()
+        self._file_index = None
 
     def _validate_target(self) -> None:
         """Validate that the target directory is safe to operate on."""
         # Check if directory exists
         if not self._root.exists():
-            raise TargetSecurityError(
-                f"Target directory does not exist: {self._root}"
-            )
+            raise TargetSecurityError(f"Target directory does not exist: {self._root}")
 
         if not self._root.is_dir():
-            raise TargetSecurityError(
-                f"Target path is not a directory: {self._root}"
-            )
+            raise TargetSecurityError(f"Target path is not a directory: {self._root}")
 
         # Check against forbidden paths
         for forbidden in self.FORBIDDEN_PATHS:
@@ -149,16 +148,16 @@ class TargetContext:
             dict with 'code', 'stdout', 'stderr' keys
         """
         # Force cwd to be our target root
-        kwargs['cwd'] = str(self._root)
-        kwargs['shell'] = True
-        kwargs['text'] = True
-        kwargs.setdefault('capture_output', True)
+        kwargs["cwd"] = str(self._root)
+        kwargs["shell"] = True
+        kwargs["text"] = True
+        kwargs.setdefault("capture_output", True)
 
         result = subprocess.run(cmd, **kwargs)
         return {
             "code": result.returncode,
             "stdout": result.stdout,
-            "stderr": result.stderr
+            "stderr": result.stderr,
         }
 
     def read_file(self, rel_path: Union[str, Path]) -> str:
@@ -172,7 +171,7 @@ class TargetContext:
             File contents as string
         """
         safe_path = self.safe_path(rel_path)
-        with open(safe_path, 'r', encoding='utf-8') as f:
+        with open(safe_path, "r", encoding="utf-8") as f:
             return f.read()
 
     def write_file(self, rel_path: Union[str, Path], content: str) -> None:
@@ -186,7 +185,7 @@ class TargetContext:
         safe_path = self.safe_path(rel_path)
         # Ensure parent directory exists
         safe_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(safe_path, 'w', encoding='utf-8') as f:
+        with open(safe_path, "w", encoding="utf-8") as f:
             f.write(content)
 
     def list_files(self, pattern: str = "**/*.py") -> List[Path]:
@@ -199,17 +198,8 @@ class TargetContext:
         Returns:
             List of absolute paths
         """
-        # First try git ls-files (respects .gitignore)
-        result = self.safe_cmd("git ls-files")
-        if result['code'] == 0:
-            files = []
-            for line in result['stdout'].splitlines():
-                if line.strip():
-                    files.append(self._root / line.strip())
-            return files
-
-        # Fallback to glob
-        return list(self._root.glob(pattern))
+        # git ls-files (respects .gitignore) is cached until git's index changes
+        return self.file_index.list_files(pattern)
 
     def file_exists(self, rel_path: Union[str, Path]) -> bool:
         """Check if a file exists within the target directory."""
@@ -229,6 +219,15 @@ class TargetContext:
         """Get the target root directory."""
         return self._root
 
+    @property
+    def file_index(self):
+        """Stat-cached file index for this target, created on first use."""
+        if self._file_index is None:
+            from .file_index import FileIndex
+
+            self._file_index = FileIndex(self)
+        return self._file_index
+
     @property
     def cc_dir(self) -> Path:
         """Get the .cc directory within the target."""
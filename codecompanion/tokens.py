@@ -0,0 +1,417 @@
+"""
+Local token counting for budgets and routing.
+
+Counts tokens with a byte-level BPE over the merge list bundled in
+defaults/token_merges.txt (trained on the Python standard library by
+scripts/train_token_merges.py) instead of guessing len(text) / 4. Each
+provider's tokenizer differs from ours, so counts are scaled per provider:
+by DEFAULT_FACTORS until enough responses have been seen, then by a factor
+fitted against the ``usage`` fields of real responses (see
+codecompanion.llm.complete). Configured through environment variables:
+
+    CC_TOKEN_CALIBRATION_PATH   calibration file (default: .cc/token_calibration.json)
+
+Whole-text counts are kept in an LRU keyed by a BLAKE2b digest of the text,
+and each distinct pre-token is run through BPE once per process.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_MERGES_PATH = Path(__file__).parent / "defaults" / "token_merges.txt"
+
+TEXT_CACHE_SIZE = 4096
+PIECE_CACHE_SIZE = 65536
+
+# Pieces longer than this (minified blobs, long runs) are counted in slices
+# to keep BPE's quadratic merge loop bounded
+MAX_PIECE_CHARS = 256
+
+# Fitted factors apply after this many responses, within these bounds
+MIN_CALIBRATION_SAMPLES = 5
+FACTOR_BOUNDS = (0.25, 4.0)
+
+# Factors used until then: least-squares fits of each provider's published
+# tokenizer over the "fit" split of tests/data/token_usage.jsonl (recorded
+# by scripts/record_token_usage.py). Gemini publishes no tokenizer file, so
+# it and unknown providers get the mean of the two.
+DEFAULT_FACTORS = {"claude": 0.95, "gpt4": 0.86}
+DEFAULT_FACTOR = 0.9
+
+# Calibration is written at most this often; flush() and exit write the rest
+SAVE_INTERVAL_S = 5.0
+
+# cl100k-style pre-tokenizer: contractions, letter runs with one leading
+# non-alphanumeric, digit groups of up to three, punctuation runs, whitespace
+PRETOKEN_RE = re.compile(
+    r"'(?:[sdmt]|ll|ve|re)"
+    r"|(?:[^\r\n\w]|_)?[^\W\d_]+"
+    r"|\d{1,3}"
+    r"| ?(?:[^\s\w]|_)+[\r\n]*"
+    r"|\s*[\r\n]+"
+    r"|\s+(?!\S)"
+    r"|\s+"
+)
+
+
+def _byte_symbols() -> Tuple[str, ...]:
+    """GPT-2 byte-to-unicode table, so merge files hold no whitespace"""
+    printable = set(range(ord("!"), ord("~") + 1))
+    printable |= set(range(ord("¡"), ord("¬") + 1))
+    printable |= set(range(ord("®"), ord("ÿ") + 1))
+    symbols, extra = [], 0
+    for byte in range(256):
+        if byte in printable:
+            symbols.append(chr(byte))
+        else:
+            symbols.append(chr(256 + extra))
+            extra += 1
+    return tuple(symbols)
+
+
+BYTE_SYMBOLS = _byte_symbols()
+
+
+def provider_for_model(model: Optional[str]) -> Optional[str]:
+    """Calibration provider (claude, gpt4, gemini) for a model name"""
+    name = (model or "").lower()
+    if name.startswith("claude"):
+        return "claude"
+    if name.startswith("gpt"):
+        return "gpt4"
+    if name.startswith("gemini"):
+        return "gemini"
+    return None
+
+
+def prompt_text(system: str, messages: list) -> str:
+    """Flatten a chat request into the text its input tokens are billed for"""
+    parts = [system or ""]
+    for message in messages:
+        content = message.get("content", "")
+        parts.append(content if isinstance(content, str) else json.dumps(content))
+    return "\n".join(parts)
+
+
+class BPETokenizer:
+    """Byte-level BPE over a ranked merge list"""
+
+    def __init__(self, merges_path: Path = DEFAULT_MERGES_PATH):
+        self.merges_path = Path(merges_path)
+        self._ranks: Optional[Dict[Tuple[str, str], int]] = None
+        self._piece_counts: Dict[str, int] = {}
+        self._load_lock = threading.Lock()
+
+    @property
+    def ranks(self) -> Dict[Tuple[str, str], int]:
+        # Loaded on first use so importing the module stays cheap
+        if self._ranks is None:
+            with self._load_lock:
+                if self._ranks is None:
+                    ranks = {}
+                    with open(self.merges_path, encoding="utf-8") as f:
+                        for line in f:
+                            if line.startswith("#") or not line.strip():
+                                continue
+                            left, right = line.split()
+                            ranks[(left, right)] = len(ranks)
+                    self._ranks = ranks
+        return self._ranks
+
+    def _bpe(self, piece: str) -> List[str]:
+        word = [BYTE_SYMBOLS[b] for b in piece.encode("utf-8")]
+        ranks = self.ranks
+        while len(word) > 1:
+            best_rank, pair = None, None
+            for left, right in zip(word, word[1:]):
+                rank = ranks.get((left, right))
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best_rank, pair = rank, (left, right)
+            if pair is None:
+                break
+            merged, out, i = pair[0] + pair[1], [], 0
+            while i < len(word):
+                if i + 1 < len(word) and word[i] == pair[0] and word[i + 1] == pair[1]:
+                    out.append(merged)
+                    i += 2
+                else:
+                    out.append(word[i])
+                    i += 1
+            word = out
+        return word
+
+    def tokenize(self, text: str) -> List[str]:
+        """BPE tokens of the text, as byte-symbol strings"""
+        tokens = []
+        for piece in PRETOKEN_RE.findall(text):
+            for start in range(0, len(piece), MAX_PIECE_CHARS):
+                tokens.extend(self._bpe(piece[start : start + MAX_PIECE_CHARS]))
+        return tokens
+
+    def _count_piece(self, piece: str) -> int:
+        count = sum(
+            len(self._bpe(piece[start : start + MAX_PIECE_CHARS]))
+            for start in range(0, len(piece), MAX_PIECE_CHARS)
+        )
+        if len(self._piece_counts) >= PIECE_CACHE_SIZE:
+            self._piece_counts.clear()
+        self._piece_counts[piece] = count
+        return count
+
+    def count(self, text: str) -> int:
+        """Number of BPE tokens in the text"""
+        piece_counts = self._piece_counts
+        total = 0
+        for piece in PRETOKEN_RE.findall(text):
+            count = piece_counts.get(piece)
+            total += self._count_piece(piece) if count is None else count
+        return total
+
+
+class TokenCalibration:
+    """
+    Per-provider scale factors fitted against reported token usage.
+
+    The factor is the least-squares slope (through the origin) of reported
+    tokens over local counts. Each response is also scored against the
+    estimate made before it was seen, for both the calibrated count and the
+    old len/4 estimate, so accuracy can be read back from stats().
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self._providers: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = 0.0
+        self._load()
+        if self.path is not None:
+            atexit.register(self.flush)
+
+    def _load(self):
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            self._providers = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._providers = {}
+
+    def _save(self):
+        if self.path is None:
+            return
+        self._dirty = False
+        self._last_save = time.monotonic()
+        # Calibration is best-effort; a read-only workspace must not break calls
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self._providers, indent=2), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    def flush(self):
+        """Write observations not yet saved"""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    @staticmethod
+    def _fit(provider: Optional[str], entry: Optional[Dict[str, float]]) -> float:
+        if (
+            not entry
+            or entry["samples"] < MIN_CALIBRATION_SAMPLES
+            or not entry["sum_xx"]
+        ):
+            return DEFAULT_FACTORS.get(provider, DEFAULT_FACTOR)
+        low, high = FACTOR_BOUNDS
+        return min(high, max(low, entry["sum_xy"] / entry["sum_xx"]))
+
+    def factor(self, provider: Optional[str]) -> float:
+        """Multiplier from local counts to the provider's tokens"""
+        entry = self._providers.get(provider) if provider else None
+        return self._fit(provider, entry)
+
+    def record(self, provider: str, counted: int, actual: int, chars: int):
+        """Add one (local count, reported tokens) observation"""
+        if not provider or counted <= 0 or actual <= 0:
+            return
+        with self._lock:
+            entry = self._providers.setdefault(
+                provider,
+                {
+                    "samples": 0,
+                    "sum_xy": 0.0,
+                    "sum_xx": 0.0,
+                    "abs_error": 0.0,
+                    "char_abs_error": 0.0,
+                },
+            )
+            estimate = counted * self._fit(provider, entry)
+            entry["abs_error"] += abs(estimate - actual) / actual
+            entry["char_abs_error"] += abs(max(1, chars // 4) - actual) / actual
+            entry["samples"] += 1
+            entry["sum_xy"] += counted * actual
+            entry["sum_xx"] += counted * counted
+            self._dirty = True
+            if time.monotonic() - self._last_save >= SAVE_INTERVAL_S:
+                self._save()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Factor and mean absolute percentage errors per provider"""
+        with self._lock:
+            return {
+                provider: {
+                    "samples": int(entry["samples"]),
+                    "factor": round(self._fit(provider, entry), 4),
+                    "mape": round(entry["abs_error"] / entry["samples"] * 100, 1),
+                    "char_estimate_mape": round(
+                        entry["char_abs_error"] / entry["samples"] * 100, 1
+                    ),
+                }
+                for provider, entry in self._providers.items()
+                if entry["samples"]
+            }
+
+
+class TokenCounter:
+    """Calibrated token counts with an LRU of whole-text results"""
+
+    def __init__(
+        self,
+        tokenizer: Optional[BPETokenizer] = None,
+        calibration: Optional[TokenCalibration] = None,
+        cache_size: int = TEXT_CACHE_SIZE,
+    ):
+        self.tokenizer = tokenizer or BPETokenizer()
+        self.calibration = calibration or TokenCalibration()
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _digest(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def _scale(self, raw: int, provider: Optional[str]) -> int:
+        if raw == 0:
+            return 0
+        return max(1, round(raw * self.calibration.factor(provider)))
+
+    def _store(self, counts: Dict[bytes, int]):
+        with self._lock:
+            for digest, raw in counts.items():
+                self._cache[digest] = raw
+                self._cache.move_to_end(digest)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def count_raw(self, text: str) -> int:
+        """Uncalibrated BPE count"""
+        if not text:
+            return 0
+        digest = self._digest(text)
+        with self._lock:
+            raw = self._cache.get(digest)
+            if raw is not None:
+                self._cache.move_to_end(digest)
+                self.hits += 1
+                return raw
+            self.misses += 1
+        raw = self.tokenizer.count(text)
+        self._store({digest: raw})
+        return raw
+
+    def count(self, text: str, provider: Optional[str] = None) -> int:
+        """Token count, scaled to the provider's tokenizer when calibrated"""
+        return self._scale(self.count_raw(text), provider)
+
+    def count_batch(
+        self, texts: Iterable[str], provider: Optional[str] = None
+    ) -> List[int]:
+        """Counts for many texts, with one cache pass and duplicates counted once"""
+        texts = list(texts)
+        digests = [self._digest(text) if text else None for text in texts]
+        raw: Dict[bytes, int] = {}
+        missing: Dict[bytes, str] = {}
+        with self._lock:
+            for text, digest in zip(texts, digests):
+                if digest is None or digest in raw or digest in missing:
+                    continue
+                cached = self._cache.get(digest)
+                if cached is None:
+                    missing[digest] = text
+                    self.misses += 1
+                else:
+                    self._cache.move_to_end(digest)
+                    raw[digest] = cached
+                    self.hits += 1
+
+        computed = {
+            digest: self.tokenizer.count(text) for digest, text in missing.items()
+        }
+        if computed:
+            self._store(computed)
+            raw.update(computed)
+        return [self._scale(raw[d], provider) if d else 0 for d in digests]
+
+    def record_usage(self, provider: str, text: str, actual_tokens: Optional[int]):
+        """Calibrate the provider's factor from a response's reported tokens"""
+        if text and actual_tokens:
+            self.calibration.record(
+                provider, self.count_raw(text), int(actual_tokens), len(text)
+            )
+
+    def stats(self) -> dict:
+        """Cache counters and per-provider calibration, for `codecompanion --info`"""
+        lookups = self.hits + self.misses
+        return {
+            "cached_texts": len(self._cache),
+            "cached_pieces": len(self.tokenizer._piece_counts),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": f"{(self.hits / lookups * 100):.1f}%" if lookups else None,
+            "calibration": self.calibration.stats(),
+        }
+
+
+_counter: Optional[TokenCounter] = None
+
+
+def get_token_counter() -> TokenCounter:
+    """Process-wide counter calibrated from the environment's calibration file"""
+    global _counter
+    if _counter is None:
+        path = os.getenv(
+            "CC_TOKEN_CALIBRATION_PATH", Path(".cc") / "token_calibration.json"
+        )
+        _counter = TokenCounter(calibration=TokenCalibration(path))
+    return _counter
+
+
+def reset_token_counter():
+    """Drop the process-wide counter so the next call re-reads the environment"""
+    global _counter
+    _counter = None
+
+
+def count_tokens(text: str, provider: Optional[str] = None) -> int:
+    """Calibrated token count for text sent to (or returned by) a provider"""
+    return get_token_counter().count(text, provider)
+
+
+def count_tokens_batch(
+    texts: Iterable[str], provider: Optional[str] = None
+) -> List[int]:
+    """Calibrated token counts for many texts"""
+    return get_token_counter().count_batch(texts, provider)
@@ -5,9 +5,7 @@ Provides event-sourced orchestration, data-driven model routing, and structured
 artifact handling for coordinated multi-agent workflows.
 """
 
-from .orchestrator import *
-from .router import *
-from .artifacts import *
+import importlib
 
 __version__ = "1.0.0"
 __all__ = [
@@ -25,3 +23,24 @@ __all__ = [
     "ArtifactHandler",
     "ValidationResult",
 ]
+
+# Submodules are imported on first attribute access (PEP 562) so that
+# importing a single module such as core.memory does not pull in pydantic
+# models, the router and the artifact validators.
+_EXPORT_MODULES = (".orchestrator", ".router", ".artifacts")
+
+
+def __getattr__(name):
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    for module_name in _EXPORT_MODULES:
+        module = importlib.import_module(module_name, __name__)
+        if hasattr(module, name):
+            value = getattr(module, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
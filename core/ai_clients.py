@@ -5,8 +5,9 @@ Provides unified interfaces for OpenAI, Anthropic, and Google AI APIs
 with structured communication protocols and error handling.
 """
 
+import functools
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 import json
 
@@ -22,6 +23,38 @@ from settings import settings
 logger = logging.getLogger(__name__)
 
 
+def _tracks_load(model: ModelType):
+    """Report each call's start and outcome to the router's live load telemetry"""
+
+    def decorate(call):
+        @functools.wraps(call)
+        async def tracked(self, agent_input: AgentInput, agent_type: AgentType):
+            if self.router is None:
+                return await call(self, agent_input, agent_type)
+
+            started = self.router.record_request_start(model)
+            output = None
+            try:
+                output = await call(self, agent_input, agent_type)
+                return output
+            finally:
+                if output is None:
+                    error = "request raised"
+                else:
+                    error = (output.artifact or {}).get("error", "")
+                self.router.record_request_end(
+                    model,
+                    started,
+                    tokens=(output.tokens_consumed or 0) if output else 0,
+                    success=not error,
+                    error_message=str(error),
+                )
+
+        return tracked
+
+    return decorate
+
+
 class AIClientConfig(BaseModel):
     """Configuration for AI clients using strict settings"""
 
@@ -190,8 +223,10 @@ Format your response as JSON with these fields:
 class RealAIClients:
     """Real AI API clients for multi-agent execution"""
 
-    def __init__(self, config: Optional[AIClientConfig] = None):
+    def __init__(self, config: Optional[AIClientConfig] = None, router: Any = None):
         self.config = config or AIClientConfig()
+        # DataDrivenRouter whose load balancing is fed by these calls
+        self.router = router
 
         # Initialize clients
         self.openai_client = None
@@ -221,6 +256,7 @@ class RealAIClients:
         except Exception as e:
             logger.error(f"Failed to initialize AI clients: {e}")
 
+    @_tracks_load(ModelType.CLAUDE_SONNET)
     async def call_claude_agent(
         self, agent_input: AgentInput, agent_type: AgentType
     ) -> AgentOutput:
@@ -299,6 +335,7 @@ class RealAIClients:
                 tokens_consumed=0,
             )
 
+    @_tracks_load(ModelType.GPT4O)
     async def call_gpt4_agent(
         self, agent_input: AgentInput, agent_type: AgentType
     ) -> AgentOutput:
@@ -384,6 +421,7 @@ class RealAIClients:
                 tokens_consumed=0,
             )
 
+    @_tracks_load(ModelType.GEMINI_FLASH)
     async def call_gemini_agent(
         self, agent_input: AgentInput, agent_type: AgentType
     ) -> AgentOutput:
@@ -7,8 +7,9 @@ semantic validation, and structured handoff protocols between agents.
 
 import json
 import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from uuid import uuid4
 from pydantic import BaseModel, Field, ValidationError
 
@@ -22,10 +23,24 @@ from schemas.artifact_schemas import (
     RunbookSchema,
 )
 from core.artifacts import ArtifactValidator, ValidationResult
+from storage.artifact_store import (
+    ArtifactStore,
+    canonical_json,
+    content_digest,
+    split_metadata,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Confidence metrics memoised per (content hash, type, agent, validation scores)
+CONFIDENCE_MEMO_SIZE = 4096
+
+
+def _schema_name(artifact: ArtifactBase) -> str:
+    """Schema name of an artifact; ArtifactType values match the schema keys"""
+    return getattr(artifact.artifact_type, "value", artifact.artifact_type)
+
 
 class ArtifactLineage(BaseModel):
     """Tracks the lineage and evolution of artifacts"""
@@ -129,9 +144,10 @@ class TypedArtifactHandler:
     - Semantic similarity checking
     - Domain-specific quality assessment
     - Conflict detection and resolution
+    - Optional content-addressed persistence (pass `db_path`)
     """
 
-    def __init__(self):
+    def __init__(self, db_path: Optional[str] = None):
         self.artifact_schemas = {
             "SpecDoc": SpecDocSchema,
             "DesignDoc": DesignDocSchema,
@@ -154,11 +170,19 @@ class TypedArtifactHandler:
         self.artifact_lineage: Dict[str, ArtifactLineage] = {}
         self.artifact_store: Dict[str, ArtifactBase] = {}
 
+        # Durable store; the dicts above act as its in-process cache
+        self.content_store = ArtifactStore(db_path) if db_path else None
+
+        self._confidence_memo: "OrderedDict[Tuple, ConfidenceMetrics]" = OrderedDict()
+        self.confidence_memo_hits = 0
+        self.confidence_memo_misses = 0
+
     def create_artifact(
         self,
         agent_output: Dict[str, Any],
         artifact_type: str,
         agent_id: str = "unknown",
+        parent_ids: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Create and validate a typed artifact from agent output.
@@ -167,6 +191,7 @@ class TypedArtifactHandler:
             agent_output: Raw output from agent
             artifact_type: Type of artifact to create
             agent_id: ID of the creating agent
+            parent_ids: IDs of artifacts this one was derived from
 
         Returns:
             Dict containing the validated artifact and metadata
@@ -182,23 +207,11 @@ class TypedArtifactHandler:
         artifact_id = str(uuid4())
         creation_time = datetime.now()
 
-        # Map artifact type names
-        artifact_type_mapping = {
-            "SpecDoc": "SPEC_DOC",
-            "DesignDoc": "DESIGN_DOC",
-            "CodePatch": "CODE_PATCH",
-            "TestPlan": "TEST_PLAN",
-            "EvalReport": "EVAL_REPORT",
-            "Runbook": "RUNBOOK",
-        }
-
-        mapped_type = artifact_type_mapping.get(artifact_type, artifact_type.upper())
-
-        # Prepare artifact data
+        # Prepare artifact data; schema names double as ArtifactType values
         artifact_data = {
             **agent_output,
             "artifact_id": artifact_id,
-            "artifact_type": mapped_type,
+            "artifact_type": artifact_type,
             "created_at": creation_time,
             "created_by": agent_id,
             "version": "1.0.0",
@@ -213,22 +226,39 @@ class TypedArtifactHandler:
                 artifact.dict(), validator_id=f"typed_handler_{agent_id}"
             )
 
-            # Calculate confidence metrics
-            confidence_metrics = self._calculate_confidence_metrics(
-                artifact, artifact_type, agent_id, validation_result
+            body, semantic_hash = self._semantic_body(artifact)
+
+            # Calculate confidence metrics (memoised on unchanged content)
+            confidence_metrics = self._memoized_confidence_metrics(
+                semantic_hash, artifact, artifact_type, agent_id, validation_result
             )
 
             # Create lineage tracking
+            parent_ids = list(parent_ids or [])
             lineage = ArtifactLineage(
                 artifact_id=artifact_id,
+                parent_artifacts=parent_ids,
                 creation_agent=agent_id,
-                semantic_hash=self._generate_semantic_hash(artifact),
+                semantic_hash=semantic_hash,
                 version_chain=[artifact_id],
             )
 
             # Store artifact and lineage
             self.artifact_store[artifact_id] = artifact
             self.artifact_lineage[artifact_id] = lineage
+            for parent_id in parent_ids:
+                parent_lineage = self.artifact_lineage.get(parent_id)
+                if parent_lineage and artifact_id not in parent_lineage.child_artifacts:
+                    parent_lineage.child_artifacts.append(artifact_id)
+            if self.content_store:
+                self.content_store.put(
+                    artifact_type,
+                    artifact.dict(),
+                    lineage.dict(),
+                    body,
+                    semantic_hash,
+                    parent_ids,
+                )
 
             # Generate impact analysis
             impact_analysis = self._analyze_impact(artifact, artifact_type)
@@ -269,6 +299,38 @@ class TypedArtifactHandler:
                 "raw_output": agent_output,
             }
 
+    def _memoized_confidence_metrics(
+        self,
+        semantic_hash: str,
+        artifact: ArtifactBase,
+        artifact_type: str,
+        agent_id: str,
+        validation_result: ValidationResult,
+    ) -> ConfidenceMetrics:
+        """Reuse confidence metrics computed for identical content"""
+
+        key = (
+            semantic_hash,
+            artifact_type,
+            agent_id,
+            validation_result.completeness_score,
+            validation_result.quality_score,
+        )
+        cached = self._confidence_memo.get(key)
+        if cached is not None:
+            self._confidence_memo.move_to_end(key)
+            self.confidence_memo_hits += 1
+            return cached.copy()
+
+        self.confidence_memo_misses += 1
+        metrics = self._calculate_confidence_metrics(
+            artifact, artifact_type, agent_id, validation_result
+        )
+        self._confidence_memo[key] = metrics.copy()
+        if len(self._confidence_memo) > CONFIDENCE_MEMO_SIZE:
+            self._confidence_memo.popitem(last=False)
+        return metrics
+
     def _calculate_confidence_metrics(
         self,
         artifact: ArtifactBase,
@@ -417,20 +479,18 @@ class TypedArtifactHandler:
 
         return 0.0
 
-    def _generate_semantic_hash(self, artifact: ArtifactBase) -> str:
-        """Generate a semantic hash for change detection"""
+    def _semantic_body(self, artifact: ArtifactBase) -> Tuple[bytes, str]:
+        """Canonical JSON of the semantic content and its stable hash"""
 
         # Extract semantic content (exclude metadata)
-        semantic_content = artifact.dict()
-        metadata_keys = {"artifact_id", "created_at", "created_by", "version"}
+        _, semantic_dict = split_metadata(artifact.dict())
 
-        semantic_dict = {
-            k: v for k, v in semantic_content.items() if k not in metadata_keys
-        }
+        body = canonical_json(semantic_dict)
+        return body, content_digest(body)
 
-        # Create deterministic hash
-        content_str = json.dumps(semantic_dict, sort_keys=True)
-        return str(hash(content_str))
+    def _generate_semantic_hash(self, artifact: ArtifactBase) -> str:
+        """Generate a semantic hash for change detection"""
+        return self._semantic_body(artifact)[1]
 
     def _analyze_impact(
         self, artifact: ArtifactBase, artifact_type: str
@@ -485,12 +545,34 @@ class TypedArtifactHandler:
 
         return impact
 
+    def _load_artifact(self, artifact_id: str) -> bool:
+        """Pull an artifact and its lineage from the durable store into memory"""
+        if not self.content_store:
+            return False
+        stored = self.content_store.get(artifact_id)
+        if stored is None:
+            return False
+        self._cache_stored(*stored)
+        return True
+
+    def _cache_stored(
+        self, schema_name: str, record: Dict[str, Any], lineage: Dict[str, Any]
+    ) -> ArtifactBase:
+        artifact = self.artifact_schemas[schema_name](**record)
+        self.artifact_store[artifact.artifact_id] = artifact
+        self.artifact_lineage[artifact.artifact_id] = ArtifactLineage(**lineage)
+        return artifact
+
     def get_artifact(self, artifact_id: str) -> Optional[ArtifactBase]:
         """Retrieve an artifact by ID"""
+        if artifact_id not in self.artifact_store:
+            self._load_artifact(artifact_id)
         return self.artifact_store.get(artifact_id)
 
     def get_lineage(self, artifact_id: str) -> Optional[ArtifactLineage]:
         """Get lineage information for an artifact"""
+        if artifact_id not in self.artifact_lineage:
+            self._load_artifact(artifact_id)
         return self.artifact_lineage.get(artifact_id)
 
     def update_artifact(
@@ -498,7 +580,7 @@ class TypedArtifactHandler:
     ) -> Dict[str, Any]:
         """Update an existing artifact with change tracking"""
 
-        if artifact_id not in self.artifact_store:
+        if self.get_artifact(artifact_id) is None:
             raise ValueError(f"Artifact {artifact_id} not found")
 
         current_artifact = self.artifact_store[artifact_id]
@@ -518,7 +600,7 @@ class TypedArtifactHandler:
         updated_artifact = artifact_class(**updated_data)
 
         # Update semantic hash and lineage
-        new_semantic_hash = self._generate_semantic_hash(updated_artifact)
+        body, new_semantic_hash = self._semantic_body(updated_artifact)
 
         lineage.add_modification(
             agent_id=agent_id,
@@ -530,6 +612,14 @@ class TypedArtifactHandler:
 
         # Store updated artifact
         self.artifact_store[artifact_id] = updated_artifact
+        if self.content_store:
+            self.content_store.put(
+                _schema_name(updated_artifact),
+                updated_artifact.dict(),
+                lineage.dict(),
+                body,
+                new_semantic_hash,
+            )
 
         logger.info(f"Updated artifact {artifact_id} by {agent_id}")
 
@@ -548,9 +638,27 @@ class TypedArtifactHandler:
     ) -> List[Dict[str, Any]]:
         """List artifacts with optional filtering"""
 
+        if self.content_store:
+            artifacts = []
+            # Stored types are schema names, e.g. "SpecDoc"
+            schema_names = {name.lower(): name for name in self.artifact_schemas}
+            schema_name = schema_names.get((artifact_type or "").lower(), artifact_type)
+            for stored in self.content_store.list(schema_name, agent_id):
+                artifact = self._cache_stored(*stored)
+                artifacts.append(
+                    {
+                        "artifact": artifact.dict(),
+                        "lineage": self.artifact_lineage[artifact.artifact_id].dict(),
+                    }
+                )
+            return artifacts
+
         artifacts = []
         for artifact_id, artifact in self.artifact_store.items():
-            if artifact_type and artifact.artifact_type.value != artifact_type.lower():
+            if (
+                artifact_type
+                and artifact.artifact_type.lower() != artifact_type.lower()
+            ):
                 continue
             if agent_id and artifact.created_by != agent_id:
                 continue
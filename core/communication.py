@@ -2,8 +2,12 @@
 Agent communication protocols and message handling
 """
 
+import asyncio
+import heapq
+import itertools
 import uuid
-from typing import Dict, List, Any, Callable
+from collections import deque
+from typing import Deque, Dict, List, Any, Callable, Optional
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -73,37 +77,62 @@ class Message:
 
 
 class MessageQueue:
-    """Message queue for handling agent communications"""
+    """Priority message queue for handling agent communications.
+
+    Messages live in a binary heap ordered by (priority desc, arrival order),
+    so enqueue and dequeue are O(log n). Removal marks the heap entry dead
+    and it is skipped when it surfaces (lazy deletion). Per-recipient heaps
+    let an agent pull its own messages without scanning everyone else's.
+    """
+
+    # Heap entry layout: [-priority, sequence, message, alive]
+    _PRIORITY, _SEQ, _MESSAGE, _ALIVE = range(4)
 
     def __init__(self, max_size: int = 1000):
         self.max_size = max_size
-        self.messages: List[Message] = []
         self.handlers: Dict[MessageType, List[Callable]] = {}
         self.subscribers: Dict[str, List[Callable]] = {}
 
-    def add_message(self, message: Message) -> bool:
-        """Add message to queue"""
-        if len(self.messages) >= self.max_size:
-            # Remove oldest low priority messages
-            self.messages = [
-                m for m in self.messages if m.priority != MessagePriority.LOW
-            ]
+        self._heap: List[list] = []
+        self._recipient_heaps: Dict[str, List[list]] = {}
+        # Arrival-ordered entries per priority, used to pick eviction victims
+        self._by_priority: Dict[MessagePriority, Deque[list]] = {
+            priority: deque() for priority in MessagePriority
+        }
+        self._live: Dict[str, list] = {}
+        self._sequence = itertools.count()
+        self._dead = 0
+        self._waiters: Dict[Optional[str], List[asyncio.Future]] = {}
 
-            if len(self.messages) >= self.max_size:
-                logger.warning("Message queue full, dropping oldest message")
-                self.messages.pop(0)
+    @property
+    def messages(self) -> List[Message]:
+        """Snapshot of queued messages in delivery order"""
+        return [entry[self._MESSAGE] for entry in sorted(self._live.values())]
 
-        # Insert message based on priority
-        inserted = False
-        for i, existing_msg in enumerate(self.messages):
-            if message.priority.value > existing_msg.priority.value:
-                self.messages.insert(i, message)
-                inserted = True
-                break
+    def __len__(self) -> int:
+        return len(self._live)
 
-        if not inserted:
-            self.messages.append(message)
+    def add_message(self, message: Message) -> bool:
+        """Add message to queue"""
+        if message.message_id in self._live:
+            self._discard(self._live[message.message_id])
+
+        if len(self._live) >= self.max_size:
+            # Drop the oldest message of the lowest priority present
+            victim = self._eviction_candidate()
+            if victim is not None:
+                logger.warning(
+                    f"Message queue full, dropping message {victim[self._MESSAGE].message_id}"
+                )
+                self._discard(victim)
+
+        entry = [-message.priority.value, next(self._sequence), message, True]
+        self._live[message.message_id] = entry
+        heapq.heappush(self._heap, entry)
+        heapq.heappush(self._recipient_heaps.setdefault(message.recipient, []), entry)
+        self._by_priority[message.priority].append(entry)
 
+        self._wake_waiters(message.recipient)
         logger.debug(f"Added message {message.message_id} to queue")
         return True
 
@@ -111,26 +140,137 @@ class MessageQueue:
         self, recipient: str = None, message_type: MessageType = None
     ) -> List[Message]:
         """Get messages from queue with optional filtering"""
-        messages = self.messages.copy()
-
         if recipient:
-            messages = [
-                m for m in messages if m.recipient == recipient or m.recipient == "all"
+            entries = [
+                entry
+                for key in {recipient, "all"}
+                for entry in self._recipient_heaps.get(key, [])
+                if entry[self._ALIVE]
             ]
+        else:
+            entries = list(self._live.values())
+
+        entries.sort()
+        messages = [entry[self._MESSAGE] for entry in entries]
 
         if message_type:
             messages = [m for m in messages if m.message_type == message_type]
 
         return messages
 
+    def pop_message(self, recipient: str = None) -> Optional[Message]:
+        """Remove and return the next message, optionally for one recipient"""
+        if recipient is None:
+            entry = self._peek(self._heap)
+        else:
+            # Messages addressed to "all" compete with the recipient's own
+            candidates = [
+                e
+                for e in (
+                    self._peek(self._recipient_heaps.get(recipient)),
+                    self._peek(self._recipient_heaps.get("all")),
+                )
+                if e is not None
+            ]
+            entry = min(candidates) if candidates else None
+
+        if entry is None:
+            return None
+        self._discard(entry)
+        return entry[self._MESSAGE]
+
+    async def get(
+        self, recipient: str = None, timeout: Optional[float] = None
+    ) -> Optional[Message]:
+        """Wait for the next message instead of polling.
+
+        Returns None if ``timeout`` seconds pass with nothing to deliver.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while True:
+            message = self.pop_message(recipient)
+            if message is not None:
+                return message
+
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return None
+
+            waiter = loop.create_future()
+            self._waiters.setdefault(recipient, []).append(waiter)
+            try:
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                return None
+            finally:
+                waiters = self._waiters.get(recipient, [])
+                if waiter in waiters:
+                    waiters.remove(waiter)
+
     def remove_message(self, message_id: str) -> bool:
         """Remove message from queue"""
-        for i, message in enumerate(self.messages):
-            if message.message_id == message_id:
-                self.messages.pop(i)
-                logger.debug(f"Removed message {message_id} from queue")
-                return True
-        return False
+        entry = self._live.get(message_id)
+        if entry is None:
+            return False
+        self._discard(entry)
+        logger.debug(f"Removed message {message_id} from queue")
+        return True
+
+    def _discard(self, entry: list):
+        """Lazily delete an entry; it is skipped when it reaches a heap top"""
+        entry[self._ALIVE] = False
+        self._live.pop(entry[self._MESSAGE].message_id, None)
+        self._dead += 1
+        if self._dead > 64 and self._dead > len(self._live):
+            self._compact()
+
+    def _peek(self, heap: Optional[List[list]]) -> Optional[list]:
+        while heap and not heap[0][self._ALIVE]:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def _eviction_candidate(self) -> Optional[list]:
+        for priority in sorted(MessagePriority, key=lambda p: p.value):
+            bucket = self._by_priority[priority]
+            while bucket and not bucket[0][self._ALIVE]:
+                bucket.popleft()
+            if bucket:
+                return bucket[0]
+        return None
+
+    def _compact(self):
+        """Rebuild the heaps once dead entries outnumber live ones"""
+        live = list(self._live.values())
+        self._heap = live[:]
+        heapq.heapify(self._heap)
+
+        self._recipient_heaps = {}
+        for entry in live:
+            self._recipient_heaps.setdefault(entry[self._MESSAGE].recipient, []).append(
+                entry
+            )
+        for heap in self._recipient_heaps.values():
+            heapq.heapify(heap)
+
+        for priority, bucket in self._by_priority.items():
+            self._by_priority[priority] = deque(e for e in bucket if e[self._ALIVE])
+        self._dead = 0
+
+    def _wake_waiters(self, recipient: str):
+        if not self._waiters:
+            return
+        if recipient == "all":
+            keys = list(self._waiters)
+        else:
+            keys = [recipient, None]
+
+        for key in keys:
+            for waiter in self._waiters.pop(key, []):
+                if not waiter.done():
+                    # add_message may be called from outside the waiter's loop
+                    waiter.get_loop().call_soon_threadsafe(_resolve_waiter, waiter)
 
     def register_handler(self, message_type: MessageType, handler: Callable):
         """Register handler for specific message type"""
@@ -157,6 +297,11 @@ class MessageQueue:
                 logger.error(f"Error processing message {message.message_id}: {e}")
 
 
+def _resolve_waiter(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
 class AgentCommunication:
     """Central communication system for agent interactions"""
 
@@ -409,7 +554,7 @@ class AgentCommunication:
             "handoffs_completed": len(self.handoff_history),
             "broadcast_subscribers": len(self.broadcast_subscribers),
             "most_active_conversations": most_active,
-            "queue_size": len(self.message_queue.messages),
+            "queue_size": len(self.message_queue),
         }
 
     def cleanup_old_messages(self, days_old: int = 7):
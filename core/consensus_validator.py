@@ -5,18 +5,30 @@ This module implements consensus-based validation using multiple AI models
 with domain-specific expertise weighting and statistical significance testing.
 """
 
+import asyncio
+import hashlib
 import logging
+import time
+import weakref
 import numpy as np
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, List, Any, Optional, Tuple
 from uuid import uuid4
+from scipy import sparse
 from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
 
 logger = logging.getLogger(__name__)
 
+# Validation texts whose term vectors are kept between rounds
+TEXT_VECTOR_CACHE_SIZE = 4096
+# Validation rounds kept for latency and fan-out statistics
+ROUND_METRICS_HISTORY = 1000
+
 
 class ValidationDomain(str, Enum):
     """Domain types for specialized validation"""
@@ -110,11 +122,36 @@ class ConsensusValidator:
         self.min_models_required = 2
         self.significance_threshold = 0.05
 
-        # Text similarity analyzer
-        self.vectorizer = TfidfVectorizer(
-            max_features=1000, stop_words="english", ngram_range=(1, 2)
+        # Per-provider concurrency limits for fanned-out model validations
+        self.model_providers = {
+            "gpt-4": "openai",
+            "claude": "anthropic",
+            "gemini": "google",
+        }
+        self.provider_concurrency = {"openai": 4, "anthropic": 4, "google": 4}
+        self.default_provider_concurrency = 2
+        self._provider_semaphores: "weakref.WeakKeyDictionary" = (
+            weakref.WeakKeyDictionary()
         )
 
+        # Seconds a validation round waits for outstanding models
+        self.round_timeout = 30.0
+        # Stop waiting once the outstanding votes can no longer flip the outcome
+        self.quorum_early_exit = True
+        self.round_metrics: Deque[Dict[str, Any]] = deque(maxlen=ROUND_METRICS_HISTORY)
+
+        # Text similarity analyzer: term counts are cached by content hash and
+        # IDF weighting is applied per round over the texts being compared
+        self.vectorizer = HashingVectorizer(
+            stop_words="english",
+            ngram_range=(1, 2),
+            alternate_sign=False,
+            norm=None,
+        )
+        self._text_vector_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self.text_vector_cache_hits = 0
+        self.text_vector_cache_misses = 0
+
         # Validation history for learning
         self.validation_history: List[ConsensusResult] = []
 
@@ -152,7 +189,9 @@ class ConsensusValidator:
         )
 
         # Get model validations
-        model_validations = await self._get_model_validations(artifact, domain)
+        model_validations, round_info = await self._run_validation_round(
+            artifact, domain, consensus_method
+        )
 
         if len(model_validations) < self.min_models_required:
             raise ValueError(
@@ -166,6 +205,13 @@ class ConsensusValidator:
 
         # Calculate processing time
         consensus_result.processing_time = (datetime.now() - start_time).total_seconds()
+        consensus_result.statistical_metrics.update(
+            {
+                "round_latency_s": round_info["round_latency_s"],
+                "fan_out": float(round_info["fan_out"]),
+                "responses": float(round_info["responses"]),
+            }
+        )
 
         # Store in validation history
         self.validation_history.append(consensus_result)
@@ -179,22 +225,206 @@ class ConsensusValidator:
         return consensus_result
 
     async def _get_model_validations(
-        self, artifact: Dict[str, Any], domain: ValidationDomain
+        self,
+        artifact: Dict[str, Any],
+        domain: ValidationDomain,
+        consensus_method: Optional[ConsensusMethod] = None,
     ) -> List[ModelValidation]:
         """Get validation results from multiple models"""
 
+        model_validations, _ = await self._run_validation_round(
+            artifact, domain, consensus_method
+        )
+        return model_validations
+
+    async def _run_validation_round(
+        self,
+        artifact: Dict[str, Any],
+        domain: ValidationDomain,
+        consensus_method: Optional[ConsensusMethod] = None,
+    ) -> Tuple[List[ModelValidation], Dict[str, Any]]:
+        """
+        Fan out validations to every model weighted for the domain.
+
+        Models run concurrently, bounded per provider. The round ends when all
+        models have answered, when the round deadline passes, or (with quorum
+        early exit) when the outstanding votes can no longer change the outcome;
+        unfinished validations are cancelled.
+        """
+
         available_models = list(self.domain_weights.get(domain, {}).keys())
-        model_validations = []
+        start = time.perf_counter()
+        deadline = start + self.round_timeout
+
+        tasks = {
+            asyncio.create_task(
+                self._validate_with_model(artifact, model_name, domain)
+            ): model_name
+            for model_name in available_models
+        }
+        pending = set(tasks)
+        model_validations: List[ModelValidation] = []
+        model_latencies: Dict[str, float] = {}
+        decided: Optional[bool] = None
 
-        # Simulate model validations (in real implementation, would call actual models)
-        for model_name in available_models:
-            validation = await self._simulate_model_validation(
-                artifact, model_name, domain
+        try:
+            while pending:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    model_latencies[tasks[task]] = time.perf_counter() - start
+                    validation = task.result()
+                    if validation:
+                        model_validations.append(validation)
+
+                if pending and self.quorum_early_exit:
+                    decided = self._decided_outcome(
+                        domain,
+                        consensus_method,
+                        model_validations,
+                        [tasks[task] for task in pending],
+                    )
+                    if decided is not None:
+                        break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        unfinished = sorted(tasks[task] for task in pending)
+        if unfinished and decided is None:
+            logger.warning(
+                f"Validation round for {domain.value} timed out waiting for {unfinished}"
             )
-            if validation:
-                model_validations.append(validation)
 
-        return model_validations
+        # Keep the configured model order regardless of completion order
+        order = {model_name: i for i, model_name in enumerate(available_models)}
+        model_validations.sort(key=lambda v: order[v.model_name])
+
+        round_info = {
+            "domain": domain.value,
+            "fan_out": len(available_models),
+            "responses": len(model_validations),
+            "early_exit": decided is not None,
+            "skipped_models": unfinished if decided is not None else [],
+            "timed_out_models": unfinished if decided is None else [],
+            "round_latency_s": time.perf_counter() - start,
+            "model_latency_s": model_latencies,
+        }
+        self.round_metrics.append(round_info)
+
+        return model_validations, round_info
+
+    async def _validate_with_model(
+        self, artifact: Dict[str, Any], model_name: str, domain: ValidationDomain
+    ) -> Optional[ModelValidation]:
+        """Run one model validation under its provider's concurrency limit"""
+
+        async with self._provider_semaphore(model_name):
+            try:
+                return await self._simulate_model_validation(
+                    artifact, model_name, domain
+                )
+            except Exception as e:
+                logger.error(f"Validation failed for {model_name}: {e}")
+                return None
+
+    def _provider_semaphore(self, model_name: str) -> asyncio.Semaphore:
+        """Semaphore for the model's provider, scoped to the running event loop"""
+
+        provider = self.model_providers.get(model_name, model_name)
+        semaphores = self._provider_semaphores.setdefault(
+            asyncio.get_running_loop(), {}
+        )
+        if provider not in semaphores:
+            semaphores[provider] = asyncio.Semaphore(
+                self.provider_concurrency.get(
+                    provider, self.default_provider_concurrency
+                )
+            )
+        return semaphores[provider]
+
+    def _decided_outcome(
+        self,
+        domain: ValidationDomain,
+        consensus_method: Optional[ConsensusMethod],
+        model_validations: List[ModelValidation],
+        pending_models: List[str],
+    ) -> Optional[bool]:
+        """
+        Pass/fail outcome if the pending models can no longer change it, else None.
+
+        Pending models may score anywhere in [0, 1], so the outcome is decided
+        when it is the same at both extremes. Majority, weighted and hybrid
+        consensus reduce to such a threshold test; the other methods always wait.
+        """
+
+        if len(model_validations) < self.min_models_required:
+            return None
+
+        threshold = self.consensus_thresholds.get(domain, 0.85)
+
+        if consensus_method == ConsensusMethod.MAJORITY_VOTE:
+            total_votes = len(model_validations) + len(pending_models)
+            pass_votes = sum(
+                1 for v in model_validations if v.quality_score >= threshold
+            )
+            if pass_votes > total_votes / 2:
+                return True
+            if pass_votes + len(pending_models) <= total_votes / 2:
+                return False
+            return None
+
+        if consensus_method not in (
+            ConsensusMethod.WEIGHTED_VOTING,
+            ConsensusMethod.HYBRID,
+        ):
+            return None
+
+        weights = self.domain_weights.get(domain, {})
+        received_weight = sum(weights.get(v.model_name, 0.0) for v in model_validations)
+        if received_weight <= 0:
+            return None
+
+        low, high = self._bounded_mean(
+            [
+                (v.quality_score, weights.get(v.model_name, 0.0))
+                for v in model_validations
+            ],
+            sum(weights.get(model_name, 0.0) for model_name in pending_models),
+        )
+        if consensus_method == ConsensusMethod.HYBRID:
+            # Hybrid passes exactly when 0.6 * weighted + 0.4 * mean >= threshold
+            mean_low, mean_high = self._bounded_mean(
+                [(v.quality_score, 1.0) for v in model_validations],
+                float(len(pending_models)),
+            )
+            low = 0.6 * low + 0.4 * mean_low
+            high = 0.6 * high + 0.4 * mean_high
+
+        if low >= threshold:
+            return True
+        if high < threshold:
+            return False
+        return None
+
+    @staticmethod
+    def _bounded_mean(
+        scored: List[Tuple[float, float]], pending_weight: float
+    ) -> Tuple[float, float]:
+        """Range of a weighted mean of [0, 1] scores with pending_weight still unknown"""
+
+        weighted_sum = sum(score * weight for score, weight in scored)
+        total_weight = sum(weight for _, weight in scored) + pending_weight
+        return (
+            weighted_sum / total_weight,
+            (weighted_sum + pending_weight) / total_weight,
+        )
 
     async def _simulate_model_validation(
         self, artifact: Dict[str, Any], model_name: str, domain: ValidationDomain
@@ -567,7 +797,7 @@ class ConsensusValidator:
 
         try:
             # Calculate TF-IDF vectors
-            tfidf_matrix = self.vectorizer.fit_transform(validation_texts)
+            tfidf_matrix = self._tfidf_matrix(validation_texts)
 
             # Calculate pairwise cosine similarities
             similarities = cosine_similarity(tfidf_matrix)
@@ -620,6 +850,46 @@ class ConsensusValidator:
             },
         )
 
+    def _text_vectors(self, texts: List[str]) -> sparse.csr_matrix:
+        """Term-count rows for texts, cached by content hash"""
+
+        keys = [hashlib.sha256(text.encode("utf-8")).hexdigest() for text in texts]
+        missing = {
+            key: text
+            for key, text in zip(keys, texts)
+            if key not in self._text_vector_cache
+        }
+        if missing:
+            counts = self.vectorizer.transform(list(missing.values()))
+            for i, key in enumerate(missing):
+                self._text_vector_cache[key] = counts[i]
+        self.text_vector_cache_misses += len(missing)
+        self.text_vector_cache_hits += len(keys) - len(missing)
+
+        rows = []
+        for key in keys:
+            self._text_vector_cache.move_to_end(key)
+            rows.append(self._text_vector_cache[key])
+        while len(self._text_vector_cache) > TEXT_VECTOR_CACHE_SIZE:
+            self._text_vector_cache.popitem(last=False)
+
+        return sparse.vstack(rows, format="csr")
+
+    def _tfidf_matrix(self, texts: List[str]) -> sparse.csr_matrix:
+        """
+        L2-normalised TF-IDF rows for texts, with smoothed IDF over this set of
+        texts (the same weighting TfidfVectorizer.fit_transform applies)
+        """
+
+        tfidf = self._text_vectors(texts).astype(np.float64)
+        tfidf.sum_duplicates()
+        _, term_ids, document_frequency = np.unique(
+            tfidf.indices, return_inverse=True, return_counts=True
+        )
+        n = tfidf.shape[0]
+        tfidf.data *= np.log((1 + n) / (1 + document_frequency[term_ids])) + 1
+        return normalize(tfidf)
+
     async def _statistical_significance_consensus(
         self,
         artifact_id: str,
@@ -811,4 +1081,30 @@ class ConsensusValidator:
             "avg_processing_time": avg_processing_time,
             "domain_distribution": domain_counts,
             "domain_pass_rates": domain_pass_rates,
+            "round_metrics": self.get_round_metrics(),
+        }
+
+    def get_round_metrics(self) -> Dict[str, Any]:
+        """Latency and fan-out statistics for recent validation rounds"""
+
+        rounds = list(self.round_metrics)
+        cache_stats = {
+            "hits": self.text_vector_cache_hits,
+            "misses": self.text_vector_cache_misses,
+            "size": len(self._text_vector_cache),
+        }
+        if not rounds:
+            return {"rounds": 0, "text_vector_cache": cache_stats}
+
+        latencies = [r["round_latency_s"] for r in rounds]
+        return {
+            "rounds": len(rounds),
+            "avg_round_latency_s": float(np.mean(latencies)),
+            "p95_round_latency_s": float(np.percentile(latencies, 95)),
+            "avg_fan_out": float(np.mean([r["fan_out"] for r in rounds])),
+            "avg_responses": float(np.mean([r["responses"] for r in rounds])),
+            "early_exit_rate": sum(1 for r in rounds if r["early_exit"]) / len(rounds),
+            "timeout_rate": sum(1 for r in rounds if r["timed_out_models"])
+            / len(rounds),
+            "text_vector_cache": cache_stats,
         }
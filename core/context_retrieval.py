@@ -0,0 +1,394 @@
+"""
+Token-Budgeted Context Retrieval
+
+Ranks the context handles of a MemoryIndex by relevance, recency and access
+frequency, and packs the best set under a per-call token budget so agents
+get the context that matters instead of whole histories. Cold handles are
+compressed once the index grows past its auto-compress threshold.
+"""
+
+import logging
+import math
+import re
+import uuid
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from schemas.ledgers import ContextHandle, MemoryIndex
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Tokens per retrieval when retrieval_budget names neither the service nor "default"
+DEFAULT_RETRIEVAL_TOKENS = 4000
+
+RANKING_WEIGHTS = {"relevance": 0.5, "recency": 0.3, "frequency": 0.2}
+
+# Priority handles outrank everything else
+PRIORITY_BONUS = 1.0
+
+DEFAULT_COMPRESSION_RULES = {
+    "codec": "zstd" if ZSTD_AVAILABLE else "zlib",
+    "summary_tokens": 64,
+    # Compress down to this fraction of the threshold, so compression
+    # does not re-trigger on the very next write
+    "target_ratio": 0.8,
+}
+
+_BYTES_PER_MB = 1024 * 1024
+_TERM_RE = re.compile(r"[a-z0-9_]{2,}")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)"""
+    return len(text) // 4 + 1 if text else 0
+
+
+def _terms(text: str) -> Set[str]:
+    return set(_TERM_RE.findall(text.lower()))
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor().compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+@dataclass
+class _StoredContext:
+    """Content behind one handle, either raw text or a compressed blob"""
+
+    text: Optional[str]
+    summary: str
+    tokens: int
+    summary_tokens: int
+    terms: Set[str]
+    blob: Optional[bytes] = None
+    codec: Optional[str] = None
+
+    @property
+    def compressed(self) -> bool:
+        return self.blob is not None
+
+    @property
+    def stored_bytes(self) -> int:
+        if self.blob is not None:
+            return len(self.blob) + len(self.summary.encode("utf-8"))
+        return len(self.text.encode("utf-8"))
+
+
+@dataclass
+class RetrievedContext:
+    """A handle chosen for a prompt, in full or as its summary"""
+
+    handle_id: str
+    text: str
+    tokens: int
+    score: float
+    summarized: bool = False
+
+
+@dataclass
+class RetrievalResult:
+    """Outcome of one budgeted retrieval"""
+
+    items: List[RetrievedContext] = field(default_factory=list)
+    token_budget: int = 0
+    tokens_used: int = 0
+    candidates: int = 0
+    skipped: int = 0
+
+    def render(self, separator: str = "\n\n") -> str:
+        """Join the retrieved context into a prompt section"""
+        return separator.join(item.text for item in self.items)
+
+
+class ContextRetriever:
+    """
+    Budgeted retrieval over the context handles of a MemoryIndex
+    """
+
+    def __init__(
+        self,
+        index: MemoryIndex,
+        token_counter: Callable[[str], int] = estimate_tokens,
+        weights: Optional[Dict[str, float]] = None,
+    ):
+        self.index = index
+        self.token_counter = token_counter
+        self.weights = {**RANKING_WEIGHTS, **(weights or {})}
+        self.compression_rules = {
+            **DEFAULT_COMPRESSION_RULES,
+            **index.compression_rules,
+        }
+
+        self._handles: Dict[str, ContextHandle] = {
+            handle.handle_id: handle for handle in index.context_handles
+        }
+        self._contents: Dict[str, _StoredContext] = {}
+        self._document_frequency: Counter = Counter()
+
+    # Storage
+
+    def add_context(
+        self, handle: ContextHandle, content: str, summary: Optional[str] = None
+    ) -> ContextHandle:
+        """Store content behind a handle, compressing cold handles if needed"""
+        if handle.handle_id in self._contents:
+            self.remove_context(handle.handle_id)
+        if handle.handle_id not in self._handles:
+            self.index.context_handles.append(handle)
+            self._handles[handle.handle_id] = handle
+
+        summary = summary or self._summarize(content)
+        terms = _terms(" ".join([handle.description, *handle.tags, content]))
+        stored = _StoredContext(
+            text=content,
+            summary=summary,
+            tokens=self.token_counter(content),
+            summary_tokens=self.token_counter(summary),
+            terms=terms,
+        )
+        self._contents[handle.handle_id] = stored
+        self._document_frequency.update(terms)
+
+        handle.size_bytes = stored.stored_bytes
+        self.index.current_storage_mb += stored.stored_bytes / _BYTES_PER_MB
+
+        if self.index.current_storage_mb > self.index.auto_compress_threshold_mb:
+            self.compress_cold_handles()
+        return handle
+
+    def remember(
+        self,
+        description: str,
+        content: str,
+        context_type: str = "conversation",
+        tags: Iterable[str] = (),
+    ) -> ContextHandle:
+        """Store content under a new handle"""
+        handle = ContextHandle(
+            handle_id=f"{context_type}_{uuid.uuid4().hex[:12]}",
+            context_type=context_type,
+            description=description,
+            size_bytes=0,
+            tags=list(tags),
+        )
+        return self.add_context(handle, content)
+
+    def remove_context(self, handle_id: str) -> bool:
+        """Drop a handle and its content from the index"""
+        stored = self._contents.pop(handle_id, None)
+        handle = self._handles.pop(handle_id, None)
+        if handle is None:
+            return False
+        if stored is not None:
+            self._document_frequency.subtract(stored.terms)
+            self.index.current_storage_mb = max(
+                0.0, self.index.current_storage_mb - stored.stored_bytes / _BYTES_PER_MB
+            )
+        self.index.context_handles = [
+            h for h in self.index.context_handles if h.handle_id != handle_id
+        ]
+        self.index.active_handles.discard(handle_id)
+        self.index.access_patterns.pop(handle_id, None)
+        return True
+
+    def get_content(self, handle_id: str) -> Optional[str]:
+        """Full content behind a handle, decompressing it if it is cold"""
+        stored = self._contents.get(handle_id)
+        if stored is None:
+            return None
+        if stored.compressed:
+            return _decompress(stored.blob, stored.codec).decode("utf-8")
+        return stored.text
+
+    def _summarize(self, content: str) -> str:
+        """Leading sentences of the content, up to summary_tokens"""
+        limit = self.compression_rules["summary_tokens"]
+        summary = ""
+        for sentence in _SENTENCE_RE.split(content.strip()):
+            candidate = f"{summary} {sentence}".strip()
+            if self.token_counter(candidate) > limit:
+                break
+            summary = candidate
+        # A single overlong sentence is cut at the character estimate
+        return summary or content[: limit * 4]
+
+    def compress_cold_handles(self, now: Optional[datetime] = None) -> List[str]:
+        """Compress the coldest handles until storage is back under the threshold"""
+        now = now or datetime.now()
+        target_mb = (
+            self.index.auto_compress_threshold_mb
+            * self.compression_rules["target_ratio"]
+        )
+        codec = self.compression_rules["codec"]
+        protected = set(self.index.priority_handles) | self.index.active_handles
+
+        cold = sorted(
+            (
+                handle_id
+                for handle_id, stored in self._contents.items()
+                if not stored.compressed and handle_id not in protected
+            ),
+            key=lambda handle_id: self._heat(self._handles[handle_id], now),
+        )
+
+        compressed = []
+        for handle_id in cold:
+            if self.index.current_storage_mb <= target_mb:
+                break
+            stored = self._contents[handle_id]
+            before = stored.stored_bytes
+            raw = stored.text.encode("utf-8")
+            stored.blob = _compress(raw, codec)
+            stored.codec = codec
+            stored.text = None
+
+            handle = self._handles[handle_id]
+            handle.compression_ratio = len(stored.blob) / max(1, len(raw))
+            handle.size_bytes = stored.stored_bytes
+            self.index.current_storage_mb -= (
+                before - stored.stored_bytes
+            ) / _BYTES_PER_MB
+            compressed.append(handle_id)
+
+        if compressed:
+            self.index.last_cleaned = now
+            logger.info(f"Compressed {len(compressed)} cold context handles")
+        return compressed
+
+    # Ranking
+
+    def _recency(self, handle: ContextHandle, now: datetime) -> float:
+        last_seen = handle.last_accessed or handle.created_at
+        age_hours = max(0.0, (now - last_seen).total_seconds() / 3600.0)
+        return 0.5 ** (age_hours / self.index.access_half_life_hours)
+
+    def _frequency(self, handle_id: str, now: datetime) -> float:
+        score = self.index.access_frequency(handle_id, now)
+        return score / (1.0 + score)
+
+    def _heat(self, handle: ContextHandle, now: datetime) -> float:
+        """Query-independent part of the ranking score"""
+        return self.weights["recency"] * self._recency(handle, now) + self.weights[
+            "frequency"
+        ] * self._frequency(handle.handle_id, now)
+
+    def _relevance(
+        self, query_weights: Dict[str, float], stored: _StoredContext
+    ) -> float:
+        """IDF-weighted share of the query terms the handle covers"""
+        total = sum(query_weights.values())
+        if not total:
+            return 0.0
+        return (
+            sum(w for term, w in query_weights.items() if term in stored.terms) / total
+        )
+
+    def _query_weights(self, query: str) -> Dict[str, float]:
+        documents = len(self._contents)
+        return {
+            term: math.log(1.0 + documents / (1.0 + self._document_frequency[term]))
+            for term in _terms(query)
+        }
+
+    def rank(
+        self, query: str = "", now: Optional[datetime] = None
+    ) -> List[Tuple[float, str]]:
+        """(score, handle_id) pairs, best first"""
+        now = now or datetime.now()
+        query_weights = self._query_weights(query)
+        priority = set(self.index.priority_handles)
+
+        ranked = []
+        for handle_id, stored in self._contents.items():
+            score = self._heat(self._handles[handle_id], now)
+            if query_weights:
+                score += self.weights["relevance"] * self._relevance(
+                    query_weights, stored
+                )
+            if handle_id in priority:
+                score += PRIORITY_BONUS
+            ranked.append((score, handle_id))
+        ranked.sort(key=lambda pair: pair[0], reverse=True)
+        return ranked
+
+    # Retrieval
+
+    def token_budget(self, service: str = "default") -> int:
+        """Per-call token budget for a service"""
+        budgets = self.index.retrieval_budget
+        return budgets.get(service, budgets.get("default", DEFAULT_RETRIEVAL_TOKENS))
+
+    def retrieve(
+        self,
+        query: str = "",
+        service: str = "default",
+        token_budget: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> RetrievalResult:
+        """Pack the best-ranked context under the token budget
+
+        Handles are taken in rank order. One whose full content does not fit
+        is included as its summary if that fits, and skipped otherwise.
+        """
+        now = now or datetime.now()
+        budget = self.token_budget(service) if token_budget is None else token_budget
+        result = RetrievalResult(token_budget=budget, candidates=len(self._contents))
+
+        remaining = budget
+        for score, handle_id in self.rank(query, now):
+            if remaining <= 0:
+                result.skipped += 1
+                continue
+            stored = self._contents[handle_id]
+            if stored.tokens <= remaining:
+                item = RetrievedContext(
+                    handle_id, self.get_content(handle_id), stored.tokens, score
+                )
+            elif stored.summary_tokens <= remaining:
+                item = RetrievedContext(
+                    handle_id, stored.summary, stored.summary_tokens, score, True
+                )
+            else:
+                result.skipped += 1
+                continue
+            result.items.append(item)
+            remaining -= item.tokens
+
+        result.tokens_used = budget - remaining
+        self.index.active_handles = {item.handle_id for item in result.items}
+        for item in result.items:
+            handle = self._handles[item.handle_id]
+            handle.last_accessed = now
+            handle.access_count += 1
+            self.index.record_access(item.handle_id, now)
+        return result
+
+    def get_statistics(self) -> Dict[str, float]:
+        """Handle counts, storage and stored token totals"""
+        compressed = sum(1 for stored in self._contents.values() if stored.compressed)
+        return {
+            "handles": len(self._contents),
+            "compressed_handles": compressed,
+            "storage_mb": self.index.current_storage_mb,
+            "stored_tokens": sum(stored.tokens for stored in self._contents.values()),
+        }
@@ -5,19 +5,41 @@ Implements budget controls, cost tracking, and spending optimization
 across different project complexities and model usage patterns.
 """
 
+import atexit
 import logging
 import json
+import queue
+import threading
+import time
+import weakref
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from uuid import uuid4
 import sqlite3
 from pathlib import Path
 
+from codecompanion.tokens import count_tokens, provider_for_model
 from schemas.routing import ModelType
 
 logger = logging.getLogger(__name__)
 
+# Planning estimate for requests that give neither a token count nor a prompt
+DEFAULT_ESTIMATED_TOKENS = 1000
+
+# Completion allowance added to a counted prompt when the request sets no max_tokens
+DEFAULT_OUTPUT_TOKENS = 1000
+
+# Governors with a running writer, closed at exit without being kept alive
+_open_governors: "weakref.WeakSet[CostGovernor]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_governors():
+    for governor in list(_open_governors):
+        governor.close()
+
 
 class ProjectComplexity(str, Enum):
     """Project complexity levels for budget allocation"""
@@ -57,6 +79,16 @@ class UsageMetrics:
     cost_incurred: float = 0.0
     requests_made: int = 0
     period_start: datetime = field(default_factory=datetime.now)
+    # Held by outstanding reservations, not yet committed or released
+    tokens_reserved: int = 0
+    cost_reserved: float = 0.0
+
+    @property
+    def committed_and_reserved(self) -> Tuple[int, float]:
+        return (
+            self.tokens_used + self.tokens_reserved,
+            self.cost_incurred + self.cost_reserved,
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -65,10 +97,12 @@ class UsageMetrics:
             "cost_incurred": self.cost_incurred,
             "requests_made": self.requests_made,
             "period_start": self.period_start.isoformat(),
+            "tokens_reserved": self.tokens_reserved,
+            "cost_reserved": self.cost_reserved,
         }
 
     def reset(self):
-        """Reset usage metrics for new period"""
+        """Reset usage metrics for new period (outstanding reservations are kept)"""
         self.tokens_used = 0
         self.agents_active = 0
         self.cost_incurred = 0.0
@@ -76,11 +110,45 @@ class UsageMetrics:
         self.period_start = datetime.now()
 
 
+@dataclass(frozen=True)
+class BudgetSnapshot:
+    """Remaining budget for one project, captured once per routing decision"""
+
+    remaining_cost_usd: float
+    remaining_tokens: int
+
+    def can_afford(self, estimated_cost: float, estimated_tokens: int) -> bool:
+        return (
+            estimated_cost <= self.remaining_cost_usd
+            and estimated_tokens <= self.remaining_tokens
+        )
+
+
+@dataclass(frozen=True)
+class BudgetReservation:
+    """Estimated tokens and cost held against a project budget"""
+
+    reservation_id: str
+    project_id: str
+    tokens: int
+    cost_usd: float
+    complexity_level: str
+    model_type: Optional[ModelType] = None
+    # time.monotonic() deadline after which an unfinished hold is returned
+    expires_at: float = float("inf")
+
+
 class CostGovernor:
     """
     Cost governance system that manages budgets and prevents overspending
     """
 
+    # Usage, violation and optimization rows written per batch
+    WRITE_BATCH_SIZE = 200
+
+    # Seconds a reservation holds budget before it is treated as abandoned
+    RESERVATION_TTL_S = 600.0
+
     def __init__(self, db_path: str = "cost_governance.db"):
         self.db_path = db_path
 
@@ -110,9 +178,21 @@ class CostGovernor:
             ModelType.GEMINI_PRO: 0.001,
         }
 
-        # Current usage tracking
+        # Current usage tracking; the ledger lock guards current_usage,
+        # outstanding reservations and alert bookkeeping
         self.current_usage: Dict[str, UsageMetrics] = {}
         self.cost_alerts_sent: Dict[str, List[datetime]] = {}
+        self._reservations: Dict[str, BudgetReservation] = {}
+        # Expired holds, kept for one more TTL so a late commit still records usage
+        self._expired: Dict[str, BudgetReservation] = {}
+        self._next_expiry = float("inf")
+        self._ledger_lock = threading.Lock()
+
+        # Usage history and violations are persisted off the request path
+        self._write_queue: "queue.Queue[Tuple[str, Tuple]]" = queue.Queue()
+        self._writer = None
+        self._stop_writer: Optional[weakref.finalize] = None
+        self._writer_lock = threading.Lock()
 
         # Initialize database
         self._init_database()
@@ -182,52 +262,55 @@ class CostGovernor:
             complexity = ProjectComplexity(project_complexity)
             budget = self.budgets[complexity]
 
-            # Get or create usage metrics
-            if project_id not in self.current_usage:
-                self.current_usage[project_id] = UsageMetrics()
-
-            usage = self.current_usage[project_id]
-
-            # Update usage from current data
-            usage.tokens_used = current_usage.get("tokens_used", usage.tokens_used)
-            usage.cost_incurred = current_usage.get(
-                "cost_incurred", usage.cost_incurred
-            )
-            usage.requests_made = current_usage.get(
-                "requests_made", usage.requests_made
-            )
-            usage.agents_active = current_usage.get(
-                "agents_active", usage.agents_active
-            )
+            # Caller-supplied figures are checked alongside the ledger but
+            # never overwrite it
+            with self._ledger_lock:
+                self._expire_reservations()
+                usage = self.current_usage.setdefault(project_id, UsageMetrics())
+                ledger_tokens, ledger_cost = usage.committed_and_reserved
+                checked = UsageMetrics(
+                    tokens_used=max(ledger_tokens, current_usage.get("tokens_used", 0)),
+                    cost_incurred=max(
+                        ledger_cost, current_usage.get("cost_incurred", 0.0)
+                    ),
+                    requests_made=max(
+                        usage.requests_made, current_usage.get("requests_made", 0)
+                    ),
+                    agents_active=max(
+                        usage.agents_active, current_usage.get("agents_active", 0)
+                    ),
+                )
 
             # Check each budget constraint
             violations = []
 
-            if usage.tokens_used > budget.max_tokens:
+            if checked.tokens_used > budget.max_tokens:
                 violations.append(
-                    f"Token limit exceeded: {usage.tokens_used}/{budget.max_tokens}"
+                    f"Token limit exceeded: {checked.tokens_used}/{budget.max_tokens}"
                 )
 
-            if usage.cost_incurred > budget.max_cost_usd:
+            if checked.cost_incurred > budget.max_cost_usd:
                 violations.append(
-                    f"Cost limit exceeded: ${usage.cost_incurred:.2f}/${budget.max_cost_usd}"
+                    f"Cost limit exceeded: ${checked.cost_incurred:.2f}/${budget.max_cost_usd}"
                 )
 
-            if usage.agents_active > budget.max_agents:
+            if checked.agents_active > budget.max_agents:
                 violations.append(
-                    f"Agent limit exceeded: {usage.agents_active}/{budget.max_agents}"
+                    f"Agent limit exceeded: {checked.agents_active}/{budget.max_agents}"
                 )
 
-            if usage.requests_made > budget.max_requests:
+            if checked.requests_made > budget.max_requests:
                 violations.append(
-                    f"Request limit exceeded: {usage.requests_made}/{budget.max_requests}"
+                    f"Request limit exceeded: {checked.requests_made}/{budget.max_requests}"
                 )
 
             # Log violations
             if violations:
                 for violation in violations:
                     logger.warning(f"Budget violation for {project_id}: {violation}")
-                    self._record_budget_violation(project_id, violation, budget, usage)
+                    self._record_budget_violation(
+                        project_id, violation, budget, checked
+                    )
 
                 # Send cost alert if not recently sent
                 self._maybe_send_cost_alert(project_id, violations)
@@ -258,14 +341,14 @@ class CostGovernor:
             True if model is affordable, False otherwise
         """
         try:
-            estimated_tokens = context.get("estimated_tokens", 1000)
+            estimated_tokens = self.estimate_tokens(context, model_type)
             estimated_cost = self.estimate_cost(model_type, estimated_tokens)
 
-            if project_id not in self.current_usage:
-                self.current_usage[project_id] = UsageMetrics()
-
-            usage = self.current_usage[project_id]
-            projected_cost = usage.cost_incurred + estimated_cost
+            with self._ledger_lock:
+                self._expire_reservations()
+                usage = self.current_usage.get(project_id) or UsageMetrics()
+                held_tokens, held_cost = usage.committed_and_reserved
+            projected_cost = held_cost + estimated_cost
 
             # Get project complexity and budget
             complexity = ProjectComplexity(context.get("project_complexity", "medium"))
@@ -280,7 +363,7 @@ class CostGovernor:
                 return False
 
             # Check token budget
-            projected_tokens = usage.tokens_used + estimated_tokens
+            projected_tokens = held_tokens + estimated_tokens
             if projected_tokens > budget.max_tokens:
                 logger.info(
                     f"Model {model_type.value} would exceed token budget: "
@@ -294,6 +377,221 @@ class CostGovernor:
             logger.error(f"Error checking model affordability: {e}")
             return True  # Fail open
 
+    def budget_snapshot(
+        self, project_complexity: str = "medium", project_id: str = "default"
+    ) -> Optional[BudgetSnapshot]:
+        """
+        Capture remaining cost and token budget for a project.
+
+        Lets callers check many models against one read of the usage state
+        instead of calling can_afford_model per model. Returns None when the
+        complexity level is unknown (callers should fail open, as
+        can_afford_model does).
+        """
+        try:
+            budget = self.budgets[ProjectComplexity(project_complexity)]
+        except (ValueError, KeyError):
+            return None
+
+        with self._ledger_lock:
+            self._expire_reservations()
+            usage = self.current_usage.get(project_id) or UsageMetrics()
+            held_tokens, held_cost = usage.committed_and_reserved
+        return BudgetSnapshot(
+            remaining_cost_usd=budget.max_cost_usd - held_cost,
+            remaining_tokens=budget.max_tokens - held_tokens,
+        )
+
+    def reserve(
+        self,
+        project_id: str,
+        estimated_tokens: int,
+        estimated_cost: Optional[float] = None,
+        project_complexity: str = "medium",
+        model_type: Optional[ModelType] = None,
+        ttl_s: Optional[float] = None,
+    ) -> Optional[BudgetReservation]:
+        """
+        Atomically check and hold estimated usage against a project budget.
+
+        Concurrent callers cannot together overshoot the budget: the check and
+        the hold happen under the ledger lock. Returns None (and records a
+        violation) when the request does not fit; an unknown complexity level
+        fails open, as check_budget does. Every reservation should be finished
+        with commit() or release(); one left unfinished for ttl_s seconds is
+        released automatically, and a later commit still records its usage.
+
+        Args:
+            project_id: Project identifier
+            estimated_tokens: Tokens to hold
+            estimated_cost: Cost to hold; estimated from model_type if omitted
+            project_complexity: Complexity level selecting the budget
+            model_type: Model the request will use
+            ttl_s: Seconds to hold the budget (RESERVATION_TTL_S if omitted)
+        """
+        if estimated_cost is None:
+            estimated_cost = (
+                self.estimate_cost(model_type, estimated_tokens) if model_type else 0.0
+            )
+
+        try:
+            budget = self.budgets[ProjectComplexity(project_complexity)]
+        except (ValueError, KeyError):
+            logger.error(f"Unknown project complexity: {project_complexity}")
+            budget = None
+
+        reservation = BudgetReservation(
+            reservation_id=uuid4().hex,
+            project_id=project_id,
+            tokens=estimated_tokens,
+            cost_usd=estimated_cost,
+            complexity_level=project_complexity,
+            model_type=model_type,
+            expires_at=time.monotonic()
+            + (self.RESERVATION_TTL_S if ttl_s is None else ttl_s),
+        )
+
+        with self._ledger_lock:
+            self._expire_reservations()
+            usage = self.current_usage.setdefault(project_id, UsageMetrics())
+            held_tokens, held_cost = usage.committed_and_reserved
+            violation = None
+            if budget is not None:
+                if held_cost + estimated_cost > budget.max_cost_usd:
+                    violation = (
+                        f"Cost reservation denied: ${held_cost + estimated_cost:.2f}"
+                        f"/${budget.max_cost_usd}"
+                    )
+                elif held_tokens + estimated_tokens > budget.max_tokens:
+                    violation = (
+                        f"Token reservation denied: {held_tokens + estimated_tokens}"
+                        f"/{budget.max_tokens}"
+                    )
+
+            if violation is None:
+                usage.tokens_reserved += estimated_tokens
+                usage.cost_reserved += estimated_cost
+                self._reservations[reservation.reservation_id] = reservation
+                self._next_expiry = min(self._next_expiry, reservation.expires_at)
+                return reservation
+
+            checked = UsageMetrics(tokens_used=held_tokens, cost_incurred=held_cost)
+
+        logger.info(f"Budget reservation for {project_id} denied: {violation}")
+        self._record_budget_violation(project_id, violation, budget, checked)
+        return None
+
+    def commit(
+        self,
+        reservation: BudgetReservation,
+        actual_tokens: Optional[int] = None,
+        actual_cost: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Convert a reservation into recorded usage.
+
+        Actual figures default to the reserved estimates. A reservation that
+        already expired has no hold left but its usage is still recorded.
+        Returns False if the reservation was already committed or released.
+        """
+        tokens = reservation.tokens if actual_tokens is None else actual_tokens
+        cost = reservation.cost_usd if actual_cost is None else actual_cost
+
+        with self._ledger_lock:
+            usage = self.current_usage.setdefault(
+                reservation.project_id, UsageMetrics()
+            )
+            if self._reservations.pop(reservation.reservation_id, None) is not None:
+                usage.tokens_reserved -= reservation.tokens
+                usage.cost_reserved -= reservation.cost_usd
+            elif self._expired.pop(reservation.reservation_id, None) is None:
+                return False
+            usage.tokens_used += tokens
+            usage.cost_incurred += cost
+            usage.requests_made += 1
+
+        self._queue_usage_row(
+            reservation.project_id,
+            reservation.model_type.value if reservation.model_type else "unknown",
+            tokens,
+            cost,
+            reservation.complexity_level,
+            metadata,
+        )
+        return True
+
+    def release(self, reservation: BudgetReservation) -> bool:
+        """
+        Return a reservation's held amounts to the budget without recording usage.
+
+        Returns False if the reservation was already committed, released or
+        expired.
+        """
+        with self._ledger_lock:
+            self._expired.pop(reservation.reservation_id, None)
+            if self._reservations.pop(reservation.reservation_id, None) is None:
+                return False
+            usage = self.current_usage.setdefault(
+                reservation.project_id, UsageMetrics()
+            )
+            usage.tokens_reserved -= reservation.tokens
+            usage.cost_reserved -= reservation.cost_usd
+        return True
+
+    def _expire_reservations(self):
+        """Return the holds of reservations past their deadline (ledger lock held)"""
+        now = time.monotonic()
+        if now < self._next_expiry:
+            return
+
+        self._expired = {
+            reservation_id: reservation
+            for reservation_id, reservation in self._expired.items()
+            if now < reservation.expires_at + self.RESERVATION_TTL_S
+        }
+        next_expiry = float("inf")
+        for reservation_id, reservation in list(self._reservations.items()):
+            if now < reservation.expires_at:
+                next_expiry = min(next_expiry, reservation.expires_at)
+                continue
+            del self._reservations[reservation_id]
+            self._expired[reservation_id] = reservation
+            usage = self.current_usage.setdefault(
+                reservation.project_id, UsageMetrics()
+            )
+            usage.tokens_reserved -= reservation.tokens
+            usage.cost_reserved -= reservation.cost_usd
+            logger.warning(
+                f"Budget reservation {reservation_id} for {reservation.project_id} "
+                "expired unfinished; its hold was returned"
+            )
+        for reservation in self._expired.values():
+            next_expiry = min(
+                next_expiry, reservation.expires_at + self.RESERVATION_TTL_S
+            )
+        self._next_expiry = next_expiry
+
+    def estimate_tokens(
+        self, context: Dict[str, Any], model_type: Optional[ModelType] = None
+    ) -> int:
+        """
+        Tokens a request is expected to use
+
+        An explicit ``estimated_tokens`` in the context wins; otherwise the
+        context's ``prompt`` is counted locally, calibrated for the model's
+        provider, plus the completion's ``max_tokens`` (DEFAULT_OUTPUT_TOKENS
+        if unset). Falls back to DEFAULT_ESTIMATED_TOKENS.
+        """
+        if "estimated_tokens" in context:
+            return context["estimated_tokens"]
+        prompt = context.get("prompt")
+        if not prompt:
+            return DEFAULT_ESTIMATED_TOKENS
+        provider = provider_for_model(getattr(model_type, "value", model_type))
+        output_tokens = context.get("max_tokens", DEFAULT_OUTPUT_TOKENS)
+        return count_tokens(prompt, provider) + output_tokens
+
     def estimate_cost(self, model_type: ModelType, estimated_tokens: int) -> float:
         """Estimate cost for model and token usage"""
         cost_per_1k = self.model_costs.get(model_type, 0.003)  # Default fallback
@@ -311,33 +609,21 @@ class CostGovernor:
         """Record actual usage for tracking and learning"""
         try:
             # Update current usage
-            if project_id not in self.current_usage:
-                self.current_usage[project_id] = UsageMetrics()
-
-            usage = self.current_usage[project_id]
-            usage.tokens_used += tokens_used
-            usage.cost_incurred += actual_cost
-            usage.requests_made += 1
+            with self._ledger_lock:
+                usage = self.current_usage.setdefault(project_id, UsageMetrics())
+                usage.tokens_used += tokens_used
+                usage.cost_incurred += actual_cost
+                usage.requests_made += 1
 
             # Store in database
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT INTO usage_history 
-                    (project_id, model_type, tokens_used, cost_incurred, 
-                     complexity_level, timestamp, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        project_id,
-                        model_type.value,
-                        tokens_used,
-                        actual_cost,
-                        complexity_level,
-                        datetime.now().isoformat(),
-                        json.dumps(metadata or {}),
-                    ),
-                )
+            self._queue_usage_row(
+                project_id,
+                model_type.value,
+                tokens_used,
+                actual_cost,
+                complexity_level,
+                metadata,
+            )
 
             logger.debug(
                 f"Recorded usage: {project_id} used {tokens_used} tokens "
@@ -421,30 +707,53 @@ class CostGovernor:
             logger.error(f"Error getting usage summary: {e}")
             return {"error": str(e)}
 
+    def _queue_usage_row(
+        self,
+        project_id: str,
+        model_type: str,
+        tokens_used: int,
+        cost: float,
+        complexity_level: str,
+        metadata: Optional[Dict[str, Any]],
+    ):
+        self._queue_write(
+            """
+            INSERT INTO usage_history
+            (project_id, model_type, tokens_used, cost_incurred,
+             complexity_level, timestamp, metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                project_id,
+                model_type,
+                tokens_used,
+                cost,
+                complexity_level,
+                datetime.now().isoformat(),
+                json.dumps(metadata or {}),
+            ),
+        )
+
     def _record_budget_violation(
         self, project_id: str, violation: str, budget: BudgetLimits, usage: UsageMetrics
     ):
         """Record budget violation for analysis"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT INTO budget_violations 
-                    (project_id, violation_type, budget_limit, actual_usage,
-                     timestamp, action_taken)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        project_id,
-                        violation,
-                        budget.max_cost_usd,  # Primary budget limit
-                        usage.cost_incurred,
-                        datetime.now().isoformat(),
-                        "Request rejected",
-                    ),
-                )
-        except Exception as e:
-            logger.error(f"Failed to record budget violation: {e}")
+        self._queue_write(
+            """
+            INSERT INTO budget_violations
+            (project_id, violation_type, budget_limit, actual_usage,
+             timestamp, action_taken)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """,
+            (
+                project_id,
+                violation,
+                budget.max_cost_usd,  # Primary budget limit
+                usage.cost_incurred,
+                datetime.now().isoformat(),
+                "Request rejected",
+            ),
+        )
 
     def _record_cost_optimization(
         self,
@@ -454,44 +763,122 @@ class CostGovernor:
         estimated_savings: float,
     ):
         """Record cost optimization suggestion"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT INTO cost_optimizations 
-                    (project_id, original_model, optimized_model, 
-                     estimated_savings, timestamp, reason)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        project_id,
-                        original_model.value,
-                        optimized_model.value,
-                        estimated_savings,
-                        datetime.now().isoformat(),
-                        "Cost optimization",
-                    ),
+        self._queue_write(
+            """
+            INSERT INTO cost_optimizations
+            (project_id, original_model, optimized_model,
+             estimated_savings, timestamp, reason)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """,
+            (
+                project_id,
+                original_model.value,
+                optimized_model.value,
+                estimated_savings,
+                datetime.now().isoformat(),
+                "Cost optimization",
+            ),
+        )
+
+    def _queue_write(self, sql: str, row: Tuple):
+        """Queue a row for the background database writer"""
+        # Queued before the writer check so a row that lands behind close()'s
+        # stop sentinel is drained by the writer started after close returns
+        self._write_queue.put((sql, row))
+        self._ensure_writer()
+
+    def _ensure_writer(self):
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                # The writer holds only the queue, so an unclosed governor can
+                # still be collected; collecting it stops the writer
+                self._writer = threading.Thread(
+                    target=self._write_rows,
+                    args=(self._write_queue, self.db_path, self.WRITE_BATCH_SIZE),
+                    name="cost-governor-writer",
+                    daemon=True,
                 )
-        except Exception as e:
-            logger.error(f"Failed to record cost optimization: {e}")
+                self._stop_writer = weakref.finalize(self, self._write_queue.put, None)
+                self._stop_writer.atexit = False
+                self._writer.start()
+                _open_governors.add(self)
+
+    @staticmethod
+    def _write_rows(write_queue: "queue.Queue", db_path: str, batch_size: int):
+        """Writer loop: block for one row, then drain a batch grouped by statement"""
+        while True:
+            item = write_queue.get()
+            if item is None:
+                write_queue.task_done()
+                return
+            batch: List[Tuple[str, Tuple]] = [item]
+            stop = False
+            while len(batch) < batch_size:
+                try:
+                    item = write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            statements: Dict[str, List[Tuple]] = {}
+            for sql, row in batch:
+                statements.setdefault(sql, []).append(row)
+
+            try:
+                with sqlite3.connect(db_path) as conn:
+                    for sql, rows in statements.items():
+                        conn.executemany(sql, rows)
+            except Exception as e:
+                logger.error(f"Failed to store {len(batch)} cost governance rows: {e}")
+            finally:
+                for _ in batch:
+                    write_queue.task_done()
+                if stop:
+                    write_queue.task_done()
+            if stop:
+                return
+
+    def flush(self):
+        """Block until every queued usage, violation and optimization row is written"""
+        self._write_queue.join()
+
+    def close(self):
+        """
+        Write every queued row and stop the background writer.
+
+        Runs at exit for every governor with a running writer; later writes
+        start a new writer.
+        """
+        # Held throughout so no new writer can start and take the sentinel
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+            if writer is None:
+                return
+            _open_governors.discard(self)
+            # Finalizers are disabled once interpreter shutdown begins, so
+            # the sentinel is put here rather than by calling the finalizer
+            self._stop_writer.detach()
+            self._write_queue.put(None)
+            writer.join()
 
     def _maybe_send_cost_alert(self, project_id: str, violations: List[str]):
         """Send cost alert if not recently sent"""
         now = datetime.now()
 
-        if project_id not in self.cost_alerts_sent:
-            self.cost_alerts_sent[project_id] = []
+        with self._ledger_lock:
+            alerts = self.cost_alerts_sent.setdefault(project_id, [])
 
-        # Check if alert was sent in last hour
-        recent_alerts = [
-            alert_time
-            for alert_time in self.cost_alerts_sent[project_id]
-            if (now - alert_time).total_seconds() < 3600
-        ]
+            # Check if alert was sent in last hour
+            if any((now - alert_time).total_seconds() < 3600 for alert_time in alerts):
+                return
+            alerts.append(now)
 
-        if not recent_alerts:
-            logger.warning(f"COST ALERT for {project_id}: {violations}")
-            self.cost_alerts_sent[project_id].append(now)
+        logger.warning(f"COST ALERT for {project_id}: {violations}")
 
     def _calculate_time_remaining(
         self, usage: UsageMetrics, budget: BudgetLimits
@@ -532,8 +919,11 @@ class CostGovernor:
 
     def reset_usage(self, project_id: str):
         """Reset usage metrics for a project"""
-        if project_id in self.current_usage:
-            self.current_usage[project_id].reset()
+        with self._ledger_lock:
+            usage = self.current_usage.get(project_id)
+            if usage is not None:
+                usage.reset()
+        if usage is not None:
             logger.info(f"Reset usage metrics for project {project_id}")
 
     def set_custom_budget(
@@ -6,8 +6,11 @@ and ensuring proper communication flows based on agent capabilities.
 """
 
 import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, FrozenSet, Iterable, List, Any, Optional, Sequence, Tuple
 from enum import Enum
 from pydantic import BaseModel, Field
 
@@ -17,6 +20,23 @@ from core.artifact_handler import TypedArtifactHandler
 
 logger = logging.getLogger(__name__)
 
+# Memoised per-artifact verdicts, keyed by (rule, artifact content hash)
+VERDICT_MEMO_SIZE = 8192
+
+# Validation latencies kept for percentile reporting
+LATENCY_WINDOW = 2048
+
+
+def _type_value(artifact_type: Any) -> str:
+    """Plain string for an ArtifactType member or an enum-valued string"""
+    return getattr(artifact_type, "value", artifact_type)
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of pre-sorted values"""
+    index = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values))) - 1))
+    return sorted_values[index]
+
 
 class AgentType(str, Enum):
     """Supported agent types in the system"""
@@ -103,6 +123,18 @@ class HandoffResult(BaseModel):
         use_enum_values = True
 
 
+@dataclass(frozen=True)
+class CompiledHandoffRule:
+    """A handoff rule with its artifact type sets resolved to plain strings"""
+
+    rule: HandoffRule
+    key: Tuple[str, str]
+    required: FrozenSet[str]
+    optional: FrozenSet[str]
+    produces: FrozenSet[str]
+    consumes: FrozenSet[str]
+
+
 class AgentHandoff:
     """
     Agent communication protocol with strict handoff validation.
@@ -246,6 +278,76 @@ class AgentHandoff:
         self.active_handoffs: Dict[str, HandoffRequest] = {}
         self.handoff_history: List[HandoffResult] = []
 
+        # (type, producible, consumable) per (rule key, artifact content hash)
+        self._verdict_memo: "OrderedDict[Tuple, Tuple[str, bool, bool]]" = OrderedDict()
+        self.verdict_memo_hits = 0
+        self.verdict_memo_misses = 0
+        self.validation_latencies: deque = deque(maxlen=LATENCY_WINDOW)
+
+        self.compile_rules()
+
+    def compile_rules(self):
+        """Build the dense (from, to) rule table; call again after editing rules"""
+        self._agent_index = {agent.value: i for i, agent in enumerate(AgentType)}
+        size = len(self._agent_index)
+        self._rule_table: List[List[Optional[CompiledHandoffRule]]] = [
+            [None] * size for _ in range(size)
+        ]
+
+        for (source, target), rule in self.handoff_rules.items():
+            source, target = AgentType(source), AgentType(target)
+            self._rule_table[self._agent_index[source.value]][
+                self._agent_index[target.value]
+            ] = CompiledHandoffRule(
+                rule=rule,
+                key=(source.value, target.value),
+                required=frozenset(map(_type_value, rule.required_artifacts)),
+                optional=frozenset(map(_type_value, rule.optional_artifacts)),
+                produces=frozenset(
+                    map(
+                        _type_value, self.agent_capabilities[source].get("produces", [])
+                    )
+                ),
+                consumes=frozenset(
+                    map(
+                        _type_value, self.agent_capabilities[target].get("consumes", [])
+                    )
+                ),
+            )
+
+        # Verdicts depend on the rule table
+        self._verdict_memo.clear()
+
+    def _artifact_verdict(
+        self, compiled: CompiledHandoffRule, artifact_id: str
+    ) -> Optional[Tuple[str, bool, bool]]:
+        """(artifact type, producible, consumable) for an artifact under a rule"""
+        lineage = self.artifact_handler.get_lineage(artifact_id)
+        if lineage is None:
+            return None
+
+        key = (compiled.key, lineage.semantic_hash)
+        verdict = self._verdict_memo.get(key)
+        if verdict is not None:
+            self._verdict_memo.move_to_end(key)
+            self.verdict_memo_hits += 1
+            return verdict
+
+        artifact = self.artifact_handler.get_artifact(artifact_id)
+        if artifact is None:
+            return None
+        self.verdict_memo_misses += 1
+        artifact_type = _type_value(artifact.artifact_type)
+        verdict = (
+            artifact_type,
+            artifact_type in compiled.produces,
+            artifact_type in compiled.consumes,
+        )
+        self._verdict_memo[key] = verdict
+        if len(self._verdict_memo) > VERDICT_MEMO_SIZE:
+            self._verdict_memo.popitem(last=False)
+        return verdict
+
     def validate_handoff(
         self, from_agent: str, to_agent: str, artifacts: List[str]
     ) -> HandoffResult:
@@ -261,27 +363,69 @@ class AgentHandoff:
             HandoffResult with validation status and details
         """
 
-        start_time = datetime.now()
-        request_id = (
-            f"handoff_{start_time.strftime('%Y%m%d_%H%M%S')}_{from_agent}_{to_agent}"
-        )
+        start = time.perf_counter()
+        result = self._validate(from_agent, to_agent, artifacts)
+        result.processing_time = time.perf_counter() - start
+        self._record(result, from_agent, to_agent)
+        return result
 
-        try:
-            # Convert agent strings to enum types
-            from_agent_type = AgentType(from_agent)
-            to_agent_type = AgentType(to_agent)
+    def validate_handoffs_batch(
+        self, handoffs: Iterable[Tuple[str, str, Sequence[str]]]
+    ) -> List[HandoffResult]:
+        """
+        Validate many proposed handoffs in one pass.
+
+        Artifacts shared between handoffs under the same rule are checked
+        once, through the per-(rule, content hash) verdict memo.
+
+        Args:
+            handoffs: (from_agent, to_agent, artifact IDs) triples
+
+        Returns:
+            One HandoffResult per handoff, in order
+        """
+
+        results = []
+        for from_agent, to_agent, artifacts in handoffs:
+            start = time.perf_counter()
+            result = self._validate(from_agent, to_agent, artifacts)
+            result.processing_time = time.perf_counter() - start
+            self._record(result, from_agent, to_agent, log=False)
+            results.append(result)
+
+        logger.info(f"Validated batch of {len(results)} handoffs")
+        return results
+
+    def _record(
+        self, result: HandoffResult, from_agent: str, to_agent: str, log: bool = True
+    ):
+        self.handoff_history.append(result)
+        self.validation_latencies.append(result.processing_time)
+        if log:
+            logger.info(
+                f"Handoff validation {from_agent} -> {to_agent}: {_type_value(result.status)}"
+            )
+
+    def _validate(
+        self, from_agent: str, to_agent: str, artifacts: Sequence[str]
+    ) -> HandoffResult:
+        request_id = f"handoff_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{from_agent}_{to_agent}"
 
-        except ValueError as e:
+        from_index = self._agent_index.get(_type_value(from_agent))
+        to_index = self._agent_index.get(_type_value(to_agent))
+        if from_index is None or to_index is None:
+            invalid = from_agent if from_index is None else to_agent
             return HandoffResult(
                 request_id=request_id,
                 status=HandoffStatus.REJECTED,
-                validation_errors=[f"Invalid agent type: {e}"],
-                processing_time=(datetime.now() - start_time).total_seconds(),
+                validation_errors=[
+                    f"Invalid agent type: '{invalid}' is not a valid AgentType"
+                ],
             )
 
         # Check if handoff rule exists
-        handoff_rule = self.handoff_rules.get((from_agent_type, to_agent_type))
-        if not handoff_rule:
+        compiled = self._rule_table[from_index][to_index]
+        if compiled is None:
             return HandoffResult(
                 request_id=request_id,
                 status=HandoffStatus.REJECTED,
@@ -291,7 +435,6 @@ class AgentHandoff:
                 recommendations=[
                     f"Define handoff protocol for {from_agent} -> {to_agent}"
                 ],
-                processing_time=(datetime.now() - start_time).total_seconds(),
             )
 
         # Validate artifacts
@@ -300,45 +443,39 @@ class AgentHandoff:
         validation_errors = []
 
         # Check artifact existence and types
-        artifact_types = []
+        provided_artifacts = set()
+        invalid_producers = set()
+        invalid_consumers = set()
         for artifact_id in artifacts:
-            artifact = self.artifact_handler.get_artifact(artifact_id)
-            if not artifact:
+            verdict = self._artifact_verdict(compiled, artifact_id)
+            if verdict is None:
                 rejected_artifacts.append(artifact_id)
                 validation_errors.append(f"Artifact {artifact_id} not found")
                 continue
 
-            artifact_types.append(artifact.artifact_type)
+            artifact_type, producible, consumable = verdict
+            provided_artifacts.add(artifact_type)
+            if not producible:
+                invalid_producers.add(artifact_type)
+            if not consumable:
+                invalid_consumers.add(artifact_type)
             validated_artifacts.append(artifact_id)
 
         # Validate required artifacts
-        required_artifacts = set(handoff_rule.required_artifacts)
-        provided_artifacts = set(artifact_types)
-
-        missing_required = required_artifacts - provided_artifacts
+        missing_required = sorted(compiled.required - provided_artifacts)
         if missing_required:
-            validation_errors.append(
-                f"Missing required artifacts: {[art.value for art in missing_required]}"
-            )
+            validation_errors.append(f"Missing required artifacts: {missing_required}")
 
-        # Check agent capabilities
-        from_capabilities = self.agent_capabilities.get(from_agent_type, {})
-        to_capabilities = self.agent_capabilities.get(to_agent_type, {})
-
-        # Validate that from_agent can produce these artifacts
-        can_produce = set(from_capabilities.get("produces", []))
-        invalid_producers = provided_artifacts - can_produce
+        # Validate that from_agent can produce and to_agent can consume these artifacts
+        invalid_producers = sorted(invalid_producers)
         if invalid_producers:
             validation_errors.append(
-                f"Agent {from_agent} cannot produce: {[art.value for art in invalid_producers]}"
+                f"Agent {from_agent} cannot produce: {invalid_producers}"
             )
-
-        # Validate that to_agent can consume these artifacts
-        can_consume = set(to_capabilities.get("consumes", []))
-        invalid_consumers = provided_artifacts - can_consume
+        invalid_consumers = sorted(invalid_consumers)
         if invalid_consumers:
             validation_errors.append(
-                f"Agent {to_agent} cannot consume: {[art.value for art in invalid_consumers]}"
+                f"Agent {to_agent} cannot consume: {invalid_consumers}"
             )
 
         # Determine final status
@@ -352,35 +489,25 @@ class AgentHandoff:
         # Generate recommendations
         recommendations = []
         if missing_required:
-            recommendations.append(
-                f"Provide missing artifacts: {[art.value for art in missing_required]}"
-            )
+            recommendations.append(f"Provide missing artifacts: {missing_required}")
         if invalid_producers:
             recommendations.append(
-                f"Use appropriate agent for producing: {[art.value for art in invalid_producers]}"
+                f"Use appropriate agent for producing: {invalid_producers}"
             )
         if invalid_consumers:
             recommendations.append(
-                f"Route artifacts to compatible agent for: {[art.value for art in invalid_consumers]}"
+                f"Route artifacts to compatible agent for: {invalid_consumers}"
             )
 
-        result = HandoffResult(
+        return HandoffResult(
             request_id=request_id,
             status=status,
             validated_artifacts=validated_artifacts,
             rejected_artifacts=rejected_artifacts,
             validation_errors=validation_errors,
             recommendations=recommendations,
-            processing_time=(datetime.now() - start_time).total_seconds(),
         )
 
-        # Store result
-        self.handoff_history.append(result)
-
-        logger.info(f"Handoff validation {from_agent} -> {to_agent}: {status.value}")
-
-        return result
-
     def execute_handoff(self, handoff_request: HandoffRequest) -> HandoffResult:
         """
         Execute a validated handoff request.
@@ -394,8 +521,8 @@ class AgentHandoff:
 
         # First validate the handoff
         validation_result = self.validate_handoff(
-            handoff_request.from_agent.value,
-            handoff_request.to_agent.value,
+            _type_value(handoff_request.from_agent),
+            _type_value(handoff_request.to_agent),
             handoff_request.artifacts,
         )
 
@@ -448,10 +575,10 @@ class AgentHandoff:
                     {
                         "to_agent": target.value,
                         "required_artifacts": [
-                            art.value for art in rule.required_artifacts
+                            _type_value(art) for art in rule.required_artifacts
                         ],
                         "optional_artifacts": [
-                            art.value for art in rule.optional_artifacts
+                            _type_value(art) for art in rule.optional_artifacts
                         ],
                         "conditions": rule.conditions,
                         "priority": rule.priority,
@@ -498,18 +625,21 @@ class AgentHandoff:
             Suggested workflow sequence
         """
 
-        # Analyze current artifacts
-        artifact_types = []
+        # Analyze current artifacts in one pass, stopping once every type is seen
+        artifact_types = set()
+        all_types = len(ArtifactType)
         for artifact_id in project_artifacts:
             artifact = self.artifact_handler.get_artifact(artifact_id)
             if artifact:
-                artifact_types.append(artifact.artifact_type)
+                artifact_types.add(_type_value(artifact.artifact_type))
+                if len(artifact_types) == all_types:
+                    break
 
         workflow_suggestions = []
 
         # Basic workflow patterns
-        if ArtifactType.SPEC_DOC in artifact_types:
-            if ArtifactType.CODE_PATCH not in artifact_types:
+        if ArtifactType.SPEC_DOC.value in artifact_types:
+            if ArtifactType.CODE_PATCH.value not in artifact_types:
                 workflow_suggestions.append(
                     {
                         "step": 1,
@@ -521,8 +651,8 @@ class AgentHandoff:
                     }
                 )
 
-        if ArtifactType.CODE_PATCH in artifact_types:
-            if ArtifactType.TEST_PLAN not in artifact_types:
+        if ArtifactType.CODE_PATCH.value in artifact_types:
+            if ArtifactType.TEST_PLAN.value not in artifact_types:
                 workflow_suggestions.append(
                     {
                         "step": 2,
@@ -534,7 +664,7 @@ class AgentHandoff:
                     }
                 )
 
-        if ArtifactType.TEST_PLAN in artifact_types:
+        if ArtifactType.TEST_PLAN.value in artifact_types:
             workflow_suggestions.append(
                 {
                     "step": 3,
@@ -594,4 +724,23 @@ class AgentHandoff:
             "average_processing_time": avg_processing_time,
             "active_handoffs": len(self.active_handoffs),
             "common_errors": common_errors,
+            "validation_latency_ms": self._latency_percentiles(),
+            "verdict_memo": {
+                "hits": self.verdict_memo_hits,
+                "misses": self.verdict_memo_misses,
+                "size": len(self._verdict_memo),
+            },
+        }
+
+    def _latency_percentiles(self) -> Dict[str, float]:
+        """p50/p90/p99/max of recent validation latencies, in milliseconds"""
+        if not self.validation_latencies:
+            return {}
+        latencies = sorted(self.validation_latencies)
+        return {
+            "p50": _percentile(latencies, 0.50) * 1000,
+            "p90": _percentile(latencies, 0.90) * 1000,
+            "p99": _percentile(latencies, 0.99) * 1000,
+            "max": latencies[-1] * 1000,
+            "samples": len(latencies),
         }
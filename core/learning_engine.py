@@ -14,9 +14,6 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Any, Optional, Tuple
 import json
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.model_selection import cross_val_score
-from sklearn.preprocessing import StandardScaler
 
 logger = logging.getLogger(__name__)
 
@@ -288,6 +285,12 @@ class MAMLLearner:
     def __init__(self, meta_lr: float = 0.01, inner_lr: float = 0.1):
         self.meta_lr = meta_lr
         self.inner_lr = inner_lr
+
+        # sklearn is imported here rather than at module level; it adds
+        # seconds to cold start for every importer of this module
+        from sklearn.ensemble import RandomForestRegressor
+        from sklearn.preprocessing import StandardScaler
+
         self.base_model = RandomForestRegressor(n_estimators=50, random_state=42)
         self.scaler = StandardScaler()
         self.is_trained = False
@@ -318,6 +321,8 @@ class MAMLLearner:
         self.is_trained = True
 
         # Calculate meta-learning metrics
+        from sklearn.model_selection import cross_val_score
+
         cv_scores = cross_val_score(self.base_model, X_scaled, all_y, cv=5)
 
         logger.info(
@@ -345,6 +350,8 @@ class MAMLLearner:
         X_scaled = self.scaler.transform(X_support)
 
         # Simple adaptation: retrain on support data
+        from sklearn.ensemble import RandomForestRegressor
+
         adapted_model = RandomForestRegressor(n_estimators=20, random_state=42)
         adapted_model.fit(X_scaled, y_support)
 
@@ -14,7 +14,7 @@ import json
 
 from core.event_streaming import StreamEvent, EventType, EventStreamType
 from core.intelligent_router import IntelligentTaskRouter
-from agents.live_agent_workers import LiveAgentOrchestrator
+from agents.live_agent_workers import TASK_QUEUED, LiveAgentOrchestrator
 from schemas.artifacts import ArtifactType
 
 logger = logging.getLogger(__name__)
@@ -31,7 +31,9 @@ class LiveOrchestrator:
 
         self.event_bus = bus
         self.router = IntelligentTaskRouter(self.event_bus)
-        self.agent_orchestrator = LiveAgentOrchestrator(self.event_bus)
+        self.agent_orchestrator = LiveAgentOrchestrator(
+            self.event_bus, assignment_callback=self._record_assignment
+        )
 
         # Active workflows
         self.active_workflows: Dict[str, Dict[str, Any]] = {}
@@ -405,17 +407,24 @@ class LiveOrchestrator:
             )
 
             if selected_agent:
+                # A queued phase is assigned by the dispatcher once a worker
+                # frees a slot; it shows as queued until _record_assignment
+                queued = selected_agent == TASK_QUEUED
                 workflow["agent_assignments"][phase["phase_id"]] = selected_agent
 
                 # Create task event
                 task_event = StreamEvent(
                     correlation_id=correlation_id,
                     event_type=EventType.TASK_CREATED,
-                    agent_id=selected_agent,
+                    agent_id=None if queued else selected_agent,
                     task_id=task_data["task_id"],
                     artifact_id=f"{task_data['task_id']}_artifact",
                     payload=task_data,
-                    metadata={"phase": phase["phase_id"], "live_execution": True},
+                    metadata={
+                        "phase": phase["phase_id"],
+                        "live_execution": True,
+                        "queued": queued,
+                    },
                 )
 
                 await self.event_bus.publish_event(EventStreamType.TASKS, task_event)
@@ -425,6 +434,13 @@ class LiveOrchestrator:
             self._monitor_phase_completion(correlation_id, phase["phase_id"])
         )
 
+    def _record_assignment(self, worker_id: str, task_data: Dict[str, Any]):
+        """Record the worker the dispatcher gave a phase task to"""
+        workflow = self.active_workflows.get(task_data.get("correlation_id"))
+        phase = task_data.get("phase_info")
+        if workflow and phase:
+            workflow["agent_assignments"][phase["phase_id"]] = worker_id
+
     async def _monitor_phase_completion(self, correlation_id: str, phase_id: str):
         """Monitor phase completion and trigger next phase or quality cascade"""
 
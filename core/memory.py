@@ -5,9 +5,10 @@ Project memory system for storing and retrieving agent interactions and context
 import json
 import sqlite3
 import os
-from typing import Dict, List, Any
+from typing import Callable, Dict, Iterator, List, Any, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
+from collections import OrderedDict
 import uuid
 import logging
 
@@ -42,13 +43,78 @@ class MemoryEntry:
         return cls(**data)
 
 
+class SessionMemory:
+    """LRU-bounded in-process cache of recent memory entries.
+
+    Entries that are not yet on disk (e.g. imported ones) are marked dirty and
+    handed to ``spill`` when evicted or flushed, so nothing is lost when the
+    cache drops them.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        spill: Optional[Callable[[MemoryEntry], None]] = None,
+    ):
+        self.max_entries = max_entries
+        self.spill = spill
+        self._entries: "OrderedDict[str, MemoryEntry]" = OrderedDict()
+        self._dirty: set = set()
+
+    def append(self, entry: MemoryEntry, dirty: bool = False):
+        """Add an entry as most recently used, evicting the oldest if full"""
+        self._entries[entry.entry_id] = entry
+        self._entries.move_to_end(entry.entry_id)
+        if dirty:
+            self._dirty.add(entry.entry_id)
+        while len(self._entries) > self.max_entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._spill(evicted)
+
+    def get(self, entry_id: str) -> Optional[MemoryEntry]:
+        """Return an entry and mark it as recently used"""
+        entry = self._entries.get(entry_id)
+        if entry is not None:
+            self._entries.move_to_end(entry_id)
+        return entry
+
+    def flush(self):
+        """Write every dirty entry to disk"""
+        for entry_id in list(self._dirty):
+            self._spill(self._entries[entry_id])
+
+    def clear(self):
+        self.flush()
+        self._entries.clear()
+
+    def _spill(self, entry: MemoryEntry):
+        if entry.entry_id in self._dirty:
+            self._dirty.discard(entry.entry_id)
+            if self.spill:
+                self.spill(entry)
+
+    def __contains__(self, entry_id: str) -> bool:
+        return entry_id in self._entries
+
+    def __iter__(self) -> Iterator[MemoryEntry]:
+        return iter(list(self._entries.values()))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class ProjectMemory:
     """Memory system for storing project context and agent interactions"""
 
-    def __init__(self, db_path: str = "project_memory.db"):
+    def __init__(
+        self, db_path: str = "project_memory.db", max_session_entries: int = 1000
+    ):
         self.db_path = db_path
         self.current_context: Dict[str, Any] = {}
-        self.session_memory: List[MemoryEntry] = []
+        self.session_memory = SessionMemory(
+            max_entries=max_session_entries, spill=self._spill_memory_entry
+        )
+        self.fts_enabled = False
         self.init_database()
 
     def init_database(self):
@@ -98,11 +164,62 @@ class ProjectMemory:
                     "CREATE INDEX IF NOT EXISTS idx_project ON memory_entries(project_id)"
                 )
 
+                self.fts_enabled = self._init_fts(conn)
+
                 conn.commit()
                 logger.info("Memory database initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize memory database: {e}")
 
+    def _init_fts(self, conn: sqlite3.Connection) -> bool:
+        """Create the FTS5 index over memory_entries and its sync triggers"""
+        try:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'memory_entries_fts'"
+            ).fetchone()
+
+            # External-content table: the text lives once, in memory_entries
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS memory_entries_fts USING fts5(
+                    content, agent_name UNINDEXED,
+                    content='memory_entries', content_rowid='rowid'
+                )
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS memory_entries_ai
+                AFTER INSERT ON memory_entries BEGIN
+                    INSERT INTO memory_entries_fts(rowid, content, agent_name)
+                    VALUES (new.rowid, new.content, new.agent_name);
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS memory_entries_ad
+                AFTER DELETE ON memory_entries BEGIN
+                    INSERT INTO memory_entries_fts(memory_entries_fts, rowid, content, agent_name)
+                    VALUES ('delete', old.rowid, old.content, old.agent_name);
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS memory_entries_au
+                AFTER UPDATE ON memory_entries BEGIN
+                    INSERT INTO memory_entries_fts(memory_entries_fts, rowid, content, agent_name)
+                    VALUES ('delete', old.rowid, old.content, old.agent_name);
+                    INSERT INTO memory_entries_fts(rowid, content, agent_name)
+                    VALUES (new.rowid, new.content, new.agent_name);
+                END
+            """)
+
+            # Index rows written before the FTS table existed
+            if not exists:
+                conn.execute(
+                    "INSERT INTO memory_entries_fts(memory_entries_fts) VALUES ('rebuild')"
+                )
+            return True
+
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, memory search will use LIKE: {e}")
+            return False
+
     def add_interaction(
         self,
         request: str,
@@ -317,17 +434,68 @@ class ProjectMemory:
     def search_memory(
         self, query: str, agent_name: str = None, limit: int = 20
     ) -> List[Dict[str, Any]]:
-        """Search memory for specific content"""
-        query_lower = query.lower()
-        results = []
+        """Search memory for specific content, best matches first"""
+        # Session entries are persisted on write (or flushed here), so the
+        # database is the single source of truth for search.
+        self.session_memory.flush()
+        if self.fts_enabled:
+            results = self._search_fts(query, agent_name, limit)
+            if results is not None:
+                return results
+        return self._search_like(query, agent_name, limit)
+
+    @staticmethod
+    def _fts_query(query: str) -> str:
+        """Quote each term so user input is never parsed as FTS5 syntax"""
+        terms = [t.replace('"', '""') for t in query.split()]
+        return " ".join(f'"{t}"' for t in terms if t)
+
+    def _search_fts(
+        self, query: str, agent_name: str, limit: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """BM25-ranked FTS5 search with highlighted snippets"""
+        match = self._fts_query(query)
+        if not match:
+            return []
 
-        # Search session memory
-        for entry in self.session_memory:
-            if query_lower in entry.content.lower():
-                if not agent_name or entry.agent_name == agent_name:
-                    results.append(entry.to_dict())
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
 
-        # Search database
+                sql_query = """
+                    SELECT m.*,
+                           bm25(memory_entries_fts) AS score,
+                           snippet(memory_entries_fts, 0, '[', ']', '...', 16) AS snippet
+                    FROM memory_entries_fts
+                    JOIN memory_entries m ON m.rowid = memory_entries_fts.rowid
+                    WHERE memory_entries_fts MATCH ?
+                """
+                params: List[Any] = [match]
+
+                if agent_name:
+                    sql_query += " AND m.agent_name = ?"
+                    params.append(agent_name)
+
+                # bm25() is lower-is-better
+                sql_query += " ORDER BY score LIMIT ?"
+                params.append(limit)
+
+                results = []
+                for row in conn.execute(sql_query, params):
+                    entry_dict = dict(row)
+                    entry_dict["metadata"] = json.loads(entry_dict["metadata"] or "{}")
+                    results.append(entry_dict)
+                return results
+
+        except sqlite3.OperationalError as e:
+            logger.error(f"FTS search failed, falling back to LIKE: {e}")
+            return None
+
+    def _search_like(
+        self, query: str, agent_name: str, limit: int
+    ) -> List[Dict[str, Any]]:
+        """Substring scan used when FTS5 is not compiled into SQLite"""
+        results = []
         try:
             with sqlite3.connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
@@ -345,22 +513,15 @@ class ProjectMemory:
                 sql_query += " ORDER BY timestamp DESC LIMIT ?"
                 params.append(limit)
 
-                rows = conn.execute(sql_query, params).fetchall()
-
-                for row in rows:
+                for row in conn.execute(sql_query, params).fetchall():
                     entry_dict = dict(row)
                     entry_dict["metadata"] = json.loads(entry_dict["metadata"] or "{}")
-
-                    # Avoid duplicates
-                    if not any(
-                        r["entry_id"] == entry_dict["entry_id"] for r in results
-                    ):
-                        results.append(entry_dict)
+                    results.append(entry_dict)
 
         except Exception as e:
             logger.error(f"Error searching memory: {e}")
 
-        return results[:limit]
+        return results
 
     def get_knowledge_for_agent(self, agent_name: str) -> Dict[str, Any]:
         """Get accumulated knowledge for a specific agent"""
@@ -429,7 +590,7 @@ class ProjectMemory:
     def clear_context(self):
         """Clear current context (useful for new projects)"""
         self.current_context = {}
-        self.session_memory = []
+        self.session_memory.clear()
         logger.info("Context and session memory cleared")
 
     def save_project_context(self, project_id: str):
@@ -557,6 +718,31 @@ class ProjectMemory:
         except Exception as e:
             logger.error(f"Error storing memory entry: {e}")
 
+    def _spill_memory_entry(self, entry: MemoryEntry):
+        """Make sure an entry evicted from session memory is on disk"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    INSERT OR IGNORE INTO memory_entries 
+                    (entry_id, timestamp, agent_name, interaction_type, content, metadata, project_id)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                    (
+                        entry.entry_id,
+                        entry.timestamp.isoformat(),
+                        entry.agent_name,
+                        entry.interaction_type,
+                        entry.content,
+                        json.dumps(entry.metadata),
+                        entry.project_id,
+                    ),
+                )
+                conn.commit()
+
+        except Exception as e:
+            logger.error(f"Error spilling memory entry: {e}")
+
     def _update_context_from_interaction(
         self, request: str, response: str, agent_name: str
     ):
@@ -651,17 +837,26 @@ class ProjectMemory:
             if "session_memory" in import_data:
                 for entry_dict in import_data["session_memory"]:
                     entry = MemoryEntry.from_dict(entry_dict)
-                    self.session_memory.append(entry)
+                    self.session_memory.append(entry, dirty=True)
 
             # Import project memory to database
             if "project_memory" in import_data:
                 with sqlite3.connect(self.db_path) as conn:
                     for entry_dict in import_data["project_memory"]:
+                        # Upsert rather than REPLACE so the FTS update
+                        # trigger fires instead of a silent delete+insert
                         conn.execute(
                             """
-                            INSERT OR REPLACE INTO memory_entries 
+                            INSERT INTO memory_entries 
                             (entry_id, timestamp, agent_name, interaction_type, content, metadata, project_id)
                             VALUES (?, ?, ?, ?, ?, ?, ?)
+                            ON CONFLICT(entry_id) DO UPDATE SET
+                                timestamp = excluded.timestamp,
+                                agent_name = excluded.agent_name,
+                                interaction_type = excluded.interaction_type,
+                                content = excluded.content,
+                                metadata = excluded.metadata,
+                                project_id = excluded.project_id
                         """,
                             (
                                 entry_dict["entry_id"],
@@ -7,8 +7,11 @@ based on outcome learning and cost governance.
 
 import logging
 import json
+import queue
+import threading
 from datetime import datetime
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+from uuid import uuid4
 from dataclasses import dataclass, field
 import sqlite3
 from pathlib import Path
@@ -16,7 +19,7 @@ from pathlib import Path
 from schemas.routing import ModelType, TaskType
 from schemas.outcomes import TaskOutcome
 from core.bandit_learning import ThompsonSamplingBandit
-from core.cost_governor import CostGovernor
+from core.cost_governor import BudgetReservation, CostGovernor
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +68,15 @@ class CapabilityVector:
         return adjustment
 
 
+def _context_bucket(context: Dict[str, Any]) -> Tuple[bool, bool, bool]:
+    """The context inputs CapabilityVector._get_context_adjustment depends on"""
+    return (
+        context.get("complexity", 0.5) > 0.7,
+        bool(context.get("time_sensitive", False)),
+        bool(context.get("cost_sensitive", False)),
+    )
+
+
 # TaskOutcome is now imported from schemas.outcomes
 
 
@@ -74,11 +86,26 @@ class IntelligentRouter:
     and multi-objective optimization
     """
 
+    # Routing decisions written per batch by the background writer
+    DECISION_BATCH_SIZE = 200
+
     def __init__(self, db_path: str = "router_learning.db"):
         self.db_path = db_path
         self.capability_vectors = self._initialize_capability_vectors()
         self.bandit = ThompsonSamplingBandit()
         self.cost_governor = CostGovernor()
+
+        for model_type in self.capability_vectors:
+            self.bandit.register_arm(model_type.value)
+
+        # (task_type, context bucket) -> adjusted capability per model;
+        # cleared whenever learned weights change
+        self._capability_cache: Dict[Tuple, Dict[ModelType, float]] = {}
+
+        # Routing decisions are persisted off the request path
+        self._decision_queue: "queue.Queue[Tuple]" = queue.Queue()
+        self._decision_writer = None
+        self._writer_lock = threading.Lock()
         # Performance tracker will be initialized externally to avoid circular imports
 
         # Learning parameters
@@ -231,7 +258,7 @@ class IntelligentRouter:
         features["cost_sensitive"] = float(context.get("cost_sensitive", False))
         features["quality_priority"] = context.get("quality_priority", 0.5)
         features["estimated_tokens"] = min(
-            1.0, context.get("estimated_tokens", 1000) / 10000
+            1.0, self.cost_governor.estimate_tokens(context) / 10000
         )
 
         # Task type indicators
@@ -244,6 +271,7 @@ class IntelligentRouter:
 
     def _count_complexity_keywords(self, text: str) -> int:
         """Count complexity-indicating keywords"""
+        text = text.lower()
         keywords = [
             "complex",
             "advanced",
@@ -256,10 +284,11 @@ class IntelligentRouter:
             "extensive",
             "multi-step",
         ]
-        return sum(1 for keyword in keywords if keyword.lower() in text.lower())
+        return sum(1 for keyword in keywords if keyword in text)
 
     def _count_code_keywords(self, text: str) -> int:
         """Count coding-related keywords"""
+        text = text.lower()
         keywords = [
             "code",
             "function",
@@ -272,10 +301,11 @@ class IntelligentRouter:
             "programming",
             "development",
         ]
-        return sum(1 for keyword in keywords if keyword.lower() in text.lower())
+        return sum(1 for keyword in keywords if keyword in text)
 
     def _count_reasoning_keywords(self, text: str) -> int:
         """Count reasoning-related keywords"""
+        text = text.lower()
         keywords = [
             "analyze",
             "design",
@@ -290,13 +320,19 @@ class IntelligentRouter:
             "think",
             "reason",
         ]
-        return sum(1 for keyword in keywords if keyword.lower() in text.lower())
+        return sum(1 for keyword in keywords if keyword in text)
 
     def route_task(
         self, task: Dict[str, Any], context: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
         Route task to optimal model using learned weights and bandit optimization
+
+        The decision's ``reservation`` holds the selected model's estimated
+        usage against the budget. Pass it to update_from_outcome once the call
+        finishes, or to release_decision if the call never runs; a hold left
+        unfinished expires after CostGovernor.RESERVATION_TTL_S. Decisions made
+        after the budget check fails carry no reservation.
         """
         features = self.extract_features(task)
         task_type = context.get("task_type", TaskType.REASONING_LONG)
@@ -305,38 +341,48 @@ class IntelligentRouter:
         # Check budget constraints
         project_complexity = context.get("project_complexity", "medium")
         current_usage = context.get("current_usage", {})
+        project_id = context.get("project_id", "default")
+        task_id = task.get("id") or context.get("task_id") or uuid4().hex
 
         if not self.cost_governor.check_budget(project_complexity, current_usage):
             logger.warning("Budget constraints violated, using cost-efficient model")
-            return self._select_cost_efficient_model(features, context)
+            return self._select_cost_efficient_model(features, context, task_id)
 
         # Get model scores using bandit algorithm
         model_scores = {}
         model_contexts = {}
 
-        # Register all models with bandit if not already registered
-        for model_type in self.capability_vectors.keys():
-            self.bandit.register_arm(model_type.value)
+        # One budget read and one Thompson draw per decision
+        budget = self.cost_governor.budget_snapshot(project_complexity, project_id)
+        try:
+            selected_arm = self.bandit.select_arm(context=features)
+        except Exception:
+            selected_arm = None
+
+        capability_scores = self._capability_scores(task_type.value, context)
 
         for model_type, capability_vector in self.capability_vectors.items():
             # Skip models that are over budget
-            if not self.cost_governor.can_afford_model(model_type, context):
-                continue
+            if budget is not None:
+                estimated_tokens = self.cost_governor.estimate_tokens(
+                    context, model_type
+                )
+                if not budget.can_afford(
+                    self.cost_governor.estimate_cost(model_type, estimated_tokens),
+                    estimated_tokens,
+                ):
+                    continue
 
             # Get capability-based score
-            capability_score = capability_vector.get_adjusted_capability(
-                task_type.value, context
-            )
+            capability_score = capability_scores[model_type]
 
-            # Get Thompson Sampling exploration bonus
-            try:
-                selected_arm = self.bandit.select_arm(context=features)
-                # If this model was selected by bandit, give it a bonus
+            # Thompson Sampling exploration bonus for the drawn arm
+            if selected_arm is None:
+                exploration_bonus = self.exploration_factor * 0.5  # Default exploration
+            else:
                 exploration_bonus = (
                     self.exploration_factor if selected_arm == model_type.value else 0.0
                 )
-            except Exception:
-                exploration_bonus = self.exploration_factor * 0.5  # Default exploration
 
             # Multi-objective optimization
             quality_component = capability_score * self.quality_weight
@@ -366,14 +412,31 @@ class IntelligentRouter:
                 "exploration_bonus": exploration_bonus,
             }
 
-        # Select best model
+        # Select the best model whose estimated usage can be held against the
+        # budget; the hold is committed or released when the call finishes
         if not model_scores:
             raise ValueError("No models available within budget constraints")
 
-        best_model = max(model_scores.items(), key=lambda x: x[1])[0]
+        best_model = None
+        for model_type, _ in sorted(
+            model_scores.items(), key=lambda x: x[1], reverse=True
+        ):
+            reservation = self.cost_governor.reserve(
+                project_id,
+                self.cost_governor.estimate_tokens(context, model_type),
+                project_complexity=project_complexity,
+                model_type=model_type,
+            )
+            if reservation is not None:
+                best_model = model_type
+                break
+        if best_model is None:
+            raise ValueError("No models available within budget constraints")
 
         # Create routing decision
         routing_decision = {
+            "task_id": task_id,
+            "reservation": reservation,
             "selected_model": best_model,
             "routing_score": model_scores[best_model],
             "alternatives": sorted(
@@ -396,8 +459,22 @@ class IntelligentRouter:
 
         return routing_decision
 
+    def _capability_scores(
+        self, task_type: str, context: Dict[str, Any]
+    ) -> Dict[ModelType, float]:
+        """Adjusted capability per model, memoized per (task type, context bucket)"""
+        key = (task_type, _context_bucket(context))
+        scores = self._capability_cache.get(key)
+        if scores is None:
+            scores = {
+                model_type: vector.get_adjusted_capability(task_type, context)
+                for model_type, vector in self.capability_vectors.items()
+            }
+            self._capability_cache[key] = scores
+        return scores
+
     def _select_cost_efficient_model(
-        self, features: Dict[str, float], context: Dict[str, Any]
+        self, features: Dict[str, float], context: Dict[str, Any], task_id: str
     ) -> Dict[str, Any]:
         """Select most cost-efficient model when budget is constrained"""
         cost_efficient_models = [ModelType.CLAUDE_HAIKU, ModelType.GEMINI_FLASH]
@@ -409,6 +486,8 @@ class IntelligentRouter:
                 break
 
         return {
+            "task_id": task_id,
+            "reservation": None,
             "selected_model": best_model,
             "routing_score": 0.6,  # Moderate score for cost-efficient fallback
             "alternatives": [],
@@ -418,8 +497,28 @@ class IntelligentRouter:
             "timestamp": datetime.now(),
         }
 
-    def update_from_outcome(self, task_id: str, outcome: TaskOutcome):
+    def release_decision(self, routing_decision: Dict[str, Any]) -> bool:
+        """
+        Return the budget held for a routed task that was never executed.
+
+        Returns False if the decision holds nothing (or was already settled).
+        """
+        reservation = routing_decision.get("reservation")
+        return reservation is not None and self.cost_governor.release(reservation)
+
+    def update_from_outcome(
+        self,
+        task_id: str,
+        outcome: TaskOutcome,
+        reservation: Optional[BudgetReservation] = None,
+    ):
         """Update learning from task outcome"""
+        # Settle the routing-time hold with the usage actually incurred
+        if reservation is not None:
+            self.cost_governor.commit(
+                reservation, actual_tokens=outcome.token_usage, actual_cost=outcome.cost
+            )
+
         try:
             # Update bandit algorithm
             reward = self._calculate_reward(outcome)
@@ -481,6 +580,7 @@ class IntelligentRouter:
 
         model_vector.learned_weights[task_type] = max(0.1, min(2.0, updated_weight))
         model_vector.last_updated = datetime.now()
+        self._capability_cache.clear()
 
         logger.debug(
             f"Updated {outcome.model_used.value} weight for {task_type}: "
@@ -488,27 +588,65 @@ class IntelligentRouter:
         )
 
     def _store_routing_decision(self, decision: Dict[str, Any]):
-        """Store routing decision in database"""
+        """Queue routing decision for the background database writer"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO routing_decisions 
-                    (task_id, selected_model, routing_score, alternatives, 
-                     decision_factors, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        decision.get("task_id", "unknown"),
-                        decision["selected_model"].value,
-                        decision["routing_score"],
-                        json.dumps([(k.value, v) for k, v in decision["alternatives"]]),
-                        json.dumps(decision["decision_factors"]),
-                        decision["timestamp"],
-                    ),
-                )
+            row = (
+                decision.get("task_id", "unknown"),
+                decision["selected_model"].value,
+                decision["routing_score"],
+                json.dumps([(k.value, v) for k, v in decision["alternatives"]]),
+                json.dumps(decision["decision_factors"]),
+                decision["timestamp"].isoformat(),
+            )
         except Exception as e:
             logger.error(f"Failed to store routing decision: {e}")
+            return
+
+        self._ensure_decision_writer()
+        self._decision_queue.put(row)
+
+    def _ensure_decision_writer(self):
+        if self._decision_writer is not None:
+            return
+        with self._writer_lock:
+            if self._decision_writer is None:
+                self._decision_writer = threading.Thread(
+                    target=self._write_decisions,
+                    name="routing-decision-writer",
+                    daemon=True,
+                )
+                self._decision_writer.start()
+
+    def _write_decisions(self):
+        """Writer loop: block for one decision, then drain a batch"""
+        while True:
+            batch: List[Tuple] = [self._decision_queue.get()]
+            while len(batch) < self.DECISION_BATCH_SIZE:
+                try:
+                    batch.append(self._decision_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.executemany(
+                        """
+                        INSERT INTO routing_decisions
+                        (task_id, selected_model, routing_score, alternatives,
+                         decision_factors, timestamp)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                        batch,
+                    )
+            except Exception as e:
+                logger.error(f"Failed to store {len(batch)} routing decisions: {e}")
+            finally:
+                for _ in batch:
+                    self._decision_queue.task_done()
+
+    def flush_decisions(self):
+        """Block until every queued routing decision has been written"""
+        self._decision_queue.join()
 
     def _store_outcome(self, outcome: TaskOutcome):
         """Store task outcome in database"""
@@ -588,4 +726,6 @@ class IntelligentRouter:
 
         # Use the main routing logic
         routing_decision = self.route_task({"context": task_context}, task_context)
+        # Selection only: nothing is executed against the held budget
+        self.release_decision(routing_decision)
         return routing_decision["selected_model"]
@@ -5,12 +5,16 @@ This module implements a cascading quality assurance system that routes artifact
 through multiple quality stages based on confidence thresholds and task complexity.
 """
 
+import bisect
+import hashlib
 import logging
 import asyncio
+import time
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, List, Any, Optional, Set, Tuple
 from uuid import uuid4
 
 from core.artifacts import ArtifactValidator, ArtifactType
@@ -18,6 +22,11 @@ from core.artifacts import ArtifactValidator, ArtifactType
 logger = logging.getLogger(__name__)
 
 
+def _stable_digest(text: str) -> int:
+    """Hash that, unlike hash(), is the same in every process"""
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=4).digest(), "big")
+
+
 class TaskComplexity(str, Enum):
     """Task complexity levels for quality threshold determination"""
 
@@ -87,6 +96,32 @@ class CascadeArtifact:
     requires_human_review: bool = False
 
 
+class LatencyHistogram:
+    """Fixed-bucket histogram of latencies in seconds"""
+
+    BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+    def __init__(self, bounds: Tuple[float, ...] = BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"<={bound * 1000:g}ms" for bound in self.bounds]
+        labels.append(f">{self.bounds[-1] * 1000:g}ms")
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
 class QualityCascade:
     """
     Quality Cascading Engine that routes artifacts through multiple quality stages
@@ -131,6 +166,35 @@ class QualityCascade:
         # Active cascade processes
         self.active_cascades: Dict[str, CascadeArtifact] = {}
 
+        # Finished cascades are evicted from active_cascades into a bounded
+        # store; cascades parked for revision or human review stay active
+        # until active_cascades outgrows max_active_cascades
+        self.max_active_cascades = 1000
+        self.max_completed_cascades = 5000
+        self.completed_cascades: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._parked_cascades: "OrderedDict[str, None]" = OrderedDict()
+
+        # Central scheduler: per-stage work queues drained in batches, with a
+        # global budget of stage batches evaluated concurrently
+        self.stage_batch_size = 32
+        self.max_concurrent_batches = 8
+        self.stage_queues: Dict[CascadeStage, Deque[Tuple[str, float]]] = {
+            stage: deque() for stage in self.cascade_stages
+        }
+        self.stage_latency = {
+            stage: LatencyHistogram() for stage in self.cascade_stages
+        }
+        self.batches_processed = 0
+        self.artifacts_evaluated = 0
+        self._in_flight_batches = 0
+        self._scheduler_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._scheduler_task: Optional[asyncio.Task] = None
+        # The event loop only keeps weak references to tasks
+        self._batch_tasks: Set[asyncio.Task] = set()
+        self._work_available: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._batch_slots: Optional[asyncio.Semaphore] = None
+
         # Quality reviewers per stage (mock for now - would integrate with real agents)
         self.stage_reviewers = {
             CascadeStage.PEER_REVIEW: ["claude", "gpt4"],
@@ -178,6 +242,7 @@ class QualityCascade:
 
         # Store in active cascades
         self.active_cascades[cascade_id] = cascade_artifact
+        self._evict_parked_cascades()
 
         # Publish cascade started event
         if self.event_bus:
@@ -202,7 +267,7 @@ class QualityCascade:
                 logger.warning(f"Could not publish cascade event: {e}")
 
         # Start cascade processing
-        asyncio.create_task(self._process_cascade(cascade_id))
+        await self._process_cascade(cascade_id)
 
         logger.info(
             f"Started quality cascade {cascade_id} for artifact {cascade_artifact.artifact_id}"
@@ -210,107 +275,236 @@ class QualityCascade:
         return cascade_id
 
     async def _process_cascade(self, cascade_id: str) -> None:
-        """Process artifact through cascade stages"""
+        """Queue a cascade at its current stage on the central scheduler"""
 
         cascade_artifact = self.active_cascades.get(cascade_id)
         if not cascade_artifact:
             logger.error(f"Cascade artifact not found: {cascade_id}")
             return
 
-        try:
-            while cascade_artifact.current_stage in self.cascade_stages:
-                stage_result = await self._process_stage(cascade_artifact)
+        self._ensure_scheduler()
+        self._enqueue(cascade_id, cascade_artifact.current_stage)
 
-                # Record stage in history
-                cascade_artifact.stage_history.append(
-                    {
-                        "stage": cascade_artifact.current_stage.value,
-                        "result": stage_result.value,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "quality_score": cascade_artifact.quality_metrics.overall_score
-                        if cascade_artifact.quality_metrics
-                        else 0.0,
-                    }
-                )
+    def _ensure_scheduler(self) -> None:
+        """Start the scheduler on the running event loop if it is not running"""
 
-                # Handle stage result
-                if stage_result == CascadeResult.PASSED:
-                    # Move to next stage or complete
-                    next_stage = self._get_next_stage(cascade_artifact.current_stage)
-                    if next_stage:
-                        cascade_artifact.current_stage = next_stage
-                        logger.info(
-                            f"Cascade {cascade_id} advanced to stage: {next_stage.value}"
-                        )
-                    else:
-                        # Cascade completed successfully
-                        await self._complete_cascade(cascade_id, CascadeResult.APPROVED)
-                        break
-
-                elif stage_result == CascadeResult.REQUIRES_REVISION:
-                    # Send back for revision
-                    await self._request_revision(cascade_artifact)
-                    break
-
-                elif stage_result == CascadeResult.ESCALATE:
-                    # Escalate to human review
-                    cascade_artifact.requires_human_review = True
-                    cascade_artifact.current_stage = CascadeStage.HUMAN_REVIEW
-                    await self._escalate_to_human(cascade_artifact)
-                    break
-
-                elif stage_result == CascadeResult.FAILED:
-                    # Cascade failed
+        loop = asyncio.get_running_loop()
+        if (
+            self._scheduler_loop is loop
+            and self._scheduler_task
+            and not self._scheduler_task.done()
+        ):
+            return
+
+        self._scheduler_loop = loop
+        self._work_available = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._batch_slots = asyncio.Semaphore(self.max_concurrent_batches)
+        self._in_flight_batches = 0
+        self._scheduler_task = loop.create_task(self._run_scheduler())
+
+    def _enqueue(self, cascade_id: str, stage: CascadeStage) -> None:
+        self.stage_queues[stage].append((cascade_id, time.perf_counter()))
+        self._idle.clear()
+        self._work_available.set()
+
+    async def _run_scheduler(self) -> None:
+        """Drain the stage queues in batches within the concurrency budget"""
+
+        while True:
+            await self._work_available.wait()
+            self._work_available.clear()
+
+            # Later stages first, so cascades already under way finish before
+            # newly submitted ones take up the budget
+            for stage in reversed(self.cascade_stages):
+                queue = self.stage_queues[stage]
+                while queue:
+                    await self._batch_slots.acquire()
+                    batch = [
+                        queue.popleft()
+                        for _ in range(min(self.stage_batch_size, len(queue)))
+                    ]
+                    self._in_flight_batches += 1
+                    task = asyncio.create_task(self._run_stage_batch(stage, batch))
+                    self._batch_tasks.add(task)
+                    task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_stage_batch(
+        self, stage: CascadeStage, batch: List[Tuple[str, float]]
+    ) -> None:
+        """Evaluate one batch of cascades waiting on a stage and advance them"""
+
+        try:
+            entries = [
+                (cascade_id, self.active_cascades[cascade_id], enqueued_at)
+                for cascade_id, enqueued_at in batch
+                if cascade_id in self.active_cascades
+            ]
+            try:
+                results = await self._process_stage_batch(
+                    stage, [artifact for _, artifact, _ in entries]
+                )
+            except Exception as e:
+                logger.error(f"Error processing stage {stage.value} batch: {e}")
+                results = [CascadeResult.FAILED] * len(entries)
+
+            finished_at = time.perf_counter()
+            for (cascade_id, cascade_artifact, enqueued_at), stage_result in zip(
+                entries, results
+            ):
+                self.stage_latency[stage].record(finished_at - enqueued_at)
+                try:
+                    await self._advance_cascade(
+                        cascade_id, cascade_artifact, stage_result
+                    )
+                except Exception as e:
+                    logger.error(f"Error processing cascade {cascade_id}: {e}")
                     await self._complete_cascade(cascade_id, CascadeResult.FAILED)
-                    break
 
-                # Update artifact timestamp
+            self.batches_processed += 1
+            self.artifacts_evaluated += len(entries)
+        finally:
+            self._in_flight_batches -= 1
+            self._batch_slots.release()
+            if not self._in_flight_batches and not any(self.stage_queues.values()):
+                self._idle.set()
+
+    async def _advance_cascade(
+        self,
+        cascade_id: str,
+        cascade_artifact: CascadeArtifact,
+        stage_result: CascadeResult,
+    ) -> None:
+        """Record a stage result and move the cascade on"""
+
+        # Record stage in history
+        cascade_artifact.stage_history.append(
+            {
+                "stage": cascade_artifact.current_stage.value,
+                "result": stage_result.value,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "quality_score": cascade_artifact.quality_metrics.overall_score
+                if cascade_artifact.quality_metrics
+                else 0.0,
+            }
+        )
+
+        # Handle stage result
+        if stage_result == CascadeResult.PASSED:
+            # Move to next stage or complete
+            next_stage = self._get_next_stage(cascade_artifact.current_stage)
+            if next_stage:
+                cascade_artifact.current_stage = next_stage
                 cascade_artifact.updated_at = datetime.now(timezone.utc)
+                logger.debug(
+                    f"Cascade {cascade_id} advanced to stage: {next_stage.value}"
+                )
+                self._enqueue(cascade_id, next_stage)
+            else:
+                # Cascade completed successfully
+                await self._complete_cascade(cascade_id, CascadeResult.APPROVED)
 
-        except Exception as e:
-            logger.error(f"Error processing cascade {cascade_id}: {e}")
+        elif stage_result == CascadeResult.REQUIRES_REVISION:
+            # Send back for revision
+            await self._request_revision(cascade_artifact)
+            self._park_cascade(cascade_id)
+
+        elif stage_result == CascadeResult.ESCALATE:
+            # Escalate to human review
+            cascade_artifact.requires_human_review = True
+            cascade_artifact.current_stage = CascadeStage.HUMAN_REVIEW
+            await self._escalate_to_human(cascade_artifact)
+            self._park_cascade(cascade_id)
+
+        else:
+            # Cascade failed
             await self._complete_cascade(cascade_id, CascadeResult.FAILED)
 
+    async def wait_until_idle(self) -> None:
+        """Wait until every queued cascade has been processed"""
+
+        if self._idle is not None:
+            await self._idle.wait()
+
+    async def shutdown(self) -> None:
+        """Stop the scheduler; queued cascades are kept for the next start"""
+
+        if self._scheduler_task and not self._scheduler_task.done():
+            self._scheduler_task.cancel()
+            try:
+                await self._scheduler_task
+            except asyncio.CancelledError:
+                pass
+        self._scheduler_task = None
+
     async def _process_stage(self, cascade_artifact: CascadeArtifact) -> CascadeResult:
         """Process a single cascade stage"""
 
-        stage = cascade_artifact.current_stage
-        complexity = cascade_artifact.complexity
-        quality_metrics = cascade_artifact.quality_metrics
-
-        if not quality_metrics:
-            logger.error(
-                f"No quality metrics for cascade artifact {cascade_artifact.artifact_id}"
-            )
-            return CascadeResult.FAILED
+        (stage_result,) = await self._process_stage_batch(
+            cascade_artifact.current_stage, [cascade_artifact]
+        )
+        return stage_result
 
-        # Get threshold for this stage and complexity
-        threshold = self.confidence_thresholds.get(complexity, {}).get(stage, 0.9)
+    async def _process_stage_batch(
+        self, stage: CascadeStage, cascade_artifacts: List[CascadeArtifact]
+    ) -> List[CascadeResult]:
+        """Process one stage for a batch of cascade artifacts"""
 
-        logger.info(
-            f"Processing stage {stage.value} for artifact {cascade_artifact.artifact_id}, "
-            f"quality score: {quality_metrics.overall_score:.3f}, threshold: {threshold}"
+        logger.debug(
+            f"Processing stage {stage.value} for {len(cascade_artifacts)} artifacts"
         )
 
-        # Check if artifact meets quality threshold
-        if quality_metrics.overall_score >= threshold:
+        results: List[Optional[CascadeResult]] = [None] * len(cascade_artifacts)
+        needs_check = []
+
+        for i, cascade_artifact in enumerate(cascade_artifacts):
+            quality_metrics = cascade_artifact.quality_metrics
+            if not quality_metrics:
+                logger.error(
+                    f"No quality metrics for cascade artifact {cascade_artifact.artifact_id}"
+                )
+                results[i] = CascadeResult.FAILED
+                continue
+
+            # Get threshold for this stage and complexity
+            threshold = self.confidence_thresholds.get(
+                cascade_artifact.complexity, {}
+            ).get(stage, 0.9)
+
             # Early exit if confidence threshold met
-            return CascadeResult.PASSED
+            if quality_metrics.overall_score >= threshold:
+                results[i] = CascadeResult.PASSED
+            else:
+                needs_check.append(i)
 
-        # Perform stage-specific quality checks
-        if stage == CascadeStage.INITIAL_AGENT:
-            return await self._initial_agent_check(cascade_artifact)
+        if needs_check:
+            # Perform stage-specific quality checks
+            checked = await self._stage_checks(
+                stage, [cascade_artifacts[i] for i in needs_check]
+            )
+            for i, stage_result in zip(needs_check, checked):
+                results[i] = stage_result
 
-        elif stage == CascadeStage.PEER_REVIEW:
-            return await self._peer_review_check(cascade_artifact)
+        return results
 
-        elif stage == CascadeStage.QUALITY_CHECK:
-            return await self._quality_assurance_check(cascade_artifact)
+    async def _stage_checks(
+        self, stage: CascadeStage, cascade_artifacts: List[CascadeArtifact]
+    ) -> List[CascadeResult]:
+        """Run the stage-specific quality checks for a batch of artifacts"""
 
-        elif stage == CascadeStage.FINAL_APPROVAL:
-            return await self._final_approval_check(cascade_artifact)
+        checks = {
+            CascadeStage.INITIAL_AGENT: self._initial_agent_batch,
+            CascadeStage.PEER_REVIEW: self._peer_review_batch,
+            CascadeStage.QUALITY_CHECK: self._quality_assurance_batch,
+            CascadeStage.FINAL_APPROVAL: self._final_approval_batch,
+        }
+        check = checks.get(stage)
+        if check is None:
+            return [CascadeResult.FAILED] * len(cascade_artifacts)
 
-        return CascadeResult.FAILED
+        return await check(cascade_artifacts)
 
     async def _assess_quality(
         self, cascade_artifact: CascadeArtifact
@@ -362,120 +556,168 @@ class QualityCascade:
     ) -> CascadeResult:
         """Initial agent quality check"""
 
-        # Basic validation and formatting checks
-        quality_metrics = cascade_artifact.quality_metrics
-        if quality_metrics and quality_metrics.overall_score < 0.6:
-            return CascadeResult.REQUIRES_REVISION
-
-        if quality_metrics and len(quality_metrics.validation_errors) > 3:
-            return CascadeResult.REQUIRES_REVISION
+        (check_result,) = await self._initial_agent_batch([cascade_artifact])
+        return check_result
+
+    async def _initial_agent_batch(
+        self, cascade_artifacts: List[CascadeArtifact]
+    ) -> List[CascadeResult]:
+        """Initial agent quality check for a batch of artifacts"""
+
+        results = []
+        for cascade_artifact in cascade_artifacts:
+            # Basic validation and formatting checks
+            quality_metrics = cascade_artifact.quality_metrics
+            if quality_metrics and (
+                quality_metrics.overall_score < 0.6
+                or len(quality_metrics.validation_errors) > 3
+            ):
+                results.append(CascadeResult.REQUIRES_REVISION)
+            else:
+                results.append(CascadeResult.PASSED)
 
-        return CascadeResult.PASSED
+        return results
 
     async def _peer_review_check(
         self, cascade_artifact: CascadeArtifact
     ) -> CascadeResult:
         """Peer review quality check"""
 
+        (review_result,) = await self._peer_review_batch([cascade_artifact])
+        return review_result
+
+    async def _peer_review_batch(
+        self, cascade_artifacts: List[CascadeArtifact]
+    ) -> List[CascadeResult]:
+        """Peer review a batch of artifacts in one pass per reviewer"""
+
         # Simulate peer review process
         reviewers = self.stage_reviewers.get(CascadeStage.PEER_REVIEW, [])
 
-        # Mock review scores (in real implementation, would call actual AI agents)
-        review_scores = []
-        for reviewer in reviewers:
-            # Simulate review score based on quality metrics
-            base_score = cascade_artifact.quality_metrics.overall_score
-            # Add some variance to simulate different reviewer perspectives
-            review_score = min(
-                1.0, max(0.0, base_score + (hash(reviewer) % 20 - 10) / 100)
-            )
-            review_scores.append(review_score)
+        # Mock review offsets (in real implementation, each reviewer would be
+        # sent the whole batch in one call); they simulate different reviewer
+        # perspectives and are fixed per reviewer across processes
+        reviewer_offsets = [
+            (reviewer, (_stable_digest(reviewer) % 20 - 10) / 100)
+            for reviewer in reviewers
+        ]
+        timestamp = datetime.now(timezone.utc).isoformat()
+
+        results = []
+        for cascade_artifact in cascade_artifacts:
+            quality_metrics = cascade_artifact.quality_metrics
+            if not reviewer_offsets or not quality_metrics:
+                results.append(CascadeResult.ESCALATE)
+                continue
+
+            review_scores = []
+            for reviewer, offset in reviewer_offsets:
+                review_score = min(
+                    1.0, max(0.0, quality_metrics.overall_score + offset)
+                )
+                review_scores.append(review_score)
 
-            # Add review to artifact
-            cascade_artifact.reviews.append(
-                {
-                    "reviewer": reviewer,
-                    "stage": CascadeStage.PEER_REVIEW.value,
-                    "score": review_score,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "comments": f"Automated review by {reviewer}",
-                }
-            )
+                # Add review to artifact
+                cascade_artifact.reviews.append(
+                    {
+                        "reviewer": reviewer,
+                        "stage": CascadeStage.PEER_REVIEW.value,
+                        "score": review_score,
+                        "timestamp": timestamp,
+                        "comments": f"Automated review by {reviewer}",
+                    }
+                )
 
-        # Calculate consensus score
-        if review_scores and cascade_artifact.quality_metrics:
+            # Calculate consensus score
             consensus_score = sum(review_scores) / len(review_scores)
 
             # Update quality metrics with peer review feedback
-            cascade_artifact.quality_metrics.overall_score = (
-                cascade_artifact.quality_metrics.overall_score * 0.6
-                + consensus_score * 0.4
+            quality_metrics.overall_score = (
+                quality_metrics.overall_score * 0.6 + consensus_score * 0.4
             )
 
             # Determine result based on consensus
             if consensus_score >= 0.8:
-                return CascadeResult.PASSED
+                results.append(CascadeResult.PASSED)
             elif consensus_score >= 0.6:
-                return CascadeResult.REQUIRES_REVISION
+                results.append(CascadeResult.REQUIRES_REVISION)
             else:
-                return CascadeResult.ESCALATE
+                results.append(CascadeResult.ESCALATE)
 
-        return CascadeResult.ESCALATE
+        return results
 
     async def _quality_assurance_check(
         self, cascade_artifact: CascadeArtifact
     ) -> CascadeResult:
         """Quality assurance check with detailed validation"""
 
-        # Detailed quality checks
-        quality_issues = []
-        quality_metrics = cascade_artifact.quality_metrics
-
-        # Check for critical validation errors
-        if quality_metrics and len(quality_metrics.validation_errors) > 0:
-            quality_issues.extend(quality_metrics.validation_errors)
-
-        # Check overall quality score
-        if quality_metrics and quality_metrics.overall_score < 0.85:
-            quality_issues.append("Overall quality score below QA threshold")
-
-        # Check consistency across reviews
-        if len(cascade_artifact.reviews) >= 2:
-            review_scores = [r["score"] for r in cascade_artifact.reviews]
-            score_variance = max(review_scores) - min(review_scores)
-            if score_variance > 0.3:
-                quality_issues.append("High variance in peer review scores")
-
-        # Determine result
-        if not quality_issues:
-            return CascadeResult.PASSED
-        elif len(quality_issues) <= 2:
-            return CascadeResult.REQUIRES_REVISION
-        else:
-            return CascadeResult.ESCALATE
+        (qa_result,) = await self._quality_assurance_batch([cascade_artifact])
+        return qa_result
+
+    async def _quality_assurance_batch(
+        self, cascade_artifacts: List[CascadeArtifact]
+    ) -> List[CascadeResult]:
+        """Quality assurance check for a batch of artifacts"""
+
+        results = []
+        for cascade_artifact in cascade_artifacts:
+            # Detailed quality checks
+            quality_issues = []
+            quality_metrics = cascade_artifact.quality_metrics
+
+            # Check for critical validation errors
+            if quality_metrics and len(quality_metrics.validation_errors) > 0:
+                quality_issues.extend(quality_metrics.validation_errors)
+
+            # Check overall quality score
+            if quality_metrics and quality_metrics.overall_score < 0.85:
+                quality_issues.append("Overall quality score below QA threshold")
+
+            # Check consistency across reviews
+            if len(cascade_artifact.reviews) >= 2:
+                review_scores = [r["score"] for r in cascade_artifact.reviews]
+                score_variance = max(review_scores) - min(review_scores)
+                if score_variance > 0.3:
+                    quality_issues.append("High variance in peer review scores")
+
+            # Determine result
+            if not quality_issues:
+                results.append(CascadeResult.PASSED)
+            elif len(quality_issues) <= 2:
+                results.append(CascadeResult.REQUIRES_REVISION)
+            else:
+                results.append(CascadeResult.ESCALATE)
+
+        return results
 
     async def _final_approval_check(
         self, cascade_artifact: CascadeArtifact
     ) -> CascadeResult:
         """Final approval check with highest standards"""
 
-        # Strict final approval criteria
-        quality_metrics = cascade_artifact.quality_metrics
-        if (
-            quality_metrics
-            and quality_metrics.overall_score >= 0.9
-            and len(quality_metrics.validation_errors) == 0
-            and len(cascade_artifact.reviews) >= 2
-        ):
-            # Check if all reviews are positive
-            recent_reviews = [
-                r for r in cascade_artifact.reviews if r.get("score", 0) >= 0.8
-            ]
-            if len(recent_reviews) >= 2:
-                return CascadeResult.PASSED
+        (approval_result,) = await self._final_approval_batch([cascade_artifact])
+        return approval_result
+
+    async def _final_approval_batch(
+        self, cascade_artifacts: List[CascadeArtifact]
+    ) -> List[CascadeResult]:
+        """Final approval check for a batch of artifacts"""
+
+        results = []
+        for cascade_artifact in cascade_artifacts:
+            # Strict final approval criteria; everything else is escalated to
+            # human review for the final decision
+            quality_metrics = cascade_artifact.quality_metrics
+            approved = (
+                quality_metrics
+                and quality_metrics.overall_score >= 0.9
+                and len(quality_metrics.validation_errors) == 0
+                # At least two positive reviews
+                and sum(r.get("score", 0) >= 0.8 for r in cascade_artifact.reviews) >= 2
+            )
+            results.append(CascadeResult.PASSED if approved else CascadeResult.ESCALATE)
 
-        # Escalate to human review for final decision
-        return CascadeResult.ESCALATE
+        return results
 
     def _get_next_stage(self, current_stage: CascadeStage) -> Optional[CascadeStage]:
         """Get the next cascade stage"""
@@ -537,15 +779,47 @@ class QualityCascade:
             except Exception as e:
                 logger.warning(f"Could not publish completion event: {e}")
 
-        # Move from active to completed (in real implementation, would store in database)
+        # Move from active to the completed store
+        self._retire_cascade(cascade_id, result)
+
+    def _retire_cascade(self, cascade_id: str, result: CascadeResult) -> None:
+        """Evict a finished cascade from active_cascades into the completed store"""
+
+        status = self.get_cascade_status(cascade_id)
         del self.active_cascades[cascade_id]
+        self._parked_cascades.pop(cascade_id, None)
+
+        status["result"] = result.value
+        self.completed_cascades[cascade_id] = status
+        while len(self.completed_cascades) > self.max_completed_cascades:
+            self.completed_cascades.popitem(last=False)
+
+    def _park_cascade(self, cascade_id: str) -> None:
+        """Keep a cascade awaiting revision or human review active while there is room"""
+
+        self._parked_cascades[cascade_id] = None
+        self._evict_parked_cascades()
+
+    def _evict_parked_cascades(self) -> None:
+        while (
+            len(self.active_cascades) > self.max_active_cascades
+            and self._parked_cascades
+        ):
+            cascade_id = next(iter(self._parked_cascades))
+            self._retire_cascade(
+                cascade_id,
+                CascadeResult.ESCALATE
+                if self.active_cascades[cascade_id].requires_human_review
+                else CascadeResult.REQUIRES_REVISION,
+            )
 
     def get_cascade_status(self, cascade_id: str) -> Optional[Dict[str, Any]]:
         """Get current status of a cascade process"""
 
         cascade_artifact = self.active_cascades.get(cascade_id)
         if not cascade_artifact:
-            return None
+            completed = self.completed_cascades.get(cascade_id)
+            return dict(completed) if completed else None
 
         return {
             "cascade_id": cascade_id,
@@ -575,6 +849,7 @@ class QualityCascade:
         """Get quality cascade statistics"""
 
         active_count = len(self.active_cascades)
+        scheduler_statistics = self._scheduler_statistics()
 
         if not self.active_cascades:
             return {
@@ -583,6 +858,7 @@ class QualityCascade:
                 "quality_score_range": {"min": 0.0, "max": 0.0},
                 "stages_distribution": {},
                 "complexity_distribution": {},
+                **scheduler_statistics,
             }
 
         # Calculate statistics
@@ -613,4 +889,26 @@ class QualityCascade:
                 "min": min(quality_scores) if quality_scores else 0.0,
                 "max": max(quality_scores) if quality_scores else 0.0,
             },
+            **scheduler_statistics,
+        }
+
+    def _scheduler_statistics(self) -> Dict[str, Any]:
+        """Queue depth, stage latency and batching statistics"""
+
+        return {
+            "queue_depth": {
+                stage.value: len(queue) for stage, queue in self.stage_queues.items()
+            },
+            "stage_latency": {
+                stage.value: histogram.to_dict()
+                for stage, histogram in self.stage_latency.items()
+            },
+            "scheduler": {
+                "in_flight_batches": self._in_flight_batches,
+                "batches_processed": self.batches_processed,
+                "avg_batch_size": self.artifacts_evaluated / self.batches_processed
+                if self.batches_processed
+                else 0.0,
+                "completed_cascades": len(self.completed_cascades),
+            },
         }
@@ -11,11 +11,16 @@ from typing import Dict, List, Optional, Any, Callable
 import uuid
 
 from core.ai_clients import RealAIClients
+from core.context_retrieval import ContextRetriever
 from agents.base_agent import AgentInput, AgentType
 from schemas.artifacts import ArtifactType
+from schemas.ledgers import MemoryIndex
 
 logger = logging.getLogger(__name__)
 
+# Tokens of earlier agent output carried into each later agent's prompt
+PROMPT_CONTEXT_TOKENS = 1000
+
 
 class RealExecutionEngine:
     """
@@ -26,6 +31,7 @@ class RealExecutionEngine:
         self,
         status_callback: Optional[Callable] = None,
         output_callback: Optional[Callable] = None,
+        router: Any = None,
     ):
         """
         Initialize real execution engine.
@@ -33,14 +39,16 @@ class RealExecutionEngine:
         Args:
             status_callback: Function to call with status updates
             output_callback: Function to call with agent outputs
+            router: DataDrivenRouter to report request load and latency to
         """
-        self.ai_clients = RealAIClients()
+        self.ai_clients = RealAIClients(router=router)
         self.status_callback = status_callback or self._default_status_callback
         self.output_callback = output_callback or self._default_output_callback
 
         # Track execution state
         self.current_artifacts = []
         self.execution_id = None
+        self.context: Optional[ContextRetriever] = None
 
     def _default_status_callback(self, message: str):
         """Default status callback"""
@@ -50,6 +58,20 @@ class RealExecutionEngine:
         """Default output callback"""
         logger.info(f"Agent Output [{agent_name}]: {content[:100]}...")
 
+    def _start_context(self):
+        """Fresh context memory for one workflow execution"""
+        self.context = ContextRetriever(
+            MemoryIndex(
+                index_id=self.execution_id,
+                project_id=self.execution_id,
+                retrieval_budget={"default": PROMPT_CONTEXT_TOKENS},
+            )
+        )
+
+    def _prior_context(self, query: str) -> str:
+        """Earlier agent output most relevant to the query, within the budget"""
+        return self.context.retrieve(query).render()
+
     def add_real_timeline_event(self, timestamp: str, message: str):
         """Add real timeline event with actual current time for live UI display"""
         import streamlit as st
@@ -109,6 +131,7 @@ class RealExecutionEngine:
             Dictionary with execution results and artifacts
         """
         self.execution_id = f"real_execution_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self._start_context()
 
         # Initialize session state for real-time tracking
         import streamlit as st
@@ -157,6 +180,7 @@ class RealExecutionEngine:
                 completion_time, "✅ Claude requirements analysis complete"
             )
             self.add_real_artifact("Requirements Analysis by Claude", pm_result)
+            self.context.remember("Requirements analysis", pm_result)
             self.output_callback("Project Manager (Claude)", pm_result)
 
             # Step 2: Real GPT-4 Code Generation
@@ -167,7 +191,8 @@ class RealExecutionEngine:
             )
 
             gpt4_prompt = f"""
-            Based on Claude's analysis: {pm_result[:800]}...
+            Based on Claude's analysis:
+            {self._prior_context("requirements technical recommendations project structure")}
             
             Design the complete system architecture including:
             - Technology stack and frameworks
@@ -186,6 +211,7 @@ class RealExecutionEngine:
                 completion_time, "✅ GPT-4 architecture design complete"
             )
             self.add_real_artifact("System Architecture by GPT-4", code_result)
+            self.context.remember("System architecture", code_result)
             self.output_callback("Code Generator (GPT-4)", code_result)
 
             # Step 3: Real Gemini UI Design
@@ -197,7 +223,8 @@ class RealExecutionEngine:
 
             gemini_prompt = f"""
             Create comprehensive UI design for: {project_config.get("description")}
-            Architecture: {code_result[:600]}...
+            Architecture:
+            {self._prior_context("user interface screens components frontend architecture")}
             
             Design user interface including:
             - Screen layouts and navigation
@@ -309,6 +336,7 @@ class RealExecutionEngine:
         self.execution_id = (
             f"simple_execution_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         )
+        self._start_context()
         current_time = datetime.now().strftime("%H:%M:%S")
 
         self.status_callback(f"🚀 Simple AI workflow started at {current_time}")
@@ -329,6 +357,7 @@ class RealExecutionEngine:
 
             result1 = await self.simple_openai_call("Requirements Analyst", prompt1)
             artifacts.append(("Requirements Analysis", result1))
+            self.context.remember("Requirements analysis", result1)
             self.output_callback("Requirements Analyst", result1)
             self.status_callback("✅ Requirements analysis complete")
 
@@ -336,7 +365,8 @@ class RealExecutionEngine:
             self.status_callback("🏗️ Designing system architecture...")
 
             prompt2 = f"""
-            Based on these requirements: {result1[:500]}...
+            Based on these requirements:
+            {self._prior_context("features technical requirements development plan")}
             
             Design the system architecture including:
             - Technology stack
@@ -347,6 +377,7 @@ class RealExecutionEngine:
 
             result2 = await self.simple_openai_call("System Architect", prompt2)
             artifacts.append(("System Architecture", result2))
+            self.context.remember("System architecture", result2)
             self.output_callback("System Architect", result2)
             self.status_callback("✅ Architecture design complete")
 
@@ -355,7 +386,8 @@ class RealExecutionEngine:
 
             prompt3 = f"""
             Create the code structure for: {project_config.get("description")}
-            Architecture: {result2[:500]}...
+            Architecture:
+            {self._prior_context("technology stack component structure code files")}
             
             Provide file structure, key components, and sample code.
             """
@@ -5,9 +5,11 @@ Provides intelligent routing based on capability vectors, task analysis,
 and multi-objective optimization considering quality, cost, and latency.
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from pydantic import BaseModel, Field
 import logging
+import math
+import time
 from datetime import datetime
 
 from schemas.routing import (
@@ -96,6 +98,94 @@ class ModelSelection(BaseModel):
     )
 
 
+class FailureWindow:
+    """
+    Failure counts in fixed-size time buckets.
+
+    Memory is bounded by the number of buckets and a window query sums at
+    most that many counters, however many failures were recorded.
+    """
+
+    def __init__(self, bucket_seconds: int = 60, num_buckets: int = 30):
+        self.bucket_seconds = bucket_seconds
+        self.num_buckets = num_buckets
+        self._counts = [0] * num_buckets
+        self._epochs = [-1] * num_buckets
+
+    def record(self, now: float):
+        epoch = int(now // self.bucket_seconds)
+        slot = epoch % self.num_buckets
+        if self._epochs[slot] != epoch:
+            self._epochs[slot] = epoch
+            self._counts[slot] = 0
+        self._counts[slot] += 1
+
+    def count(self, window_seconds: float, now: float) -> int:
+        """Failures in the last window_seconds (at bucket granularity)"""
+        epoch = int(now // self.bucket_seconds)
+        span = min(self.num_buckets, math.ceil(window_seconds / self.bucket_seconds))
+        oldest = epoch - span + 1
+        return sum(
+            count
+            for count, bucket_epoch in zip(self._counts, self._epochs)
+            if oldest <= bucket_epoch <= epoch
+        )
+
+
+class ModelLoad:
+    """Live load telemetry for one model, fed from request outcomes"""
+
+    # Seconds over which the token rate decays
+    TOKEN_RATE_TAU = 60.0
+
+    def __init__(self, capability: ModelCapability, ewma_alpha: float = 0.2):
+        self.ewma_alpha = ewma_alpha
+        self.max_concurrent = max(1, capability.max_concurrent_tasks)
+        self.tokens_per_minute_limit = capability.tokens_per_minute_limit
+        self.in_flight = 0
+        self.completed = 0
+        self.ewma_latency = capability.avg_response_time_ms / 1000.0
+        self.token_rate = 0.0  # tokens per second, exponentially decayed
+        self._token_rate_at = 0.0
+        self.reported_load = 0.0
+        self.failures = FailureWindow()
+
+    def record_tokens(self, tokens: int, now: float):
+        decay = math.exp(-(now - self._token_rate_at) / self.TOKEN_RATE_TAU)
+        self.token_rate = self.token_rate * decay + tokens / self.TOKEN_RATE_TAU
+        self._token_rate_at = now
+
+    def record_latency(self, latency_s: float):
+        self.completed += 1
+        self.ewma_latency += self.ewma_alpha * (latency_s - self.ewma_latency)
+
+    @property
+    def utilization(self) -> float:
+        return min(1.0, max(self.in_flight / self.max_concurrent, self.reported_load))
+
+    def expected_wait(self, tokens: int = 0) -> float:
+        """
+        Seconds a new request waits before being served.
+
+        Requests beyond max_concurrent queue behind the busy slots: the
+        in-flight requests, or the reported load's share of max_concurrent
+        when that is higher. A token rate at the provider limit adds the
+        time to admit the request's tokens.
+        """
+        busy = max(self.in_flight, self.reported_load * self.max_concurrent)
+        queued_ahead = busy - self.max_concurrent + 1
+        wait = max(0, queued_ahead) * self.ewma_latency / self.max_concurrent
+
+        limit_per_s = self.tokens_per_minute_limit / 60.0
+        if limit_per_s > 0 and self.token_rate >= limit_per_s:
+            wait += tokens / limit_per_s
+        return wait
+
+    def expected_completion(self, tokens: int = 0) -> float:
+        """Expected wait plus service time for a new request"""
+        return self.expected_wait(tokens) + self.ewma_latency
+
+
 class DataDrivenRouter:
     """
     Advanced router that uses capability vectors and task analysis for optimal model selection.
@@ -114,8 +204,10 @@ class DataDrivenRouter:
         quality_weight: float = 0.7,
         cost_weight: float = 0.2,
         latency_weight: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
     ):
         self.models = models or MODEL_CAPABILITIES
+        self.clock = clock
         self.model_router = ModelRouter(
             available_models=self.models,
             quality_weight=quality_weight,
@@ -127,9 +219,10 @@ class DataDrivenRouter:
         self.performance_history: Dict[ModelType, List[Dict[str, Any]]] = {}
         self.routing_history: List[ModelSelection] = []
 
-        # Dynamic load tracking
-        self.current_loads: Dict[ModelType, float] = {}
-        self.recent_failures: Dict[ModelType, List[datetime]] = {}
+        # Live load tracking, fed by record_request_start/record_request_end
+        self.model_loads: Dict[ModelType, ModelLoad] = {
+            model.model_type: ModelLoad(model) for model in self.models
+        }
 
         logger.info(f"Router initialized with {len(self.models)} models")
 
@@ -298,42 +391,60 @@ class DataDrivenRouter:
         else:
             return TaskType.REASONING_LONG  # Default fallback
 
+    @property
+    def current_loads(self) -> Dict[ModelType, float]:
+        """Utilization per model: in-flight over max concurrency"""
+        return {model: load.utilization for model, load in self.model_loads.items()}
+
     def apply_load_balancing(
         self, routing_decision: RoutingDecision, context: RoutingContext
     ) -> RoutingDecision:
-        """Apply load balancing adjustments to routing decision"""
-
-        selected_model = routing_decision.selected_model
-        current_load = self.current_loads.get(selected_model, 0.0)
-
-        # If selected model is heavily loaded, consider alternatives
-        if current_load > 0.8:  # 80% load threshold
-            logger.info(
-                f"Model {selected_model} heavily loaded ({current_load:.2f}), considering alternatives"
-            )
-
-            # Look for alternatives with lower load
-            for alt_model, alt_score in routing_decision.alternatives:
-                alt_load = self.current_loads.get(alt_model, 0.0)
+        """
+        Apply load balancing adjustments to routing decision.
 
-                # Switch if alternative has significantly lower load and reasonable score
-                if (
-                    alt_load < current_load - 0.3
-                    and alt_score > routing_decision.final_score * 0.85
-                ):
-                    logger.info(f"Switching to {alt_model} due to load balancing")
+        Only kicks in when the selected model would queue: among alternatives
+        scoring within 85% of the selection, the one with the lowest expected
+        wait plus service time wins if it beats the selected model.
+        """
 
-                    # Create new routing decision with alternative
-                    new_decision = routing_decision.copy()
-                    new_decision.selected_model = alt_model
-                    new_decision.final_score = alt_score * (
-                        1.0 - alt_load * 0.2
-                    )  # Adjust for load
-                    new_decision.routing_parameters["load_balancing_applied"] = True
+        selected_model = routing_decision.selected_model
+        selected_load = self.model_loads.get(selected_model)
+        if selected_load is None:
+            return routing_decision
+
+        tokens = routing_decision.complexity.estimated_tokens
+        if selected_load.expected_wait(tokens) <= 0:
+            return routing_decision
+
+        best_model, best_score = None, None
+        best_time = selected_load.expected_completion(tokens)
+        for alt_model, alt_score in routing_decision.alternatives:
+            alt_load = self.model_loads.get(alt_model)
+            if alt_load is None or alt_score < routing_decision.final_score * 0.85:
+                continue
+            alt_time = alt_load.expected_completion(tokens)
+            if alt_time < best_time:
+                best_model, best_score, best_time = alt_model, alt_score, alt_time
+
+        if best_model is None:
+            return routing_decision
 
-                    return new_decision
+        logger.info(
+            f"Switching from {selected_model} to {best_model} due to load balancing "
+            f"(expected {best_time:.2f}s vs "
+            f"{selected_load.expected_completion(tokens):.2f}s)"
+        )
 
-        return routing_decision
+        # Create new routing decision with alternative
+        new_decision = routing_decision.model_copy()
+        new_decision.selected_model = best_model
+        new_decision.final_score = best_score
+        new_decision.routing_parameters = {
+            **routing_decision.routing_parameters,
+            "load_balancing_applied": True,
+            "expected_completion_s": best_time,
+        }
+        return new_decision
 
     def check_recent_failures(
         self,
@@ -343,19 +454,11 @@ class DataDrivenRouter:
     ) -> bool:
         """Check if model has had recent failures"""
 
-        if model not in self.recent_failures:
+        load = self.model_loads.get(model)
+        if load is None:
             return False
 
-        recent_failures = self.recent_failures[model]
-        cutoff_time = datetime.now().timestamp() - (time_window_minutes * 60)
-
-        # Count failures in time window
-        recent_count = sum(
-            1
-            for failure_time in recent_failures
-            if failure_time.timestamp() > cutoff_time
-        )
-
+        recent_count = load.failures.count(time_window_minutes * 60, self.clock())
         return recent_count >= failure_threshold
 
     def route_task(
@@ -414,10 +517,7 @@ class DataDrivenRouter:
             "load_factor": 1.0
             - self.current_loads.get(routing_decision.selected_model, 0.0),
             "reliability_factor": 1.0
-            - (
-                len(self.recent_failures.get(routing_decision.selected_model, []))
-                / 10.0
-            ),
+            - (self._recent_failure_count(routing_decision.selected_model) / 10.0),
             "task_match": 1.0
             if task_type
             in [
@@ -501,26 +601,51 @@ Key factors: {"High complexity task requiring strong reasoning" if complexity.re
         return selection
 
     def update_model_load(self, model: ModelType, load: float):
-        """Update current load for a model"""
-        self.current_loads[model] = max(0.0, min(1.0, load))
+        """
+        Report an external load figure, the fraction of the model's slots in
+        use. Utilization and expected_wait() never drop below it.
+        """
+        if model in self.model_loads:
+            self.model_loads[model].reported_load = max(0.0, min(1.0, load))
+
+    def record_request_start(self, model: ModelType) -> float:
+        """Count a request as in flight; returns its start time for record_request_end"""
+        if model in self.model_loads:
+            self.model_loads[model].in_flight += 1
+        return self.clock()
+
+    def record_request_end(
+        self,
+        model: ModelType,
+        started_at: float,
+        tokens: int = 0,
+        success: bool = True,
+        error_message: str = "",
+    ):
+        """Record the outcome of a request started with record_request_start"""
+        load = self.model_loads.get(model)
+        if load is None:
+            return
+
+        now = self.clock()
+        load.in_flight = max(0, load.in_flight - 1)
+        load.record_tokens(tokens, now)
+        if success:
+            load.record_latency(now - started_at)
+        else:
+            self.record_failure(model, error_message)
 
     def record_failure(self, model: ModelType, error_message: str):
         """Record a model failure for load balancing"""
-        if model not in self.recent_failures:
-            self.recent_failures[model] = []
-
-        self.recent_failures[model].append(datetime.now())
-
-        # Keep only recent failures (last 30 minutes)
-        cutoff_time = datetime.now().timestamp() - (30 * 60)
-        self.recent_failures[model] = [
-            failure_time
-            for failure_time in self.recent_failures[model]
-            if failure_time.timestamp() > cutoff_time
-        ]
+        if model in self.model_loads:
+            self.model_loads[model].failures.record(self.clock())
 
         logger.warning(f"Recorded failure for {model}: {error_message}")
 
+    def _recent_failure_count(self, model: ModelType, window_minutes: int = 30) -> int:
+        load = self.model_loads.get(model)
+        return load.failures.count(window_minutes * 60, self.clock()) if load else 0
+
     def get_routing_stats(self) -> Dict[str, Any]:
         """Get routing statistics and performance metrics"""
 
@@ -536,9 +661,18 @@ Key factors: {"High complexity task requiring strong reasoning" if complexity.re
             "model_usage_distribution": {
                 model: count / total_selections for model, count in model_usage.items()
             },
-            "current_loads": self.current_loads.copy(),
+            "current_loads": self.current_loads,
             "recent_failures": {
-                model: len(failures) for model, failures in self.recent_failures.items()
+                model: self._recent_failure_count(model) for model in self.model_loads
+            },
+            "live_telemetry": {
+                model: {
+                    "in_flight": load.in_flight,
+                    "ewma_latency_s": load.ewma_latency,
+                    "tokens_per_minute": load.token_rate * 60,
+                    "expected_wait_s": load.expected_wait(),
+                }
+                for model, load in self.model_loads.items()
             },
             "avg_confidence": sum(
                 sum(selection.confidence_factors.values())
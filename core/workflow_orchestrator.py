@@ -1,10 +1,15 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from enum import Enum
+import time
 import uuid
 
 from core.model_orchestrator import AgentType
 
+# Assumed model time for an agent type before one of its steps has finished
+DEFAULT_EXPECTED_MODEL_S = 30.0
+
 
 class ProjectComplexity(Enum):
     SIMPLE = "simple"
@@ -45,13 +50,19 @@ class WorkflowStep:
         self.files_generated: Dict[str, str] = {}
         self.started_at: Optional[datetime] = None
         self.completed_at: Optional[datetime] = None
+        # Monotonic timestamps behind the wall/queue/model timings
+        self.submitted_at: Optional[float] = None
+        self.model_started_at: Optional[float] = None
+        self.streamed = False
+        self.timings: Dict[str, float] = {}
 
 
 class WorkflowOrchestrator:
     """Advanced orchestration engine for coordinating multi-agent AI collaboration"""
 
-    def __init__(self, agents: Dict[str, Any]):
+    def __init__(self, agents: Dict[str, Any], max_parallel_steps: int = 3):
         self.agents = agents
+        self.max_parallel_steps = max_parallel_steps
         self.current_project = None
         self.workflow_steps = []
         self.agent_communications = []
@@ -63,6 +74,11 @@ class WorkflowOrchestrator:
             "debug_reports": {},
         }
         self.collaboration_log = []
+        self.workflow_wall_time = 0.0
+        # Output length seen per agent type, the yardstick for streamed progress
+        self.expected_output_chars: Dict[AgentType, int] = {}
+        # Model time seen per agent type, the yardstick for everything else
+        self.expected_model_s: Dict[AgentType, float] = {}
 
     def analyze_project_requirements(
         self, description: str, project_type: ProjectType, complexity: ProjectComplexity
@@ -265,7 +281,10 @@ class WorkflowOrchestrator:
 
         step.status = AgentStatus.WORKING
         step.started_at = datetime.now()
-        step.progress = 10
+        started = time.monotonic()
+        if step.submitted_at is None:
+            step.submitted_at = started
+        step.timings = {"queue_s": started - step.submitted_at, "model_s": 0.0}
 
         # Get the appropriate agent
         agent_mapping = {
@@ -281,6 +300,7 @@ class WorkflowOrchestrator:
 
         if not agent:
             step.status = AgentStatus.ERROR
+            step.timings["wall_s"] = time.monotonic() - step.submitted_at
             return {"error": f"Agent {agent_key} not available"}
 
         # Create enhanced context with project information
@@ -296,13 +316,10 @@ class WorkflowOrchestrator:
         }
 
         try:
-            # Simulate progress updates
-            step.progress = 30
-
             # Execute the agent task
-            result = agent.process_request(step.task, enhanced_context)
-
-            step.progress = 80
+            step.model_started_at = time.monotonic()
+            result = self._run_agent(agent, step, enhanced_context)
+            step.timings["model_s"] = time.monotonic() - step.model_started_at
 
             # Process the result
             step.output = result.get("content", "")
@@ -310,6 +327,10 @@ class WorkflowOrchestrator:
             step.progress = 100
             step.status = AgentStatus.COMPLETED
             step.completed_at = datetime.now()
+            step.timings["wall_s"] = time.monotonic() - step.submitted_at
+            if step.output:
+                self.expected_output_chars[step.agent_type] = len(step.output)
+            self.expected_model_s[step.agent_type] = step.timings["model_s"]
 
             # Log the collaboration
             self.collaboration_log.append(
@@ -329,8 +350,54 @@ class WorkflowOrchestrator:
         except Exception as e:
             step.status = AgentStatus.ERROR
             step.progress = 0
+            step.timings["wall_s"] = time.monotonic() - step.submitted_at
             return {"error": str(e)}
 
+    def _run_agent(
+        self, agent: Any, step: WorkflowStep, context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Run the agent, tracking progress from its streamed output when it
+        offers stream_request(); otherwise step_progress() estimates it from
+        the time spent in the model.
+        """
+        stream_request = getattr(agent, "stream_request", None)
+        if stream_request is None:
+            return agent.process_request(step.task, context)
+
+        step.streamed = True
+
+        # Progress is received characters against the last output length
+        # for this agent type, capped below 100 until the stream ends
+        expected = self.expected_output_chars.get(step.agent_type, 4000)
+        received = 0
+        result: Dict[str, Any] = {}
+        for chunk in stream_request(step.task, context):
+            if isinstance(chunk, dict):
+                # Final item carries the structured result
+                result = chunk
+                continue
+            received += len(chunk)
+            step.progress = min(95, int(95 * received / expected))
+        return result
+
+    def step_progress(self, step: WorkflowStep) -> int:
+        """
+        Progress of a step. A running step whose agent does not stream is
+        measured by its model time against the last completed run of the
+        same agent type, capped below 100 until it returns.
+        """
+        if (
+            step.status != AgentStatus.WORKING
+            or step.streamed
+            or step.model_started_at is None
+        ):
+            return step.progress
+
+        expected = self.expected_model_s.get(step.agent_type, DEFAULT_EXPECTED_MODEL_S)
+        elapsed = time.monotonic() - step.model_started_at
+        return min(95, int(95 * elapsed / max(expected, 1e-3)))
+
     def orchestrate_project(
         self,
         project_description: str,
@@ -353,62 +420,82 @@ class WorkflowOrchestrator:
             "collaboration_history": [],
         }
 
-        completed_steps = []
-
-        # Continue processing until all steps are completed
-        max_iterations = len(self.workflow_steps) * 2  # Prevent infinite loops
-        iteration = 0
+        self.run_workflow_steps(execution_context)
 
-        while (
-            len(completed_steps) < len(self.workflow_steps)
-            and iteration < max_iterations
-        ):
-            iteration += 1
-            steps_executed_this_round = 0
-
-            for step in self.workflow_steps:
-                # Skip if already completed
-                if step in completed_steps:
-                    continue
+        # Phase 4: Final project summary
+        return self.generate_project_summary()
 
-                # Check dependencies
-                if self.are_dependencies_satisfied(step, completed_steps):
-                    # Add collaboration communication
+    def run_workflow_steps(self, execution_context: Dict[str, Any]):
+        """
+        Run workflow steps on a bounded pool as their dependencies complete.
+
+        Outputs, communications and collaboration history are updated on the
+        calling thread as each step finishes; every step gets a snapshot of
+        the history as it was when the step became ready.
+        """
+        completed_steps: List[WorkflowStep] = []
+        pending = list(self.workflow_steps)
+        running = {}
+        run_start = time.monotonic()
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_parallel_steps, thread_name_prefix="workflow-step"
+        ) as pool:
+            while pending or running:
+                # Submit every step whose dependencies are satisfied
+                for step in [
+                    s
+                    for s in pending
+                    if self.are_dependencies_satisfied(s, completed_steps)
+                ]:
+                    pending.remove(step)
+                    step.submitted_at = time.monotonic()
+                    step.status = AgentStatus.WAITING
                     self.add_agent_communication(
                         f"{step.agent_type.value} is now working on: {step.task}"
                     )
-
-                    # Execute the step
-                    result = self.execute_workflow_step(step, execution_context)
+                    context = {
+                        **execution_context,
+                        "collaboration_history": list(
+                            execution_context["collaboration_history"]
+                        ),
+                    }
+                    future = pool.submit(self.execute_workflow_step, step, context)
+                    running[future] = step
+
+                # Nothing running and nothing ready: remaining steps are blocked
+                # by a failed dependency
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    result = future.result()
 
                     # Only add to completed if successful
-                    if step.status == AgentStatus.COMPLETED:
-                        # Update project outputs based on agent type
-                        self.update_project_outputs(step.agent_type, result)
-
-                        completed_steps.append(step)
-                        steps_executed_this_round += 1
-
-                        # Add completion communication
-                        self.add_agent_communication(
-                            f"{step.agent_type.value} completed task: {step.task}"
-                        )
-
-                        # Update context for next steps
-                        execution_context["collaboration_history"].append(
-                            {
-                                "step_id": step.id,
-                                "agent": step.agent_type.value,
-                                "output": result,
-                            }
-                        )
-
-            # If no steps were executed this round, break to prevent infinite loops
-            if steps_executed_this_round == 0:
-                break
+                    if step.status != AgentStatus.COMPLETED:
+                        continue
 
-        # Phase 4: Final project summary
-        return self.generate_project_summary()
+                    # Update project outputs based on agent type
+                    self.update_project_outputs(step.agent_type, result)
+                    completed_steps.append(step)
+
+                    # Add completion communication
+                    self.add_agent_communication(
+                        f"{step.agent_type.value} completed task: {step.task}"
+                    )
+
+                    # Update context for next steps
+                    execution_context["collaboration_history"].append(
+                        {
+                            "step_id": step.id,
+                            "agent": step.agent_type.value,
+                            "output": result,
+                        }
+                    )
+
+        self.workflow_wall_time = time.monotonic() - run_start
 
     def are_dependencies_satisfied(
         self, step: WorkflowStep, completed_steps: List[WorkflowStep]
@@ -467,6 +554,12 @@ class WorkflowOrchestrator:
             "outputs": self.project_outputs,
             "collaboration_log": self.collaboration_log,
             "agent_communications": self.agent_communications,
+            "step_timings": {
+                step.id: {"agent": step.agent_type.value, **step.timings}
+                for step in self.workflow_steps
+                if step.timings
+            },
+            "workflow_wall_time_s": self.workflow_wall_time,
             "execution_summary": f"Successfully orchestrated {len(self.workflow_steps)} agents to deliver complete project solution",
         }
 
@@ -478,7 +571,7 @@ class WorkflowOrchestrator:
             agent_name = step.agent_type.value
             agent_statuses[agent_name] = {
                 "status": step.status.value,
-                "progress": step.progress,
+                "progress": self.step_progress(step),
                 "current_task": step.task,
                 "started_at": step.started_at.isoformat() if step.started_at else None,
                 "completed_at": step.completed_at.isoformat()
@@ -487,7 +580,7 @@ class WorkflowOrchestrator:
             }
 
         overall_progress = (
-            sum(step.progress for step in self.workflow_steps)
+            sum(self.step_progress(step) for step in self.workflow_steps)
             / len(self.workflow_steps)
             if self.workflow_steps
             else 0
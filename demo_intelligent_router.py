@@ -183,7 +183,11 @@ async def demo_intelligent_routing():
             print(f"      Cost: ${outcome.cost:.4f}")
 
             # Update router learning
-            router.update_from_outcome(outcome.task_id, outcome)
+            router.update_from_outcome(
+                routing_decision["task_id"],
+                outcome,
+                routing_decision.get("reservation"),
+            )
 
             # Small delay to simulate real processing
             await asyncio.sleep(0.5)
@@ -15,6 +15,8 @@ from collections import defaultdict, deque
 import sqlite3
 from pathlib import Path
 
+import numpy as np
+
 from schemas.routing import ModelType, TaskType
 from schemas.outcomes import TaskOutcome
 
@@ -174,6 +176,94 @@ class TrendAnalysis:
         }
 
 
+class OnlineTrend:
+    """
+    Running linear regression of a metric against time.
+
+    Means, second moments and the co-moment are kept Welford-style, so
+    points can be added and expired in O(1) without losing precision to
+    large raw sums. x is days since the first point ever added.
+    """
+
+    def __init__(self):
+        self.points: deque = deque()  # (timestamp, x, y) in arrival order
+        self.origin: Optional[datetime] = None
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c_xy = 0.0
+
+    def add(self, timestamp: datetime, y: float):
+        if self.origin is None:
+            self.origin = timestamp
+        x = (timestamp - self.origin).total_seconds() / 86400
+        self.points.append((timestamp, x, y))
+
+        self.n += 1
+        dx = x - self.mean_x
+        self.mean_x += dx / self.n
+        dy = y - self.mean_y
+        self.mean_y += dy / self.n
+        self.m2_x += dx * (x - self.mean_x)
+        self.m2_y += dy * (y - self.mean_y)
+        self.c_xy += dx * (y - self.mean_y)
+
+    def _remove_oldest(self):
+        _, x, y = self.points.popleft()
+        if self.n == 1:
+            self.n = 0
+            self.mean_x = self.mean_y = self.m2_x = self.m2_y = self.c_xy = 0.0
+            return
+
+        old_mean_x, old_mean_y = self.mean_x, self.mean_y
+        self.n -= 1
+        self.mean_x = (old_mean_x * (self.n + 1) - x) / self.n
+        self.mean_y = (old_mean_y * (self.n + 1) - y) / self.n
+        self.m2_x -= (x - self.mean_x) * (x - old_mean_x)
+        self.m2_y -= (y - self.mean_y) * (y - old_mean_y)
+        self.c_xy -= (x - self.mean_x) * (y - old_mean_y)
+
+    def expire(self, cutoff: datetime):
+        """Drop points older than cutoff (amortized O(1) per point)"""
+        while self.points and self.points[0][0] < cutoff:
+            self._remove_oldest()
+
+    @property
+    def first_timestamp(self) -> Optional[datetime]:
+        return self.points[0][0] if self.points else None
+
+    @property
+    def last_timestamp(self) -> Optional[datetime]:
+        return self.points[-1][0] if self.points else None
+
+    def slope_and_correlation(self) -> Optional[Tuple[float, float]]:
+        if self.n < 2 or self.m2_x <= 1e-10 or self.m2_y <= 1e-12:
+            return None
+        slope = self.c_xy / self.m2_x
+        correlation = self.c_xy / (self.m2_x * self.m2_y) ** 0.5
+        return slope, max(-1.0, min(1.0, correlation))
+
+
+class RollingRate:
+    """Fixed-size window of booleans with a running count of True"""
+
+    def __init__(self, window_size: int = 10):
+        self.window: deque = deque(maxlen=window_size)
+        self.count = 0
+
+    def add(self, value: bool) -> Optional[float]:
+        """Add a value; returns the window rate once the window is full"""
+        if len(self.window) == self.window.maxlen:
+            self.count -= self.window[0]
+        self.window.append(value)
+        self.count += value
+        if len(self.window) < self.window.maxlen:
+            return None
+        return self.count / self.window.maxlen
+
+
 class PerformanceTracker:
     """
     Comprehensive performance tracking for model router optimization
@@ -191,6 +281,14 @@ class PerformanceTracker:
         # Recent outcomes for trend analysis
         self.recent_outcomes: deque = deque(maxlen=1000)
 
+        # Online trend accumulators per (model, metric) over the outcomes in
+        # recent_outcomes from the last trend_window_days, the same data
+        # _recompute_trends reads; analyze_trends over that window uses these
+        self.trend_window_days = 30
+        self.success_window_size = 10
+        self.trend_accumulators: Dict[Tuple[ModelType, str], OnlineTrend] = {}
+        self.success_windows: Dict[ModelType, RollingRate] = {}
+
         # Performance insights cache
         self.insights_cache: Dict[str, Any] = {}
         self.cache_expiry: Optional[datetime] = None
@@ -272,7 +370,7 @@ class PerformanceTracker:
                            execution_time, token_usage, cost, error_type, timestamp
                     FROM task_outcomes
                     WHERE timestamp > ?
-                    ORDER BY timestamp DESC
+                    ORDER BY timestamp ASC
                 """,
                     (cutoff_date.isoformat(),),
                 )
@@ -320,7 +418,7 @@ class PerformanceTracker:
                             )
 
                         self.metrics[key].update_with_outcome(outcome)
-                        self.recent_outcomes.append(outcome)
+                        self._add_recent_outcome(outcome)
 
                     except (ValueError, TypeError) as e:
                         logger.warning(f"Skipping invalid historical record: {e}")
@@ -349,7 +447,7 @@ class PerformanceTracker:
             self.metrics[key].update_with_outcome(outcome)
 
             # Add to recent outcomes
-            self.recent_outcomes.append(outcome)
+            self._add_recent_outcome(outcome)
 
             # Invalidate insights cache
             self.insights_cache.clear()
@@ -413,8 +511,115 @@ class PerformanceTracker:
 
         return results
 
+    def _add_recent_outcome(self, outcome: TaskOutcome):
+        """Append to recent_outcomes, keeping the trend accumulators in step"""
+        if len(self.recent_outcomes) == self.recent_outcomes.maxlen:
+            self._evict_from_trends(self.recent_outcomes[0])
+        self.recent_outcomes.append(outcome)
+        self._update_trend_accumulators(outcome)
+        self._expire_trends(datetime.now() - timedelta(days=self.trend_window_days))
+
+    def _evict_from_trends(self, outcome: TaskOutcome):
+        """Drop an outcome leaving recent_outcomes, unless it already expired"""
+        model = outcome.model_used
+        for metric_name in ("quality_score", "execution_time"):
+            accumulator = self.trend_accumulators.get((model, metric_name))
+            # Points are in arrival order, so a live evictee is the oldest one
+            if accumulator and accumulator.first_timestamp is not None:
+                if accumulator.first_timestamp <= outcome.timestamp:
+                    accumulator._remove_oldest()
+        self._trim_success_trend(model)
+
+    def _expire_trends(self, cutoff: datetime):
+        for (model, metric_name), accumulator in self.trend_accumulators.items():
+            if metric_name != "success_rate":
+                accumulator.expire(cutoff)
+        for model in self.success_windows:
+            self._trim_success_trend(model)
+
+    def _trim_success_trend(self, model: ModelType):
+        """
+        Keep one success-rate point per full window of the model's retained
+        outcomes, as _calculate_rolling_success_rate yields over them.
+        Points are dropped oldest first, so each kept point's window lies
+        within the retained outcomes.
+        """
+        success = self.trend_accumulators.get((model, "success_rate"))
+        if success is None:
+            return
+        quality = self.trend_accumulators.get((model, "quality_score"))
+        retained = quality.n if quality else 0
+        keep = max(0, retained - self.success_window_size + 1)
+        while success.n > keep:
+            success._remove_oldest()
+
+    def _update_trend_accumulators(self, outcome: TaskOutcome):
+        """Feed an outcome into the per-(model, metric) running trends"""
+        model = outcome.model_used
+        for metric_name, value in (
+            ("quality_score", outcome.quality_score),
+            ("execution_time", outcome.execution_time),
+        ):
+            self._trend_accumulator(model, metric_name).add(outcome.timestamp, value)
+
+        window = self.success_windows.get(model)
+        if window is None:
+            window = self.success_windows[model] = RollingRate(self.success_window_size)
+        rate = window.add(outcome.success)
+        if rate is not None:
+            self._trend_accumulator(model, "success_rate").add(outcome.timestamp, rate)
+
+    def _trend_accumulator(self, model: ModelType, metric_name: str) -> OnlineTrend:
+        key = (model, metric_name)
+        accumulator = self.trend_accumulators.get(key)
+        if accumulator is None:
+            accumulator = self.trend_accumulators[key] = OnlineTrend()
+        return accumulator
+
     def analyze_trends(self, days_back: int = 30) -> Dict[str, List[TrendAnalysis]]:
-        """Analyze performance trends over time"""
+        """
+        Analyze performance trends over time.
+
+        Over the tracked window (trend_window_days) the fits come from the
+        running accumulators in O(models x metrics); any other window is
+        recomputed from recent_outcomes. Both cover the same outcomes.
+        """
+        if days_back != self.trend_window_days:
+            return self._recompute_trends(days_back)
+
+        self._expire_trends(datetime.now() - timedelta(days=days_back))
+
+        quality_counts = {
+            model: accumulator.n
+            for (model, metric_name), accumulator in self.trend_accumulators.items()
+            if metric_name == "quality_score"
+        }
+        if sum(quality_counts.values()) < 10:
+            logger.warning("Insufficient data for trend analysis")
+            return {}
+
+        trends_by_model = defaultdict(list)
+        for (model_type, metric_name), accumulator in self.trend_accumulators.items():
+            if quality_counts.get(model_type, 0) < 5 or accumulator.n < 5:
+                continue
+
+            fit = accumulator.slope_and_correlation()
+            if fit is None:
+                continue
+
+            trends_by_model[model_type.value].append(
+                self._build_trend(
+                    metric_name,
+                    *fit,
+                    [timestamp for timestamp, _, _ in accumulator.points],
+                    [y for _, _, y in accumulator.points],
+                )
+            )
+
+        return dict(trends_by_model)
+
+    def _recompute_trends(self, days_back: int) -> Dict[str, List[TrendAnalysis]]:
+        """Full recomputation from recent_outcomes for an arbitrary window"""
         cutoff_date = datetime.now() - timedelta(days=days_back)
         recent_outcomes = [
             outcome
@@ -426,37 +631,43 @@ class PerformanceTracker:
             logger.warning("Insufficient data for trend analysis")
             return {}
 
-        trends_by_model = defaultdict(list)
-
-        # Group outcomes by model and analyze trends
-        for model_type in ModelType:
-            model_outcomes = [
-                outcome
-                for outcome in recent_outcomes
-                if outcome.model_used == model_type
-            ]
+        # Group outcomes by model in one pass
+        outcomes_by_model: Dict[ModelType, List[TaskOutcome]] = defaultdict(list)
+        for outcome in recent_outcomes:
+            outcomes_by_model[outcome.model_used].append(outcome)
 
+        trends_by_model = defaultdict(list)
+        for model_type, model_outcomes in outcomes_by_model.items():
             if len(model_outcomes) < 5:
                 continue
 
             # Sort by timestamp
             model_outcomes.sort(key=lambda x: x.timestamp)
+            timestamps = [o.timestamp for o in model_outcomes]
 
-            # Analyze different metrics
+            # Rolling rates are aligned with the timestamp closing each window
+            rolling = self._calculate_rolling_success_rate(
+                model_outcomes, self.success_window_size
+            )
             metrics_to_analyze = [
-                ("quality_score", [o.quality_score for o in model_outcomes]),
-                ("execution_time", [o.execution_time for o in model_outcomes]),
-                ("success_rate", self._calculate_rolling_success_rate(model_outcomes)),
+                (
+                    "quality_score",
+                    timestamps,
+                    [o.quality_score for o in model_outcomes],
+                ),
+                (
+                    "execution_time",
+                    timestamps,
+                    [o.execution_time for o in model_outcomes],
+                ),
+                ("success_rate", timestamps[len(timestamps) - len(rolling) :], rolling),
             ]
 
-            for metric_name, values in metrics_to_analyze:
+            for metric_name, metric_timestamps, values in metrics_to_analyze:
                 if not values or len(values) < 5:
                     continue
 
-                trend = self._calculate_trend(
-                    metric_name, [o.timestamp for o in model_outcomes], values
-                )
-
+                trend = self._calculate_trend(metric_name, metric_timestamps, values)
                 if trend:
                     trends_by_model[model_type.value].append(trend)
 
@@ -469,13 +680,11 @@ class PerformanceTracker:
         if len(outcomes) < window_size:
             return []
 
-        rolling_rates = []
-        for i in range(window_size - 1, len(outcomes)):
-            window = outcomes[i - window_size + 1 : i + 1]
-            success_rate = sum(1 for o in window if o.success) / len(window)
-            rolling_rates.append(success_rate)
-
-        return rolling_rates
+        # Prefix sums give every window in O(n)
+        successes = np.cumsum([0] + [1 if o.success else 0 for o in outcomes])
+        return (
+            (successes[window_size:] - successes[:-window_size]) / window_size
+        ).tolist()
 
     def _calculate_trend(
         self, metric_name: str, timestamps: List[datetime], values: List[float]
@@ -486,64 +695,60 @@ class PerformanceTracker:
                 return None
 
             # Convert timestamps to numeric values (days since first timestamp)
-            time_numeric = [
-                (ts - timestamps[0]).total_seconds() / 86400  # Convert to days
-                for ts in timestamps
-            ]
-
-            # Simple linear regression to detect trend
-            n = len(values)
-            sum_x = sum(time_numeric)
-            sum_y = sum(values)
-            sum_xy = sum(x * y for x, y in zip(time_numeric, values))
-            sum_x2 = sum(x * x for x in time_numeric)
-
-            # Calculate slope (trend direction)
-            denominator = n * sum_x2 - sum_x * sum_x
-            if abs(denominator) < 1e-10:  # Avoid division by zero
-                return None
-
-            slope = (n * sum_xy - sum_x * sum_y) / denominator
-
-            # Calculate correlation coefficient (trend strength)
-            mean_x = sum_x / n
-            mean_y = sum_y / n
-
-            numerator = sum(
-                (x - mean_x) * (y - mean_y) for x, y in zip(time_numeric, values)
+            x = np.array(
+                [(ts - timestamps[0]).total_seconds() / 86400 for ts in timestamps]
             )
-            denom_x = sum((x - mean_x) ** 2 for x in time_numeric)
-            denom_y = sum((y - mean_y) ** 2 for y in values)
+            y = np.asarray(values, dtype=float)
 
-            if denom_x <= 0 or denom_y <= 0:
+            dx = x - x.mean()
+            dy = y - y.mean()
+            m2_x = float(dx @ dx)
+            m2_y = float(dy @ dy)
+            if m2_x <= 1e-10 or m2_y <= 1e-12:
                 return None
 
-            correlation = numerator / (denom_x * denom_y) ** 0.5
-
-            # Determine trend direction
-            if abs(slope) < 0.01:  # Threshold for "stable"
-                direction = "stable"
-            elif slope > 0:
-                direction = "improving"
-            else:
-                direction = "declining"
-
-            # Calculate confidence based on correlation strength and data points
-            confidence = min(1.0, abs(correlation) * (min(n, 50) / 50))
-
-            return TrendAnalysis(
-                metric_name=metric_name,
-                time_periods=timestamps,
-                values=values,
-                trend_direction=direction,
-                trend_strength=abs(correlation),
-                confidence_level=confidence,
+            c_xy = float(dx @ dy)
+            return self._build_trend(
+                metric_name,
+                c_xy / m2_x,
+                c_xy / (m2_x * m2_y) ** 0.5,
+                timestamps,
+                list(values),
             )
 
         except Exception as e:
             logger.error(f"Error calculating trend for {metric_name}: {e}")
             return None
 
+    def _build_trend(
+        self,
+        metric_name: str,
+        slope: float,
+        correlation: float,
+        timestamps: List[datetime],
+        values: List[float],
+    ) -> TrendAnalysis:
+        """Classify a fitted slope/correlation into a TrendAnalysis"""
+        # Determine trend direction
+        if abs(slope) < 0.01:  # Threshold for "stable"
+            direction = "stable"
+        elif slope > 0:
+            direction = "improving"
+        else:
+            direction = "declining"
+
+        # Calculate confidence based on correlation strength and data points
+        confidence = min(1.0, abs(correlation) * (min(len(values), 50) / 50))
+
+        return TrendAnalysis(
+            metric_name=metric_name,
+            time_periods=timestamps,
+            values=values,
+            trend_direction=direction,
+            trend_strength=abs(correlation),
+            confidence_level=confidence,
+        )
+
     def generate_insights(self, force_refresh: bool = False) -> Dict[str, Any]:
         """Generate performance insights and recommendations"""
         # Check cache
@@ -12,6 +12,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
+from typing import Optional
 
 from core.quality_cascade import QualityCascade, TaskComplexity, CascadeStage
 from core.consensus_validator import ConsensusValidator, ValidationDomain
@@ -20,6 +21,15 @@ from storage.performance_store import PerformanceStore, MetricType, AggregationP
 
 logger = logging.getLogger(__name__)
 
+# Seconds the store's aggregate queries are reused across reruns
+STATS_TTL = 60
+
+
+@st.cache_data(ttl=STATS_TTL, show_spinner=False)
+def _store_query(_store: PerformanceStore, db_path: str, method: str, **kwargs):
+    """Read-only PerformanceStore aggregate, cached per database path"""
+    return getattr(_store, method)(**kwargs)
+
 
 class QualityMonitoringDashboard:
     """
@@ -27,16 +37,28 @@ class QualityMonitoringDashboard:
     and performance analytics
     """
 
-    def __init__(self):
-        self.quality_cascade = QualityCascade()
-        self.consensus_validator = ConsensusValidator()
-        self.continuous_learner = ContinuousLearner()
-        self.performance_store = PerformanceStore()
+    def __init__(
+        self,
+        quality_cascade: Optional[QualityCascade] = None,
+        consensus_validator: Optional[ConsensusValidator] = None,
+        continuous_learner: Optional[ContinuousLearner] = None,
+        performance_store: Optional[PerformanceStore] = None,
+    ):
+        # Long-lived apps pass shared instances; otherwise each is created here
+        self.quality_cascade = quality_cascade or QualityCascade()
+        self.consensus_validator = consensus_validator or ConsensusValidator()
+        self.continuous_learner = continuous_learner or ContinuousLearner()
+        self.performance_store = performance_store or PerformanceStore()
 
         # Initialize session state for dashboard data
         if "dashboard_data" not in st.session_state:
             st.session_state.dashboard_data = {}
 
+    def _query(self, method: str, **kwargs):
+        return _store_query(
+            self.performance_store, self.performance_store.db_path, method, **kwargs
+        )
+
     def render_dashboard(self):
         """Render the complete quality monitoring dashboard"""
 
@@ -100,6 +122,7 @@ class QualityMonitoringDashboard:
         # Manual refresh button
         if st.sidebar.button("🔄 Refresh Data"):
             st.session_state.dashboard_data.clear()
+            _store_query.clear()
             st.rerun()
 
         # Store selections in session state
@@ -112,7 +135,7 @@ class QualityMonitoringDashboard:
         st.subheader("Quality Metrics Overview")
 
         # Get quality statistics
-        quality_stats = self.performance_store.get_quality_statistics()
+        quality_stats = self._query("get_quality_statistics")
 
         # Key metrics row
         col1, col2, col3, col4 = st.columns(4)
@@ -562,7 +585,7 @@ class QualityMonitoringDashboard:
             st.dataframe(perf_df, use_container_width=True)
 
         # Learning analytics from performance store
-        learning_analytics = self.performance_store.get_learning_analytics(days_back=30)
+        learning_analytics = self._query("get_learning_analytics", days_back=30)
 
         if learning_analytics["outcome_statistics"]:
             st.subheader("Learning Outcomes (Last 30 Days)")
@@ -617,7 +640,7 @@ class QualityMonitoringDashboard:
         st.subheader("Performance Trends")
 
         # Get performance trends
-        trends = self.performance_store.get_model_performance_trends(days_back=30)
+        trends = self._query("get_model_performance_trends", days_back=30)
 
         if trends:
             # Model selection for detailed view
@@ -808,6 +831,7 @@ class QualityMonitoringDashboard:
 
             if st.button("Clean Old Data"):
                 deleted_count = self.performance_store.cleanup_old_metrics(days_to_keep)
+                _store_query.clear()
                 st.success(f"Cleaned up {deleted_count} old records.")
 
             st.subheader("Data Export")
@@ -822,11 +846,15 @@ class QualityMonitoringDashboard:
                     st.error("Failed to export metrics")
 
 
-def quality_monitoring_dashboard():
-    """Main function to render the quality monitoring dashboard"""
+def quality_monitoring_dashboard(**services):
+    """Main function to render the quality monitoring dashboard
+
+    Keyword arguments are passed to QualityMonitoringDashboard as shared
+    service instances.
+    """
 
     # Initialize dashboard
-    dashboard = QualityMonitoringDashboard()
+    dashboard = QualityMonitoringDashboard(**services)
 
     # Render the complete dashboard
     dashboard.render_dashboard()
@@ -184,6 +184,27 @@ class ContextHandle(BaseModel):
     )
 
 
+class AccessPattern(BaseModel):
+    """Exponentially decayed access counter for a context handle"""
+
+    score: float = Field(default=0.0, description="Decayed access count")
+    count: int = Field(default=0, description="Total number of accesses")
+    last_access: Optional[datetime] = Field(None, description="Last access time")
+
+    def decayed_score(self, now: datetime, half_life_hours: float) -> float:
+        """Access score decayed to `now`"""
+        if self.last_access is None:
+            return 0.0
+        age_hours = max(0.0, (now - self.last_access).total_seconds() / 3600.0)
+        return self.score * 0.5 ** (age_hours / half_life_hours)
+
+    def record(self, now: datetime, half_life_hours: float):
+        """Decay the score to `now` and count one access"""
+        self.score = self.decayed_score(now, half_life_hours) + 1.0
+        self.count += 1
+        self.last_access = now
+
+
 class ProgressLedger(BaseModel):
     """Tracks progress across multiple work items with agent assignments and artifacts"""
 
@@ -290,8 +311,11 @@ class MemoryIndex(BaseModel):
     )
 
     # Access patterns
-    access_patterns: Dict[str, List[datetime]] = Field(
-        default_factory=dict, description="Handle access history"
+    access_half_life_hours: float = Field(
+        default=24.0, gt=0.0, description="Half-life of access counters"
+    )
+    access_patterns: Dict[str, AccessPattern] = Field(
+        default_factory=dict, description="Decayed access counters per handle"
     )
     priority_handles: List[str] = Field(
         default_factory=list, description="High-priority context handles"
@@ -302,6 +326,37 @@ class MemoryIndex(BaseModel):
     )
     last_cleaned: Optional[datetime] = Field(None, description="Last cleanup time")
 
+    @validator("access_patterns", pre=True)
+    def convert_access_history(cls, v, values):
+        """Fold legacy per-handle timestamp lists into decayed counters"""
+        half_life = values.get("access_half_life_hours", 24.0)
+        patterns = {}
+        for handle_id, pattern in (v or {}).items():
+            if isinstance(pattern, list):
+                # JSON round-trips leave the legacy timestamps as ISO strings
+                accessed = [
+                    datetime.fromisoformat(at) if isinstance(at, str) else at
+                    for at in pattern
+                ]
+                folded = AccessPattern()
+                for accessed_at in sorted(accessed):
+                    folded.record(accessed_at, half_life)
+                pattern = folded
+            patterns[handle_id] = pattern
+        return patterns
+
+    def record_access(self, handle_id: str, at: Optional[datetime] = None):
+        """Count an access to a handle"""
+        pattern = self.access_patterns.setdefault(handle_id, AccessPattern())
+        pattern.record(at or datetime.now(), self.access_half_life_hours)
+
+    def access_frequency(self, handle_id: str, now: Optional[datetime] = None) -> float:
+        """Decayed access count of a handle"""
+        pattern = self.access_patterns.get(handle_id)
+        if pattern is None:
+            return 0.0
+        return pattern.decayed_score(now or datetime.now(), self.access_half_life_hours)
+
     def get_storage_utilization(self) -> float:
         """Calculate storage utilization percentage"""
         return (self.current_storage_mb / self.storage_budget_mb) * 100.0
@@ -0,0 +1,113 @@
+"""
+Record provider token counts for held-out text samples
+
+Writes tests/data/token_usage.jsonl: chunks of this repository's Python and
+Markdown sources (which the bundled merges are not trained on) with the
+number of tokens each provider's published tokenizer gives them. These
+stand in for recorded ``usage`` fields: the accuracy test checks the local
+counter against them, and codecompanion.tokens.DEFAULT_FACTORS is the
+least-squares fit over the "fit" split.
+
+Needs the reference tokenizers, which codecompanion itself does not use:
+
+    pip install tiktoken tokenizers
+    python scripts/record_token_usage.py \\
+        --cl100k path/to/cl100k_base.tiktoken \\
+        --claude path/to/anthropic/tokenizer.json
+
+cl100k_base is the GPT-4 tokenizer; tokenizer.json shipped with the
+anthropic SDK up to 0.7 and is Claude's published (pre-Claude 3) tokenizer.
+Gemini publishes no tokenizer file, so it has no samples.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+DEFAULT_OUTPUT = project_root / "tests" / "data" / "token_usage.jsonl"
+
+CL100K_PATTERN = (
+    r"""(?i:'s|'t|'re|'ve|'m|'ll|'d)|[^\r\n\p{L}\p{N}]?\p{L}+|\p{N}{1,3}"""
+    r"""| ?[^\s\p{L}\p{N}]+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+"""
+)
+
+SAMPLE_CHARS = 3000
+
+
+def source_files():
+    tracked = subprocess.run(
+        ["git", "ls-files"],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return [
+        name
+        for name in tracked
+        if name.endswith((".py", ".md"))
+        and not name.startswith("tests/data/")
+        and "/site-packages/" not in name
+    ]
+
+
+def first_chunk(text: str) -> str:
+    """Leading lines of the text, up to SAMPLE_CHARS"""
+    chunk = ""
+    for line in text.splitlines(keepends=True):
+        if chunk and len(chunk) + len(line) > SAMPLE_CHARS:
+            break
+        chunk += line
+    return chunk
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cl100k", type=Path, required=True)
+    parser.add_argument("--claude", type=Path, required=True)
+    parser.add_argument("--samples", type=int, default=80)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    import tiktoken
+    from tiktoken.load import load_tiktoken_bpe
+    from tokenizers import Tokenizer
+
+    gpt4 = tiktoken.Encoding(
+        name="cl100k_base",
+        pat_str=CL100K_PATTERN,
+        mergeable_ranks=load_tiktoken_bpe(str(args.cl100k)),
+        special_tokens={},
+    )
+    claude = Tokenizer.from_file(str(args.claude))
+
+    files = source_files()
+    step = max(1, len(files) // args.samples)
+    written = 0
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        for name in files[::step][: args.samples]:
+            text = first_chunk((project_root / name).read_text(encoding="utf-8"))
+            if not text.strip():
+                continue
+            written += 1
+            sample = {
+                "source": name,
+                "split": "fit" if written % 2 else "eval",
+                "text": text,
+                "usage": {
+                    "claude": len(claude.encode(text).ids),
+                    "gpt4": len(gpt4.encode(text, disallowed_special=())),
+                },
+            }
+            f.write(json.dumps(sample, ensure_ascii=False) + "\n")
+    print(f"Wrote {written} samples to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
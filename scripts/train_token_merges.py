@@ -0,0 +1,139 @@
+"""
+Train the BPE merge list bundled with codecompanion.tokens
+
+Learns byte-level merges from a general corpus, by default the Python
+standard library's sources, docstrings and text files. The repository's own
+sources are left out: merges fitted to them make its prompts look cheaper
+than they are, and keep them free for tests/data/token_usage.jsonl, the
+held-out samples the per-provider default factors are fitted on.
+
+    python scripts/train_token_merges.py --merges 32768
+
+Re-run scripts/record_token_usage.py and refit DEFAULT_FACTORS afterwards.
+"""
+
+import argparse
+import heapq
+import sys
+import sysconfig
+from collections import Counter, defaultdict
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from codecompanion.tokens import BYTE_SYMBOLS, DEFAULT_MERGES_PATH, PRETOKEN_RE
+
+CORPUS_SUFFIXES = (".py", ".md", ".rst", ".txt")
+
+
+def corpus_files(root: Path):
+    return sorted(
+        path
+        for path in root.rglob("*")
+        if path.suffix in CORPUS_SUFFIXES and "site-packages" not in path.parts
+    )
+
+
+def word_frequencies(files) -> Counter:
+    words = Counter()
+    for path in files:
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        words.update(PRETOKEN_RE.findall(text))
+    return words
+
+
+def train(words: Counter, merges: int):
+    """Greedy BPE with incremental pair counts and a lazy max-heap"""
+    symbols = []
+    freqs = []
+    for word, freq in words.items():
+        symbols.append([BYTE_SYMBOLS[b] for b in word.encode("utf-8")])
+        freqs.append(freq)
+
+    pair_counts = Counter()
+    pair_words = defaultdict(set)
+    for index, word in enumerate(symbols):
+        for pair in zip(word, word[1:]):
+            pair_counts[pair] += freqs[index]
+            pair_words[pair].add(index)
+
+    heap = [(-count, pair) for pair, count in pair_counts.items()]
+    heapq.heapify(heap)
+
+    learned = []
+    while heap and len(learned) < merges:
+        count, pair = heapq.heappop(heap)
+        if -count != pair_counts.get(pair) or -count < 2:
+            continue
+        learned.append(pair)
+        merged = pair[0] + pair[1]
+
+        changed = set()
+        for index in pair_words.pop(pair, ()):
+            word, freq = symbols[index], freqs[index]
+            for old in zip(word, word[1:]):
+                pair_counts[old] -= freq
+                changed.add(old)
+
+            out, i = [], 0
+            while i < len(word):
+                if i + 1 < len(word) and (word[i], word[i + 1]) == pair:
+                    out.append(merged)
+                    i += 2
+                else:
+                    out.append(word[i])
+                    i += 1
+            symbols[index] = out
+
+            for new in zip(out, out[1:]):
+                pair_counts[new] += freq
+                pair_words[new].add(index)
+                changed.add(new)
+
+        del pair_counts[pair]
+        for other in changed:
+            if pair_counts.get(other, 0) > 0:
+                heapq.heappush(heap, (-pair_counts[other], other))
+            else:
+                pair_counts.pop(other, None)
+    return learned
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--merges", type=int, default=32768)
+    parser.add_argument("--output", type=Path, default=DEFAULT_MERGES_PATH)
+    parser.add_argument(
+        "--corpus",
+        type=Path,
+        default=Path(sysconfig.get_paths()["stdlib"]),
+        help="directory of training text (default: the Python standard library)",
+    )
+    args = parser.parse_args()
+
+    stdlib = Path(sysconfig.get_paths()["stdlib"])
+    corpus = (
+        f"the Python {sys.version_info.major}.{sys.version_info.minor} standard library"
+        if args.corpus == stdlib
+        else args.corpus.name
+    )
+
+    words = word_frequencies(corpus_files(args.corpus))
+    learned = train(words, args.merges)
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(
+            f"# byte-level BPE merges, {len(learned)} entries, trained on {corpus}\n"
+        )
+        for left, right in learned:
+            f.write(f"{left} {right}\n")
+    print(
+        f"Wrote {len(learned)} merges from {len(words)} distinct words to {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
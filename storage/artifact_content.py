@@ -0,0 +1,27 @@
+"""
+Stored form of artifact content
+
+storage.runs and storage.database_manager share one ``artifacts`` table.
+Content longer than ARTIFACT_COMPRESS_THRESHOLD characters is stored
+zlib-compressed as a BLOB, so every query that reads ``artifacts.content``
+must pass the value through unpack_artifact_content.
+"""
+
+import zlib
+from typing import Any
+
+ARTIFACT_COMPRESS_THRESHOLD = 16 * 1024
+
+
+def pack_artifact_content(content: Any) -> Any:
+    """Value to store in artifacts.content"""
+    if isinstance(content, str) and len(content) > ARTIFACT_COMPRESS_THRESHOLD:
+        return zlib.compress(content.encode("utf-8"))
+    return content
+
+
+def unpack_artifact_content(content: Any) -> Any:
+    """Text of a stored artifacts.content value"""
+    if isinstance(content, bytes):
+        return zlib.decompress(content).decode("utf-8")
+    return content
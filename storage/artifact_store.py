@@ -0,0 +1,264 @@
+"""
+Content-Addressed Artifact Store
+
+Persists typed artifacts and their lineage in SQLite. Artifact bodies are
+keyed by a BLAKE2b digest of their canonical JSON, so identical bodies are
+stored once however many artifacts share them, and the digest is stable
+across processes for change detection.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Per-artifact metadata, kept out of the content-addressed body
+METADATA_KEYS = frozenset({"artifact_id", "created_at", "created_by", "version"})
+
+DIGEST_SIZE = 32
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def canonical_json(value: Any) -> bytes:
+    """
+    Serialise with sorted keys and no whitespace, as UTF-8 bytes
+
+    Always uses the stdlib encoder: digests are persisted, so the bytes must
+    not depend on which optional JSON libraries are installed.
+    """
+    return json.dumps(
+        value,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_json_default,
+    ).encode("utf-8")
+
+
+def content_digest(body: bytes) -> str:
+    """Stable BLAKE2b digest of a canonical body"""
+    return hashlib.blake2b(body, digest_size=DIGEST_SIZE).hexdigest()
+
+
+def split_metadata(record: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Split an artifact dict into (metadata, semantic content)"""
+    metadata = {k: v for k, v in record.items() if k in METADATA_KEYS}
+    content = {k: v for k, v in record.items() if k not in METADATA_KEYS}
+    return metadata, content
+
+
+class ArtifactStore:
+    """
+    SQLite store for artifacts, deduplicated bodies and lineage edges
+    """
+
+    def __init__(self, db_path: str = "artifact_store.db"):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._initialize_database()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Long-lived WAL connection for the calling thread"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _initialize_database(self):
+        conn = self._get_connection()
+        with conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS artifact_bodies (
+                    digest TEXT PRIMARY KEY,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS typed_artifacts (
+                    artifact_id TEXT PRIMARY KEY,
+                    schema_name TEXT NOT NULL,
+                    created_by TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    digest TEXT NOT NULL REFERENCES artifact_bodies(digest),
+                    lineage TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS artifact_edges (
+                    parent_id TEXT NOT NULL,
+                    child_id TEXT NOT NULL,
+                    PRIMARY KEY (parent_id, child_id)
+                ) WITHOUT ROWID;
+
+                CREATE INDEX IF NOT EXISTS idx_typed_artifacts_schema
+                    ON typed_artifacts(schema_name, created_by);
+                CREATE INDEX IF NOT EXISTS idx_typed_artifacts_agent
+                    ON typed_artifacts(created_by);
+                CREATE INDEX IF NOT EXISTS idx_artifact_edges_child
+                    ON artifact_edges(child_id, parent_id);
+            """)
+
+    def put(
+        self,
+        schema_name: str,
+        record: Dict[str, Any],
+        lineage: Dict[str, Any],
+        body: bytes,
+        digest: str,
+        parent_ids: Iterable[str] = (),
+    ):
+        """Insert or replace an artifact whose semantic body hashes to `digest`
+
+        The body is only written if no artifact has stored it before.
+        """
+        metadata, _ = split_metadata(record)
+        created_at = metadata.get("created_at")
+        if isinstance(created_at, (datetime, date)):
+            created_at = created_at.isoformat()
+
+        # Edges live in their own table; the lineage column keeps the rest
+        lineage = {
+            k: v
+            for k, v in lineage.items()
+            if k not in ("parent_artifacts", "child_artifacts")
+        }
+
+        conn = self._get_connection()
+        with conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO artifact_bodies (digest, body, size) VALUES (?, ?, ?)",
+                (digest, body, len(body)),
+            )
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO typed_artifacts
+                (artifact_id, schema_name, created_by, version, created_at,
+                 digest, lineage)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    metadata["artifact_id"],
+                    schema_name,
+                    metadata["created_by"],
+                    metadata["version"],
+                    str(created_at),
+                    digest,
+                    canonical_json(lineage).decode("utf-8"),
+                ),
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO artifact_edges (parent_id, child_id) VALUES (?, ?)",
+                [(parent_id, metadata["artifact_id"]) for parent_id in parent_ids],
+            )
+
+    def _select(
+        self, where: str = "", params: Tuple = ()
+    ) -> List[Tuple[str, Dict, Dict]]:
+        rows = (
+            self._get_connection()
+            .execute(
+                f"""
+            SELECT a.artifact_id, a.schema_name, a.created_by, a.version,
+                   a.created_at, a.lineage, b.body,
+                   (SELECT json_group_array(parent_id) FROM artifact_edges
+                    WHERE child_id = a.artifact_id),
+                   (SELECT json_group_array(child_id) FROM artifact_edges
+                    WHERE parent_id = a.artifact_id)
+            FROM typed_artifacts a
+            JOIN artifact_bodies b ON b.digest = a.digest
+            {where}
+            ORDER BY a.rowid
+            """,
+                params,
+            )
+            .fetchall()
+        )
+
+        results = []
+        for (
+            artifact_id,
+            schema_name,
+            created_by,
+            version,
+            created_at,
+            lineage,
+            body,
+            parents,
+            children,
+        ) in rows:
+            record = json.loads(body)
+            record.update(
+                artifact_id=artifact_id,
+                created_by=created_by,
+                version=version,
+                created_at=created_at,
+            )
+            lineage = json.loads(lineage)
+            lineage["parent_artifacts"] = json.loads(parents)
+            lineage["child_artifacts"] = json.loads(children)
+            results.append((schema_name, record, lineage))
+        return results
+
+    def get(
+        self, artifact_id: str
+    ) -> Optional[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+        """Return (schema_name, artifact record, lineage) or None"""
+        rows = self._select("WHERE a.artifact_id = ?", (artifact_id,))
+        return rows[0] if rows else None
+
+    def list(
+        self, schema_name: Optional[str] = None, created_by: Optional[str] = None
+    ) -> List[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+        """Artifacts matching the filters, in insertion order"""
+        clauses, params = [], []
+        if schema_name:
+            clauses.append("a.schema_name = ?")
+            params.append(schema_name)
+        if created_by:
+            clauses.append("a.created_by = ?")
+            params.append(created_by)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._select(where, tuple(params))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Artifact and unique body counts, and bytes saved by deduplication"""
+        conn = self._get_connection()
+        artifacts, logical_bytes = conn.execute(
+            """
+            SELECT COUNT(*), COALESCE(SUM(b.size), 0)
+            FROM typed_artifacts a JOIN artifact_bodies b ON b.digest = a.digest
+            """
+        ).fetchone()
+        bodies, stored_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM artifact_bodies"
+        ).fetchone()
+        edges = conn.execute("SELECT COUNT(*) FROM artifact_edges").fetchone()[0]
+        return {
+            "artifacts": artifacts,
+            "unique_bodies": bodies,
+            "lineage_edges": edges,
+            "stored_bytes": stored_bytes,
+            "deduplicated_bytes": logical_bytes - stored_bytes,
+        }
+
+    def close(self):
+        """Close the calling thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -12,28 +12,178 @@ Provides a comprehensive interface for database operations including:
 import sqlite3
 import json
 import logging
+import threading
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import uuid
 
+from storage.artifact_content import unpack_artifact_content
+
 logger = logging.getLogger(__name__)
 
 
+# Counter updates are single UPSERTs whose VALUES carry a batch of n updates
+# (n = 1 when written directly), so coalesced updates apply the same way.
+AGENT_PERFORMANCE_UPSERT = """
+    INSERT INTO agent_performance
+    (model_name, task_type, success_rate, avg_quality_score,
+     total_executions, success_count)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(model_name, task_type) DO UPDATE SET
+        avg_quality_score = (
+            avg_quality_score * total_executions
+            + excluded.avg_quality_score * excluded.total_executions
+        ) / (total_executions + excluded.total_executions),
+        success_rate = CAST(success_count + excluded.success_count AS REAL)
+            / (total_executions + excluded.total_executions),
+        total_executions = total_executions + excluded.total_executions,
+        success_count = success_count + excluded.success_count,
+        last_updated = CURRENT_TIMESTAMP
+"""
+
+BANDIT_ARM_UPSERT = """
+    INSERT INTO bandit_arms
+    (model_name, task_category, alpha, beta, total_pulls,
+     success_count, reward_sum)
+    VALUES (?, ?, 1.0 + ?, 1.0 + ?, ?, ?, ?)
+    ON CONFLICT(model_name, task_category) DO UPDATE SET
+        alpha = alpha + excluded.success_count,
+        beta = beta + excluded.total_pulls - excluded.success_count,
+        total_pulls = total_pulls + excluded.total_pulls,
+        success_count = success_count + excluded.success_count,
+        reward_sum = reward_sum + excluded.reward_sum,
+        last_updated = CURRENT_TIMESTAMP
+"""
+
+
+def _performance_row(
+    model_name: str, task_type: str, count: int, successes: int, quality_sum: float
+) -> Tuple:
+    return (
+        model_name,
+        task_type,
+        successes / count,
+        quality_sum / count,
+        count,
+        successes,
+    )
+
+
+def _bandit_row(
+    model_name: str, task_category: str, count: int, successes: int, reward_sum: float
+) -> Tuple:
+    return (
+        model_name,
+        task_category,
+        successes,
+        count - successes,
+        count,
+        successes,
+        reward_sum,
+    )
+
+
 class DatabaseManager:
     """
     Central database manager for all persistence operations
     """
 
-    def __init__(self, db_path: str = "data/codecompanion.db"):
+    def __init__(
+        self,
+        db_path: str = "data/codecompanion.db",
+        write_behind: bool = False,
+        flush_interval: float = 0.05,
+    ):
+        """
+        Args:
+            db_path: Path to the SQLite database
+            write_behind: Queue counter updates and write them from a
+                background thread, coalescing updates to the same key
+            flush_interval: Seconds between write-behind flushes
+        """
         self.db_path = db_path
         self.initialize_db()
 
+        # One long-lived WAL connection for counter updates, shared by every
+        # thread under a lock (SQLite serializes writers anyway)
+        self._write_conn: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+
+        # Write-behind: (model, task) -> [count, successes, quality/reward sum]
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self._pending_performance: Dict[Tuple[str, str], List] = {}
+        self._pending_bandit: Dict[Tuple[str, str], List] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop_writer = threading.Event()
+        self._writer = None
+        if write_behind:
+            self._writer = threading.Thread(
+                target=self._run_writer, name="database-manager-writer", daemon=True
+            )
+            self._writer.start()
+
     def get_connection(self) -> sqlite3.Connection:
         """Get database connection with proper configuration"""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row  # Enable column access by name
         return conn
 
+    def _write_counters(self, sql: str, rows: List[Tuple]):
+        """Apply counter UPSERT rows in one transaction on the writer connection"""
+        with self._write_lock:
+            if self._write_conn is None:
+                # Used from whichever thread holds the lock
+                conn = sqlite3.connect(
+                    self.db_path, timeout=30, check_same_thread=False
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                self._write_conn = conn
+            with self._write_conn:
+                self._write_conn.executemany(sql, rows)
+
+    def flush(self):
+        """Write every queued counter update now"""
+        with self._flush_lock:
+            with self._pending_lock:
+                performance, self._pending_performance = self._pending_performance, {}
+                bandit, self._pending_bandit = self._pending_bandit, {}
+            if not performance and not bandit:
+                return
+
+            try:
+                self._write_counters(
+                    AGENT_PERFORMANCE_UPSERT,
+                    [
+                        _performance_row(*key, *totals)
+                        for key, totals in performance.items()
+                    ],
+                )
+                self._write_counters(
+                    BANDIT_ARM_UPSERT,
+                    [_bandit_row(*key, *totals) for key, totals in bandit.items()],
+                )
+            except Exception as e:
+                logger.error(f"Failed to flush counter updates: {e}")
+
+    def _run_writer(self):
+        while not self._stop_writer.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        """Flush queued updates and close the writer connection"""
+        if self._writer is not None:
+            self._stop_writer.set()
+            self._writer.join()
+            self._writer = None
+        self.flush()
+        with self._write_lock:
+            if self._write_conn is not None:
+                self._write_conn.close()
+                self._write_conn = None
+
     def initialize_db(self):
         """Initialize database if it doesn't exist"""
         try:
@@ -159,7 +309,7 @@ class DatabaseManager:
                         "id": row["id"],
                         "artifact_type": row["artifact_type"],
                         "title": row["title"],
-                        "content": row["content"],
+                        "content": unpack_artifact_content(row["content"]),
                         "agent_name": row["agent_name"],
                         "quality_score": row["quality_score"],
                         "confidence_score": row["confidence_score"],
@@ -200,7 +350,7 @@ class DatabaseManager:
                     {
                         "id": row["id"],
                         "title": row["title"],
-                        "content": row["content"],
+                        "content": unpack_artifact_content(row["content"]),
                         "agent_name": row["agent_name"],
                         "quality_score": row["quality_score"],
                         "created_at": row["created_at"],
@@ -339,78 +489,29 @@ class DatabaseManager:
         self, model_name: str, task_type: str, success: bool, quality_score: float = 0.0
     ):
         """Update agent performance metrics"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        if self.write_behind:
+            with self._pending_lock:
+                totals = self._pending_performance.setdefault(
+                    (model_name, task_type), [0, 0, 0.0]
+                )
+                totals[0] += 1
+                totals[1] += 1 if success else 0
+                totals[2] += quality_score
+            return
 
         try:
-            # Get current stats
-            cursor.execute(
-                """
-                SELECT total_executions, success_count, avg_quality_score
-                FROM agent_performance 
-                WHERE model_name = ? AND task_type = ?
-            """,
-                (model_name, task_type),
+            self._write_counters(
+                AGENT_PERFORMANCE_UPSERT,
+                [
+                    _performance_row(
+                        model_name, task_type, 1, 1 if success else 0, quality_score
+                    )
+                ],
             )
-
-            row = cursor.fetchone()
-
-            if row:
-                total_executions = row["total_executions"]
-                success_count = row["success_count"]
-                avg_quality = row["avg_quality_score"]
-
-                new_total = total_executions + 1
-                new_success = success_count + (1 if success else 0)
-                new_avg_quality = (
-                    (avg_quality * total_executions) + quality_score
-                ) / new_total
-                new_success_rate = new_success / new_total
-
-                cursor.execute(
-                    """
-                    UPDATE agent_performance 
-                    SET success_rate = ?, avg_quality_score = ?, 
-                        total_executions = ?, success_count = ?,
-                        last_updated = CURRENT_TIMESTAMP
-                    WHERE model_name = ? AND task_type = ?
-                """,
-                    (
-                        new_success_rate,
-                        new_avg_quality,
-                        new_total,
-                        new_success,
-                        model_name,
-                        task_type,
-                    ),
-                )
-            else:
-                # Insert new record
-                success_rate = 1.0 if success else 0.0
-                cursor.execute(
-                    """
-                    INSERT INTO agent_performance 
-                    (model_name, task_type, success_rate, avg_quality_score, 
-                     total_executions, success_count)
-                    VALUES (?, ?, ?, ?, 1, ?)
-                """,
-                    (
-                        model_name,
-                        task_type,
-                        success_rate,
-                        quality_score,
-                        1 if success else 0,
-                    ),
-                )
-
-            conn.commit()
-            logger.info(f"Updated performance for {model_name} on {task_type}")
+            logger.debug(f"Updated performance for {model_name} on {task_type}")
 
         except Exception as e:
             logger.error(f"Failed to update agent performance: {e}")
-            conn.rollback()
-        finally:
-            conn.close()
 
     def get_agent_performance(self, model_name: Optional[str] = None) -> List[Dict]:
         """Get agent performance metrics"""
@@ -566,85 +667,32 @@ class DatabaseManager:
         reward: Optional[float] = None,
     ):
         """Update bandit learning parameters"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        try:
-            # Get current parameters
-            cursor.execute(
-                """
-                SELECT alpha, beta, total_pulls, success_count, reward_sum
-                FROM bandit_arms 
-                WHERE model_name = ? AND task_category = ?
-            """,
-                (model_name, task_category),
-            )
-
-            row = cursor.fetchone()
-            reward = reward if reward is not None else (1.0 if success else 0.0)
-
-            if row:
-                alpha = row["alpha"]
-                beta = row["beta"]
-                total_pulls = row["total_pulls"]
-                success_count = row["success_count"]
-                reward_sum = row["reward_sum"]
-
-                # Update parameters (Beta distribution)
-                new_alpha = alpha + (1 if success else 0)
-                new_beta = beta + (0 if success else 1)
-                new_total = total_pulls + 1
-                new_success = success_count + (1 if success else 0)
-                new_reward_sum = reward_sum + reward
-
-                cursor.execute(
-                    """
-                    UPDATE bandit_arms 
-                    SET alpha = ?, beta = ?, total_pulls = ?, 
-                        success_count = ?, reward_sum = ?,
-                        last_updated = CURRENT_TIMESTAMP
-                    WHERE model_name = ? AND task_category = ?
-                """,
-                    (
-                        new_alpha,
-                        new_beta,
-                        new_total,
-                        new_success,
-                        new_reward_sum,
-                        model_name,
-                        task_category,
-                    ),
-                )
-            else:
-                # Insert new arm
-                alpha = 1.0 + (1 if success else 0)
-                beta = 1.0 + (0 if success else 1)
+        reward = reward if reward is not None else (1.0 if success else 0.0)
 
-                cursor.execute(
-                    """
-                    INSERT INTO bandit_arms 
-                    (model_name, task_category, alpha, beta, total_pulls, 
-                     success_count, reward_sum)
-                    VALUES (?, ?, ?, ?, 1, ?, ?)
-                """,
-                    (
-                        model_name,
-                        task_category,
-                        alpha,
-                        beta,
-                        1 if success else 0,
-                        reward,
-                    ),
+        if self.write_behind:
+            with self._pending_lock:
+                totals = self._pending_bandit.setdefault(
+                    (model_name, task_category), [0, 0, 0.0]
                 )
+                totals[0] += 1
+                totals[1] += 1 if success else 0
+                totals[2] += reward
+            return
 
-            conn.commit()
+        try:
+            # Beta distribution parameters, counts and reward sum in one UPSERT
+            self._write_counters(
+                BANDIT_ARM_UPSERT,
+                [
+                    _bandit_row(
+                        model_name, task_category, 1, 1 if success else 0, reward
+                    )
+                ],
+            )
             logger.debug(f"Updated bandit arm: {model_name} - {task_category}")
 
         except Exception as e:
             logger.error(f"Failed to update bandit arm: {e}")
-            conn.rollback()
-        finally:
-            conn.close()
 
     def get_bandit_arms(self) -> List[Dict]:
         """Get all bandit arms for learning"""
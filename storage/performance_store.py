@@ -6,17 +6,137 @@ quality metrics, and learning outcomes with efficient querying capabilities.
 """
 
 import logging
+import math
 import sqlite3
 import json
+import threading
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, asdict
 from enum import Enum
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from uuid import uuid4
-import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Rollup granularities and their bucket widths
+ROLLUP_GRANULARITIES = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+}
+
+# Log-bucketed histogram: adjacent bins differ by 5%, so percentiles read
+# from a rollup are within ~2.5% of the exact value
+HISTOGRAM_GAMMA = 1.05
+_LOG_GAMMA = math.log(HISTOGRAM_GAMMA)
+
+
+def _utc_naive(ts: datetime) -> datetime:
+    """Normalise to naive UTC so bucket keys sort as plain strings"""
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return ts
+
+
+def _bucket_start(ts: datetime, granularity: str) -> datetime:
+    ts = _utc_naive(ts)
+    if granularity == "minute":
+        return ts.replace(second=0, microsecond=0)
+    if granularity == "hour":
+        return ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _bucket_ceil(ts: datetime, granularity: str) -> datetime:
+    floor = _bucket_start(ts, granularity)
+    return floor if floor == ts else floor + ROLLUP_GRANULARITIES[granularity]
+
+
+def _cover(
+    lo: datetime, hi: datetime, finest: str
+) -> List[Tuple[str, datetime, datetime]]:
+    """Tile [lo, hi), aligned to `finest`, with the coarsest buckets that fit"""
+    levels = list(ROLLUP_GRANULARITIES)
+    levels = levels[levels.index(finest) :]
+    ranges = []
+    for fine, coarse in zip(levels, levels[1:]):
+        coarse_lo, coarse_hi = _bucket_ceil(lo, coarse), _bucket_start(hi, coarse)
+        if coarse_lo >= coarse_hi:
+            break
+        ranges += [(fine, lo, coarse_lo), (fine, coarse_hi, hi)]
+        lo, hi, finest = coarse_lo, coarse_hi, coarse
+    ranges.append((finest, lo, hi))
+    return [(g, a, b) for g, a, b in ranges if a < b]
+
+
+def _rollup_ranges(
+    start_time: datetime,
+    end_time: datetime,
+    retained_from: Optional[Dict[str, datetime]] = None,
+) -> List[Tuple[str, datetime, datetime]]:
+    """Cover [start, end] with the fewest rollup buckets, to minute precision.
+
+    Returns (granularity, first_bucket, end_bucket) spans: coarse day
+    buckets in the middle, hour and minute buckets at the ragged edges.
+    `retained_from` maps a granularity to the oldest bucket retention has
+    kept; older parts of the window fall back to the next coarser rollup,
+    with the window's start rounded down to that bucket.
+    """
+    lo = _bucket_start(start_time, "minute")
+    hi = _bucket_start(end_time, "minute") + ROLLUP_GRANULARITIES["minute"]
+    retained_from = retained_from or {}
+
+    # Finest granularity usable up to each limit, oldest segment first
+    segments = [
+        ("day", retained_from.get("hour", datetime.min)),
+        ("hour", retained_from.get("minute", datetime.min)),
+        ("minute", hi),
+    ]
+    ranges = []
+    for finest, limit in segments:
+        segment_hi = min(hi, limit)
+        if lo >= segment_hi:
+            continue
+        segment_lo = _bucket_start(lo, finest)
+        segment_hi = _bucket_ceil(segment_hi, finest)
+        ranges.extend(_cover(segment_lo, segment_hi, finest))
+        lo = segment_hi
+    return ranges
+
+
+def _histogram_key(value: float) -> str:
+    if value == 0:
+        return "z"
+    index = math.floor(math.log(abs(value)) / _LOG_GAMMA)
+    return f"{'p' if value > 0 else 'n'}{index}"
+
+
+def _histogram_value(key: str) -> float:
+    """Representative (geometric midpoint) value of a histogram bin"""
+    if key == "z":
+        return 0.0
+    magnitude = HISTOGRAM_GAMMA ** (int(key[1:]) + 0.5)
+    return magnitude if key[0] == "p" else -magnitude
+
+
+def _histogram_percentile(
+    histogram: Dict[str, int], q: float, min_value: float, max_value: float
+) -> float:
+    """Approximate the q-th percentile from merged histogram bins"""
+    bins = sorted((_histogram_value(k), c) for k, c in histogram.items())
+    total = sum(c for _, c in bins)
+    if not total:
+        return 0.0
+
+    rank = q / 100 * (total - 1)
+    seen = 0
+    for value, count in bins:
+        seen += count
+        if seen > rank:
+            # Bin midpoints can fall outside the observed range
+            return min(max(value, min_value), max_value)
+    return max_value
+
 
 class MetricType(str, Enum):
     """Types of performance metrics"""
@@ -102,8 +222,19 @@ class PerformanceStore:
 
     def __init__(self, db_path: str = "performance_store.db"):
         self.db_path = db_path
+        self._local = threading.local()
         self._initialize_database()
 
+    def _get_connection(self) -> sqlite3.Connection:
+        """Long-lived WAL connection for the calling thread"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
     def _initialize_database(self):
         """Initialize SQLite database with performance-optimized schema"""
 
@@ -190,6 +321,36 @@ class PerformanceStore:
             )
         """)
 
+        # Pre-aggregated rollups, maintained on write
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'metric_rollups'"
+        )
+        rollups_exist = cursor.fetchone() is not None
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS metric_rollups (
+                granularity TEXT NOT NULL, -- 'minute', 'hour', 'day'
+                bucket_start TEXT NOT NULL,
+                model_name TEXT NOT NULL,
+                task_type TEXT NOT NULL,
+                metric_type TEXT NOT NULL,
+                sample_count INTEGER NOT NULL,
+                value_sum REAL NOT NULL,
+                value_sum_sq REAL NOT NULL,
+                min_value REAL NOT NULL,
+                max_value REAL NOT NULL,
+                histogram TEXT NOT NULL, -- JSON {bin: count}
+                PRIMARY KEY (granularity, bucket_start, model_name, task_type, metric_type)
+            )
+        """)
+
+        # Oldest bucket kept per rollup granularity, advanced by apply_retention
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS rollup_retention (
+                granularity TEXT PRIMARY KEY,
+                retained_from TEXT NOT NULL
+            )
+        """)
+
         # Performance optimization indexes
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_metrics_timestamp ON performance_metrics(timestamp)"
@@ -205,39 +366,211 @@ class PerformanceStore:
         )
 
         conn.commit()
+
+        # Roll up history recorded before the rollup tables existed
+        if not rollups_exist:
+            self._rebuild_rollups(conn)
+            conn.commit()
         conn.close()
 
         logger.info("Performance store database initialized")
 
-    def store_metric(self, metric: PerformanceMetric) -> bool:
-        """Store a single performance metric"""
+    _INSERT_METRIC_SQL = """
+        INSERT OR IGNORE INTO performance_metrics
+        (metric_id, metric_type, model_name, task_type, value, timestamp, metadata, correlation_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
 
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+    _UPDATE_METRIC_SQL = """
+        UPDATE performance_metrics
+        SET metric_type = ?, model_name = ?, task_type = ?, value = ?,
+            timestamp = ?, metadata = ?, correlation_id = ?
+        WHERE metric_id = ?
+    """
+
+    _UPSERT_ROLLUP_SQL = """
+        INSERT INTO metric_rollups
+        (granularity, bucket_start, model_name, task_type, metric_type,
+         sample_count, value_sum, value_sum_sq, min_value, max_value, histogram)
+        VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?, ?, json_object(?, 1))
+        ON CONFLICT (granularity, bucket_start, model_name, task_type, metric_type)
+        DO UPDATE SET
+            sample_count = sample_count + 1,
+            value_sum = value_sum + excluded.value_sum,
+            value_sum_sq = value_sum_sq + excluded.value_sum_sq,
+            min_value = MIN(min_value, excluded.min_value),
+            max_value = MAX(max_value, excluded.max_value),
+            histogram = json_set(
+                histogram, ?, COALESCE(json_extract(histogram, ?), 0) + 1
+            )
+    """
 
-            metric_data = metric.to_dict()
+    _REMOVE_ROLLUP_SQL = """
+        UPDATE metric_rollups
+        SET sample_count = sample_count - 1,
+            value_sum = value_sum - ?,
+            value_sum_sq = value_sum_sq - ?,
+            histogram = CASE
+                WHEN json_extract(histogram, ?) > 1
+                THEN json_set(histogram, ?, json_extract(histogram, ?) - 1)
+                ELSE json_remove(histogram, ?)
+            END
+        WHERE granularity = ? AND bucket_start = ?
+          AND model_name = ? AND task_type = ? AND metric_type = ?
+    """
+
+    _DELETE_EMPTY_ROLLUP_SQL = """
+        DELETE FROM metric_rollups
+        WHERE granularity = ? AND bucket_start = ?
+          AND model_name = ? AND task_type = ? AND metric_type = ?
+          AND sample_count <= 0
+    """
 
+    def _write_metric(self, cursor: sqlite3.Cursor, data: Dict[str, Any]):
+        """Insert a raw metric and fold it into the rollups (caller commits)"""
+        cursor.execute(
+            self._INSERT_METRIC_SQL,
+            (
+                data["metric_id"],
+                data["metric_type"],
+                data["model_name"],
+                data["task_type"],
+                data["value"],
+                data["timestamp"],
+                data["metadata"],
+                data["correlation_id"],
+            ),
+        )
+
+        if cursor.rowcount == 0:
+            # Re-stored metric_id: take the old value out of the rollups
+            # before refreshing the raw row and counting the new one
+            old = cursor.execute(
+                "SELECT model_name, task_type, metric_type, value, timestamp "
+                "FROM performance_metrics WHERE metric_id = ?",
+                (data["metric_id"],),
+            ).fetchone()
+            self._unroll_value(
+                cursor, old[0], old[1], old[2], old[3], datetime.fromisoformat(old[4])
+            )
             cursor.execute(
-                """
-                INSERT OR REPLACE INTO performance_metrics
-                (metric_id, metric_type, model_name, task_type, value, timestamp, metadata, correlation_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+                self._UPDATE_METRIC_SQL,
                 (
-                    metric_data["metric_id"],
-                    metric_data["metric_type"],
-                    metric_data["model_name"],
-                    metric_data["task_type"],
-                    metric_data["value"],
-                    metric_data["timestamp"],
-                    metric_data["metadata"],
-                    metric_data["correlation_id"],
+                    data["metric_type"],
+                    data["model_name"],
+                    data["task_type"],
+                    data["value"],
+                    data["timestamp"],
+                    data["metadata"],
+                    data["correlation_id"],
+                    data["metric_id"],
                 ),
             )
 
-            conn.commit()
-            conn.close()
+        self._rollup_value(
+            cursor,
+            data["model_name"],
+            data["task_type"],
+            data["metric_type"],
+            data["value"],
+            datetime.fromisoformat(data["timestamp"]),
+        )
+
+    def _rollup_value(
+        self,
+        cursor: sqlite3.Cursor,
+        model_name: str,
+        task_type: str,
+        metric_type: str,
+        value: float,
+        timestamp: datetime,
+    ):
+        bin_key = _histogram_key(value)
+        bin_path = f'$."{bin_key}"'
+        cursor.executemany(
+            self._UPSERT_ROLLUP_SQL,
+            [
+                (
+                    granularity,
+                    _bucket_start(timestamp, granularity).isoformat(),
+                    model_name,
+                    task_type,
+                    metric_type,
+                    value,
+                    value * value,
+                    value,
+                    value,
+                    bin_key,
+                    bin_path,
+                    bin_path,
+                )
+                for granularity in ROLLUP_GRANULARITIES
+            ],
+        )
+
+    def _unroll_value(
+        self,
+        cursor: sqlite3.Cursor,
+        model_name: str,
+        task_type: str,
+        metric_type: str,
+        value: float,
+        timestamp: datetime,
+    ):
+        """Reverse _rollup_value for a replaced metric.
+
+        Count, sums and histogram are exact; min/max cannot be reversed and
+        stay as bounds until the bucket empties and is dropped.
+        """
+        bin_path = f'$."{_histogram_key(value)}"'
+        keys = [
+            (
+                granularity,
+                _bucket_start(timestamp, granularity).isoformat(),
+                model_name,
+                task_type,
+                metric_type,
+            )
+            for granularity in ROLLUP_GRANULARITIES
+        ]
+        cursor.executemany(
+            self._REMOVE_ROLLUP_SQL,
+            [
+                (value, value * value, bin_path, bin_path, bin_path, bin_path, *key)
+                for key in keys
+            ],
+        )
+        cursor.executemany(self._DELETE_EMPTY_ROLLUP_SQL, keys)
+
+    def _rebuild_rollups(self, conn: sqlite3.Connection):
+        """Recompute every rollup bucket from the raw metrics table"""
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM metric_rollups")
+        cursor.execute("DELETE FROM rollup_retention")
+        rows = conn.execute(
+            "SELECT model_name, task_type, metric_type, value, timestamp FROM performance_metrics"
+        )
+        count = 0
+        for model_name, task_type, metric_type, value, timestamp in rows:
+            self._rollup_value(
+                cursor,
+                model_name,
+                task_type,
+                metric_type,
+                value,
+                datetime.fromisoformat(timestamp),
+            )
+            count += 1
+        if count:
+            logger.info(f"Rebuilt rollups from {count} raw metrics")
+
+    def store_metric(self, metric: PerformanceMetric) -> bool:
+        """Store a single performance metric"""
+
+        try:
+            conn = self._get_connection()
+            with conn:
+                self._write_metric(conn.cursor(), metric.to_dict())
 
             logger.debug(
                 f"Stored metric: {metric.metric_type.value} = {metric.value} for {metric.model_name}"
@@ -255,34 +588,11 @@ class PerformanceStore:
             return 0
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            metric_data = [metric.to_dict() for metric in metrics]
-
-            cursor.executemany(
-                """
-                INSERT OR REPLACE INTO performance_metrics
-                (metric_id, metric_type, model_name, task_type, value, timestamp, metadata, correlation_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                [
-                    (
-                        data["metric_id"],
-                        data["metric_type"],
-                        data["model_name"],
-                        data["task_type"],
-                        data["value"],
-                        data["timestamp"],
-                        data["metadata"],
-                        data["correlation_id"],
-                    )
-                    for data in metric_data
-                ],
-            )
-
-            conn.commit()
-            conn.close()
+            conn = self._get_connection()
+            with conn:
+                cursor = conn.cursor()
+                for metric in metrics:
+                    self._write_metric(cursor, metric.to_dict())
 
             logger.info(f"Stored {len(metrics)} metrics in batch")
             return len(metrics)
@@ -363,56 +673,102 @@ class PerformanceStore:
 
         return metrics
 
+    def _query_rollups(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        metric_type: Optional[str] = None,
+    ) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
+        """Merge rollup buckets covering [start, end] per (model, task, metric)"""
+
+        conn = self._get_connection()
+        retained_from = {
+            granularity: datetime.fromisoformat(bucket)
+            for granularity, bucket in conn.execute(
+                "SELECT granularity, retained_from FROM rollup_retention"
+            )
+        }
+        ranges = _rollup_ranges(start_time, end_time, retained_from)
+        if not ranges:
+            return {}
+
+        span_clause = " OR ".join(
+            "(granularity = ? AND bucket_start >= ? AND bucket_start < ?)"
+            for _ in ranges
+        )
+        params: List[Any] = [
+            p for g, lo, hi in ranges for p in (g, lo.isoformat(), hi.isoformat())
+        ]
+        query = f"""
+            SELECT model_name, task_type, metric_type, sample_count, value_sum,
+                   value_sum_sq, min_value, max_value, histogram
+            FROM metric_rollups
+            WHERE ({span_clause})
+        """
+        if metric_type:
+            query += " AND metric_type = ?"
+            params.append(metric_type)
+
+        merged: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        for row in conn.execute(query, params):
+            key = (row[0], row[1], row[2])
+            acc = merged.get(key)
+            if acc is None:
+                acc = merged[key] = {
+                    "count": 0,
+                    "sum": 0.0,
+                    "sum_sq": 0.0,
+                    "min": row[6],
+                    "max": row[7],
+                    "histogram": {},
+                }
+            acc["count"] += row[3]
+            acc["sum"] += row[4]
+            acc["sum_sq"] += row[5]
+            acc["min"] = min(acc["min"], row[6])
+            acc["max"] = max(acc["max"], row[7])
+            for bin_key, count in json.loads(row[8]).items():
+                acc["histogram"][bin_key] = acc["histogram"].get(bin_key, 0) + count
+
+        return merged
+
     def compute_aggregated_metrics(
         self,
         period: AggregationPeriod,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
     ) -> List[AggregatedMetrics]:
-        """Compute and store aggregated metrics for the specified period"""
+        """Compute and store aggregated metrics for the specified period.
+
+        Reads the minute/hour/day rollups, so the cost depends on the number
+        of buckets in the window rather than the number of raw metrics.
+        Percentiles are approximated from the rollup histograms.
+        """
 
         if not start_time:
             start_time = datetime.now(timezone.utc) - timedelta(days=7)
         if not end_time:
             end_time = datetime.now(timezone.utc)
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Get raw metrics for aggregation
-        cursor.execute(
-            """
-            SELECT model_name, task_type, metric_type, value
-            FROM performance_metrics
-            WHERE timestamp >= ? AND timestamp <= ?
-        """,
-            (start_time.isoformat(), end_time.isoformat()),
-        )
-
-        raw_data = cursor.fetchall()
-
-        if not raw_data:
-            conn.close()
+        grouped_data = self._query_rollups(start_time, end_time)
+        if not grouped_data:
             return []
 
-        # Group by model, task type, and metric type
-        grouped_data = {}
-        for row in raw_data:
-            model_name, task_type, metric_type, value = row
-            key = (model_name, task_type, metric_type)
-
-            if key not in grouped_data:
-                grouped_data[key] = []
-            grouped_data[key].append(value)
-
         # Compute aggregated metrics
         aggregated_metrics = []
 
-        for (model_name, task_type, metric_type), values in grouped_data.items():
-            if len(values) < 2:  # Skip if insufficient data
+        for (model_name, task_type, metric_type), acc in grouped_data.items():
+            count = acc["count"]
+            if count < 2:  # Skip if insufficient data
                 continue
 
-            values = np.array(values)
+            mean = acc["sum"] / count
+            variance = max(acc["sum_sq"] / count - mean * mean, 0.0)
+
+            def percentile(q: float) -> float:
+                return _histogram_percentile(
+                    acc["histogram"], q, acc["min"], acc["max"]
+                )
 
             aggregated = AggregatedMetrics(
                 model_name=model_name,
@@ -421,19 +777,22 @@ class PerformanceStore:
                 period=period,
                 start_time=start_time,
                 end_time=end_time,
-                mean_value=float(np.mean(values)),
-                median_value=float(np.median(values)),
-                std_deviation=float(np.std(values)),
-                min_value=float(np.min(values)),
-                max_value=float(np.max(values)),
-                sample_count=len(values),
-                percentile_25=float(np.percentile(values, 25)),
-                percentile_75=float(np.percentile(values, 75)),
-                percentile_95=float(np.percentile(values, 95)),
+                mean_value=mean,
+                median_value=percentile(50),
+                std_deviation=math.sqrt(variance),
+                min_value=acc["min"],
+                max_value=acc["max"],
+                sample_count=count,
+                percentile_25=percentile(25),
+                percentile_75=percentile(75),
+                percentile_95=percentile(95),
             )
 
             aggregated_metrics.append(aggregated)
 
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
         # Store aggregated metrics
         for agg_metric in aggregated_metrics:
             cursor.execute(
@@ -464,7 +823,6 @@ class PerformanceStore:
             )
 
         conn.commit()
-        conn.close()
 
         logger.info(
             f"Computed {len(aggregated_metrics)} aggregated metrics for {period.value} period"
@@ -526,80 +884,63 @@ class PerformanceStore:
     def get_quality_statistics(self) -> Dict[str, Any]:
         """Get comprehensive quality statistics"""
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         cursor = conn.cursor()
 
-        # Overall statistics
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_metrics,
-                AVG(value) as avg_value,
-                MIN(value) as min_value,
-                MAX(value) as max_value
-            FROM performance_metrics
-            WHERE metric_type = 'quality_score'
-        """)
-
-        overall_stats = cursor.fetchone()
-
-        # Per-model statistics
+        # Per-model statistics over the whole history, from day rollups
         cursor.execute("""
             SELECT 
                 model_name,
-                COUNT(*) as metric_count,
-                AVG(value) as avg_quality,
-                MIN(value) as min_quality,
-                MAX(value) as max_quality
-            FROM performance_metrics
-            WHERE metric_type = 'quality_score'
+                SUM(sample_count) as metric_count,
+                SUM(value_sum) as quality_sum,
+                MIN(min_value) as min_quality,
+                MAX(max_value) as max_quality
+            FROM metric_rollups
+            WHERE granularity = 'day' AND metric_type = 'quality_score'
             GROUP BY model_name
         """)
 
         model_stats = {}
+        total_count, total_sum = 0, 0.0
+        overall_min, overall_max = None, None
         for row in cursor.fetchall():
             model_stats[row[0]] = {
                 "metric_count": row[1],
-                "avg_quality": row[2],
+                "avg_quality": row[2] / row[1],
                 "min_quality": row[3],
                 "max_quality": row[4],
             }
+            total_count += row[1]
+            total_sum += row[2]
+            overall_min = row[3] if overall_min is None else min(overall_min, row[3])
+            overall_max = row[4] if overall_max is None else max(overall_max, row[4])
 
         # Recent trends (last 7 days)
-        week_ago = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
-        cursor.execute(
-            """
-            SELECT 
-                model_name,
-                COUNT(*) as recent_count,
-                AVG(value) as recent_avg_quality
-            FROM performance_metrics
-            WHERE metric_type = 'quality_score' AND timestamp >= ?
-            GROUP BY model_name
-        """,
-            (week_ago,),
+        now = datetime.now(timezone.utc)
+        recent = self._query_rollups(
+            now - timedelta(days=7), now, metric_type=MetricType.QUALITY_SCORE.value
         )
 
-        recent_trends = {}
-        for row in cursor.fetchall():
-            recent_trends[row[0]] = {
-                "recent_count": row[1],
-                "recent_avg_quality": row[2],
-            }
+        recent_by_model: Dict[str, List[float]] = {}
+        for (model_name, _task_type, _metric_type), acc in recent.items():
+            totals = recent_by_model.setdefault(model_name, [0, 0.0])
+            totals[0] += acc["count"]
+            totals[1] += acc["sum"]
 
-        conn.close()
+        recent_trends = {
+            model_name: {
+                "recent_count": count,
+                "recent_avg_quality": value_sum / count,
+            }
+            for model_name, (count, value_sum) in recent_by_model.items()
+        }
 
         return {
             "overall": {
-                "total_metrics": overall_stats[0] if overall_stats else 0,
-                "avg_quality": overall_stats[1]
-                if overall_stats and overall_stats[1]
-                else 0.0,
-                "min_quality": overall_stats[2]
-                if overall_stats and overall_stats[2]
-                else 0.0,
-                "max_quality": overall_stats[3]
-                if overall_stats and overall_stats[3]
-                else 0.0,
+                "total_metrics": total_count,
+                "avg_quality": total_sum / total_count if total_count else 0.0,
+                "min_quality": overall_min or 0.0,
+                "max_quality": overall_max or 0.0,
             },
             "by_model": model_stats,
             "recent_trends": recent_trends,
@@ -752,6 +1093,62 @@ class PerformanceStore:
             logger.error(f"Error cleaning up old metrics: {e}")
             return 0
 
+    def apply_retention(
+        self,
+        raw_days_to_keep: int = 7,
+        minute_rollup_days: int = 2,
+        hour_rollup_days: int = 90,
+    ) -> Dict[str, int]:
+        """Drop raw metrics and fine-grained rollups past their retention.
+
+        Day rollups are kept indefinitely, so aggregates over long windows
+        stay available after the raw rows are gone. The retention horizon is
+        recorded so queries reaching past it read the coarser rollups.
+        """
+
+        now = _utc_naive(datetime.now(timezone.utc))
+        raw_cutoff = datetime.now(timezone.utc) - timedelta(days=raw_days_to_keep)
+
+        try:
+            conn = self._get_connection()
+            with conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "DELETE FROM performance_metrics WHERE timestamp < ?",
+                    (raw_cutoff.isoformat(),),
+                )
+                deleted_raw = cursor.rowcount
+
+                deleted_rollups = 0
+                for granularity, days in (
+                    ("minute", minute_rollup_days),
+                    ("hour", hour_rollup_days),
+                ):
+                    cutoff = _bucket_ceil(now - timedelta(days=days), granularity)
+                    cursor.execute(
+                        "DELETE FROM metric_rollups WHERE granularity = ? AND bucket_start < ?",
+                        (granularity, cutoff.isoformat()),
+                    )
+                    deleted_rollups += cursor.rowcount
+                    cursor.execute(
+                        """
+                        INSERT INTO rollup_retention (granularity, retained_from)
+                        VALUES (?, ?)
+                        ON CONFLICT (granularity) DO UPDATE SET
+                            retained_from = MAX(retained_from, excluded.retained_from)
+                        """,
+                        (granularity, cutoff.isoformat()),
+                    )
+
+            logger.info(
+                f"Retention dropped {deleted_raw} raw metrics and {deleted_rollups} rollup buckets"
+            )
+            return {"raw_metrics": deleted_raw, "rollup_buckets": deleted_rollups}
+
+        except Exception as e:
+            logger.error(f"Error applying retention: {e}")
+            return {"raw_metrics": 0, "rollup_buckets": 0}
+
     def export_metrics(
         self,
         output_file: str,
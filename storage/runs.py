@@ -3,18 +3,45 @@ import sqlite3
 import time
 import os
 
+from storage.artifact_content import pack_artifact_content, unpack_artifact_content
+
 DB = "./data/codecompanion.db"
 os.makedirs("./data", exist_ok=True)
 
+ARTIFACT_COLUMNS = {
+    "run_id": "TEXT",
+    "idx": "INTEGER",
+    "kind": "TEXT",
+    "agent": "TEXT",
+    "confidence": "REAL",
+    "content": "TEXT",
+}
+
+# DB path -> whether artifacts has the legacy project_id layout; the database
+# is shared with storage.database_manager, so the variant is detected once per
+# process rather than recorded in PRAGMA user_version
+_legacy_schema: Dict[str, bool] = {}
+
 
 def _conn():
     return sqlite3.connect(DB)
 
 
+def _columns(cursor, table: str) -> set:
+    # PRAGMA statements can't take bound parameters; the table-valued form can
+    rows = cursor.execute("SELECT name FROM pragma_table_info(?)", (table,))
+    return {r[0] for r in rows}
+
+
 def _col_exists(cursor, table: str, col: str) -> bool:
-    rows = cursor.execute("PRAGMA table_info(?)", (table,)).fetchall()
-    names = {r[1] for r in rows}
-    return col in names
+    return col in _columns(cursor, table)
+
+
+def _is_legacy_schema(c) -> bool:
+    legacy = _legacy_schema.get(DB)
+    if legacy is None:
+        legacy = _legacy_schema[DB] = _col_exists(c, "artifacts", "project_id")
+    return legacy
 
 
 def init():
@@ -34,36 +61,13 @@ def init():
         )""")
         # migration: add missing columns if table already existed
         # (SQLite allows ADD COLUMN without default)
-        try:
-            if not _col_exists(c, "artifacts", "run_id"):
-                c.execute("ALTER TABLE artifacts ADD COLUMN run_id TEXT")
-        except sqlite3.OperationalError:
-            pass  # Column may already exist
-        try:
-            if not _col_exists(c, "artifacts", "idx"):
-                c.execute("ALTER TABLE artifacts ADD COLUMN idx INTEGER")
-        except sqlite3.OperationalError:
-            pass
-        try:
-            if not _col_exists(c, "artifacts", "kind"):
-                c.execute("ALTER TABLE artifacts ADD COLUMN kind TEXT")
-        except sqlite3.OperationalError:
-            pass
-        try:
-            if not _col_exists(c, "artifacts", "agent"):
-                c.execute("ALTER TABLE artifacts ADD COLUMN agent TEXT")
-        except sqlite3.OperationalError:
-            pass
-        try:
-            if not _col_exists(c, "artifacts", "confidence"):
-                c.execute("ALTER TABLE artifacts ADD COLUMN confidence REAL")
-        except sqlite3.OperationalError:
-            pass
-        try:
-            if not _col_exists(c, "artifacts", "content"):
-                c.execute("ALTER TABLE artifacts ADD COLUMN content TEXT")
-        except sqlite3.OperationalError:
-            pass
+        existing = _columns(c, "artifacts")
+        for col, col_type in ARTIFACT_COLUMNS.items():
+            if col not in existing:
+                try:
+                    c.execute(f"ALTER TABLE artifacts ADD COLUMN {col} {col_type}")
+                except sqlite3.OperationalError:
+                    pass  # Added concurrently by another process
         # helpful index
         try:
             c.execute(
@@ -71,52 +75,53 @@ def init():
             )
         except Exception:
             pass
+        _legacy_schema[DB] = "project_id" in existing
 
 
 def save_run(run_id: str, objective: str, artifacts: List[Dict[str, Any]]):
+    # One transaction for the run row and every artifact
     with _conn() as c:
         c.execute(
             "INSERT OR REPLACE INTO runs(id, objective, created_at) VALUES (?,?,?)",
             (run_id, objective, time.strftime("%Y-%m-%d %H:%M:%S")),
         )
-        for i, a in enumerate(artifacts):
-            # Check if we have the old schema with project_id or new schema
-            cursor = c.cursor()
-            cursor.execute("PRAGMA table_info(artifacts)")
-            columns = {col[1] for col in cursor.fetchall()}
-
-            if "project_id" in columns:
-                # Use old schema - insert with all required columns
-                c.execute(
-                    """INSERT INTO artifacts(project_id, artifact_type, title, content, agent_name, run_id, idx, kind, agent, confidence)
-                             VALUES (?,?,?,?,?,?,?,?,?,?)""",
+        if _is_legacy_schema(c):
+            # Old schema - insert with all required columns
+            c.executemany(
+                """INSERT INTO artifacts(project_id, artifact_type, title, content, agent_name, run_id, idx, kind, agent, confidence)
+                         VALUES (?,?,?,?,?,?,?,?,?,?)""",
+                [
                     (
                         run_id,
                         a.get("type", "Unknown"),
                         a.get("type", "Untitled"),
-                        a.get("content", ""),
+                        pack_artifact_content(a.get("content", "")),
                         a.get("agent", "Unknown"),
                         run_id,
                         i,
                         a.get("type"),
                         a.get("agent"),
                         float(a.get("confidence", 0.75)),
-                    ),
-                )
-            else:
-                # Use new schema
-                c.execute(
-                    """INSERT INTO artifacts(run_id, idx, kind, agent, confidence, content)
-                             VALUES (?,?,?,?,?,?)""",
+                    )
+                    for i, a in enumerate(artifacts)
+                ],
+            )
+        else:
+            c.executemany(
+                """INSERT INTO artifacts(run_id, idx, kind, agent, confidence, content)
+                         VALUES (?,?,?,?,?,?)""",
+                [
                     (
                         run_id,
                         i,
                         a.get("type"),
                         a.get("agent"),
                         float(a.get("confidence", 0.75)),
-                        a.get("content", ""),
-                    ),
-                )
+                        pack_artifact_content(a.get("content", "")),
+                    )
+                    for i, a in enumerate(artifacts)
+                ],
+            )
 
 
 def load_runs(limit=20):
@@ -129,20 +134,12 @@ def load_runs(limit=20):
 
 def load_artifacts(run_id: str):
     with _conn() as c:
-        # Check schema and adapt query accordingly
-        cursor = c.cursor()
-        cursor.execute("PRAGMA table_info(artifacts)")
-        columns = {col[1] for col in cursor.fetchall()}
-
-        if "project_id" in columns:
+        if _is_legacy_schema(c):
             # Old schema - map old columns to new format
-            return c.execute(
-                "SELECT artifact_type as kind, agent_name as agent, confidence, content FROM artifacts WHERE run_id=? ORDER BY idx ASC",
-                (run_id,),
-            ).fetchall()
+            query = "SELECT artifact_type as kind, agent_name as agent, confidence, content FROM artifacts WHERE run_id=? ORDER BY idx ASC"
         else:
-            # New schema
-            return c.execute(
-                "SELECT kind, agent, confidence, content FROM artifacts WHERE run_id=? ORDER BY idx ASC",
-                (run_id,),
-            ).fetchall()
+            query = "SELECT kind, agent, confidence, content FROM artifacts WHERE run_id=? ORDER BY idx ASC"
+        return [
+            (kind, agent, confidence, unpack_artifact_content(content))
+            for kind, agent, confidence, content in c.execute(query, (run_id,))
+        ]
@@ -0,0 +1,61 @@
+"""
+Rerun-time regression budget for the Streamlit app.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("streamlit.testing.v1")
+
+from ui.rerun_timing import RERUN_BUDGET_MS, RerunTimer, benchmark_reruns
+
+# Pages whose dependencies are part of the base install
+PAGES = [
+    "🚀 Real Mode",
+    "📋 Schema Demonstration",
+    "🎯 Task & Artifact Management",
+    "🤖 Agent Orchestration",
+    "🗄️ Database Infrastructure",
+]
+
+
+def test_timer_summarizes_runs_per_page():
+    timer = RerunTimer(window=3)
+    for page, seconds in [("a", 0.010), ("b", 0.050), ("a", 0.030), ("a", 0.020)]:
+        timer.record(page, seconds)
+
+    # The oldest run fell out of the window
+    assert timer.summary() == {
+        "a": {"runs": 2, "last_ms": 20.0, "median_ms": 25.0, "max_ms": 30.0},
+        "b": {"runs": 1, "last_ms": 50.0, "median_ms": 50.0, "max_ms": 50.0},
+    }
+
+
+def test_pages_rerun_without_errors(tmp_path, monkeypatch):
+    monkeypatch.setenv("CC_EMBED_API", "false")
+    monkeypatch.chdir(tmp_path)
+
+    results = benchmark_reruns(pages=PAGES, reruns=1)
+
+    assert set(results) == set(PAGES)
+    for page, stats in results.items():
+        assert "error" not in stats, f"{page}: {stats.get('error')}"
+
+
+@pytest.mark.benchmark
+def test_pages_rerun_within_budget(tmp_path, monkeypatch):
+    """Benchmark: warm reruns of each page, in a scratch working directory"""
+    monkeypatch.setenv("CC_EMBED_API", "false")
+    monkeypatch.chdir(tmp_path)
+
+    results = benchmark_reruns(pages=PAGES, reruns=3)
+
+    for page, stats in results.items():
+        assert "error" not in stats, f"{page}: {stats.get('error')}"
+        print(f"{page}: cold {stats['cold_ms']} ms, median {stats['median_ms']} ms")
+        assert stats["median_ms"] < RERUN_BUDGET_MS
@@ -0,0 +1,115 @@
+"""
+Tests for atomic spending updates and cached checks in BudgetStore.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from codecompanion.dashboard.models import Budget, BudgetPeriod, BudgetStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BudgetStore(tmp_path / "budgets.db")
+
+
+def add_budget(
+    store, budget_id, period=BudgetPeriod.DAILY, limit=10.0, spending=0.0, **kwargs
+):
+    return store.create(
+        Budget(
+            id=budget_id,
+            name=budget_id,
+            period=period,
+            limit=limit,
+            current_spending=spending,
+            **kwargs,
+        )
+    )
+
+
+def test_concurrent_spending_is_not_lost(store):
+    add_budget(store, "daily", limit=1000.0)
+    add_budget(store, "session", period=BudgetPeriod.SESSION, limit=1000.0)
+
+    def worker():
+        for _ in range(200):
+            store.add_spending_to_active(0.125)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert store.get("daily").current_spending == 200.0
+    assert store.get("session").current_spending == 0.0
+    assert store.add_spending("missing", 1.0) is None
+
+
+def test_check_budgets_classifies_and_tracks_writes(store):
+    add_budget(store, "near", limit=10.0, spending=7.0)
+    add_budget(store, "full", period=BudgetPeriod.TOTAL, limit=10.0, spending=9.5)
+    add_budget(store, "off", limit=1.0, spending=5.0, enabled=False)
+
+    result = store.check_budgets(1.0)
+    assert result == {"exceeded": ["full"], "warnings": ["near"], "allowed": False}
+
+    # Spending updates refresh the cache, resets and edits invalidate it
+    store.add_spending("near", 1.0)
+    assert store.check_budgets(1.0)["warnings"] == []
+    store.reset_period("full")
+    assert store.check_budgets(1.0)["allowed"]
+    off = store.get("off")
+    off.enabled = True
+    store.update(off)
+    assert store.check_budgets(0.0)["exceeded"] == ["off"]
+
+
+def test_reset_period_sets_period_end(store):
+    add_budget(store, "weekly", period=BudgetPeriod.WEEKLY, spending=3.0)
+    add_budget(
+        store, "total", period=BudgetPeriod.TOTAL, spending=3.0, period_end="never"
+    )
+
+    weekly = store.reset_period("weekly")
+    assert weekly.current_spending == 0.0
+    assert weekly.period_end > weekly.period_start
+    assert store.reset_period("total").period_end == "never"
+    assert store.reset_period("missing") is None
+
+
+def test_warm_budget_check_does_not_query_the_database(store, monkeypatch):
+    for i in range(50):
+        add_budget(store, f"b{i}", limit=100.0, spending=i)
+    expected = store.check_budgets(0.5)
+
+    def no_queries():
+        raise AssertionError("check_budgets queried the database")
+
+    monkeypatch.setattr(store, "_get_conn", no_queries)
+    for _ in range(100):
+        assert store.check_budgets(0.5) == expected
+
+
+@pytest.mark.benchmark
+def test_benchmark_cached_budget_check(store):
+    """Benchmark: per-job budget check against 50 enabled budgets"""
+    for i in range(50):
+        add_budget(store, f"b{i}", limit=100.0, spending=i)
+    store.check_budgets(0.5)
+
+    runs = 10_000
+    start = time.perf_counter()
+    for _ in range(runs):
+        store.check_budgets(0.5)
+    per_check = (time.perf_counter() - start) / runs
+    print(f"check_budgets: {per_check * 1e6:.1f} us/check")
+    assert per_check < 1e-3
@@ -0,0 +1,153 @@
+"""
+Tests for bounded parallel validation rounds in ConsensusValidator.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.consensus_validator import (
+    ConsensusMethod,
+    ConsensusValidator,
+    ModelValidation,
+    ValidationDomain,
+)
+
+ARTIFACT = {"id": "a1", "type": "code", "content": "def f(): pass"}
+
+
+def make_validator(scores, delays, started=None):
+    """Validator whose models answer with fixed scores after fixed delays"""
+    validator = ConsensusValidator()
+    validator.peak_in_flight = 0
+    in_flight = set()
+
+    async def fake_validation(artifact, model_name, domain):
+        if started is not None:
+            started.append(model_name)
+        in_flight.add(model_name)
+        validator.peak_in_flight = max(validator.peak_in_flight, len(in_flight))
+        await asyncio.sleep(delays[model_name])
+        in_flight.discard(model_name)
+        return ModelValidation(
+            model_name=model_name,
+            domain=domain,
+            confidence_score=scores[model_name],
+            quality_score=scores[model_name],
+            validation_text=f"{model_name} reviewed the {domain.value} artifact",
+        )
+
+    validator._simulate_model_validation = fake_validation
+    return validator
+
+
+@pytest.mark.asyncio
+async def test_round_latency_is_the_slowest_model_not_the_sum():
+    delays = {"gpt-4": 0.2, "claude": 0.2, "gemini": 0.2}
+    validator = make_validator(dict.fromkeys(delays, 0.95), delays)
+
+    result = await validator.validate_consensus(
+        [ARTIFACT], ValidationDomain.SECURITY, ConsensusMethod.STATISTICAL_SIGNIFICANCE
+    )
+
+    assert len(result.model_validations) == 3
+    assert result.statistical_metrics["fan_out"] == 3.0
+    # All three models were in flight together, so the round beat running them in turn
+    assert validator.peak_in_flight == 3
+    assert result.statistical_metrics["round_latency_s"] < sum(delays.values())
+
+
+@pytest.mark.asyncio
+async def test_provider_semaphore_bounds_concurrency():
+    validator = ConsensusValidator()
+    validator.domain_weights[ValidationDomain.TESTING] = {
+        f"gpt-4-{i}": 0.1 for i in range(6)
+    }
+    validator.model_providers.update({f"gpt-4-{i}": "openai" for i in range(6)})
+    validator.provider_concurrency["openai"] = 2
+    active, peak = 0, 0
+    original = validator._simulate_model_validation
+
+    async def tracked(artifact, model_name, domain):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+        return await original(artifact, model_name, domain)
+
+    validator._simulate_model_validation = tracked
+    validations = await validator._get_model_validations(
+        ARTIFACT, ValidationDomain.TESTING
+    )
+
+    assert len(validations) == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_quorum_early_exit_cancels_outstanding_model():
+    # Two failing votes carry 0.8 of the weight; gemini cannot rescue the round
+    scores = {"gpt-4": 0.4, "claude": 0.5, "gemini": 1.0}
+    delays = {"gpt-4": 0.01, "claude": 0.01, "gemini": 5.0}
+    validator = make_validator(scores, delays)
+
+    start = time.perf_counter()
+    result = await validator.validate_consensus(
+        [ARTIFACT], ValidationDomain.SECURITY, ConsensusMethod.HYBRID
+    )
+
+    assert time.perf_counter() - start < 1.0
+    assert not result.validation_passed
+    assert [v.model_name for v in result.model_validations] == ["gpt-4", "claude"]
+    (round_info,) = validator.round_metrics
+    assert round_info["early_exit"]
+    assert round_info["skipped_models"] == ["gemini"]
+
+
+@pytest.mark.asyncio
+async def test_undecided_round_waits_until_deadline():
+    # The outcome hinges on gemini, which never answers in time
+    scores = {"gpt-4": 0.95, "claude": 0.95, "gemini": 0.95}
+    delays = {"gpt-4": 0.01, "claude": 0.01, "gemini": 5.0}
+    validator = make_validator(scores, delays)
+    validator.round_timeout = 0.2
+
+    result = await validator.validate_consensus(
+        [ARTIFACT], ValidationDomain.SECURITY, ConsensusMethod.WEIGHTED_VOTING
+    )
+
+    assert result.validation_passed
+    assert validator.round_metrics[-1]["timed_out_models"] == ["gemini"]
+    assert validator.get_round_metrics()["timeout_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_cached_tfidf_matches_tfidf_vectorizer():
+    validator = ConsensusValidator()
+    texts = [
+        "gpt-4 validation: Good code quality in security domain. Some minor improvements recommended.",
+        "claude validation: Excellent code quality in security domain. Well-structured with minimal issues identified.",
+        "gemini validation: Good code quality in security domain. Some minor improvements recommended.",
+    ]
+
+    reference = TfidfVectorizer(
+        max_features=1000, stop_words="english", ngram_range=(1, 2)
+    ).fit_transform(texts)
+    np.testing.assert_allclose(
+        cosine_similarity(validator._tfidf_matrix(texts)),
+        cosine_similarity(reference),
+    )
+
+    validator._tfidf_matrix(texts[::-1])
+    assert validator.text_vector_cache_misses == 3
+    assert validator.text_vector_cache_hits == 3
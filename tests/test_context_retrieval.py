@@ -0,0 +1,168 @@
+"""
+Tests for token-budgeted context retrieval over a MemoryIndex.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.context_retrieval import ContextRetriever
+from schemas.ledgers import ContextHandle, MemoryIndex
+
+NOW = datetime(2024, 6, 1, 12, 0)
+
+TOPICS = {
+    "auth": "The login endpoint validates the JWT session token and refreshes expired tokens.",
+    "payments": "The checkout service charges the saved card through the payment gateway and retries declined charges.",
+    "search": "The product search query uses the full text index and ranks results by popularity.",
+    "deploy": "The deployment pipeline builds the container image and rolls it out behind the load balancer.",
+}
+
+
+def handle(handle_id, hours_ago=0, description="conversation turn"):
+    return ContextHandle(
+        handle_id=handle_id,
+        context_type="conversation",
+        description=description,
+        size_bytes=0,
+        created_at=NOW - timedelta(hours=hours_ago),
+    )
+
+
+def recorded_session(retriever, turns=300):
+    """A recorded agent session cycling through topics, newest turn last"""
+    history = []
+    topics = list(TOPICS)
+    for turn in range(turns):
+        topic = topics[turn % len(topics)]
+        content = f"Turn {turn} ({topic}). {TOPICS[topic]} " * 4
+        retriever.add_context(handle(f"turn-{turn}", hours_ago=turns - turn), content)
+        history.append(content)
+    return history
+
+
+@pytest.fixture
+def index():
+    return MemoryIndex(
+        index_id="mem", project_id="proj", retrieval_budget={"default": 400}
+    )
+
+
+def test_retrieval_ranks_relevant_recent_context_under_budget(index):
+    retriever = ContextRetriever(index)
+    recorded_session(retriever, turns=40)
+    index.priority_handles.append("turn-0")
+
+    result = retriever.retrieve("why was the card charge declined at checkout", now=NOW)
+
+    assert result.tokens_used <= result.token_budget == 400
+    assert result.items[0].handle_id == "turn-0"
+    full = [item for item in result.items[1:] if not item.summarized]
+    assert {item.text.split("(")[1].split(")")[0] for item in full} == {"payments"}
+    # Newest payment turn (39 is deploy, 37 is payments) comes first
+    assert result.items[1].handle_id == "turn-37"
+    assert index.access_patterns["turn-37"].count == 1
+    assert index.active_handles == {item.handle_id for item in result.items}
+
+
+def test_summaries_fill_a_tight_budget(index):
+    retriever = ContextRetriever(index)
+    content = "Payments retry declined charges. " + "Gateway detail. " * 200
+    retriever.add_context(handle("long"), content)
+
+    result = retriever.retrieve("payments", token_budget=80, now=NOW)
+    (item,) = result.items
+    assert item.summarized and item.text.startswith("Payments retry declined charges.")
+    assert item.tokens <= 64
+
+
+def test_cold_handles_are_compressed_over_threshold():
+    index = MemoryIndex(
+        index_id="mem",
+        project_id="proj",
+        auto_compress_threshold_mb=0.05,
+        compression_rules={"codec": "zlib"},
+    )
+    retriever = ContextRetriever(index)
+    for turn in range(20):
+        retriever.add_context(
+            handle(f"turn-{turn}", hours_ago=100 - turn),
+            f"Turn {turn}. " + "log line\n" * 1000,
+        )
+    retriever.retrieve("turn", token_budget=10, now=NOW)
+
+    stats = retriever.get_statistics()
+    assert 0 < stats["compressed_handles"] < 20
+    assert index.current_storage_mb <= 0.05
+    oldest = index.context_handles[0]
+    assert oldest.compression_ratio < 0.1
+    assert retriever.get_content(oldest.handle_id).startswith("Turn 0. log line")
+    # The newest handle is the warmest and stays uncompressed
+    assert index.context_handles[-1].compression_ratio is None
+
+
+def test_access_history_is_a_decayed_counter():
+    index = MemoryIndex(
+        index_id="mem",
+        project_id="proj",
+        access_patterns={"h": [NOW - timedelta(hours=48), NOW - timedelta(hours=24)]},
+    )
+    assert index.access_frequency("h", NOW) == pytest.approx(0.75)
+
+    for minute in range(10_000):
+        index.record_access("h", NOW + timedelta(minutes=minute))
+    pattern = index.access_patterns["h"]
+    assert pattern.count == 10_002
+    # Steady state for one access a minute with a 24h half-life
+    assert pattern.score < 1 / (1 - 0.5 ** (1 / (24 * 60)))
+
+
+def test_legacy_access_history_loads_from_json():
+    index = MemoryIndex(
+        index_id="mem",
+        project_id="proj",
+        access_patterns={"h": [NOW - timedelta(hours=24), NOW - timedelta(hours=48)]},
+    )
+    stored = index.json()
+    legacy = stored.replace(
+        index.access_patterns["h"].json(),
+        '["%s", "%s"]'
+        % (
+            (NOW - timedelta(hours=48)).isoformat(),
+            (NOW - timedelta(hours=24)).isoformat(),
+        ),
+    )
+
+    loaded = MemoryIndex.parse_raw(legacy)
+    assert loaded.access_frequency("h", NOW) == pytest.approx(0.75)
+
+
+def test_remembered_output_feeds_later_prompts(index):
+    retriever = ContextRetriever(index)
+    retriever.remember("Requirements analysis", TOPICS["payments"], tags=["pm"])
+    retriever.remember("System architecture", TOPICS["deploy"])
+
+    prompt_context = retriever.retrieve("payment gateway card charges").render()
+    assert prompt_context.startswith(TOPICS["payments"])
+    assert len(index.context_handles) == 2
+
+
+def test_benchmark_prompt_tokens_on_recorded_session(index):
+    """Benchmark: whole-history prompt vs budgeted retrieval for a 300-turn session"""
+    retriever = ContextRetriever(index)
+    history = recorded_session(retriever)
+    before = sum(retriever.token_counter(turn) for turn in history)
+
+    after = []
+    for query in ("refresh the expired session token", "retry a declined card charge"):
+        result = retriever.retrieve(query, token_budget=1500, now=NOW)
+        after.append(result.tokens_used)
+
+    print(f"prompt tokens: whole history {before}, retrieved {after}")
+    assert max(after) <= 1500
+    assert max(after) < before / 10
@@ -0,0 +1,175 @@
+"""
+Tests for the CostGovernor budget ledger.
+"""
+
+import gc
+import sqlite3
+import sys
+import threading
+import time
+import weakref
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.cost_governor import CostGovernor, ProjectComplexity
+from schemas.routing import ModelType
+
+
+@pytest.fixture
+def governor(tmp_path):
+    return CostGovernor(db_path=str(tmp_path / "cost.db"))
+
+
+def count_rows(governor, table):
+    governor.flush()
+    with sqlite3.connect(governor.db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_reservations_hold_budget_until_finished(governor):
+    # Medium budget: $25 and 200k tokens
+    first = governor.reserve("p", 100_000, 10.0)
+    second = governor.reserve("p", 50_000, 10.0)
+    assert first and second
+    assert governor.reserve("p", 10_000, 10.0) is None
+    assert governor.budget_snapshot(project_id="p").remaining_cost_usd == pytest.approx(
+        5.0
+    )
+
+    assert governor.release(second)
+    assert not governor.release(second)
+    assert governor.commit(first, actual_tokens=80_000, actual_cost=8.0)
+
+    usage = governor.current_usage["p"]
+    assert (usage.tokens_used, usage.cost_incurred, usage.requests_made) == (
+        80_000,
+        8.0,
+        1,
+    )
+    assert (usage.tokens_reserved, usage.cost_reserved) == (0, 0.0)
+    assert count_rows(governor, "usage_history") == 1
+    assert count_rows(governor, "budget_violations") == 1
+
+
+def test_unfinished_reservations_expire_but_late_commits_record_usage(governor):
+    late = governor.reserve("p", 150_000, 20.0, ttl_s=0.0)
+    dropped = governor.reserve("p", 40_000, 4.0, ttl_s=0.0)
+
+    # The expired holds no longer count against the budget
+    fresh = governor.reserve("p", 150_000, 20.0)
+    assert fresh is not None
+    usage = governor.current_usage["p"]
+    assert (usage.tokens_reserved, usage.cost_reserved) == (150_000, 20.0)
+
+    assert not governor.release(dropped)
+    assert governor.commit(late, actual_tokens=1000, actual_cost=0.5)
+    assert not governor.commit(late)
+    assert (usage.tokens_used, usage.cost_incurred) == (1000, 0.5)
+    assert usage.tokens_reserved == 150_000
+
+
+def test_check_budget_does_not_overwrite_ledger(governor):
+    governor.record_usage("p", ModelType.GPT4O, 1000, 1.0, "medium")
+
+    assert not governor.check_budget("medium", {"cost_incurred": 30.0}, project_id="p")
+    assert governor.current_usage["p"].cost_incurred == 1.0
+    assert governor.check_budget("medium", {"cost_incurred": 0.0}, project_id="p")
+
+
+def reserve_concurrently(governor):
+    """32 threads reserving and committing against one budget until it runs out"""
+    cost_per_request = 1 / 128  # exact in binary: $25 fits 3200 requests
+    granted = [0] * 32
+
+    def worker(i):
+        while True:
+            reservation = governor.reserve(
+                "shared", 50, cost_per_request, model_type=ModelType.GEMINI_FLASH
+            )
+            if reservation is None:
+                return
+            granted[i] += 1
+            governor.commit(reservation)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(32)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(granted), time.perf_counter() - start
+
+
+def test_concurrent_reservations_never_overshoot(governor):
+    """Stress: 32 threads reserving and committing against one budget"""
+    granted, _ = reserve_concurrently(governor)
+
+    usage = governor.current_usage["shared"]
+    budget = governor.budgets[ProjectComplexity.MEDIUM]
+    assert usage.cost_incurred <= budget.max_cost_usd + 1e-9
+    assert granted == usage.requests_made == 3200
+    assert usage.tokens_reserved == 0 and usage.cost_reserved == pytest.approx(0.0)
+    assert count_rows(governor, "usage_history") == 3200
+
+
+@pytest.mark.benchmark
+def test_benchmark_reservation_throughput(governor):
+    """Benchmark: contended reserve/commit rate across 32 threads"""
+    granted, elapsed = reserve_concurrently(governor)
+
+    print(f"ledger throughput: {granted / elapsed:.0f} reservations/sec")
+    assert granted / elapsed > 5000
+
+
+def test_close_writes_queued_rows_and_stops_the_writer(governor):
+    for _ in range(10):
+        governor.commit(governor.reserve("p", 100, 0.01))
+    writer = governor._writer
+
+    governor.close()
+
+    assert not writer.is_alive()
+    with sqlite3.connect(governor.db_path) as conn:
+        (count,) = conn.execute("SELECT COUNT(*) FROM usage_history").fetchone()
+    assert count == 10
+
+    # A later write starts a fresh writer
+    governor.commit(governor.reserve("p", 100, 0.01))
+    assert count_rows(governor, "usage_history") == 11
+    governor.close()
+
+
+def test_close_racing_writes_neither_hangs_nor_drops_rows(governor):
+    def write():
+        for _ in range(200):
+            governor.commit(governor.reserve("p", 10, 0.0001))
+
+    writers = [threading.Thread(target=write) for _ in range(4)]
+    for thread in writers:
+        thread.start()
+    while any(thread.is_alive() for thread in writers):
+        closer = threading.Thread(target=governor.close)
+        closer.start()
+        closer.join(timeout=5)
+        assert not closer.is_alive()
+    governor.close()
+
+    with sqlite3.connect(governor.db_path) as conn:
+        (count,) = conn.execute("SELECT COUNT(*) FROM usage_history").fetchone()
+    assert count == 800
+
+
+def test_running_writer_does_not_keep_the_governor_alive(tmp_path):
+    governor = CostGovernor(db_path=str(tmp_path / "cost.db"))
+    governor.commit(governor.reserve("p", 100, 0.01))
+    governor.flush()
+    ref = weakref.ref(governor)
+
+    del governor
+    gc.collect()
+
+    assert ref() is None
@@ -0,0 +1,119 @@
+"""
+Tests for safe_api_call deadlines on the shared API executor.
+"""
+
+import importlib
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+@pytest.fixture
+def error_handler(tmp_path, monkeypatch):
+    # The module logs to app_errors.log in the working directory
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module("utils.error_handler")
+    monkeypatch.setattr(module, "api_executor", module.APICallExecutor(max_workers=4))
+    monkeypatch.setattr(module, "rate_limiter", module.APIRateLimiter())
+    return module
+
+
+class HungProvider:
+    """Fake provider whose HTTP request never returns on its own"""
+
+    def __init__(self):
+        self.released = threading.Event()
+        self.finished = threading.Event()
+        self.timeouts = []
+
+    def call(self, prompt, timeout=None, service_name=None):
+        # Stands in for an HTTP client honouring its request timeout
+        self.timeouts.append(timeout)
+        self.released.wait(timeout)
+        self.finished.set()
+        raise ConnectionError("read timed out")
+
+
+def test_timeout_returns_at_deadline_and_call_terminates(error_handler):
+    provider = HungProvider()
+
+    start = time.monotonic()
+    result = error_handler.safe_api_call(provider.call, "hi", timeout=0.2)
+    elapsed = time.monotonic() - start
+
+    assert result["error_type"] == "timeout"
+    assert elapsed < 0.5
+    assert 0 < provider.timeouts[0] <= 0.2
+    # The abandoned call was bounded by the propagated deadline
+    assert provider.finished.wait(1.0)
+
+    metrics = error_handler.api_executor.get_metrics()
+    assert metrics["timed_out"] == 1
+    time.sleep(0.05)
+    assert error_handler.api_executor.get_metrics()["in_flight"] == 0
+
+
+def test_service_cap_queues_and_counts_wait(error_handler):
+    executor = error_handler.api_executor
+    executor.set_service_limit("slow", 1)
+    gate = threading.Event()
+
+    def slow(service_name=None):
+        gate.wait(1.0)
+        return "done"
+
+    results = []
+    callers = [
+        threading.Thread(
+            target=lambda: results.append(
+                error_handler.safe_api_call(slow, timeout=2, service_name="slow")
+            )
+        )
+        for _ in range(2)
+    ]
+    for caller in callers:
+        caller.start()
+
+    time.sleep(0.1)
+    metrics = executor.get_metrics()
+    assert metrics["in_flight"] == 1
+    assert metrics["queued"] == 1
+
+    gate.set()
+    for caller in callers:
+        caller.join(2)
+
+    assert [r["success"] for r in results] == [True, True]
+    metrics = executor.get_metrics()
+    assert metrics["completed"] == 2
+    assert metrics["queue_wait_max_s"] > 0
+
+
+def test_deadline_covers_queue_wait(error_handler):
+    executor = error_handler.api_executor
+    executor.set_service_limit("hung", 1)
+    provider = HungProvider()
+
+    blocker = threading.Thread(
+        target=error_handler.safe_api_call,
+        args=(provider.call, "first"),
+        kwargs={"timeout": 0.5, "service_name": "hung"},
+    )
+    blocker.start()
+    time.sleep(0.05)
+
+    start = time.monotonic()
+    result = error_handler.safe_api_call(
+        provider.call, "second", timeout=0.1, service_name="hung"
+    )
+
+    assert result["error_type"] == "timeout"
+    assert time.monotonic() - start < 0.3
+    assert executor.get_metrics()["rejected"] == 1
+    blocker.join(2)
@@ -0,0 +1,90 @@
+"""
+Tests for incremental project analysis in FileManager.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.file_manager import FileManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return FileManager(str(tmp_path))
+
+
+def populate(manager, count):
+    for i in range(count):
+        manager.add_file(
+            f"src/pkg{i % 7}/module_{i}.py",
+            "line\n" * (i % 97),
+            "alpha" if i % 3 else "beta",
+        )
+    manager.add_file("README.md", "# Project\n", "alpha")
+    manager.add_file("settings.yaml", "debug: true\n", "beta")
+
+
+def fresh_analysis(manager, project_name=None):
+    """Analysis recomputed from scratch over the current files"""
+    manager._rebuild_analyses()
+    return manager.analyze_project(project_name)
+
+
+def test_running_totals_match_a_full_rescan(manager):
+    populate(manager, 300)
+    manager.update_file("src/pkg3/module_3.py", "line\n" * 500)
+    manager.delete_file("src/pkg0/module_0.py")
+    # Removing a top file forces the largest-files heap to be reselected
+    manager.delete_file("src/pkg3/module_3.py")
+    manager.add_file("src/pkg1/module_1.py", "x", "beta")
+
+    incremental = [manager.analyze_project(name) for name in (None, "alpha", "beta")]
+    assert incremental == [
+        fresh_analysis(manager, name) for name in (None, "alpha", "beta")
+    ]
+    assert incremental[0]["total_files"] == 300
+    assert len(incremental[0]["largest_files"]) == 10
+    assert manager.analyze_project("missing") == {"error": "No files to analyze"}
+
+
+def test_unchanged_content_is_not_reanalyzed(manager, monkeypatch):
+    populate(manager, 20)
+    content = manager.get_file("README.md")["content"]
+    monkeypatch.setattr(
+        manager, "_detect_language", lambda *a: pytest.fail("file re-analyzed")
+    )
+
+    manager.update_file("README.md", content, {"reviewed": True})
+    assert manager.analyze_project()["language_breakdown"]["Markdown"] == 1
+
+
+@pytest.mark.benchmark
+def test_benchmark_analyze_project_10k_files(manager):
+    """Benchmark: analyze_project over 10k files, unchanged and after one edit"""
+    populate(manager, 10_000)
+
+    start = time.perf_counter()
+    for _ in range(100):
+        manager.analyze_project()
+    unchanged = (time.perf_counter() - start) / 100
+
+    manager.update_file("src/pkg1/module_1.py", "line\n" * 2)
+    start = time.perf_counter()
+    after_edit = manager.analyze_project()
+    after_edit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert fresh_analysis(manager) == after_edit
+    rescan = time.perf_counter() - start
+
+    print(
+        f"analyze_project(10k): unchanged {unchanged * 1e6:.0f} us, "
+        f"after edit {after_edit_time * 1e6:.0f} us, full rescan {rescan * 1000:.1f} ms"
+    )
+    assert unchanged < rescan / 20
@@ -0,0 +1,99 @@
+"""
+Tests for the stat-cached target file index.
+"""
+
+import hashlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from codecompanion import file_index
+from codecompanion.engine import file_hash, load_repo_map
+from codecompanion.target import TargetContext
+
+
+def git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "a.py").write_text("print('a')\n")
+    (repo / "b.txt").write_text("b\n")
+    git(repo, "init", "-q")
+    git(repo, "add", "a.py", "b.txt")
+    return repo
+
+
+def test_ls_files_runs_once_until_git_index_changes(repo, monkeypatch):
+    target = TargetContext(repo)
+    calls = []
+    safe_cmd = target.safe_cmd
+    monkeypatch.setattr(
+        target, "safe_cmd", lambda cmd: calls.append(cmd) or safe_cmd(cmd)
+    )
+
+    assert sorted(load_repo_map(target)) == ["a.py", "b.txt"]
+    assert sorted(load_repo_map(target)) == ["a.py", "b.txt"]
+    assert calls.count("git ls-files") == 1
+
+    (repo / "c.py").write_text("c\n")
+    git(repo, "add", "c.py")
+    assert sorted(load_repo_map(target)) == ["a.py", "b.txt", "c.py"]
+    assert calls.count("git ls-files") == 2
+
+
+def test_file_hash_reuses_stat_cache(repo, monkeypatch):
+    target = TargetContext(repo)
+    expected = hashlib.sha256(b"print('a')\n").hexdigest()
+    assert file_hash("a.py", target) == expected[:8]
+
+    hashed = []
+    real_hash = file_index.hash_file
+    monkeypatch.setattr(
+        file_index, "hash_file", lambda p: hashed.append(p) or real_hash(p)
+    )
+
+    assert file_hash("a.py", target) == expected[:8]
+    assert hashed == []
+
+    path = repo / "a.py"
+    path.write_text("print('changed')\n")
+    os.utime(path, ns=(1, 1))
+    assert (
+        file_hash("a.py", target)
+        == hashlib.sha256(b"print('changed')\n").hexdigest()[:8]
+    )
+    assert len(hashed) == 1
+
+
+def test_refresh_is_incremental_and_persisted(repo, monkeypatch):
+    index = TargetContext(repo).file_index
+    assert index.refresh()["changed"] == ["a.py", "b.txt"]
+
+    (repo / "b.txt").write_text("bb\n")
+    assert index.refresh() == {"changed": ["b.txt"], "removed": []}
+
+    # A fresh context loads entries from .cc/file_index.db without re-hashing
+    monkeypatch.setattr(file_index, "hash_file", lambda p: pytest.fail(f"rehashed {p}"))
+    reopened = TargetContext(repo).file_index
+    assert reopened.refresh() == {"changed": [], "removed": []}
+    assert reopened.entries()["b.txt"]["sha256"] == hashlib.sha256(b"bb\n").hexdigest()
+
+
+def test_non_git_target_falls_back_to_glob(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("x = 1\n")
+    (tmp_path / "notes.md").write_text("notes\n")
+
+    target = TargetContext(tmp_path)
+    assert [p.name for p in target.list_files()] == ["mod.py"]
+    assert file_hash("pkg/mod.py", target) == hashlib.sha256(b"x = 1\n").hexdigest()[:8]
@@ -0,0 +1,104 @@
+"""
+Tests for compiled handoff rules and batch validation in AgentHandoff.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.artifact_handler import TypedArtifactHandler
+from core.handoff_protocol import AgentHandoff, HandoffStatus
+
+SPEC = {
+    "title": "Checkout Requirements",
+    "objective": "Let customers pay for their basket with a saved card",
+    "scope": "Checkout flow for the web store",
+    "requirements": [
+        {
+            "id": "REQ-001",
+            "description": "Customers can pay with a saved card in one click",
+            "priority": "high",
+        }
+    ],
+    "acceptance_criteria": ["Payment completes in under 3 seconds"],
+    "business_value": "Fewer abandoned baskets",
+}
+
+
+@pytest.fixture
+def handoff():
+    return AgentHandoff(TypedArtifactHandler())
+
+
+def create_specs(handoff, count):
+    handler = handoff.artifact_handler
+    return [
+        handler.create_artifact(SPEC, "SpecDoc", "project_manager")["artifact"][
+            "artifact_id"
+        ]
+        for _ in range(count)
+    ]
+
+
+def test_rules_validate_types_and_capabilities(handoff):
+    (spec_id,) = create_specs(handoff, 1)
+
+    ok = handoff.validate_handoff("project_manager", "code_generator", [spec_id])
+    assert ok.status == HandoffStatus.VALIDATED
+    assert ok.validated_artifacts == [spec_id]
+
+    wrong = handoff.validate_handoff("code_generator", "test_writer", [spec_id, "nope"])
+    assert wrong.status == HandoffStatus.REJECTED
+    assert wrong.rejected_artifacts == ["nope"]
+    assert wrong.validation_errors == [
+        "Artifact nope not found",
+        "Missing required artifacts: ['CodePatch']",
+        "Agent code_generator cannot produce: ['SpecDoc']",
+    ]
+
+    assert handoff.validate_handoff(
+        "debugger", "ui_designer", []
+    ).validation_errors == ["No handoff rule defined for debugger -> ui_designer"]
+    assert handoff.validate_handoff("wizard", "debugger", []).validation_errors == [
+        "Invalid agent type: 'wizard' is not a valid AgentType"
+    ]
+
+
+def test_batch_reuses_verdicts_for_identical_content(handoff):
+    spec_ids = create_specs(handoff, 50)
+
+    results = handoff.validate_handoffs_batch(
+        [("project_manager", "code_generator", spec_ids)] * 3
+        + [("project_manager", "ui_designer", spec_ids[:1])]
+    )
+
+    assert [r.status for r in results] == [HandoffStatus.VALIDATED] * 4
+    # Identical bodies share one content hash, so one miss per rule
+    assert (handoff.verdict_memo_misses, handoff.verdict_memo_hits) == (2, 149)
+
+    metrics = handoff.get_handoff_metrics()
+    assert metrics["total_handoffs"] == 4
+    latency = metrics["validation_latency_ms"]
+    assert latency["samples"] == 4
+    assert 0 <= latency["p50"] <= latency["p99"] <= latency["max"]
+
+
+@pytest.mark.benchmark
+def test_benchmark_suggest_workflow_scales_linearly(handoff):
+    """Benchmark: suggest_workflow over 1k and 10k artifacts"""
+    spec_ids = create_specs(handoff, 1)
+    timings = {}
+    for count in (1_000, 10_000):
+        artifacts = ["missing"] * (count - 1) + spec_ids
+        start = time.perf_counter()
+        suggestions = handoff.suggest_workflow(artifacts)
+        timings[count] = time.perf_counter() - start
+        assert [s["action"] for s in suggestions] == ["code_generation"]
+
+    print(f"suggest_workflow: {timings}")
+    assert timings[10_000] < timings[1_000] * 30 + 0.01
@@ -0,0 +1,71 @@
+"""
+Import-time regression tests for CLI startup.
+
+Uses `python -X importtime` in a fresh interpreter so the measurement is a
+cold import, independent of whatever this test process already loaded.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+
+# Cumulative import budget for the CLI entry modules, in microseconds
+CLI_IMPORT_BUDGET_US = 150_000
+
+
+def import_profile(statement: str, env: dict = None) -> dict:
+    """Return {module: cumulative_us} for a cold import in a subprocess."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        env={**os.environ, **(env or {})},
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        profile[name.strip()] = int(cumulative_us)
+    return profile
+
+
+def test_codecompanion_cli_import_budget():
+    profile = import_profile("import codecompanion.cli")
+
+    assert profile["codecompanion.cli"] < CLI_IMPORT_BUDGET_US
+    # Provider clients are imported only when a command needs them
+    assert "httpx" not in profile
+    assert "codecompanion.runner" not in profile
+
+
+def test_cc_cli_defers_model_stack():
+    profile = import_profile("import cc_cli.main")
+
+    assert "services.real_models" not in profile
+    assert "storage.runs" not in profile
+
+
+def test_core_package_exports_are_lazy():
+    profile = import_profile("import core.memory")
+
+    assert "core.orchestrator" not in profile
+    assert "pydantic" not in profile
+
+
+def test_bus_import_does_not_probe_redis():
+    # An unroutable Redis URL would stall for the connect timeout if probed
+    profile = import_profile(
+        "import bus; assert bus._bus is None; b = bus.bus; "
+        "assert type(b).__name__ == 'LazyRedisBus', type(b)",
+        env={"EVENT_BUS": "redis", "REDIS_URL": "redis://10.255.255.1:6379/0"},
+    )
+
+    assert "redis" not in profile
@@ -0,0 +1,109 @@
+"""
+Tests for the content-addressed completion cache in codecompanion.llm.
+"""
+
+import pytest
+
+from codecompanion import llm
+from codecompanion.llm_cache import (
+    CompletionCache,
+    make_cache_key,
+    reset_completion_cache,
+)
+
+
+@pytest.fixture
+def cache_env(tmp_path, monkeypatch):
+    """Point the cache at a temp database and count real provider calls."""
+    monkeypatch.setenv("CC_LLM_CACHE_PATH", str(tmp_path / "llm_cache.db"))
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    for name in ("CC_LLM_CACHE", "CC_LLM_REPLAY", "CC_LLM_CACHE_SAMPLED"):
+        monkeypatch.delenv(name, raising=False)
+    reset_completion_cache()
+
+    calls = []
+
+    def fake_request(url, headers, payload, extract_fn):
+        calls.append(payload)
+        return {"content": f"answer {len(calls)}"}
+
+    monkeypatch.setattr(llm, "_retry_request", fake_request)
+    yield calls
+    reset_completion_cache()
+
+
+MESSAGES = [{"role": "user", "content": "hello"}]
+
+
+def test_identical_requests_hit_cache(cache_env):
+    first = llm.complete("system", MESSAGES, temperature=0)
+    second = llm.complete("system", MESSAGES, temperature=0)
+
+    assert first == second == {"content": "answer 1"}
+    assert len(cache_env) == 1
+
+    stats = llm.get_completion_cache().stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+def test_key_covers_system_messages_and_temperature(cache_env, monkeypatch):
+    monkeypatch.setenv("CC_LLM_CACHE_SAMPLED", "1")
+    reset_completion_cache()
+
+    llm.complete("system", MESSAGES)
+    llm.complete("other system", MESSAGES)
+    llm.complete("system", MESSAGES, temperature=0.0)
+    llm.complete("system", [{"role": "user", "content": "bye"}])
+    llm.complete("system", MESSAGES)
+
+    assert len(cache_env) == 4
+
+
+def test_sampled_calls_are_not_cached_by_default(cache_env):
+    # complete() samples at temperature 0.2 unless told otherwise
+    llm.complete("system", MESSAGES)
+    llm.complete("system", MESSAGES, temperature=0.7)
+    llm.complete("system", MESSAGES, temperature=0.7)
+    llm.complete("system", MESSAGES, temperature=0)
+    llm.complete("system", MESSAGES, temperature=0)
+
+    assert len(cache_env) == 4
+
+
+def test_sampled_calls_are_cached_when_opted_in(cache_env, monkeypatch):
+    monkeypatch.setenv("CC_LLM_CACHE_SAMPLED", "1")
+    reset_completion_cache()
+
+    llm.complete("system", MESSAGES, temperature=0.7)
+    llm.complete("system", MESSAGES, temperature=0.7)
+
+    assert len(cache_env) == 1
+
+
+def test_replay_mode_runs_offline(cache_env, monkeypatch):
+    llm.complete("system", MESSAGES, temperature=0)
+
+    monkeypatch.setenv("CC_LLM_REPLAY", "1")
+    monkeypatch.delenv("ANTHROPIC_API_KEY")
+    reset_completion_cache()
+
+    assert llm.complete("system", MESSAGES, temperature=0) == {"content": "answer 1"}
+    with pytest.raises(llm.LLMError, match="No recorded response"):
+        llm.complete("unrecorded", MESSAGES)
+    assert len(cache_env) == 1
+
+
+def test_ttl_and_max_size_eviction(tmp_path):
+    cache = CompletionCache(tmp_path / "cache.db", ttl_seconds=3600, max_entries=3)
+    keys = [make_cache_key("claude", "m", "s", [], {"i": i}) for i in range(5)]
+    for key in keys:
+        cache.put(key, "claude", "m", {"content": key})
+
+    assert cache.stats()["entries"] == 3
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[4]) == {"content": keys[4]}
+
+    expired = CompletionCache(tmp_path / "cache.db", ttl_seconds=-1)
+    assert expired.get(keys[4]) is None
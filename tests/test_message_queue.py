@@ -0,0 +1,135 @@
+"""
+Tests for the heap-based priority MessageQueue.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.communication import Message, MessagePriority, MessageQueue, MessageType
+
+
+def make_message(message_id, recipient="dev", priority=MessagePriority.NORMAL):
+    return Message(
+        message_id=message_id,
+        sender="pm",
+        recipient=recipient,
+        message_type=MessageType.REQUEST,
+        content={},
+        priority=priority,
+    )
+
+
+class TestMessageQueueOrdering:
+    def test_priority_then_fifo(self):
+        queue = MessageQueue()
+        queue.add_message(make_message("a", priority=MessagePriority.LOW))
+        queue.add_message(make_message("b"))
+        queue.add_message(make_message("c", priority=MessagePriority.URGENT))
+        queue.add_message(make_message("d"))
+
+        assert [m.message_id for m in queue.messages] == ["c", "b", "d", "a"]
+        assert [queue.pop_message().message_id for _ in range(4)] == [
+            "c",
+            "b",
+            "d",
+            "a",
+        ]
+        assert queue.pop_message() is None
+
+    def test_recipient_index_includes_broadcasts(self):
+        queue = MessageQueue()
+        queue.add_message(make_message("a", recipient="qa"))
+        queue.add_message(
+            make_message("b", recipient="all", priority=MessagePriority.HIGH)
+        )
+        queue.add_message(make_message("c", recipient="dev"))
+
+        assert [m.message_id for m in queue.get_messages("dev")] == ["b", "c"]
+        assert queue.pop_message("dev").message_id == "b"
+        assert queue.pop_message("dev").message_id == "c"
+        assert queue.pop_message("dev") is None
+        assert len(queue) == 1
+
+    def test_remove_is_lazy_but_invisible(self):
+        queue = MessageQueue()
+        for i in range(5):
+            queue.add_message(make_message(str(i)))
+
+        assert queue.remove_message("0")
+        assert not queue.remove_message("0")
+        assert [m.message_id for m in queue.get_messages("dev")] == ["1", "2", "3", "4"]
+        assert queue.pop_message().message_id == "1"
+
+    def test_full_queue_evicts_oldest_lowest_priority(self):
+        queue = MessageQueue(max_size=3)
+        queue.add_message(make_message("high", priority=MessagePriority.HIGH))
+        queue.add_message(make_message("low1", priority=MessagePriority.LOW))
+        queue.add_message(make_message("low2", priority=MessagePriority.LOW))
+        queue.add_message(make_message("new"))
+
+        assert [m.message_id for m in queue.messages] == ["high", "new", "low2"]
+
+
+class TestAsyncGet:
+    @pytest.mark.asyncio
+    async def test_get_waits_for_message(self):
+        queue = MessageQueue()
+
+        async def produce():
+            await asyncio.sleep(0.01)
+            queue.add_message(make_message("other", recipient="qa"))
+            queue.add_message(make_message("mine", recipient="dev"))
+
+        producer = asyncio.create_task(produce())
+        message = await asyncio.wait_for(queue.get("dev"), timeout=1)
+        await producer
+
+        assert message.message_id == "mine"
+        assert len(queue) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_times_out(self):
+        queue = MessageQueue()
+        assert await queue.get("dev", timeout=0.01) is None
+
+
+def enqueue_and_drain(count):
+    """Enqueue count messages over 50 recipients, then drain; returns (drained, seconds)"""
+    queue = MessageQueue(max_size=2 * count)
+    priorities = list(MessagePriority)
+    messages = [
+        make_message(f"m{i}", recipient=f"agent{i % 50}", priority=priorities[i % 4])
+        for i in range(count)
+    ]
+
+    start = time.perf_counter()
+    for message in messages:
+        queue.add_message(message)
+    drained = 0
+    while queue.pop_message(f"agent{drained % 50}") or queue.pop_message():
+        drained += 1
+    elapsed = time.perf_counter() - start
+
+    assert len(queue) == 0
+    return drained, elapsed
+
+
+def test_mixed_recipient_drain_empties_the_queue():
+    drained, _ = enqueue_and_drain(5_000)
+    assert drained == 5_000
+
+
+@pytest.mark.benchmark
+def test_benchmark_100k_enqueue_dequeue():
+    """Benchmark: 100k enqueues then dequeues stay well under quadratic cost"""
+    drained, elapsed = enqueue_and_drain(100_000)
+
+    assert drained == 100_000
+    assert elapsed < 5.0
@@ -0,0 +1,180 @@
+"""
+Tests for the IntelligentRouter routing hot path.
+"""
+
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.cost_governor import UsageMetrics
+from core.model_router import CapabilityVector, IntelligentRouter
+from schemas.outcomes import TaskOutcome
+from schemas.routing import ModelType, TaskComplexity, TaskType
+
+
+@pytest.fixture
+def router(tmp_path, monkeypatch):
+    # Bandit and cost governor databases default to the working directory
+    monkeypatch.chdir(tmp_path)
+    return IntelligentRouter(db_path=str(tmp_path / "router.db"))
+
+
+def make_request(i=0, **context):
+    task = {"description": f"Implement the database api function #{i}", "context": {}}
+    return task, {
+        "task_type": TaskType.CODE_BACKEND,
+        "estimated_tokens": 2000,
+        **context,
+    }
+
+
+def test_one_bandit_draw_and_cached_capabilities(router, monkeypatch):
+    draws = []
+    select_arm = router.bandit.select_arm
+    monkeypatch.setattr(
+        router.bandit, "select_arm", lambda **kw: draws.append(1) or select_arm(**kw)
+    )
+    adjusted = []
+    original = CapabilityVector.get_adjusted_capability
+    monkeypatch.setattr(
+        CapabilityVector,
+        "get_adjusted_capability",
+        lambda self, t, c: adjusted.append(t) or original(self, t, c),
+    )
+
+    for i in range(10):
+        router.route_task(*make_request(i))
+    router.route_task(*make_request(complexity=0.9))
+
+    assert len(draws) == 11
+    # One scoring pass per model for each of the two context buckets
+    assert len(adjusted) == 2 * len(router.capability_vectors)
+
+
+def test_learning_invalidates_capability_cache(router):
+    router.route_task(*make_request())
+    assert router._capability_cache
+
+    class Outcome:
+        model_used = ModelType.GEMINI_FLASH
+        task_type = TaskType.CODE_BACKEND
+        success = True
+        quality_score = 1.0
+        token_usage = 1000
+        cost = 0.001
+        execution_time = 1.0
+
+    router._update_capability_vectors(Outcome())
+    assert router._capability_cache == {}
+
+
+def test_budget_snapshot_filters_expensive_models(router):
+    router.cost_governor.current_usage["default"] = UsageMetrics(cost_incurred=24.99)
+
+    decision = router.route_task(*make_request(estimated_tokens=10_000))
+
+    considered = {decision["selected_model"]} | {m for m, _ in decision["alternatives"]}
+    assert ModelType.GPT4O not in considered
+    assert ModelType.GEMINI_FLASH in considered
+
+
+def make_outcome(decision, token_usage, cost):
+    return TaskOutcome(
+        task_id=decision["task_id"],
+        model_used=decision["selected_model"],
+        task_type=TaskType.CODE_BACKEND,
+        complexity=TaskComplexity(
+            technical_complexity=0.5,
+            novelty=0.3,
+            safety_risk=0.1,
+            context_requirement=0.4,
+            interdependence=0.2,
+            estimated_tokens=2000,
+        ),
+        success=True,
+        quality_score=0.9,
+        execution_time=1.0,
+        token_usage=token_usage,
+        cost=cost,
+    )
+
+
+def test_routed_budget_is_held_until_the_outcome_settles_it(router):
+    usage = router.cost_governor.current_usage
+
+    decision = router.route_task(*make_request())
+    assert usage["default"].tokens_reserved == 2000
+
+    router.update_from_outcome(
+        decision["task_id"],
+        make_outcome(decision, token_usage=1500, cost=0.01),
+        decision["reservation"],
+    )
+    assert usage["default"].tokens_reserved == 0
+    assert usage["default"].tokens_used == 1500
+
+    decision = router.route_task(*make_request())
+    assert router.release_decision(decision)
+    assert usage["default"].tokens_reserved == 0
+    assert usage["default"].tokens_used == 1500
+    assert not router.release_decision(decision)
+
+
+def test_outstanding_holds_stop_routing_past_the_budget(router):
+    # Medium budget is 200k tokens; unfinished calls keep theirs held
+    for i in range(4):
+        router.route_task(*make_request(i, estimated_tokens=50_000))
+
+    with pytest.raises(ValueError):
+        router.route_task(*make_request(estimated_tokens=50_000))
+
+
+def test_dropped_decisions_stop_holding_budget_after_the_ttl(router):
+    # Without expiry the fifth 50k hold would not fit the 200k budget
+    router.cost_governor.RESERVATION_TTL_S = 0.0
+    for i in range(5):
+        router.route_task(*make_request(i, estimated_tokens=50_000))
+
+    assert router.cost_governor.budget_snapshot().remaining_tokens == 200_000
+
+
+def test_budget_fallback_decision_holds_nothing(router):
+    task, context = make_request(current_usage={"cost_incurred": 1e9})
+
+    decision = router.route_task(task, context)
+
+    assert decision["decision_factors"] == {"reason": "budget_constraint"}
+    assert decision["task_id"] and decision["reservation"] is None
+    assert not router.release_decision(decision)
+
+
+def test_decisions_are_persisted_in_batches(router):
+    for i in range(250):
+        router.release_decision(router.route_task(*make_request(i)))
+    router.flush_decisions()
+
+    with sqlite3.connect(router.db_path) as conn:
+        (count,) = conn.execute("SELECT COUNT(*) FROM routing_decisions").fetchone()
+    assert count == 250
+
+
+@pytest.mark.benchmark
+def test_benchmark_routing_throughput(router):
+    """Benchmark: routing decisions per second on the hot path"""
+    requests = [make_request(i) for i in range(2000)]
+
+    start = time.perf_counter()
+    for task, context in requests:
+        router.release_decision(router.route_task(task, context))
+    elapsed = time.perf_counter() - start
+    router.flush_decisions()
+
+    decisions_per_sec = len(requests) / elapsed
+    print(f"routing throughput: {decisions_per_sec:.0f} decisions/sec")
+    assert decisions_per_sec > 2000
@@ -0,0 +1,181 @@
+"""
+Tests for PerformanceStore rollup tables and retention.
+"""
+
+import sqlite3
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from storage.performance_store import (
+    AggregationPeriod,
+    MetricType,
+    PerformanceMetric,
+    PerformanceStore,
+    _rollup_ranges,
+)
+
+
+def make_metric(
+    i, value, timestamp, model="gpt4", metric_type=MetricType.QUALITY_SCORE
+):
+    return PerformanceMetric(
+        metric_id=f"m{i}",
+        metric_type=metric_type,
+        model_name=model,
+        task_type="code_generation",
+        value=value,
+        timestamp=timestamp,
+        metadata={},
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PerformanceStore(db_path=str(tmp_path / "perf.db"))
+
+
+def test_aggregates_match_raw_values(store):
+    now = datetime.now(timezone.utc)
+    rng = np.random.default_rng(7)
+    values = rng.uniform(0.2, 1.0, size=500)
+    metrics = [
+        make_metric(i, float(v), now - timedelta(minutes=int(i) * 17))
+        for i, v in enumerate(values)
+    ]
+    assert store.store_metrics_batch(metrics) == 500
+
+    (agg,) = store.compute_aggregated_metrics(
+        AggregationPeriod.WEEKLY, start_time=now - timedelta(days=7), end_time=now
+    )
+
+    assert agg.sample_count == 500
+    assert agg.mean_value == pytest.approx(values.mean())
+    assert agg.std_deviation == pytest.approx(values.std())
+    assert agg.min_value == pytest.approx(values.min())
+    assert agg.max_value == pytest.approx(values.max())
+    for q, approx in ((50, agg.median_value), (95, agg.percentile_95)):
+        assert approx == pytest.approx(np.percentile(values, q), rel=0.05)
+
+
+def test_window_edges_use_minute_precision(store):
+    base = datetime(2026, 3, 2, 10, 30, tzinfo=timezone.utc)
+    for i in range(6):
+        store.store_metric(make_metric(i, 1.0 + i, base + timedelta(hours=i)))
+
+    (agg,) = store.compute_aggregated_metrics(
+        AggregationPeriod.HOURLY,
+        start_time=base + timedelta(minutes=1),
+        end_time=base + timedelta(hours=4),
+    )
+    assert agg.sample_count == 4
+    assert agg.min_value == 2.0
+    assert agg.max_value == 5.0
+
+
+def test_rollup_ranges_prefer_coarse_buckets():
+    start = datetime(2026, 1, 1, 22, 15)
+    end = datetime(2026, 1, 10, 3, 40)
+    ranges = _rollup_ranges(start, end)
+
+    assert [g for g, _, _ in ranges].count("day") == 1
+    assert len(ranges) == 5
+    # Spans tile the window without gaps
+    spans = sorted((lo, hi) for _, lo, hi in ranges)
+    assert spans[0][0] == datetime(2026, 1, 1, 22, 15)
+    assert spans[-1][1] == datetime(2026, 1, 10, 3, 41)
+    assert all(a[1] == b[0] for a, b in zip(spans, spans[1:]))
+
+
+def test_restored_metric_is_not_double_counted(store):
+    now = datetime.now(timezone.utc)
+    store.store_metric(make_metric(1, 0.5, now))
+    store.store_metric(make_metric(1, 0.5, now))
+    store.store_metric(make_metric(2, 0.7, now))
+
+    stats = store.get_quality_statistics()
+    assert stats["overall"]["total_metrics"] == 2
+    assert stats["recent_trends"]["gpt4"]["recent_avg_quality"] == pytest.approx(0.6)
+
+
+def test_restored_metric_replaces_its_rollup_contribution(store):
+    now = datetime.now(timezone.utc)
+    store.store_metric(make_metric(1, 0.5, now))
+    store.store_metric(make_metric(2, 0.7, now))
+    store.store_metric(make_metric(1, 0.9, now))
+    # Moving a metric to another bucket empties the old one
+    store.store_metric(make_metric(3, 0.4, now - timedelta(days=3)))
+    store.store_metric(make_metric(3, 0.4, now))
+
+    (agg,) = store.compute_aggregated_metrics(
+        AggregationPeriod.DAILY, start_time=now - timedelta(days=7), end_time=now
+    )
+    assert agg.sample_count == 3
+    assert agg.mean_value == pytest.approx((0.9 + 0.7 + 0.4) / 3)
+    with sqlite3.connect(store.db_path) as conn:
+        (empty,) = conn.execute(
+            "SELECT COUNT(*) FROM metric_rollups WHERE sample_count <= 0"
+        ).fetchone()
+    assert empty == 0
+
+
+def test_existing_history_is_rolled_up(tmp_path):
+    db_path = str(tmp_path / "legacy.db")
+    store = PerformanceStore(db_path=db_path)
+    now = datetime.now(timezone.utc)
+    store.store_metrics_batch([make_metric(i, 0.5, now) for i in range(3)])
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP TABLE metric_rollups")
+
+    reopened = PerformanceStore(db_path=db_path)
+    assert reopened.get_quality_statistics()["overall"]["total_metrics"] == 3
+
+
+def test_retention_keeps_day_rollups(store):
+    old = datetime.now(timezone.utc) - timedelta(days=30)
+    store.store_metrics_batch([make_metric(i, 0.8, old) for i in range(5)])
+
+    dropped = store.apply_retention(raw_days_to_keep=7)
+
+    assert dropped["raw_metrics"] == 5
+    assert dropped["rollup_buckets"] == 1  # the minute bucket
+    assert store.get_metrics() == []
+    (agg,) = store.compute_aggregated_metrics(
+        AggregationPeriod.MONTHLY, start_time=old - timedelta(days=1)
+    )
+    assert agg.sample_count == 5
+
+
+def test_window_past_minute_retention_reads_hour_rollups(store):
+    now = datetime.now(timezone.utc)
+    hour = now.replace(minute=0, second=0, microsecond=0) - timedelta(days=3)
+    values = [0.5 + 0.04 * i for i in range(10)]
+    store.store_metrics_batch(
+        [
+            make_metric(i, v, hour + timedelta(minutes=10 + i))
+            for i, v in enumerate(values)
+        ]
+        + [make_metric(99, 0.1, hour - timedelta(hours=2))]
+    )
+    start = hour + timedelta(minutes=5)
+
+    def window():
+        (agg,) = store.compute_aggregated_metrics(
+            AggregationPeriod.WEEKLY, start_time=start, end_time=now
+        )
+        return agg
+
+    before = window()
+    store.apply_retention()
+    after = window()
+
+    assert before.sample_count == after.sample_count == 10
+    assert after.mean_value == pytest.approx(before.mean_value)
+    assert after.mean_value == pytest.approx(sum(values) / 10)
@@ -0,0 +1,185 @@
+"""
+Tests for online trend accumulators in PerformanceTracker.
+"""
+
+import random
+import sys
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from monitoring.performance_tracker import OnlineTrend, PerformanceTracker, RollingRate
+from schemas.outcomes import TaskOutcome
+from schemas.routing import ModelType, TaskComplexity, TaskType
+
+COMPLEXITY = TaskComplexity(
+    technical_complexity=0.5,
+    novelty=0.5,
+    safety_risk=0.0,
+    context_requirement=0.5,
+    interdependence=0.0,
+    estimated_tokens=1000,
+)
+
+
+def make_outcome(i, timestamp, model=ModelType.GPT4O, quality=0.5, success=True):
+    return TaskOutcome(
+        task_id=f"t{i}",
+        model_used=model,
+        task_type=TaskType.CODE_BACKEND,
+        complexity=COMPLEXITY,
+        success=success,
+        quality_score=quality,
+        execution_time=10.0 + (i % 7),
+        token_usage=1000,
+        cost=0.01,
+        timestamp=timestamp,
+    )
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return PerformanceTracker(db_path=str(tmp_path / "perf.db"))
+
+
+def test_online_trend_matches_numpy_after_expiry():
+    rng = random.Random(5)
+    start = datetime(2026, 1, 1)
+    points = [
+        (start + timedelta(hours=i), 0.3 + i * 0.001 + rng.random() * 0.1)
+        for i in range(500)
+    ]
+
+    trend = OnlineTrend()
+    for ts, y in points:
+        trend.add(ts, y)
+    trend.expire(start + timedelta(hours=200))
+
+    kept = points[200:]
+    x = np.array([(ts - start).total_seconds() / 86400 for ts, _ in kept])
+    y = np.array([v for _, v in kept])
+    slope, correlation = trend.slope_and_correlation()
+    assert trend.n == 300
+    assert slope == pytest.approx(np.polyfit(x, y, 1)[0])
+    assert correlation == pytest.approx(np.corrcoef(x, y)[0, 1])
+
+
+def test_rolling_rate_keeps_running_count():
+    window = RollingRate(window_size=4)
+    rates = [window.add(v) for v in (True, False, True, True, False, False)]
+    assert rates == [None, None, None, 0.75, 0.5, 0.5]
+
+
+def test_fast_path_agrees_with_recomputation(tracker):
+    now = datetime.now()
+    for i in range(200):
+        model = ModelType.GPT4O if i % 2 else ModelType.CLAUDE_SONNET
+        quality = 0.4 + i * 0.002 if model == ModelType.GPT4O else 0.9 - i * 0.002
+        tracker.record_outcome(
+            make_outcome(
+                i, now - timedelta(hours=200 - i), model, quality, success=i % 5 != 0
+            )
+        )
+
+    fast = tracker.analyze_trends(days_back=30)
+    full = tracker._recompute_trends(30)
+
+    assert (
+        set(fast) == set(full) == {ModelType.GPT4O.value, ModelType.CLAUDE_SONNET.value}
+    )
+    for model, trends in full.items():
+        by_metric = {t.metric_name: t for t in fast[model]}
+        for expected in trends:
+            actual = by_metric[expected.metric_name]
+            assert actual.trend_direction == expected.trend_direction
+            assert actual.trend_strength == pytest.approx(expected.trend_strength)
+            assert actual.values == pytest.approx(expected.values)
+            assert actual.time_periods == expected.time_periods
+
+    directions = {
+        model: {t.metric_name: t.trend_direction for t in trends}
+        for model, trends in fast.items()
+    }
+    assert directions[ModelType.GPT4O.value]["quality_score"] == "improving"
+    assert directions[ModelType.CLAUDE_SONNET.value]["quality_score"] == "declining"
+
+
+def test_old_outcomes_expire_from_window(tracker):
+    now = datetime.now()
+    for i in range(20):
+        tracker.record_outcome(make_outcome(i, now - timedelta(days=40, hours=-i)))
+    assert tracker.analyze_trends() == {}
+
+    for i in range(20, 40):
+        tracker.record_outcome(
+            make_outcome(i, now - timedelta(hours=40 - i), quality=i / 50)
+        )
+    (trend, *_) = tracker.analyze_trends()[ModelType.GPT4O.value]
+    assert len(trend.values) == 20
+
+
+def test_trend_memory_is_bounded_by_recent_outcomes(tracker):
+    tracker.recent_outcomes = deque(maxlen=100)
+    now = datetime.now()
+    for i in range(250):
+        model = ModelType.GPT4O if i % 3 else ModelType.CLAUDE_SONNET
+        tracker.record_outcome(
+            make_outcome(
+                i, now - timedelta(seconds=250 - i), model, random.random(), i % 4 != 0
+            )
+        )
+
+    assert len(tracker.recent_outcomes) == 100
+    retained = sum(
+        accumulator.n
+        for (_, metric_name), accumulator in tracker.trend_accumulators.items()
+        if metric_name == "quality_score"
+    )
+    assert retained == 100
+
+    fast = tracker.analyze_trends()
+    full = tracker._recompute_trends(30)
+    for model, trends in full.items():
+        by_metric = {t.metric_name: t for t in fast[model]}
+        for expected in trends:
+            assert by_metric[expected.metric_name].values == pytest.approx(
+                expected.values
+            )
+
+
+@pytest.mark.benchmark
+def test_benchmark_trend_query_independent_of_history(tracker):
+    """Benchmark: analyze_trends cost does not grow with recorded history"""
+    now = datetime.now()
+    models = [ModelType.GPT4O, ModelType.CLAUDE_SONNET, ModelType.GEMINI_FLASH]
+
+    def feed(count, offset):
+        for i in range(count):
+            tracker._add_recent_outcome(
+                make_outcome(
+                    offset + i,
+                    now - timedelta(seconds=count - i),
+                    models[i % 3],
+                    random.random(),
+                )
+            )
+
+    def query_time():
+        start = time.perf_counter()
+        for _ in range(100):
+            tracker.analyze_trends()
+        return (time.perf_counter() - start) / 100
+
+    feed(1_000, 0)
+    small = query_time()
+    feed(100_000, 1_000)
+    large = query_time()
+
+    assert large < max(small * 5, 0.001)
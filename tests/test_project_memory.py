@@ -0,0 +1,131 @@
+"""
+Tests for ProjectMemory full-text search and bounded session memory.
+"""
+
+import json
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.memory import ProjectMemory
+
+
+@pytest.fixture
+def memory(tmp_path):
+    return ProjectMemory(db_path=str(tmp_path / "memory.db"), max_session_entries=5)
+
+
+class TestMemorySearch:
+    """FTS5-backed search_memory"""
+
+    def test_ranks_and_snippets(self, memory):
+        memory.add_interaction("deploy the kubernetes chart", "done", "claude")
+        memory.add_interaction("kubernetes kubernetes kubernetes", "ok", "gpt4")
+        memory.add_interaction("unrelated request", "nothing", "gemini")
+
+        results = memory.search_memory("kubernetes")
+
+        assert memory.fts_enabled
+        assert [r["agent_name"] for r in results] == ["gpt4", "claude"]
+        assert "[kubernetes]" in results[0]["snippet"]
+
+    def test_filters_by_agent(self, memory):
+        memory.add_interaction("terraform plan", "ok", "claude")
+        memory.add_interaction("terraform apply", "ok", "gpt4")
+
+        results = memory.search_memory("terraform", agent_name="gpt4")
+        assert len(results) == 1
+        assert results[0]["agent_name"] == "gpt4"
+
+    def test_query_syntax_is_escaped(self, memory):
+        memory.add_interaction('say "hello" AND NOT', "ok", "claude")
+        assert memory.search_memory('"hello" AND NOT (') != []
+
+    def test_index_backfilled_for_existing_rows(self, tmp_path):
+        db_path = tmp_path / "legacy.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE memory_entries (
+                    entry_id TEXT PRIMARY KEY, timestamp TEXT NOT NULL,
+                    agent_name TEXT NOT NULL, interaction_type TEXT NOT NULL,
+                    content TEXT NOT NULL, metadata TEXT, project_id TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.execute(
+                "INSERT INTO memory_entries VALUES ('a1', ?, 'claude', 'context', 'legacy words', '{}', NULL, NULL)",
+                (datetime.now().isoformat(),),
+            )
+
+        memory = ProjectMemory(db_path=str(db_path))
+        assert [r["entry_id"] for r in memory.search_memory("legacy")] == ["a1"]
+
+
+class TestSessionMemory:
+    """LRU bound on session_memory"""
+
+    def test_session_memory_is_bounded(self, memory):
+        for i in range(12):
+            memory.add_handoff("pm", "dev", f"handoff {i}")
+
+        assert len(memory.session_memory) == 5
+        # Evicted entries remain searchable on disk
+        assert len(memory.search_memory("handoff", limit=50)) == 12
+
+    def test_imported_entries_spill_to_disk(self, memory, tmp_path):
+        entries = [
+            {
+                "entry_id": f"imp{i}",
+                "timestamp": datetime.now().isoformat(),
+                "agent_name": "claude",
+                "interaction_type": "context",
+                "content": json.dumps({"note": f"imported note {i}"}),
+                "metadata": {},
+                "project_id": None,
+            }
+            for i in range(8)
+        ]
+        export_path = tmp_path / "export.json"
+        export_path.write_text(json.dumps({"session_memory": entries}))
+
+        assert memory.import_memory(str(export_path))
+        assert len(memory.session_memory) == 5
+        found = {r["entry_id"] for r in memory.search_memory("imported")}
+        assert found == {f"imp{i}" for i in range(8)}
+
+
+@pytest.mark.benchmark
+def test_search_latency_at_100k_entries(tmp_path):
+    """Benchmark: ranked search over 100k entries stays interactive"""
+    memory = ProjectMemory(db_path=str(tmp_path / "bench.db"))
+    now = datetime.now().isoformat()
+    words = ["router", "cache", "schema", "bandit", "cascade", "ledger", "stream"]
+
+    with sqlite3.connect(memory.db_path) as conn:
+        conn.executemany(
+            "INSERT INTO memory_entries (entry_id, timestamp, agent_name, interaction_type, content, metadata) "
+            "VALUES (?, ?, ?, 'interaction', ?, '{}')",
+            (
+                (
+                    f"e{i}",
+                    now,
+                    f"agent{i % 5}",
+                    f"{words[i % 7]} {words[(i * 3) % 7]} entry {i}",
+                )
+                for i in range(100_000)
+            ),
+        )
+
+    start = time.perf_counter()
+    results = memory.search_memory("bandit schema", limit=20)
+    elapsed = time.perf_counter() - start
+
+    assert len(results) == 20
+    assert elapsed < 0.5
@@ -0,0 +1,149 @@
+"""
+Tests for the central QualityCascade scheduler.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.quality_cascade import (
+    CascadeStage,
+    QualityCascade,
+    QualityMetrics,
+    TaskComplexity,
+)
+
+
+@pytest.fixture
+def cascade():
+    return QualityCascade()
+
+
+def with_quality(cascade, score):
+    async def assess(cascade_artifact):
+        return QualityMetrics(
+            confidence_score=score,
+            completeness_score=score,
+            accuracy_score=score,
+            consistency_score=score,
+            overall_score=score,
+        )
+
+    cascade._assess_quality = assess
+
+
+async def submit(cascade, count, complexity=TaskComplexity.MEDIUM):
+    cascade_ids = await asyncio.gather(
+        *[
+            cascade.cascade_artifact({"id": f"a{i}", "type": "code_patch"}, complexity)
+            for i in range(count)
+        ]
+    )
+    await cascade.wait_until_idle()
+    return cascade_ids
+
+
+@pytest.mark.asyncio
+async def test_waiting_artifacts_are_evaluated_in_batches(cascade):
+    with_quality(cascade, 0.99)
+
+    cascade_ids = await submit(cascade, 200)
+
+    statuses = [cascade.get_cascade_status(cascade_id) for cascade_id in cascade_ids]
+    assert {status["result"] for status in statuses} == {"approved"}
+    assert [h["stage"] for h in statuses[0]["stage_history"]] == [
+        stage.value for stage in cascade.cascade_stages
+    ]
+    assert cascade.active_cascades == {}
+
+    stats = cascade.get_quality_statistics()
+    assert set(stats["queue_depth"].values()) == {0}
+    assert stats["scheduler"]["avg_batch_size"] > 10
+    for histogram in stats["stage_latency"].values():
+        assert histogram["count"] == 200
+        assert sum(histogram["buckets"].values()) == 200
+    await cascade.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_global_budget_bounds_concurrent_batches(cascade):
+    with_quality(cascade, 0.7)
+    cascade.stage_batch_size = 4
+    cascade.max_concurrent_batches = 3
+    active, peak = 0, 0
+    stage_checks = cascade._stage_checks
+
+    async def slow_checks(stage, cascade_artifacts):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return await stage_checks(stage, cascade_artifacts)
+
+    cascade._stage_checks = slow_checks
+    await submit(cascade, 40)
+
+    assert peak == 3
+    assert cascade.get_quality_statistics()["scheduler"]["in_flight_batches"] == 0
+    await cascade.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_parked_cascades_are_evicted_to_store(cascade):
+    # Without peer reviewers every cascade is escalated at peer review
+    with_quality(cascade, 0.65)
+    cascade.stage_reviewers[CascadeStage.PEER_REVIEW] = []
+    cascade.max_active_cascades = 10
+
+    cascade_ids = await submit(cascade, 50)
+
+    assert len(cascade.active_cascades) == 10
+    assert set(cascade.active_cascades) == set(cascade_ids[-10:])
+    evicted = cascade.get_cascade_status(cascade_ids[0])
+    assert evicted["result"] == "escalate"
+    assert evicted["current_stage"] == CascadeStage.HUMAN_REVIEW.value
+    assert evicted["requires_human_review"]
+    assert cascade.get_quality_statistics()["scheduler"]["completed_cascades"] == 40
+    await cascade.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_every_stage_checks_a_batch_in_one_call(cascade):
+    # Above every stage check, below every early-exit threshold
+    with_quality(cascade, 0.95)
+    cascade.confidence_thresholds = {
+        complexity: {stage: 1.01 for stage in CascadeStage}
+        for complexity in TaskComplexity
+    }
+    calls = []
+    for name in (
+        "_initial_agent_batch",
+        "_peer_review_batch",
+        "_quality_assurance_batch",
+        "_final_approval_batch",
+    ):
+        check = getattr(cascade, name)
+
+        async def counted(cascade_artifacts, check=check, name=name):
+            calls.append((name, len(cascade_artifacts)))
+            return await check(cascade_artifacts)
+
+        setattr(cascade, name, counted)
+
+    await submit(cascade, 20)
+
+    assert {name for name, _ in calls} == {
+        "_initial_agent_batch",
+        "_peer_review_batch",
+        "_quality_assurance_batch",
+        "_final_approval_batch",
+    }
+    assert len(calls) < sum(size for _, size in calls)
+    assert max(size for _, size in calls) > 1
+    await cascade.shutdown()
@@ -0,0 +1,134 @@
+"""
+Tests for live load and failure telemetry in DataDrivenRouter.
+"""
+
+import heapq
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.router import DataDrivenRouter, FailureWindow
+from schemas.routing import MODEL_CAPABILITIES, TaskComplexity, TaskType
+
+
+class FakeClock:
+    def __init__(self, now=1_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_complexity(tokens=2000):
+    return TaskComplexity(
+        technical_complexity=0.5,
+        novelty=0.3,
+        safety_risk=0.1,
+        context_requirement=0.4,
+        interdependence=0.2,
+        estimated_tokens=tokens,
+    )
+
+
+def test_failure_window_counts_by_bucket():
+    window = FailureWindow(bucket_seconds=60, num_buckets=30)
+    for t in (0, 10, 70, 600):
+        window.record(t)
+
+    assert window.count(60, now=600) == 1
+    assert window.count(10 * 60, now=600) == 2
+    assert window.count(30 * 60, now=600) == 4
+    # The bucket holding t=0 and t=10 is recycled, not accumulated
+    window.record(30 * 60 + 5)
+    assert window.count(30 * 60, now=30 * 60 + 5) == 3
+
+
+def test_outcomes_feed_live_telemetry():
+    clock = FakeClock()
+    router = DataDrivenRouter(clock=clock)
+    model = MODEL_CAPABILITIES[0].model_type
+
+    started = router.record_request_start(model)
+    assert router.model_loads[model].in_flight == 1
+    clock.now += 5.0
+    router.record_request_end(model, started, tokens=600)
+
+    load = router.model_loads[model]
+    assert load.in_flight == 0
+    assert load.ewma_latency == pytest.approx(0.8 * 2.5 + 0.2 * 5.0)
+    assert load.token_rate * 60 == pytest.approx(600)
+
+    for _ in range(3):
+        router.record_request_end(
+            model,
+            router.record_request_start(model),
+            success=False,
+            error_message="503",
+        )
+    assert router.check_recent_failures(model)
+    clock.now += 11 * 60
+    assert not router.check_recent_failures(model)
+
+
+def simulate(balance, arrivals=3000, rate_per_s=8.0, seed=3):
+    """Mean completion time for a Poisson workload of CODE_BACKEND tasks"""
+    rng = random.Random(seed)
+    clock = FakeClock(0.0)
+    router = DataDrivenRouter(clock=clock)
+    capabilities = {m.model_type: m for m in MODEL_CAPABILITIES}
+    base = router.model_router.route_task(TaskType.CODE_BACKEND, make_complexity())
+
+    servers = {m: [0.0] * c.max_concurrent_tasks for m, c in capabilities.items()}
+    completions = []  # (time, model, started_at)
+    total = 0.0
+
+    for _ in range(arrivals):
+        clock.now += rng.expovariate(rate_per_s)
+        while completions and completions[0][0] <= clock.now:
+            done_at, model, started_at = heapq.heappop(completions)
+            now, clock.now = clock.now, done_at
+            router.record_request_end(model, started_at, tokens=2000)
+            clock.now = now
+
+        decision = router.apply_load_balancing(base, None) if balance else base
+        model = decision.selected_model
+        started_at = router.record_request_start(model)
+
+        service = (
+            capabilities[model].avg_response_time_ms / 1000 * rng.uniform(0.5, 1.5)
+        )
+        free_at = heapq.heappop(servers[model])
+        done_at = max(clock.now, free_at) + service
+        heapq.heappush(servers[model], done_at)
+        heapq.heappush(completions, (done_at, model, started_at))
+        total += done_at - clock.now
+
+    return total / arrivals
+
+
+def test_queueing_aware_balancing_on_simulated_workload():
+    # The preferred model saturates well below the offered load
+    baseline = simulate(balance=False)
+    balanced = simulate(balance=True)
+
+    assert balanced < baseline / 5
+    assert balanced < 5.0
+
+
+def test_reported_load_steers_load_balancing():
+    router = DataDrivenRouter(clock=FakeClock())
+    decision = router.model_router.route_task(TaskType.CODE_BACKEND, make_complexity())
+    selected = decision.selected_model
+
+    router.update_model_load(selected, 0.1)
+    assert router.apply_load_balancing(decision, None).selected_model == selected
+
+    router.update_model_load(selected, 0.95)
+    assert router.model_loads[selected].expected_wait() > 0
+    balanced = router.apply_load_balancing(decision, None)
+    assert balanced.selected_model in {m for m, _ in decision.alternatives}
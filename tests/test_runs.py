@@ -0,0 +1,145 @@
+"""
+Tests for run and artifact persistence in storage.runs.
+"""
+
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from storage import runs
+from storage.database_manager import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    path = str(tmp_path / "runs.db")
+    monkeypatch.setattr(runs, "DB", path)
+    monkeypatch.setattr(runs, "_legacy_schema", {})
+    return path
+
+
+def make_artifacts(count, content="print('hello')"):
+    return [
+        {
+            "type": "code",
+            "agent": f"agent{i % 3}",
+            "confidence": 0.9,
+            "content": content,
+        }
+        for i in range(count)
+    ]
+
+
+def test_col_exists_reads_table_columns(db):
+    runs.init()
+    with runs._conn() as c:
+        assert runs._col_exists(c, "artifacts", "confidence")
+        assert not runs._col_exists(c, "artifacts", "project_id")
+
+
+def test_init_migrates_missing_columns(db):
+    with sqlite3.connect(db) as c:
+        c.execute("CREATE TABLE artifacts (run_id TEXT, content TEXT)")
+    runs.init()
+
+    runs.save_run("r1", "objective", make_artifacts(2))
+    assert runs.load_artifacts("r1") == [
+        ("code", "agent0", 0.9, "print('hello')"),
+        ("code", "agent1", 0.9, "print('hello')"),
+    ]
+
+
+def test_legacy_schema_is_detected_once(db, monkeypatch):
+    with sqlite3.connect(db) as c:
+        c.execute(
+            "CREATE TABLE artifacts (project_id TEXT NOT NULL, artifact_type TEXT, "
+            "title TEXT, content TEXT, agent_name TEXT)"
+        )
+    runs.init()
+    monkeypatch.setattr(runs, "_columns", lambda *a: pytest.fail("schema re-read"))
+
+    runs.save_run("r1", "objective", make_artifacts(3))
+    assert [row[1] for row in runs.load_artifacts("r1")] == [
+        "agent0",
+        "agent1",
+        "agent2",
+    ]
+
+
+def test_large_content_is_compressed(db):
+    runs.init()
+    big = "x = 1\n" * 10_000
+    runs.save_run("r1", "objective", make_artifacts(1, big) + make_artifacts(1))
+
+    with sqlite3.connect(db) as c:
+        stored = [
+            row[0] for row in c.execute("SELECT content FROM artifacts ORDER BY idx")
+        ]
+    assert isinstance(stored[0], bytes) and len(stored[0]) < len(big) / 10
+    assert stored[1] == "print('hello')"
+    assert [row[3] for row in runs.load_artifacts("r1")] == [big, "print('hello')"]
+
+
+def test_database_manager_reads_compressed_run_artifacts(db):
+    # The DatabaseManager schema is the legacy layout sharing one artifacts table
+    manager = DatabaseManager(db)
+    runs.init()
+    big = "x = 1\n" * 10_000
+    runs.save_run("r1", "objective", make_artifacts(1, big) + make_artifacts(1))
+
+    project = manager.get_project_artifacts("r1")
+    manager.close()
+
+    assert {a["content"] for a in project} == {big, "print('hello')"}
+
+
+def test_database_stats_never_expose_compressed_content(db):
+    manager = DatabaseManager(db)
+    runs.init()
+    runs.save_run("r1", "objective", make_artifacts(1, "x = 1\n" * 10_000))
+
+    stats = manager.get_database_stats()
+    manager.close()
+
+    def values(value):
+        if isinstance(value, dict):
+            value = list(value.values())
+        if isinstance(value, list):
+            return [leaf for item in value for leaf in values(item)]
+        return [value]
+
+    assert stats["artifacts_count"] == 1
+    assert stats["recent_artifacts"][0]["count"] == 1
+    assert not any(isinstance(value, bytes) for value in values(stats))
+
+
+def test_runs_of_any_size_load_back_in_order(db):
+    runs.init()
+    for count in (1, 100, 1_000):
+        runs.save_run(f"run{count}", "objective", make_artifacts(count))
+
+        loaded = runs.load_artifacts(f"run{count}")
+        assert [agent for _, agent, _, _ in loaded] == [
+            f"agent{i % 3}" for i in range(count)
+        ]
+
+
+@pytest.mark.benchmark
+def test_benchmark_save_run_sizes(db):
+    """Benchmark: save runs of 1, 100 and 10k artifacts"""
+    runs.init()
+    for count in (1, 100, 10_000):
+        artifacts = make_artifacts(count)
+        start = time.perf_counter()
+        runs.save_run(f"run{count}", "objective", artifacts)
+        elapsed = time.perf_counter() - start
+        print(f"save_run({count}): {elapsed * 1000:.1f} ms")
+        assert len(runs.load_artifacts(f"run{count}")) == count
+
+    assert elapsed < 1.0
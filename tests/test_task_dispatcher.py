@@ -0,0 +1,119 @@
+"""
+Tests for the capability-indexed TaskDispatcher.
+"""
+
+import heapq
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from agents.task_dispatcher import TaskDispatcher
+
+
+def make_task(i, task_type="code_backend"):
+    return {"task_id": f"t{i}", "primary_task_type": task_type}
+
+
+def test_capability_index_routes_by_keyword():
+    dispatcher = TaskDispatcher(rng=random.Random(0))
+    dispatcher.register_worker("gpt4", ["code", "ui"])
+    dispatcher.register_worker("gemini", ["test", "review"])
+
+    assert dispatcher.eligible_workers("CODE_BACKEND") == ["gpt4"]
+    assert dispatcher.submit(make_task(1, "test_gen")) == "gemini"
+    assert dispatcher.submit(make_task(2, "architecture")) is None
+    assert dispatcher.get_stats()["queued"] == 0
+
+
+def test_concurrency_limit_queues_and_refills():
+    dispatcher = TaskDispatcher(rng=random.Random(0))
+    dispatcher.register_worker("w", ["code"], max_concurrency=2)
+
+    assert [dispatcher.submit(make_task(i)) for i in range(4)] == ["w", "w", None, None]
+    assert dispatcher.get_stats()["streams"] == {"code_backend": 2}
+
+    worker_id, task = dispatcher.complete("t0", latency=0.5)
+    assert (worker_id, task["task_id"]) == ("w", "t2")
+    assert dispatcher.workers["w"].in_flight == 2
+
+
+def test_power_of_two_choices_favours_fast_worker():
+    dispatcher = TaskDispatcher(ewma_alpha=1.0, rng=random.Random(1))
+    dispatcher.register_worker("fast", ["code"], max_concurrency=100)
+    dispatcher.register_worker("slow", ["code"], max_concurrency=100)
+
+    dispatcher.submit(make_task("warm_fast"))
+    dispatcher.submit(make_task("warm_slow"))
+    for task_id in ("twarm_fast", "twarm_slow"):
+        worker_id, _ = dispatcher._assignments[task_id]
+        dispatcher.complete(task_id, latency=0.1 if worker_id == "fast" else 2.0)
+
+    picks = [dispatcher.submit(make_task(i)) for i in range(20)]
+    assert picks.count("fast") > picks.count("slow")
+
+
+def simulate(tasks):
+    """Run tasks over 50 workers of mixed speed; (completed, peak, stats, seconds)"""
+    rng = random.Random(42)
+    dispatcher = TaskDispatcher(rng=rng)
+    task_types = ["code_backend", "test_gen", "architecture", "code_review"]
+    capabilities = [["code"], ["test", "review"], ["architecture"], ["code", "review"]]
+    speed = {}
+    for i in range(50):
+        worker_id = f"w{i}"
+        dispatcher.register_worker(worker_id, capabilities[i % 4], max_concurrency=4)
+        speed[worker_id] = 0.5 if i % 5 == 0 else 1.0
+
+    start = time.perf_counter()
+    clock, running, peak = 0.0, [], 0
+
+    def run(worker_id, task):
+        heapq.heappush(
+            running, (clock + speed[worker_id] * rng.uniform(0.5, 1.5), task["task_id"])
+        )
+
+    for i in range(tasks):
+        task = make_task(i, task_types[i % 4])
+        worker_id = dispatcher.submit(task)
+        if worker_id:
+            run(worker_id, task)
+        peak = max(peak, max(w.in_flight for w in dispatcher.workers.values()))
+
+    completed = 0
+    while running:
+        clock, task_id = heapq.heappop(running)
+        worker_id, _ = dispatcher._assignments[task_id]
+        next_assignment = dispatcher.complete(task_id, latency=speed[worker_id])
+        completed += 1
+        if next_assignment:
+            run(*next_assignment)
+    elapsed = time.perf_counter() - start
+
+    return completed, peak, dispatcher.get_stats(), elapsed
+
+
+def test_50_workers_drain_mixed_tasks_within_limits():
+    completed, peak, stats, _ = simulate(2_000)
+
+    assert completed == 2_000
+    assert stats["queued"] == 0 and stats["in_flight"] == 0
+    assert peak <= 4
+    # Faster workers absorb more of the load
+    fast = [s["completed"] for w, s in stats["workers"].items() if int(w[1:]) % 5 == 0]
+    slow = [s["completed"] for w, s in stats["workers"].items() if int(w[1:]) % 5 != 0]
+    assert sum(fast) / len(fast) > sum(slow) / len(slow)
+
+
+@pytest.mark.benchmark
+def test_benchmark_50_workers_10k_tasks():
+    """Benchmark: simulated 10k tasks over 50 workers with mixed latency"""
+    completed, _, _, elapsed = simulate(10_000)
+
+    assert completed == 10_000
+    assert elapsed < 2.0
@@ -0,0 +1,205 @@
+"""
+Tests for local token counting and its per-provider calibration.
+"""
+
+import glob
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from codecompanion import llm
+from codecompanion.tokens import (
+    BYTE_SYMBOLS,
+    DEFAULT_FACTOR,
+    DEFAULT_FACTORS,
+    MIN_CALIBRATION_SAMPLES,
+    BPETokenizer,
+    TokenCalibration,
+    TokenCounter,
+    get_token_counter,
+    reset_token_counter,
+)
+from codecompanion.llm_cache import reset_completion_cache
+
+project_root = Path(__file__).parent.parent
+
+CODE = '''def estimate_tokens(text: str) -> int:
+    """Rough count"""
+    return max(1, len(text) // 4)  # ~4 chars/token
+'''
+
+
+@pytest.fixture
+def counter(tmp_path):
+    return TokenCounter(calibration=TokenCalibration(tmp_path / "calibration.json"))
+
+
+def test_tokens_cover_the_text_exactly():
+    tokenizer = BPETokenizer()
+    text = CODE + "naïve café 🚀 " + "x" * 600
+    decode = {symbol: byte for byte, symbol in enumerate(BYTE_SYMBOLS)}
+
+    tokens = tokenizer.tokenize(text)
+    raw = bytes(decode[symbol] for token in tokens for symbol in token)
+
+    assert raw.decode("utf-8") == text
+    assert tokenizer.count(text) == len(tokens)
+    # Common identifiers and keywords are single merged tokens
+    assert "Ġreturn" in tokens and "def" in tokens
+
+
+def test_batch_counts_match_single_counts_and_share_the_cache(counter):
+    texts = [CODE, "hello world", CODE, "", "hello world"]
+
+    batch = counter.count_batch(texts)
+
+    assert batch == [counter.count(text) for text in texts]
+    assert batch[3] == 0
+    # Two distinct texts were counted; everything after came from the LRU
+    assert counter.misses == 2
+    assert counter.hits == 4
+
+
+def test_calibration_fits_reported_usage_and_persists(counter, tmp_path):
+    raw = counter.count_raw(CODE)
+    reported = raw + raw // 4
+    for i in range(MIN_CALIBRATION_SAMPLES):
+        assert counter.count(CODE, "claude") == round(raw * DEFAULT_FACTORS["claude"])
+        counter.record_usage("claude", CODE, reported)
+
+    assert counter.count(CODE, "claude") == reported
+    assert counter.count(CODE, "gemini") == round(raw * DEFAULT_FACTOR)
+
+    counter.calibration.flush()
+    stats = TokenCalibration(tmp_path / "calibration.json").stats()
+    assert stats["claude"]["samples"] == MIN_CALIBRATION_SAMPLES
+    assert stats["claude"]["factor"] == pytest.approx(reported / raw, abs=1e-3)
+    assert stats["claude"]["mape"] > 0
+
+
+def test_completions_calibrate_from_provider_usage(tmp_path, monkeypatch):
+    monkeypatch.setenv("CC_TOKEN_CALIBRATION_PATH", str(tmp_path / "calibration.json"))
+    monkeypatch.setenv("CC_LLM_CACHE_PATH", str(tmp_path / "llm_cache.db"))
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    reset_token_counter()
+    reset_completion_cache()
+
+    def fake_request(url, headers, payload, extract_fn):
+        return extract_fn(
+            {
+                "content": [{"text": "done"}],
+                "usage": {"input_tokens": 120, "output_tokens": 7},
+            }
+        )
+
+    monkeypatch.setattr(llm, "_retry_request", fake_request)
+    result = llm.complete("system", [{"role": "user", "content": CODE}], temperature=0)
+    # A cache hit reports the same usage but must not be counted twice
+    llm.complete("system", [{"role": "user", "content": CODE}], temperature=0)
+
+    assert result["usage"] == {"input_tokens": 120, "output_tokens": 7}
+    get_token_counter().calibration.flush()
+    stats = json.loads((tmp_path / "calibration.json").read_text())
+    assert stats["claude"]["samples"] == 2
+    reset_token_counter()
+    reset_completion_cache()
+
+
+def test_cost_governor_counts_the_prompt(tmp_path):
+    from core.cost_governor import (
+        DEFAULT_ESTIMATED_TOKENS,
+        DEFAULT_OUTPUT_TOKENS,
+        CostGovernor,
+    )
+    from codecompanion.tokens import count_tokens
+    from schemas.routing import ModelType
+
+    governor = CostGovernor(db_path=str(tmp_path / "cost.db"))
+    prompt_tokens = count_tokens(CODE, "claude")
+
+    assert governor.estimate_tokens({}) == DEFAULT_ESTIMATED_TOKENS
+    assert governor.estimate_tokens({"estimated_tokens": 42, "prompt": CODE}) == 42
+    # The prompt plus an allowance for the completion
+    assert (
+        governor.estimate_tokens({"prompt": CODE}, ModelType.CLAUDE_SONNET)
+        == prompt_tokens + DEFAULT_OUTPUT_TOKENS
+    )
+    assert (
+        governor.estimate_tokens(
+            {"prompt": CODE, "max_tokens": 200}, ModelType.CLAUDE_SONNET
+        )
+        == prompt_tokens + 200
+    )
+
+
+def test_calibration_saves_are_debounced(tmp_path, monkeypatch):
+    calibration = TokenCalibration(tmp_path / "calibration.json")
+    saves = []
+    save = calibration._save
+    monkeypatch.setattr(calibration, "_save", lambda: saves.append(1) or save())
+
+    for _ in range(20):
+        calibration.record("claude", 100, 120, 400)
+    assert len(saves) == 1
+
+    calibration.flush()
+    calibration.flush()
+    assert len(saves) == 2
+    stats = TokenCalibration(tmp_path / "calibration.json").stats()
+    assert stats["claude"]["samples"] == 20
+
+
+def test_default_factors_fit_recorded_usage():
+    """Accuracy against provider token counts for held-out repository text"""
+    with open(
+        project_root / "tests" / "data" / "token_usage.jsonl", encoding="utf-8"
+    ) as f:
+        samples = [json.loads(line) for line in f]
+    tokenizer = BPETokenizer()
+    counts = [tokenizer.count(sample["text"]) for sample in samples]
+
+    for provider, default in DEFAULT_FACTORS.items():
+        fit = [
+            (count, sample["usage"][provider])
+            for count, sample in zip(counts, samples)
+            if sample["split"] == "fit"
+        ]
+        slope = sum(x * y for x, y in fit) / sum(x * x for x, _ in fit)
+        assert default == pytest.approx(slope, abs=0.01)
+
+        held_out = [
+            (count, sample["usage"][provider], len(sample["text"]))
+            for count, sample in zip(counts, samples)
+            if sample["split"] == "eval"
+        ]
+        mape = sum(abs(x * default - y) / y for x, y, _ in held_out) / len(held_out)
+        char_mape = sum(
+            abs(max(1, chars // 4) - y) / y for _, y, chars in held_out
+        ) / len(held_out)
+        print(f"{provider}: {mape:.1%} error vs {char_mape:.1%} for len/4")
+        assert mape < char_mape
+        assert mape < 0.1
+
+
+@pytest.mark.benchmark
+def test_benchmark_counting_throughput(counter):
+    """Benchmark: cold and cached counting over the core package"""
+    paths = sorted(glob.glob(str(project_root / "core" / "*.py")))
+    texts = [open(path, encoding="utf-8").read() for path in paths]
+    chars = sum(map(len, texts))
+
+    start = time.perf_counter()
+    tokens = sum(counter.count_batch(texts))
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    counter.count_batch(texts)
+    cached = time.perf_counter() - start
+
+    print(
+        f"{tokens} tokens vs {chars // 4} by len/4; "
+        f"{chars / cold / 1e6:.2f} MB/s cold, {cached * 1e3:.2f} ms cached"
+    )
+    assert cached < cold / 10
@@ -0,0 +1,171 @@
+"""
+Tests for concurrent step scheduling in WorkflowOrchestrator.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.workflow_orchestrator import (
+    AgentStatus,
+    ProjectComplexity,
+    ProjectType,
+    WorkflowOrchestrator,
+)
+
+
+class SleepyAgent:
+    """Agent stub that records when it ran"""
+
+    def __init__(self, name, delay, log, fail=False):
+        self.name = name
+        self.delay = delay
+        self.log = log
+        self.fail = fail
+
+    def process_request(self, task, context):
+        start = time.monotonic()
+        time.sleep(self.delay)
+        self.log.append((self.name, start, time.monotonic()))
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        return {"content": f"{self.name} output", "files": {f"{self.name}.py": ""}}
+
+
+class StreamingAgent:
+    """Agent stub that streams four 1000-char chunks then the result"""
+
+    def stream_request(self, task, context):
+        for _ in range(4):
+            yield "x" * 1000
+        yield {"content": "x" * 4000, "files": {}}
+
+
+def make_agents(log, **overrides):
+    delays = {
+        "project_manager": 0.05,
+        "code_generator": 0.2,
+        "ui_designer": 0.2,
+        "test_writer": 0.05,
+        "debugger": 0.05,
+    }
+    return {
+        name: overrides.get(name) or SleepyAgent(name, delay, log)
+        for name, delay in delays.items()
+    }
+
+
+def test_independent_steps_overlap():
+    log = []
+    orchestrator = WorkflowOrchestrator(make_agents(log))
+
+    summary = orchestrator.orchestrate_project(
+        "inventory service", ProjectType.WEB_APP, ProjectComplexity.COMPLEX
+    )
+
+    assert summary["completed_steps"] == 5
+    runs = {name: (start, end) for name, start, end in log}
+    # UI design and code generation both only need the plan
+    assert runs["ui_designer"][0] < runs["code_generator"][1]
+    assert runs["code_generator"][0] < runs["ui_designer"][1]
+    # Tests still wait for both
+    assert runs["test_writer"][0] >= max(
+        runs["code_generator"][1], runs["ui_designer"][1]
+    )
+    assert summary["workflow_wall_time_s"] < 0.5
+
+
+def test_summary_records_step_timings():
+    log = []
+    orchestrator = WorkflowOrchestrator(make_agents(log), max_parallel_steps=1)
+
+    summary = orchestrator.orchestrate_project(
+        "inventory service", ProjectType.WEB_APP, ProjectComplexity.MEDIUM
+    )
+
+    timings = summary["step_timings"]
+    assert len(timings) == 4
+    for entry in timings.values():
+        assert entry["wall_s"] >= entry["model_s"] > 0
+        assert entry["queue_s"] >= 0
+    # With a single worker the second of the two ready steps had to queue
+    assert max(entry["queue_s"] for entry in timings.values()) > 0.1
+
+
+def test_failed_step_blocks_only_its_dependents():
+    log = []
+    agents = make_agents(
+        log, ui_designer=SleepyAgent("ui_designer", 0.01, log, fail=True)
+    )
+    orchestrator = WorkflowOrchestrator(agents)
+
+    summary = orchestrator.orchestrate_project(
+        "inventory service", ProjectType.WEB_APP, ProjectComplexity.MEDIUM
+    )
+
+    statuses = {s.agent_type.name: s.status for s in orchestrator.workflow_steps}
+    assert statuses["CODE_GENERATOR"] == AgentStatus.COMPLETED
+    assert statuses["UI_DESIGNER"] == AgentStatus.ERROR
+    assert statuses["TEST_WRITER"] == AgentStatus.IDLE
+    assert summary["completed_steps"] == 2
+
+
+def test_progress_follows_streamed_output():
+    agent = StreamingAgent()
+    orchestrator = WorkflowOrchestrator({"project_manager": agent})
+    orchestrator.current_project = {}
+    (step,) = orchestrator.create_intelligent_workflow(
+        {
+            "complexity": "simple",
+            "project_type": "web_app",
+            "description": "x",
+            "required_agents": [],
+        }
+    )
+
+    seen = []
+    original = agent.stream_request
+
+    def observed(task, context):
+        for chunk in original(task, context):
+            seen.append(step.progress)
+            yield chunk
+
+    agent.stream_request = observed
+    orchestrator.execute_workflow_step(step, {})
+
+    assert seen[1:] == [23, 47, 71, 95]
+    assert step.progress == 100
+    assert step.output == "x" * 4000
+
+
+def test_progress_of_non_streaming_agent_follows_model_time():
+    orchestrator = WorkflowOrchestrator({})
+    orchestrator.current_project = {}
+    (step,) = orchestrator.create_intelligent_workflow(
+        {
+            "complexity": "simple",
+            "project_type": "web_app",
+            "description": "x",
+            "required_agents": [],
+        }
+    )
+    orchestrator.workflow_steps = [step]
+    orchestrator.expected_model_s[step.agent_type] = 0.2
+
+    class ReportingAgent:
+        def process_request(self, task, context):
+            time.sleep(0.1)
+            seen.append(orchestrator.get_real_time_status()["overall_progress"])
+            return {"content": "plan"}
+
+    seen = []
+    orchestrator.agents = {"project_manager": ReportingAgent()}
+    orchestrator.execute_workflow_step(step, {})
+
+    assert 0 < seen[0] <= 95
+    assert orchestrator.step_progress(step) == 100
+    assert orchestrator.expected_model_s[step.agent_type] >= 0.1
@@ -0,0 +1,105 @@
+"""
+Tests for streaming ZIP export in FileManager and utils.helpers.
+"""
+
+import io
+import json
+import sys
+import time
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.file_manager import FileManager
+from utils.helpers import create_project_zip
+from utils.zip_stream import iter_zip_chunks
+
+
+def make_project(files=200, lines=50):
+    return {
+        f"src/module_{i}.py": "".join(
+            f"value_{i}_{n} = {n} * 2\n" for n in range(lines)
+        )
+        for i in range(files)
+    }
+
+
+def test_archive_round_trips_with_metadata(tmp_path):
+    manager = FileManager(str(tmp_path))
+    files = {**make_project(20), "docs/ünïcode.md": "# Tïtle\n", "\\win\\path.txt": "x"}
+
+    archive = zipfile.ZipFile(io.BytesIO(manager.create_archive(files, "demo")))
+    assert archive.testzip() is None
+    assert archive.read("win/path.txt") == b"x"
+
+    metadata = json.loads(archive.read("_metadata.json"))
+    assert metadata["total_files"] == len(files)
+    assert metadata["total_size"] == sum(len(c.encode("utf-8")) for c in files.values())
+    assert metadata["file_list"] == list(files)
+
+    restored = FileManager(str(tmp_path)).extract_archive(
+        manager.create_archive(files, "demo"), "demo"
+    )
+    assert restored["files_count"] == len(files)
+    assert restored["metadata"]["project_name"] == "demo"
+
+
+def test_compressed_types_are_stored_and_chunks_bounded():
+    payload = bytes(range(256)) * 4096
+    stats = {}
+    chunks = list(
+        iter_zip_chunks(
+            [("logo.png", payload), ("app.py", "print('hi')\n" * 5000)],
+            chunk_size=8192,
+            stats=stats,
+        )
+    )
+    assert max(len(chunk) for chunk in chunks) == 8192
+    assert stats["archive_size"] == sum(len(chunk) for chunk in chunks)
+
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    assert archive.getinfo("logo.png").compress_type == zipfile.ZIP_STORED
+    assert archive.getinfo("app.py").compress_type == zipfile.ZIP_DEFLATED
+    assert archive.read("logo.png") == payload
+
+
+def test_archives_past_classic_limits_use_zip64():
+    files = ((f"f{i}.txt", b"") for i in range(70_000))
+    stats = {}
+
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(iter_zip_chunks(files, stats=stats))))
+
+    assert stats["total_files"] == 70_000
+    assert len(archive.namelist()) == 70_000
+    assert archive.read("f69999.txt") == b""
+
+
+def test_helpers_zip_keeps_metadata_entry():
+    archive = zipfile.ZipFile(io.BytesIO(create_project_zip({"main.py": "print(1)"})))
+    assert json.loads(archive.read("project_metadata.json"))["total_files"] == 1
+    assert archive.read("main.py") == b"print(1)"
+
+
+def test_benchmark_backup_streams_without_buffering(tmp_path):
+    """Benchmark: peak memory while backing up a ~24 MB project"""
+    manager = FileManager(str(tmp_path))
+    for filepath, content in make_project(files=400, lines=3000).items():
+        manager.add_file(filepath, content, "big")
+    project_bytes = sum(info["size"] for info in manager.project_files.values())
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    backup = manager.backup_project("big", str(tmp_path / "big.zip"))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"backup of {project_bytes / 1e6:.1f} MB: {elapsed * 1000:.0f} ms, "
+        f"peak {peak / 1e6:.1f} MB, archive {backup['backup_size'] / 1e6:.1f} MB"
+    )
+    assert zipfile.ZipFile(tmp_path / "big.zip").testzip() is None
+    assert peak < project_bytes / 4
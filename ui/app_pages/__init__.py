@@ -0,0 +1,31 @@
+"""
+Pages of the Streamlit app
+
+Each page lives in its own module and is imported the first time it is
+shown, so a rerun executes only the page being viewed and a cold start
+imports only what that page needs.
+"""
+
+import importlib
+from typing import Callable
+
+# Navigation label -> (module, render function), in sidebar order
+PAGES = {
+    "🚀 Real Mode": ("real_mode", "render_real_mode"),
+    "🤖 Intelligent Router": ("intelligent_router", "render_intelligent_router"),
+    "🎯 Typed Artifact System": ("typed_artifacts", "render_typed_artifacts_page"),
+    "📋 Schema Demonstration": ("schema_demo", "render_schema_demo"),
+    "🎯 Task & Artifact Management": ("task_management", "render_task_management"),
+    "🤖 Agent Orchestration": ("agent_orchestration", "render_agent_orchestration"),
+    "📊 Routing & Performance": ("routing_dashboard", "render_routing_dashboard"),
+    "⚡ Live Workflow Monitor": ("workflow_monitor", "render_workflow_monitor"),
+    "🌊 Event Streaming (New)": ("event_streaming", "render_event_streaming_dashboard"),
+    "🎯 Quality Dashboard": ("quality_dashboard", "render_quality_dashboard"),
+    "🗄️ Database Infrastructure": ("database", "render_database_dashboard"),
+}
+
+
+def load_page(title: str) -> Callable[[], None]:
+    """Render function of a page, importing its module on first use"""
+    module, function = PAGES[title]
+    return getattr(importlib.import_module(f"{__name__}.{module}"), function)
@@ -0,0 +1,1080 @@
+"""
+Agent Orchestration: configure, review and launch a project
+"""
+
+import logging
+import os
+import time
+from datetime import datetime
+
+import streamlit as st
+
+from ui.app_state import add_agent_output, get_service, update_status
+from ui.app_pages.agent_monitoring import render_live_monitoring
+
+logger = logging.getLogger(__name__)
+
+
+def render_agent_orchestration():
+    """Agent orchestration and live project management"""
+
+    st.header("🤖 Live AI Agent Collaboration")
+
+    # Progress indicator
+    step_names = ["Configure", "Review", "Launch", "Monitor"]
+    current_step = st.session_state.configuration_step
+
+    progress_cols = st.columns(4)
+    for i, step_name in enumerate(step_names, 1):
+        with progress_cols[i - 1]:
+            if i < current_step:
+                st.markdown(f"✅ **{step_name}**")
+            elif i == current_step:
+                st.markdown(f"🔄 **{step_name}**")
+            else:
+                st.markdown(f"⚪ {step_name}")
+
+    st.markdown("---")
+
+    # Step 1: Project Configuration
+    if current_step == 1:
+        render_project_configuration()
+
+    # Step 2: Review and Planning
+    elif current_step == 2:
+        render_project_review()
+
+    # Step 3: Launch Controls
+    elif current_step == 3:
+        render_project_launch()
+
+    # Step 4: Live Monitoring
+    elif current_step == 4:
+        render_live_monitoring()
+
+
+def render_project_configuration():
+    """Step 1: Project Configuration"""
+
+    st.subheader("🎯 Step 1: Configure Your Project")
+
+    # Check API key availability
+    api_keys = {
+        "Claude": bool(os.environ.get("ANTHROPIC_API_KEY")),
+        "GPT-4": bool(os.environ.get("OPENAI_API_KEY")),
+        "Gemini": bool(os.environ.get("GEMINI_API_KEY")),
+    }
+
+    # API Status
+    st.markdown("#### AI Agent Status")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        status = "🟢 Ready" if api_keys["Claude"] else "🔴 Missing Key"
+        st.markdown(f"**Claude**: {status}")
+
+    with col2:
+        status = "🟢 Ready" if api_keys["GPT-4"] else "🔴 Missing Key"
+        st.markdown(f"**GPT-4**: {status}")
+
+    with col3:
+        status = "🟢 Ready" if api_keys["Gemini"] else "🔴 Missing Key"
+        st.markdown(f"**Gemini**: {status}")
+
+    available_agents = sum(api_keys.values())
+
+    if available_agents == 0:
+        st.error("⚠️ No AI agents available. Please configure API keys to proceed.")
+        return
+    elif available_agents < 3:
+        st.warning(
+            f"⚠️ Only {available_agents}/3 agents available. Project will use available agents."
+        )
+    else:
+        st.success("✅ All AI agents ready for collaboration!")
+
+    st.markdown("---")
+
+    # Project configuration form
+    st.markdown("#### Project Details")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        project_description = st.text_area(
+            "Project Description",
+            value=st.session_state.project_description,
+            height=120,
+            help="Describe what you want the AI agents to build together",
+            key="project_desc_input",
+        )
+
+        # Update session state when changed
+        if project_description != st.session_state.project_description:
+            st.session_state.project_description = project_description
+
+    with col2:
+        project_type = st.selectbox(
+            "Project Type",
+            options=[
+                "web_application",
+                "api",
+                "ui_application",
+                "data_pipeline",
+                "mobile_app",
+            ],
+            index=[
+                "web_application",
+                "api",
+                "ui_application",
+                "data_pipeline",
+                "mobile_app",
+            ].index(st.session_state.project_type),
+            help="Type of project affects the workflow phases",
+            key="project_type_input",
+        )
+
+        # Update session state when changed
+        if project_type != st.session_state.project_type:
+            st.session_state.project_type = project_type
+
+        complexity_level = st.selectbox(
+            "Complexity Level",
+            options=["Simple", "Medium", "Complex", "Advanced"],
+            index=["Simple", "Medium", "Complex", "Advanced"].index(
+                st.session_state.complexity_level
+            ),
+            key="complexity_input",
+        )
+
+        # Update session state when changed
+        if complexity_level != st.session_state.complexity_level:
+            st.session_state.complexity_level = complexity_level
+
+    # Real-time pricing preview when project type or complexity changes
+    st.markdown("---")
+    st.markdown("#### 💰 Estimated Project Metrics (Live Preview)")
+
+    # Define project phases for pricing calculation
+    workflow_preview = {
+        "web_application": 6,  # 6 phases
+        "api": 5,  # 5 phases
+        "ui_application": 5,  # 5 phases
+        "data_pipeline": 5,  # 5 phases
+        "mobile_app": 5,  # 5 phases
+    }
+
+    complexity_multipliers = {
+        "Simple": 1.0,
+        "Medium": 1.5,
+        "Complex": 2.2,
+        "Advanced": 3.0,
+    }
+
+    base_phases = workflow_preview.get(st.session_state.project_type, 6)
+    multiplier = complexity_multipliers[st.session_state.complexity_level]
+    estimated_time = int(base_phases * 8 * multiplier)  # minutes
+    estimated_cost = round(base_phases * 0.50 * multiplier, 2)  # USD
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Estimated Time", f"{estimated_time} minutes")
+
+    with col2:
+        st.metric("Estimated Cost", f"${estimated_cost}")
+
+    with col3:
+        st.metric("Total Phases", f"{base_phases}")
+
+    st.caption(
+        f"💡 Cost varies by project type and complexity. {st.session_state.project_type.replace('_', ' ').title()} projects have {base_phases} phases with {st.session_state.complexity_level.lower()} complexity multiplier."
+    )
+
+    # Configuration validation
+    current_description = st.session_state.project_description or ""
+    config_valid = (
+        current_description.strip() != ""
+        and len(current_description.strip()) >= 20
+        and available_agents > 0
+    )
+
+    if not config_valid:
+        if not current_description.strip():
+            st.error("Please provide a project description")
+        elif len(current_description.strip()) < 20:
+            st.error("Project description should be at least 20 characters")
+
+    # Navigation buttons
+    col1, col2, col3 = st.columns([1, 1, 1])
+
+    with col2:
+        if st.button(
+            "📋 Review Configuration", type="primary", disabled=not config_valid
+        ):
+            st.session_state.configuration_step = 2
+            st.session_state.project_configured = True
+            st.rerun()
+
+    with col3:
+        if st.button("🔄 Reset Configuration"):
+            # Reset to defaults
+            st.session_state.project_description = "Build a RESTful API for a task management system with user authentication, task CRUD operations, and real-time notifications."
+            st.session_state.project_type = "api"
+            st.session_state.complexity_level = "Medium"
+            st.session_state.configuration_step = 1
+            st.session_state.project_configured = False
+            st.rerun()
+
+
+def render_project_review():
+    """Step 2: Review and Planning"""
+
+    st.subheader("📋 Step 2: Review Your Project Plan")
+
+    # Configuration Summary
+    with st.container():
+        st.markdown("#### Project Configuration Summary")
+
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            st.markdown(f"**Description:** {st.session_state.project_description}")
+
+        with col2:
+            st.markdown(
+                f"**Type:** {st.session_state.project_type.replace('_', ' ').title()}"
+            )
+            st.markdown(f"**Complexity:** {st.session_state.complexity_level}")
+
+    # Workflow preview
+    st.markdown("#### 🔄 Planned Agent Workflow")
+
+    workflow_preview = {
+        "web_application": [
+            (
+                "📋 Requirements Analysis",
+                "Claude",
+                "Analyze requirements and create project specification",
+            ),
+            (
+                "🏗️ System Architecture",
+                "Claude",
+                "Design system architecture and component structure",
+            ),
+            (
+                "💻 Core Implementation",
+                "GPT-4",
+                "Implement core business logic and backend services",
+            ),
+            (
+                "🎨 UI Development",
+                "GPT-4",
+                "Create user interface and frontend components",
+            ),
+            (
+                "🧪 Testing & QA",
+                "Gemini",
+                "Generate comprehensive tests and quality assurance",
+            ),
+            ("📚 Documentation", "Claude", "Create complete project documentation"),
+        ],
+        "api": [
+            (
+                "📋 API Specification",
+                "Claude",
+                "Define API endpoints and data contracts",
+            ),
+            ("🏗️ System Architecture", "Claude", "Design scalable API architecture"),
+            (
+                "💻 Core Implementation",
+                "GPT-4",
+                "Implement API endpoints and business logic",
+            ),
+            ("🧪 Testing & QA", "Gemini", "Create API tests and validation"),
+            (
+                "📚 API Documentation",
+                "Claude",
+                "Generate comprehensive API documentation",
+            ),
+        ],
+        "ui_application": [
+            ("📋 UI Requirements", "Claude", "Analyze UI requirements and user flows"),
+            ("🎨 Design System", "GPT-4", "Create design system and component library"),
+            ("💻 Component Implementation", "GPT-4", "Build interactive UI components"),
+            ("🧪 UI Testing", "Gemini", "Test user interface and interactions"),
+            ("📚 User Documentation", "Claude", "Create user guides and documentation"),
+        ],
+        "data_pipeline": [
+            ("📋 Data Requirements", "Claude", "Analyze data sources and requirements"),
+            (
+                "🏗️ Pipeline Architecture",
+                "Claude",
+                "Design data processing architecture",
+            ),
+            ("💻 Pipeline Implementation", "GPT-4", "Build data processing pipeline"),
+            (
+                "🧪 Data Validation",
+                "Gemini",
+                "Test data quality and pipeline reliability",
+            ),
+            (
+                "📚 Pipeline Documentation",
+                "Claude",
+                "Document pipeline operations and maintenance",
+            ),
+        ],
+        "mobile_app": [
+            (
+                "📋 App Requirements",
+                "Claude",
+                "Define mobile app requirements and features",
+            ),
+            ("🎨 UI/UX Design", "GPT-4", "Design mobile user interface and experience"),
+            ("💻 App Implementation", "GPT-4", "Develop mobile application"),
+            ("🧪 App Testing", "Gemini", "Test app functionality and user experience"),
+            ("📚 App Documentation", "Claude", "Create app documentation and guides"),
+        ],
+    }
+
+    phases = workflow_preview.get(
+        st.session_state.project_type, workflow_preview["web_application"]
+    )
+
+    for i, (phase_name, agent, description) in enumerate(phases, 1):
+        with st.container():
+            col1, col2, col3 = st.columns([0.5, 2, 1])
+
+            with col1:
+                st.markdown(f"**{i}.**")
+
+            with col2:
+                st.markdown(f"**{phase_name}**")
+                st.caption(description)
+
+            with col3:
+                agent_color = {"Claude": "🟦", "GPT-4": "🟩", "Gemini": "🟨"}
+                st.markdown(f"{agent_color.get(agent, '🟪')} **{agent}**")
+
+    # Cost and time estimation
+    st.markdown("#### 💰 Estimated Project Metrics")
+
+    complexity_multipliers = {
+        "Simple": 1.0,
+        "Medium": 1.5,
+        "Complex": 2.2,
+        "Advanced": 3.0,
+    }
+
+    base_phases = len(phases)
+    multiplier = complexity_multipliers[st.session_state.complexity_level]
+    estimated_time = int(base_phases * 8 * multiplier)  # minutes
+    estimated_cost = round(base_phases * 0.50 * multiplier, 2)  # USD
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Estimated Time", f"{estimated_time} minutes")
+
+    with col2:
+        st.metric("Estimated Cost", f"${estimated_cost}")
+
+    with col3:
+        st.metric("Total Phases", f"{base_phases}")
+
+    # Quality cascade explanation
+    with st.expander("🔄 Quality Assurance Process"):
+        st.markdown("""
+        **Multi-Agent Quality Assurance:**
+        - Each phase includes automated quality reviews
+        - Agents review each other's work for optimal results
+        - Architecture: Claude → GPT-4 → Gemini validation
+        - Implementation: GPT-4 → Claude review → Gemini testing  
+        - Testing: Gemini → GPT-4 review → Claude analysis
+        
+        **Real-time Collaboration:**
+        - Live agent activity monitoring
+        - Automatic handoffs between phases
+        - Conflict resolution when agents disagree
+        - Cost and performance tracking
+        """)
+
+    # Navigation buttons
+    col1, col2, col3 = st.columns([1, 1, 1])
+
+    with col1:
+        if st.button("⬅️ Back to Configuration"):
+            st.session_state.configuration_step = 1
+            st.rerun()
+
+    with col2:
+        if st.button("🚀 Launch Project", type="primary"):
+            st.session_state.configuration_step = 3
+            st.rerun()
+
+
+def render_project_launch():
+    """Step 3: Launch Controls"""
+
+    st.subheader("🚀 Step 3: Launch Your REAL AI Project")
+
+    st.markdown("#### Final Confirmation")
+    st.success(
+        "🔑 REAL AI EXECUTION: The system will make actual API calls to Claude, GPT-4, and Gemini to collaboratively build your project."
+    )
+
+    # Project summary
+    with st.container():
+        st.markdown("**Project Summary:**")
+        col1, col2 = st.columns([3, 1])
+
+        with col1:
+            st.markdown(
+                f"• **Description:** {st.session_state.project_description[:100]}..."
+            )
+            st.markdown(
+                f"• **Type:** {st.session_state.project_type.replace('_', ' ').title()}"
+            )
+            st.markdown(f"• **Complexity:** {st.session_state.complexity_level}")
+
+        with col2:
+            # Check API availability one more time
+            api_keys = {
+                "Claude": bool(os.environ.get("ANTHROPIC_API_KEY")),
+                "GPT-4": bool(os.environ.get("OPENAI_API_KEY")),
+                "Gemini": bool(os.environ.get("GEMINI_API_KEY")),
+            }
+            available_agents = sum(api_keys.values())
+            st.markdown(f"**Available Agents:** {available_agents}/3")
+
+    # Launch controls
+    col1, col2, col3 = st.columns([1, 2, 1])
+
+    with col1:
+        if st.button("⬅️ Review Plan"):
+            st.session_state.configuration_step = 2
+            st.rerun()
+
+    with col2:
+        launch_disabled = (
+            available_agents == 0 or not st.session_state.project_description.strip()
+        )
+
+        if st.button(
+            "⚡ Start REAL AI Project", type="primary", disabled=launch_disabled
+        ):
+            if st.session_state.project_description.strip():
+                # CRITICAL DEBUG: Clear ALL session state to prevent simulation interference
+                logger.info("🔥 BUTTON CLICKED - Starting comprehensive debug trace")
+                logger.info(
+                    f"Pre-clear session state keys: {list(st.session_state.keys())}"
+                )
+
+                # Clear EVERYTHING to prevent any simulation data interference
+                for key in list(st.session_state.keys()):
+                    if key not in [
+                        "project_description",
+                        "project_type",
+                        "complexity_level",
+                        "configuration_step",
+                    ]:
+                        del st.session_state[key]
+
+                logger.info("🧹 Session state cleared completely")
+                logger.info(
+                    f"Post-clear session state keys: {list(st.session_state.keys())}"
+                )
+
+                # Show immediate feedback
+                st.success("🚀 Starting REAL AI Project! Please wait...")
+
+                # Initialize ONLY real execution state with DEBUG flags
+                st.session_state.execution_started = True
+                st.session_state.execution_phase = "starting"
+                st.session_state.debug_mode = True  # Enable comprehensive debugging
+                st.session_state.execution_source = (
+                    "REAL_API_ONLY"  # Flag to prevent simulation
+                )
+                st.session_state.project_status = []
+                st.session_state.agent_outputs = []
+                st.session_state.live_timeline = []
+                st.session_state.real_artifacts = []
+
+                # Add initial status message with REAL timestamp
+                current_time = datetime.now().strftime("%H:%M:%S")
+                logger.info(f"⏰ Adding initial status with REAL time: {current_time}")
+
+                st.session_state.project_status.append(
+                    {
+                        "time": current_time,
+                        "message": "🔥 REAL EXECUTION STARTED - Button pressed - Initializing REAL AI execution...",
+                        "is_real": True,
+                        "debug_source": "BUTTON_HANDLER",
+                        "real_timestamp": datetime.now(),
+                    }
+                )
+
+                logger.info(
+                    f"✅ Initial status added: {len(st.session_state.project_status)} events"
+                )
+
+                st.rerun()
+            else:
+                st.error("Please provide a project description")
+
+    with col3:
+        if st.button("🔄 Start Over"):
+            # Reset everything
+            st.session_state.configuration_step = 1
+            st.session_state.project_configured = False
+            st.session_state.active_live_project = None
+            st.session_state.execution_started = False
+            st.session_state.execution_phase = "idle"
+            st.session_state.project_status = []
+            st.session_state.agent_outputs = []
+            st.rerun()
+
+    # CRITICAL DEBUG CONTROLS
+    st.markdown("---")
+    with st.expander("🔍 DEBUG CONTROLS", expanded=False):
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            if st.button("🔥 DEBUG: Show Session State"):
+                st.write("Session State Keys:", list(st.session_state.keys()))
+                for key, value in st.session_state.items():
+                    st.write(
+                        f"**{key}:** {type(value).__name__} = {str(value)[:200]}..."
+                    )
+
+        with col2:
+            if st.button("🧹 DEBUG: Clear All Data"):
+                # Clear everything except project config
+                preserved = ["project_description", "project_type", "complexity_level"]
+                to_delete = [k for k in st.session_state.keys() if k not in preserved]
+
+                for key in to_delete:
+                    del st.session_state[key]
+
+                st.success(f"🧹 Cleared {len(to_delete)} session state items")
+                st.rerun()
+
+        with col3:
+            if st.button("⏰ DEBUG: Show Current Time"):
+                current_real_time = datetime.now().strftime("%H:%M:%S")
+                st.success(f"Current Real Time: {current_real_time}")
+
+                # Check for simulation data
+                simulation_check = []
+                if "project_status" in st.session_state:
+                    for status in st.session_state.project_status:
+                        if isinstance(status, dict):
+                            time_val = status.get("time", "")
+                            if time_val.startswith(
+                                "14:3"
+                            ):  # Check for fake 14:30 timestamps
+                                simulation_check.append(f"FAKE TIME FOUND: {time_val}")
+
+                if simulation_check:
+                    st.error("🚨 SIMULATION DATA DETECTED:")
+                    for check in simulation_check:
+                        st.write(check)
+                else:
+                    st.success("✅ No fake timestamps detected")
+
+    # CRITICAL: ISOLATED REAL EXECUTION BUTTON
+    st.markdown("---")
+    st.subheader("🔥 ISOLATED REAL EXECUTION")
+    st.warning(
+        "⚡ This completely bypasses all simulation systems and makes direct API calls"
+    )
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if st.button("🚀 ISOLATED Real Claude Call", type="primary"):
+            # Import and use isolated executor
+            from core.isolated_real_execution import IsolatedRealExecutor
+
+            # Clear any existing simulation data
+            for key in [
+                "project_status",
+                "agent_outputs",
+                "live_timeline",
+                "real_artifacts",
+            ]:
+                if key in st.session_state:
+                    st.session_state[key] = []
+
+            # Create isolated executor
+            executor = IsolatedRealExecutor()
+
+            # Execute ONLY real Claude call
+            result = executor.execute_real_claude_only(
+                st.session_state.project_description
+            )
+
+            # Store isolated execution state
+            st.session_state.isolated_executor = executor
+            st.session_state.isolated_result = result
+
+            st.success("✅ Isolated real execution started!")
+
+    with col2:
+        if st.button("📊 Show Isolated Results"):
+            if "isolated_executor" in st.session_state:
+                st.session_state.isolated_executor.display_isolated_results()
+            else:
+                st.warning(
+                    "❌ No isolated execution found. Run isolated Claude call first."
+                )
+
+    with col3:
+        if st.button("🧹 Clear All Real Data"):
+            # Clear isolated data
+            for key in [
+                "ISOLATED_REAL_STATUS",
+                "ISOLATED_REAL_OUTPUTS",
+                "isolated_executor",
+                "isolated_result",
+            ]:
+                if key in st.session_state:
+                    del st.session_state[key]
+
+            # Clear direct UI data
+            for key in [
+                "DIRECT_REAL_STATUS",
+                "DIRECT_REAL_OUTPUTS",
+                "DIRECT_REAL_ARTIFACTS",
+            ]:
+                if key in st.session_state:
+                    del st.session_state[key]
+
+            st.success("🧹 All real data cleared")
+
+    # CRITICAL: DIRECT UI BYPASS TEST
+    col1, col2 = st.columns(2)
+
+    with col1:
+        if st.button("🚀 TEST Direct UI Bypass", type="secondary"):
+            # Import direct UI updater
+            from core.direct_ui_updater import DirectUIUpdater
+
+            # Clear any existing data first
+            for key in [
+                "DIRECT_REAL_STATUS",
+                "DIRECT_REAL_OUTPUTS",
+                "DIRECT_REAL_ARTIFACTS",
+            ]:
+                if key in st.session_state:
+                    st.session_state[key] = []
+
+            # Create direct updater and test it
+            updater = DirectUIUpdater()
+
+            # Test direct updates
+            updater.update_status_direct(
+                "Testing direct UI bypass system", "test_agent"
+            )
+            updater.add_agent_output_direct(
+                "Test Agent",
+                "This is a test of the direct UI bypass system that completely skips the event bus and mock data generation. Current timestamp should be accurate.",
+                25,
+            )
+            updater.add_artifact_direct(
+                "Test Artifact",
+                "This artifact was created using the direct UI bypass system, confirming that real API data can reach the UI without event bus interference.",
+                "test",
+            )
+
+            st.success("✅ Direct UI bypass test completed!")
+
+    with col2:
+        if st.button("📊 Show Direct UI Summary"):
+            from core.direct_ui_updater import DirectUIUpdater
+
+            updater = DirectUIUpdater()
+            summary = updater.get_status_summary()
+
+            st.json(
+                {
+                    "execution_id": summary["execution_id"],
+                    "status_updates": summary["status_count"],
+                    "agent_outputs": summary["output_count"],
+                    "artifacts": summary["artifact_count"],
+                    "total_items": summary["total_items"],
+                    "last_update": summary["last_update"],
+                }
+            )
+
+    # Execute workflow if started
+    if (
+        st.session_state.get("execution_started", False)
+        and st.session_state.get("execution_phase") != "completed"
+    ):
+        execute_workflow_step()
+
+
+def execute_workflow_step():
+    """Execute the current workflow step with REAL AI execution"""
+    phase = st.session_state.get("execution_phase", "starting")
+
+    # CRITICAL DEBUG: Log execution flow
+    logger.info(f"🚀 execute_workflow_step called - Phase: {phase}")
+    logger.info(f"📊 Session state keys: {list(st.session_state.keys())}")
+    logger.info(f"🔍 Debug mode: {st.session_state.get('debug_mode', False)}")
+    logger.info(
+        f"🎯 Execution source: {st.session_state.get('execution_source', 'unknown')}"
+    )
+
+    project_config = {
+        "description": st.session_state.project_description,
+        "type": st.session_state.project_type.lower(),
+        "complexity": st.session_state.complexity_level,
+    }
+
+    logger.info(f"📝 Project config: {project_config}")
+
+    # Initialize real execution engine if not already done
+    if "real_execution_engine" not in st.session_state:
+        # deferred: pulls in every agent and provider SDK
+        from core.real_execution_engine import RealExecutionEngine
+
+        logger.info("🔧 Creating RealExecutionEngine with REAL callbacks")
+        st.session_state.real_execution_engine = RealExecutionEngine(
+            status_callback=update_status,
+            output_callback=add_agent_output,
+            router=get_service("router"),
+        )
+        logger.info("✅ RealExecutionEngine created successfully")
+
+    if phase == "starting":
+        # Show loading message immediately
+        st.info("🔄 Checking API readiness and initializing agents...")
+
+        update_status("🚀 Starting REAL AI project execution...")
+
+        # Check API readiness
+        api_status = st.session_state.real_execution_engine.check_api_readiness()
+        available_agents = st.session_state.real_execution_engine.get_available_agents()
+
+        update_status(
+            f"🔑 APIs Ready: Claude={api_status['claude']}, GPT-4={api_status['gpt4']}, Gemini={api_status['gemini']}"
+        )
+        update_status(f"🤖 Available Agents: {', '.join(available_agents)}")
+
+        st.session_state.execution_phase = "real_execution"
+        time.sleep(0.5)
+        st.rerun()
+
+    elif phase == "real_execution":
+        # Show execution message immediately
+        st.warning("⚡ Executing REAL AI workflow - This may take 30-60 seconds...")
+
+        # Execute the complete real AI workflow asynchronously
+        update_status("⚡ Launching real AI multi-agent collaboration...")
+
+        try:
+            # Run the real execution in a synchronous context for Streamlit
+            execution_engine = st.session_state.real_execution_engine
+
+            # Create event loop and run the async workflow
+            import asyncio
+
+            async def run_real_workflow():
+                try:
+                    # Try the complex workflow first
+                    return await execution_engine.execute_real_project_workflow(
+                        project_config
+                    )
+                except Exception as e:
+                    # If complex workflow fails due to validation, use simple workflow
+                    update_status(
+                        f"⚠️ Complex workflow failed, switching to simple workflow: {str(e)[:100]}"
+                    )
+                    return await execution_engine.execute_simple_workflow(
+                        project_config
+                    )
+
+            # Clear any previous simulation data to show only real API results
+            if "live_timeline" not in st.session_state:
+                st.session_state.live_timeline = []
+            if "real_artifacts" not in st.session_state:
+                st.session_state.real_artifacts = []
+
+            # Clear old simulation data
+            st.session_state.live_timeline.clear()
+            st.session_state.real_artifacts.clear()
+
+            # Execute the real AI workflow
+            result = asyncio.run(run_real_workflow())
+
+            if result["status"] == "completed":
+                st.session_state.execution_phase = "completed"
+                st.session_state.active_live_project = result["execution_id"]
+                st.session_state.real_execution_result = result
+                st.session_state.configuration_step = 4
+
+                # Mark completion in real timeline with current timestamp
+                completion_time = datetime.now().strftime("%H:%M:%S")
+                update_status(
+                    f"🎉 REAL AI Multi-Agent Project Completed at {completion_time}"
+                )
+
+                time.sleep(0.5)
+                st.rerun()
+            else:
+                update_status(
+                    f"❌ Real execution failed: {result.get('error', 'Unknown error')}"
+                )
+                st.session_state.execution_phase = "failed"
+
+        except Exception as e:
+            update_status(f"❌ Error in real execution: {str(e)}")
+            logger.error(f"Real execution error: {e}")
+            st.session_state.execution_phase = "failed"
+
+    # COMPREHENSIVE DEBUG PANEL - Always show when execution is active
+    if st.session_state.get("execution_started", False):
+        st.markdown("---")
+
+        # CRITICAL DEBUG INFORMATION PANEL
+        if st.session_state.get("debug_mode", False):
+            st.error("🔥 DEBUG MODE ACTIVE - Real API Execution Only")
+
+            with st.expander("🔍 CRITICAL DEBUG INFORMATION", expanded=True):
+                col1, col2, col3 = st.columns(3)
+
+                with col1:
+                    st.subheader("🕐 Time Check")
+                    current_time = datetime.now().strftime("%H:%M:%S")
+                    st.write(f"**Current Real Time:** {current_time}")
+                    st.write(
+                        f"**Execution Source:** {st.session_state.get('execution_source', 'unknown')}"
+                    )
+                    st.write(
+                        f"**Execution Phase:** {st.session_state.get('execution_phase', 'unknown')}"
+                    )
+
+                with col2:
+                    st.subheader("📊 Data Counts")
+                    st.write(f"**Session State Keys:** {len(st.session_state.keys())}")
+                    st.write(
+                        f"**Status Events:** {len(st.session_state.get('project_status', []))}"
+                    )
+                    st.write(
+                        f"**Agent Outputs:** {len(st.session_state.get('agent_outputs', []))}"
+                    )
+                    st.write(
+                        f"**Live Timeline:** {len(st.session_state.get('live_timeline', []))}"
+                    )
+
+                with col3:
+                    st.subheader("🔍 Real Data Check")
+                    real_status_count = len(
+                        [
+                            s
+                            for s in st.session_state.get("project_status", [])
+                            if isinstance(s, dict) and s.get("is_real", False)
+                        ]
+                    )
+                    real_output_count = len(
+                        [
+                            o
+                            for o in st.session_state.get("agent_outputs", [])
+                            if o.get("is_real", False)
+                        ]
+                    )
+                    st.write(f"**Real Status Events:** {real_status_count}")
+                    st.write(f"**Real Agent Outputs:** {real_output_count}")
+
+                    # Show warning if no real data
+                    if real_status_count == 0 and real_output_count == 0:
+                        st.warning("❌ NO REAL DATA FOUND!")
+                    else:
+                        st.success("✅ Real data detected")
+
+        st.subheader("🔄 Live Agent Activity")
+
+        # Show REAL timeline events (not simulation)
+        if "live_timeline" in st.session_state and st.session_state.live_timeline:
+            st.markdown("#### 🔄 Real-Time Agent Timeline")
+            for event in st.session_state.live_timeline:
+                if event.get("is_real", False):  # Only show real events
+                    st.write(f"⏰ {event['time']} - {event['message']}")
+
+        # Show status updates (real only)
+        elif "project_status" in st.session_state and st.session_state.project_status:
+            st.markdown("#### 📊 Real Progress Updates")
+            for status in st.session_state.project_status[-10:]:  # Show last 10 updates
+                # Only show real status updates, not simulation
+                if isinstance(status, dict) and status.get("is_real", False):
+                    time_str = status.get("time", "N/A")
+                    message = status.get("message", "N/A")
+                    st.write(f"⏰ {time_str} - {message}")
+                elif not isinstance(status, dict):
+                    # Legacy format
+                    current_time = datetime.now().strftime("%H:%M:%S")
+                    st.write(f"⏰ {current_time} - {str(status)}")
+
+        # HIGHEST PRIORITY: Show DIRECT UI BYPASS results (completely bypasses event bus)
+        if (
+            "DIRECT_REAL_STATUS" in st.session_state
+            or "DIRECT_REAL_OUTPUTS" in st.session_state
+            or "DIRECT_REAL_ARTIFACTS" in st.session_state
+        ):
+            st.subheader("🚀 DIRECT UI BYPASS RESULTS")
+            st.success(
+                "✅ Showing real API data via DIRECT UI updates (bypasses all event systems)"
+            )
+
+            # Show direct status updates
+            if (
+                "DIRECT_REAL_STATUS" in st.session_state
+                and st.session_state.DIRECT_REAL_STATUS
+            ):
+                st.markdown("#### 📊 DIRECT Status Updates")
+                for status in st.session_state.DIRECT_REAL_STATUS:
+                    st.write(
+                        f"⏰ {status['time']} - {status['message']} | DIRECT | {status['source']}"
+                    )
+
+            # Show direct agent outputs
+            if (
+                "DIRECT_REAL_OUTPUTS" in st.session_state
+                and st.session_state.DIRECT_REAL_OUTPUTS
+            ):
+                st.markdown("#### 🤖 DIRECT Agent Outputs")
+                for output in st.session_state.DIRECT_REAL_OUTPUTS:
+                    with st.expander(
+                        f"📄 {output['agent']} - {output['time']} | DIRECT REAL",
+                        expanded=True,
+                    ):
+                        st.markdown(output["content"])
+                        st.caption(
+                            f"Word count: {output['word_count']} | DIRECT real API call | {output['source']}"
+                        )
+
+            # Show direct artifacts
+            if (
+                "DIRECT_REAL_ARTIFACTS" in st.session_state
+                and st.session_state.DIRECT_REAL_ARTIFACTS
+            ):
+                st.markdown("#### 📄 DIRECT AI Artifacts")
+                for artifact in st.session_state.DIRECT_REAL_ARTIFACTS:
+                    with st.expander(
+                        f"📋 {artifact['title']} - {artifact['time']} | DIRECT REAL",
+                        expanded=True,
+                    ):
+                        st.markdown(artifact["content"])
+                        st.caption(
+                            f"Word count: {artifact['word_count']} | DIRECT real API call | {artifact['source']}"
+                        )
+
+        # SECONDARY PRIORITY: Show ISOLATED real execution results
+        elif (
+            "ISOLATED_REAL_STATUS" in st.session_state
+            or "ISOLATED_REAL_OUTPUTS" in st.session_state
+        ):
+            st.subheader("🔥 ISOLATED REAL EXECUTION RESULTS")
+
+            # Show isolated status
+            if (
+                "ISOLATED_REAL_STATUS" in st.session_state
+                and st.session_state.ISOLATED_REAL_STATUS
+            ):
+                st.markdown("#### 📊 ISOLATED Status Updates")
+                for status in st.session_state.ISOLATED_REAL_STATUS:
+                    st.write(
+                        f"⏰ {status['time']} - {status['message']} | ISOLATED REAL | ID: {status.get('execution_id', 'unknown')}"
+                    )
+
+            # Show isolated outputs
+            if (
+                "ISOLATED_REAL_OUTPUTS" in st.session_state
+                and st.session_state.ISOLATED_REAL_OUTPUTS
+            ):
+                st.markdown("#### 🤖 ISOLATED Agent Outputs")
+                for output in st.session_state.ISOLATED_REAL_OUTPUTS:
+                    with st.expander(
+                        f"📄 {output['agent']} - {output['time']} | ISOLATED REAL",
+                        expanded=True,
+                    ):
+                        st.markdown(output["content"])
+                        st.caption(
+                            f"Word count: {output['word_count']} | ISOLATED real API call | ID: {output.get('execution_id', 'unknown')}"
+                        )
+
+        # Show REAL AI-generated artifacts (not simulation) - Secondary priority
+        elif "real_artifacts" in st.session_state and st.session_state.real_artifacts:
+            st.subheader("📄 AI-Generated Artifacts")
+            for artifact in st.session_state.real_artifacts:
+                if artifact.get("is_real", False):  # Only show real artifacts
+                    with st.expander(
+                        f"📋 {artifact['title']} ({artifact['word_count']} words) | Real API",
+                        expanded=False,
+                    ):
+                        st.markdown(artifact["content"])
+                        st.caption(
+                            f"Generated at {artifact['formatted_time']} via real API call"
+                        )
+
+        # Show real agent outputs if available
+        elif "agent_outputs" in st.session_state and st.session_state.agent_outputs:
+            st.markdown("#### 🤖 Agent Results")
+            for output in st.session_state.agent_outputs:
+                # Only show real agent outputs, not simulation
+                if output.get("is_real", False):
+                    timestamp_str = ""
+                    if "formatted_time" in output:
+                        timestamp_str = f" - {output['formatted_time']}"
+                    elif "timestamp" in output:
+                        timestamp_str = f" - {output['timestamp'].strftime('%H:%M:%S') if hasattr(output['timestamp'], 'strftime') else str(output['timestamp'])}"
+
+                    with st.expander(
+                        f"📄 {output.get('agent', 'Unknown')}{timestamp_str} | Real API",
+                        expanded=False,
+                    ):
+                        st.markdown(output.get("content", "No content available"))
+                        if output.get("word_count"):
+                            st.caption(
+                                f"Word count: {output['word_count']} | Generated via real API call"
+                            )
+
+        # Show completion status
+        if st.session_state.get("execution_phase") == "completed":
+            if "real_execution_result" in st.session_state:
+                result = st.session_state.real_execution_result
+                st.success("🎉 REAL AI Multi-Agent Project Completed Successfully!")
+                st.balloons()
+
+                # Show execution summary
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("AI Agents Used", len(result.get("agents_executed", [])))
+                with col2:
+                    st.metric("Real API Calls", result.get("total_api_calls", 0))
+                with col3:
+                    st.metric("Artifacts Created", len(result.get("artifacts", {})))
+
+                st.info(
+                    f"✨ Real execution completed at {result.get('completion_time', 'unknown')}"
+                )
+            else:
+                st.success("🎉 Multi-Agent Project Completed Successfully!")
+                st.balloons()
+
+            # Show next steps
+            if st.button("📊 View Live Monitoring", type="primary"):
+                st.session_state.configuration_step = 4
+                st.rerun()
+
+        elif st.session_state.get("execution_phase") == "failed":
+            st.error(
+                "❌ Project execution failed. Please check the error messages above and try again."
+            )
+            if st.button("🔄 Retry Real Execution"):
+                st.session_state.execution_phase = "starting"
+                st.session_state.project_status = []
+                st.session_state.agent_outputs = []
+                st.rerun()
@@ -0,0 +1,156 @@
+"""
+Database Infrastructure: storage status and test operations
+"""
+
+import logging
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from ui.app_state import get_database_manager, get_or_create_session_id
+
+logger = logging.getLogger(__name__)
+
+# Seconds the dashboard's table counts may lag behind writes
+DB_STATS_TTL = 30
+
+
+@st.cache_data(ttl=DB_STATS_TTL, show_spinner=False)
+def load_database_stats(_db):
+    """Table counts and agent performance rows, shared across sessions"""
+    return _db.get_database_stats(), _db.get_agent_performance()
+
+
+def render_database_dashboard():
+    """Database status and management dashboard"""
+    st.header("🗄️ Database Infrastructure Dashboard")
+
+    db = get_database_manager()
+    if db is None:
+        st.error("Database manager not available")
+        return
+
+    # Database status overview
+    st.subheader("📊 Database Status")
+
+    try:
+        db_stats, performance_data = load_database_stats(db)
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.metric("Total Artifacts", db_stats.get("artifacts_count", 0))
+        with col2:
+            st.metric("Timeline Events", db_stats.get("timeline_events_count", 0))
+        with col3:
+            st.metric("Project Sessions", db_stats.get("project_sessions_count", 0))
+        with col4:
+            st.metric("Performance Records", db_stats.get("agent_performance_count", 0))
+
+        # Recent artifacts activity
+        st.subheader("📈 Recent Activity")
+        recent_activity = db_stats.get("recent_artifacts", [])
+
+        if recent_activity:
+            for activity in recent_activity:
+                st.markdown(
+                    f"**{activity['date']}**: {activity['count']} artifacts created"
+                )
+        else:
+            st.info("No recent artifact activity")
+
+        # Agent performance metrics
+        st.subheader("🤖 Agent Performance")
+
+        if performance_data:
+            performance_df = pd.DataFrame(performance_data)
+            st.dataframe(performance_df)
+        else:
+            st.info("No agent performance data available")
+
+        # Current session info
+        st.subheader("🆔 Current Session")
+        session_id = get_or_create_session_id()
+        session_info = db.get_project_session(session_id)
+
+        if session_info:
+            col1, col2 = st.columns(2)
+            with col1:
+                st.json(
+                    {
+                        "Session ID": session_info["session_id"][:8] + "...",
+                        "Status": session_info["status"],
+                        "Created": session_info["created_at"],
+                    }
+                )
+            with col2:
+                st.json(
+                    {
+                        "Project Type": session_info["project_type"],
+                        "Complexity": session_info["complexity"],
+                        "Total Artifacts": session_info["total_artifacts"],
+                    }
+                )
+
+        # Test database functionality
+        st.subheader("🧪 Test Database Operations")
+        col1, col2 = st.columns(2)
+
+        with col1:
+            if st.button("➕ Test Create Artifact"):
+                try:
+                    session_id = get_or_create_session_id()
+                    artifact_id = db.save_artifact(
+                        project_id=session_id,
+                        artifact_type="test",
+                        title="Test Artifact",
+                        content="This is a test artifact to verify database functionality.",
+                        agent_name="Test Agent",
+                        quality_score=0.8,
+                    )
+                    st.success(f"Test artifact created with ID: {artifact_id}")
+                    load_database_stats.clear()
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"Test failed: {e}")
+
+        with col2:
+            if st.button("⏰ Test Timeline Event"):
+                try:
+                    session_id = get_or_create_session_id()
+                    event_id = db.save_timeline_event(
+                        session_id=session_id,
+                        timestamp=datetime.now().strftime("%H:%M:%S"),
+                        message="Test timeline event",
+                        agent_name="Test Agent",
+                        event_type="test",
+                    )
+                    st.success(f"Test timeline event created with ID: {event_id}")
+                    load_database_stats.clear()
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"Test failed: {e}")
+
+        # Database actions
+        st.subheader("🔧 Database Actions")
+        col1, col2 = st.columns(2)
+
+        with col1:
+            if st.button("🗑️ Cleanup Old Data"):
+                try:
+                    db.cleanup_old_data(days_to_keep=7)
+                    st.success("Old data cleaned up successfully")
+                    load_database_stats.clear()
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"Cleanup failed: {e}")
+
+        with col2:
+            if st.button("📊 Refresh Stats"):
+                load_database_stats.clear()
+                st.rerun()
+
+    except Exception as e:
+        st.error(f"Database dashboard error: {e}")
+        logger.error(f"Database dashboard error: {e}")
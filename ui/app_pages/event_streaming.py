@@ -0,0 +1,244 @@
+"""
+Event Streaming: publish and inspect artifacts on the event bus
+"""
+
+import requests
+import streamlit as st
+
+from schemas.artifacts import ArtifactType
+from ui.app_state import API_BASE
+
+
+def render_event_streaming_dashboard():
+    """Real-time event streaming dashboard with Redis Streams"""
+
+    st.header("🌊 Real-Time Event Streaming Dashboard")
+    st.markdown("**Production-grade event-sourced orchestration with Redis Streams**")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.subheader("📡 Event Stream Control")
+
+        if st.session_state.api_connected:
+            st.success("FastAPI Backend Connected")
+
+            # Start workflow controls
+            st.markdown("### Start New Workflow")
+            workflow_name = st.text_input(
+                "Workflow Name", value="E-commerce API Development"
+            )
+
+            if st.button("🚀 Start Real-Time Workflow"):
+                try:
+                    # Create task data
+                    tasks = [
+                        {
+                            "task_id": "spec_generation",
+                            "title": "Generate API Specification",
+                            "goal": "Create comprehensive API spec",
+                            "description": "Generate detailed API specification with endpoints and schemas",
+                        },
+                        {
+                            "task_id": "design_architecture",
+                            "title": "Design System Architecture",
+                            "goal": "Create system design",
+                            "description": "Design scalable architecture with microservices",
+                        },
+                    ]
+
+                    # Start workflow via API
+                    response = requests.post(
+                        f"{API_BASE}/api/workflows/start",
+                        json={"tasks": tasks, "workflow_name": workflow_name},
+                    )
+
+                    if response.status_code == 200:
+                        data = response.json()
+                        st.success(
+                            f"Workflow started! Correlation ID: {data['correlation_id']}"
+                        )
+                        st.session_state.current_correlation_id = data["correlation_id"]
+                    else:
+                        st.error(f"Failed to start workflow: {response.text}")
+
+                except Exception as e:
+                    st.error(f"Error starting workflow: {e}")
+
+            # Artifact creation
+            st.markdown("### Create Artifact")
+            artifact_type = st.selectbox(
+                "Artifact Type", [at.value for at in ArtifactType]
+            )
+            agent_id = st.selectbox(
+                "Creating Agent", ["claude_agent", "gpt4_agent", "gemini_agent"]
+            )
+
+            if st.button("📄 Create Real-Time Artifact"):
+                try:
+                    correlation_id = st.session_state.get(
+                        "current_correlation_id", "demo_correlation"
+                    )
+
+                    # Create artifact via API
+                    artifact_content = {
+                        "title": f"Real-time {artifact_type}",
+                        "confidence": 0.9,
+                        "content": f"Generated {artifact_type} with real-time event streaming",
+                    }
+
+                    response = requests.post(
+                        f"{API_BASE}/api/artifacts/create",
+                        json={
+                            "artifact_type": artifact_type,
+                            "content": artifact_content,
+                            "agent_id": agent_id,
+                            "correlation_id": correlation_id,
+                        },
+                    )
+
+                    if response.status_code == 200:
+                        data = response.json()
+                        st.success(f"Artifact created: {data['artifact_id']}")
+                        st.json(data)
+                    else:
+                        st.error(f"Failed to create artifact: {response.text}")
+
+                except Exception as e:
+                    st.error(f"Error creating artifact: {e}")
+
+        else:
+            st.error("FastAPI Backend Not Available")
+            st.markdown("""
+            To enable real-time features:
+            1. Start the FastAPI server: `python api_server.py`
+            2. Optionally start Redis for full event streaming
+            3. Refresh this page
+            """)
+
+    with col2:
+        st.subheader("📊 Real-Time Statistics")
+
+        if st.button("🔄 Refresh Stats"):
+            if st.session_state.api_connected:
+                try:
+                    response = requests.get(f"{API_BASE}/api/stats/real-time")
+                    if response.status_code == 200:
+                        stats = response.json()
+                        st.json(stats)
+                    else:
+                        st.error("Failed to get stats")
+                except Exception as e:
+                    st.error(f"Stats error: {e}")
+            else:
+                # Show mock stats
+                mock_stats = {
+                    "workflow_id": "mock_workflow",
+                    "mock_mode": True,
+                    "message": "Start FastAPI server for real-time stats",
+                }
+                st.json(mock_stats)
+
+        # Event stream display
+        st.subheader("🌊 Live Event Stream")
+
+        if st.session_state.get("current_correlation_id"):
+            correlation_id = st.session_state.current_correlation_id
+
+            if st.button("📜 Get Workflow Events"):
+                try:
+                    response = requests.get(
+                        f"{API_BASE}/api/workflows/{correlation_id}/events"
+                    )
+                    if response.status_code == 200:
+                        data = response.json()
+                        st.markdown(f"**Events for {correlation_id}:**")
+
+                        for event in data.get("events", []):
+                            with st.expander(
+                                f"{event['event_type']} - {event['timestamp'][:19]}"
+                            ):
+                                st.json(event)
+                    else:
+                        st.error("Failed to get events")
+                except Exception as e:
+                    st.error(f"Events error: {e}")
+        else:
+            st.info("Start a workflow to see live events")
+
+    # Event replay section
+    st.subheader("🔄 Event Replay & Time Travel")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.markdown("### Event Replay Controls")
+        replay_correlation = st.text_input(
+            "Correlation ID for Replay",
+            value=st.session_state.get("current_correlation_id", ""),
+        )
+
+        if st.button("🎬 Replay Events"):
+            if replay_correlation and st.session_state.api_connected:
+                try:
+                    response = requests.get(
+                        f"{API_BASE}/api/workflows/{replay_correlation}/events"
+                    )
+                    if response.status_code == 200:
+                        data = response.json()
+                        st.success(f"Found {data['count']} events for replay")
+
+                        # Display events chronologically
+                        st.markdown("### Event Timeline")
+                        for i, event in enumerate(data.get("events", [])):
+                            st.markdown(
+                                f"**{i + 1}.** {event['event_type']} at {event['timestamp'][:19]}"
+                            )
+                            if event.get("agent_id"):
+                                st.markdown(f"   👤 Agent: {event['agent_id']}")
+                            if event.get("payload"):
+                                with st.expander("View Event Data"):
+                                    st.json(event["payload"])
+                except Exception as e:
+                    st.error(f"Replay error: {e}")
+
+    with col2:
+        st.markdown("### Real-Time Collaboration Feed")
+
+        if st.session_state.real_time_orchestrator:
+            st.info("Event streaming system ready")
+
+            # Simulate some real-time events for demo
+            if st.button("🎭 Simulate Agent Activity"):
+                # Add mock events to session state
+                mock_events = [
+                    {
+                        "type": "agent_started",
+                        "agent": "claude_agent",
+                        "task": "spec_generation",
+                    },
+                    {
+                        "type": "artifact_created",
+                        "agent": "claude_agent",
+                        "artifact": "spec_doc_001",
+                    },
+                    {
+                        "type": "review_requested",
+                        "artifact": "spec_doc_001",
+                        "reviewer": "gpt4_agent",
+                    },
+                    {
+                        "type": "agent_started",
+                        "agent": "gpt4_agent",
+                        "task": "design_architecture",
+                    },
+                ]
+
+                st.session_state.event_stream.extend(mock_events)
+
+                for event in mock_events:
+                    st.markdown(
+                        f"🔄 **{event['type']}** - {event.get('agent', 'system')}"
+                    )
+        else:
+            st.warning("Event streaming not initialized")
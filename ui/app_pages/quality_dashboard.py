@@ -0,0 +1,16 @@
+"""
+Quality Dashboard: cascade, consensus and learning metrics
+"""
+
+from monitoring.quality_dashboard import quality_monitoring_dashboard
+from ui.app_state import get_service
+
+
+def render_quality_dashboard():
+    """Quality dashboard over the app's shared quality and learning services"""
+    quality_monitoring_dashboard(
+        quality_cascade=get_service("quality_cascade"),
+        consensus_validator=get_service("consensus_validator"),
+        continuous_learner=get_service("continuous_learner"),
+        performance_store=get_service("performance_store"),
+    )
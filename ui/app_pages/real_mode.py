@@ -0,0 +1,149 @@
+"""
+Real Mode: run the live AI pipeline through the API
+"""
+
+import asyncio
+
+import httpx
+import streamlit as st
+
+from ui.app_state import API_BASE
+
+
+def render_real_mode():
+    """Real Mode Interface with Live AI Models"""
+    st.title("CodeCompanion — Real Mode")
+    st.markdown("**Direct AI Model Pipeline (No Redis Required)**")
+
+    from settings import settings
+
+    models = settings.get_available_models()
+
+    st.subheader("📋 Available Models")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.write(f"Claude: {'✅' if models['claude'] else '❌'}")
+    with col2:
+        st.write(f"GPT-4: {'✅' if models['gpt4'] else '❌'}")
+    with col3:
+        st.write(f"Gemini: {'✅' if models['gemini'] else '❌'}")
+
+    objective = st.text_input(
+        "Objective", placeholder="e.g., Add Google OAuth to Flask app"
+    )
+
+    if st.button("🚀 Run Real Agents", type="primary"):
+        if not objective.strip():
+            st.warning("Please enter an objective.")
+        else:
+            with st.spinner("Calling real AI models..."):
+
+                async def go(obj):
+                    async with httpx.AsyncClient(timeout=90) as client:
+                        r = await client.post(
+                            f"{API_BASE}/run_real", json={"objective": obj}
+                        )
+                        try:
+                            js = r.json()
+                        except Exception:
+                            js = {
+                                "error": f"Non-JSON response: {r.text[:500]}",
+                                "status": r.status_code,
+                            }
+                        return r.status_code, js
+
+                try:
+                    status, data = asyncio.run(go(objective.strip()))
+
+                    if status != 200 or "error" in data:
+                        st.error("Real API failed")
+                        st.code(data, language="json")
+                        st.stop()
+
+                    if "artifacts" in data:
+                        st.success("✅ Real AI Pipeline Complete!")
+
+                        # Show save completion with run_id
+                        if "run_id" in data:
+                            st.info(f"💾 Save complete - Run ID: {data['run_id']}")
+
+                        st.subheader("📊 Generated Artifacts")
+                        for i, artifact in enumerate(data["artifacts"]):
+                            with st.expander(
+                                f"{artifact['type']} — {artifact['agent']} (confidence {artifact['confidence']:.2f})"
+                            ):
+                                st.code(artifact["content"], language="markdown")
+
+                        # Show model usage details
+                        if data.get("usage"):
+                            st.subheader("📊 Model Usage Details")
+                            usage_data = data["usage"]
+
+                            # Display usage metrics in a table format
+                            usage_rows = []
+                            for call_name, metrics in usage_data.items():
+                                if isinstance(metrics, dict):
+                                    row = {
+                                        "Call": call_name,
+                                        "Status": metrics.get("status", "N/A"),
+                                        "Latency (ms)": metrics.get(
+                                            "latency_ms", "N/A"
+                                        ),
+                                    }
+                                    # Add token usage if available
+                                    if "usage" in metrics:
+                                        token_usage = metrics["usage"]
+                                        if isinstance(token_usage, dict):
+                                            row["Input Tokens"] = token_usage.get(
+                                                "input_tokens",
+                                                token_usage.get("prompt_tokens", "N/A"),
+                                            )
+                                            row["Output Tokens"] = token_usage.get(
+                                                "output_tokens",
+                                                token_usage.get(
+                                                    "completion_tokens", "N/A"
+                                                ),
+                                            )
+                                            row["Total Tokens"] = token_usage.get(
+                                                "total_tokens", "N/A"
+                                            )
+
+                                    # Add rate limiting info if available
+                                    if "rate_remaining" in metrics:
+                                        row["Rate Remaining"] = metrics[
+                                            "rate_remaining"
+                                        ]
+
+                                    usage_rows.append(row)
+
+                            if usage_rows:
+                                import pandas as pd
+
+                                df = pd.DataFrame(usage_rows)
+                                st.dataframe(df, use_container_width=True)
+                            else:
+                                st.info("No detailed usage metrics available")
+
+                        # Show general model availability
+                        st.subheader("🤖 Model Availability")
+                        st.json(data["models"])
+                    else:
+                        st.error(f"Error: {data}")
+
+                except Exception as e:
+                    st.error(f"API call failed: {e}")
+                    st.stop()
+
+    # Add History section
+    from storage.runs import init, load_runs, load_artifacts
+
+    init()
+    with st.expander("📜 History (last 20)"):
+        rows = load_runs(20)
+        for rid, obj, ts in rows:
+            if st.button(f"Open {rid} — {obj} ({ts})", key=f"open_{rid}"):
+                arts = load_artifacts(rid)
+                st.markdown(f"### Run {rid} — {obj}")
+                for k, a, c, txt in arts:
+                    st.markdown(f"**{k}** — _{a}_ (conf {c:.2f})")
+                    st.code(txt)
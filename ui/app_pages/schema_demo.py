@@ -0,0 +1,120 @@
+"""
+Schema Demonstration: browse the artifact and routing schemas
+"""
+
+import streamlit as st
+
+from schemas.artifacts import ArtifactType
+from schemas.routing import MODEL_CAPABILITIES
+from core.artifacts import ArtifactValidator
+
+
+def render_schema_demo():
+    """Demonstrate the comprehensive schema system"""
+
+    st.header("📋 Schema System Demonstration")
+    st.markdown("Explore the complete JSON Schema framework with Pydantic validation")
+
+    # Schema type selector
+    schema_type = st.selectbox(
+        "Select Schema Type to Explore:",
+        options=[
+            "Artifacts",
+            "Task Ledgers",
+            "Progress Tracking",
+            "Model Routing",
+            "Agent I/O Contracts",
+        ],
+    )
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.subheader("📝 Schema Structure")
+
+        if schema_type == "Artifacts":
+            st.markdown("### Available Artifact Types")
+            for artifact_type in ArtifactType:
+                st.markdown(
+                    f"- **{artifact_type.value}**: {get_artifact_description(artifact_type)}"
+                )
+
+            # Show example artifact
+            st.markdown("### Example: SpecDoc Schema")
+            example_spec = st.session_state.demo_data["artifacts"]["spec_doc"]
+            st.json(example_spec.model_dump())
+
+        elif schema_type == "Task Ledgers":
+            st.markdown("### Task Ledger Components")
+            st.markdown("""
+            - **Goal & Description**: Clear objective definition
+            - **Acceptance Tests**: Automated validation criteria
+            - **Risk Management**: Identified risks and mitigation strategies
+            - **Dependencies**: Task and artifact dependencies
+            - **Progress Tracking**: Real-time completion status
+            """)
+
+            example_task = st.session_state.demo_data["task"]
+            st.json(example_task.model_dump())
+
+        elif schema_type == "Model Routing":
+            st.markdown("### Routing Decision Framework")
+            st.markdown("""
+            - **Capability Vectors**: Model performance across task types
+            - **Multi-objective Optimization**: Quality, cost, latency balance
+            - **Load Balancing**: Dynamic resource allocation
+            - **Failure Recovery**: Automatic fallback strategies
+            """)
+
+            # Show model capabilities
+            for model_capability in MODEL_CAPABILITIES[:2]:
+                st.markdown(f"**{model_capability.display_name}**")
+                st.json(model_capability.model_dump())
+                break
+
+    with col2:
+        st.subheader("✅ Validation & Quality")
+
+        # Artifact validation demonstration
+        if st.button("Validate Demo Artifacts"):
+            validator = ArtifactValidator()
+
+            for artifact_name, artifact in st.session_state.demo_data[
+                "artifacts"
+            ].items():
+                validation_result = validator.validate_artifact(artifact.dict())
+
+                status = "✅ Valid" if validation_result.is_valid else "❌ Invalid"
+                st.markdown(f"**{artifact_name}**: {status}")
+                st.markdown(f"- Quality Score: {validation_result.quality_score:.2f}")
+                st.markdown(
+                    f"- Completeness: {validation_result.completeness_score:.2f}"
+                )
+
+                if validation_result.validation_errors:
+                    st.error("Validation Errors:")
+                    for error in validation_result.validation_errors:
+                        st.markdown(f"  - {error}")
+
+                if validation_result.validation_warnings:
+                    st.warning("Warnings:")
+                    for warning in validation_result.validation_warnings:
+                        st.markdown(f"  - {warning}")
+
+        # Schema statistics
+        st.subheader("📊 Schema Statistics")
+        stats = st.session_state.artifact_handler.get_artifact_stats()
+        st.json(stats)
+
+
+def get_artifact_description(artifact_type: ArtifactType) -> str:
+    """Get description for artifact type"""
+    descriptions = {
+        ArtifactType.SPEC_DOC: "Requirements and specifications document",
+        ArtifactType.DESIGN_DOC: "Architecture and design decisions",
+        ArtifactType.CODE_PATCH: "Code changes with unified diff format",
+        ArtifactType.TEST_PLAN: "Testing strategies and test cases",
+        ArtifactType.EVAL_REPORT: "Quality assessment and metrics",
+        ArtifactType.RUNBOOK: "Operational procedures and documentation",
+    }
+    return descriptions.get(artifact_type, "Unknown artifact type")
@@ -0,0 +1,168 @@
+"""
+Task & Artifact Management: the demo task ledger
+"""
+
+from datetime import datetime
+from typing import Any, Dict
+
+import streamlit as st
+
+from schemas.artifacts import ArtifactType
+from schemas.ledgers import WorkItem, TaskStatus, Priority
+
+
+def render_task_management():
+    """Task and artifact management interface"""
+
+    st.header("🎯 Task & Artifact Management")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.subheader("📋 Current Tasks")
+
+        # Display demo task
+        demo_task = st.session_state.demo_data["task"]
+
+        with st.expander(f"Task: {demo_task.title}", expanded=True):
+            st.markdown(f"**Goal**: {demo_task.goal}")
+            st.markdown(f"**Status**: {demo_task.status.value}")
+            st.markdown(f"**Priority**: {demo_task.priority.value}")
+
+            # Progress calculation
+            progress = demo_task.calculate_progress()
+            st.progress(progress / 100)
+            st.caption(f"Progress: {progress:.1f}%")
+
+            # Acceptance tests
+            st.markdown("**Acceptance Tests:**")
+            for test in demo_task.acceptance_tests:
+                st.markdown(f"- {test['description']}")
+
+            # Risks
+            if demo_task.risks:
+                st.markdown("**Identified Risks:**")
+                for risk in demo_task.risks:
+                    risk_level = "🔴" if risk["impact"] == "high" else "🟡"
+                    st.markdown(
+                        f"{risk_level} {risk['description']} (P: {risk['probability']})"
+                    )
+
+        # Work item management
+        st.subheader("📝 Work Items")
+        if st.button("Add Work Item"):
+            from datetime import datetime
+
+            new_item = WorkItem(
+                item_id=f"item_{len(demo_task.work_items) + 1:03d}",
+                title=f"Implementation Task {len(demo_task.work_items) + 1}",
+                description="New work item created",
+                status=TaskStatus.PENDING,
+                priority=Priority.MEDIUM,
+                assigned_agent="demo_agent",
+                estimated_effort=60,  # minutes
+                actual_effort=0,
+                started_at=datetime.now(),
+                completed_at=None,
+            )
+            demo_task.work_items.append(new_item)
+            st.rerun()
+
+        for item in demo_task.work_items:
+            status_emoji = {
+                "pending": "⏳",
+                "in_progress": "🔄",
+                "completed": "✅",
+                "failed": "❌",
+            }.get(item.status.value, "❓")
+            st.markdown(f"{status_emoji} **{item.title}** ({item.status.value})")
+
+    with col2:
+        st.subheader("📄 Artifact Repository")
+
+        # Artifact creation
+        artifact_type = st.selectbox(
+            "Create New Artifact:", options=[at.value for at in ArtifactType]
+        )
+
+        if st.button("Generate Artifact Template"):
+            template = create_artifact_template(ArtifactType(artifact_type))
+            st.json(template)
+
+            if st.button("Store Artifact"):
+                validation_result = st.session_state.artifact_handler.store_artifact(
+                    template
+                )
+                if validation_result.is_valid:
+                    st.success(
+                        f"Artifact stored successfully! Quality: {validation_result.quality_score:.2f}"
+                    )
+                else:
+                    st.error(
+                        f"Validation failed: {validation_result.validation_errors}"
+                    )
+
+        # Display stored artifacts
+        st.subheader("📦 Stored Artifacts")
+        for artifact_name, artifact in st.session_state.demo_data["artifacts"].items():
+            with st.expander(f"{artifact.artifact_type}: {artifact.artifact_id}"):
+                st.markdown(f"**Created by**: {artifact.created_by}")
+                st.markdown(f"**Confidence**: {artifact.confidence:.2f}")
+                st.markdown(f"**Version**: {artifact.version}")
+
+                if st.button(f"View {artifact_name}", key=f"view_{artifact_name}"):
+                    st.json(artifact.model_dump())
+
+
+def create_artifact_template(artifact_type: ArtifactType) -> Dict[str, Any]:
+    """Create template for artifact type"""
+
+    base_template = {
+        "artifact_id": f"template_{artifact_type.value}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+        "artifact_type": artifact_type.value,
+        "created_by": "template_generator",
+        "version": "1.0.0",
+        "created_at": datetime.now().isoformat(),
+        "confidence": 0.8,
+        "dependencies": [],
+        "tags": ["template", "generated"],
+    }
+
+    if artifact_type == ArtifactType.SPEC_DOC:
+        base_template.update(
+            {
+                "title": "Template Specification",
+                "objective": "Template objective",
+                "requirements": [
+                    {
+                        "id": "REQ_001",
+                        "description": "Template requirement",
+                        "priority": "medium",
+                    }
+                ],
+                "acceptance_criteria": ["Template acceptance criteria"],
+                "assumptions": ["Template assumptions"],
+                "constraints": ["Template constraints"],
+            }
+        )
+
+    elif artifact_type == ArtifactType.CODE_PATCH:
+        base_template.update(
+            {
+                "title": "Template Code Patch",
+                "description": "Template code changes",
+                "files_changed": [
+                    {
+                        "path": "example.py",
+                        "action": "modified",
+                        "lines_added": 10,
+                        "lines_removed": 5,
+                    }
+                ],
+                "diff_unified": "--- a/example.py\n+++ b/example.py\n@@ -1,3 +1,4 @@\n # Example file\n+# Added comment\n def main():\n     pass",
+                "language": "python",
+                "test_instructions": ["Run template tests"],
+            }
+        )
+
+    return base_template
@@ -0,0 +1,539 @@
+"""
+Shared state for the Streamlit app
+
+Process-wide services (database, event bus, routers, quality and learning
+components) are created once per server process with st.cache_resource and
+shared by every session and rerun. Per-session objects live in
+st.session_state, and slow-changing derived data goes through st.cache_data
+with an explicit TTL. Pages import what they need from here.
+"""
+
+import asyncio
+import importlib
+import logging
+import os
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+import httpx
+import streamlit as st
+
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Ensure the UI calls the correct base URL:
+API_BASE = "http://0.0.0.0:5050"
+
+# Seconds between API health/key checks shown in the sidebar
+API_STATUS_TTL = 15
+
+# Demo artifacts are static; each session gets its own copy of the cached build
+DEMO_DATA_TTL = 3600
+
+# name -> (module, class, constructor args), created on first use
+SERVICES = {
+    "router": ("core.router", "DataDrivenRouter", ()),
+    "intelligent_router": ("core.model_router", "IntelligentRouter", ()),
+    "event_orchestrator": (
+        "core.event_streaming",
+        "RealTimeEventOrchestrator",
+        ("streamlit_workflow",),
+    ),
+    "quality_cascade": ("core.quality_cascade", "QualityCascade", ()),
+    "consensus_validator": ("core.consensus_validator", "ConsensusValidator", ()),
+    "continuous_learner": ("core.learning_engine", "ContinuousLearner", ()),
+    "performance_store": ("storage.performance_store", "PerformanceStore", ()),
+}
+
+
+@st.cache_resource(show_spinner=False)
+def start_services():
+    """Embed the API and log the startup configuration, once per process
+
+    Raises RuntimeError if the critical configuration is invalid; the
+    failure is not cached, so a fixed configuration is picked up on rerun.
+    """
+    from server_launcher import start_api_once
+    from startup_logs import log_system_startup, validate_critical_config
+    from startup_logs_strict import log_startup_configuration
+
+    # Guard API embedding for production vs development
+    if os.getenv("CC_EMBED_API", "true").lower() == "true":
+        start_api_once()
+
+    log_startup_configuration()
+    logging.basicConfig(level=getattr(logging, settings.LOG_LEVEL))
+    validate_critical_config()
+    log_system_startup()
+
+
+@st.cache_resource(show_spinner=False)
+def get_service(name: str):
+    """Process-wide instance of one of SERVICES"""
+    module, class_name, args = SERVICES[name]
+    return getattr(importlib.import_module(module), class_name)(*args)
+
+
+def get_intelligent_router():
+    """Shared IntelligentRouter, or None if it cannot be initialized"""
+    try:
+        return get_service("intelligent_router")
+    except Exception as e:
+        logger.warning(f"Could not initialize intelligent router: {e}")
+        return None
+
+
+# health ping in sidebar
+async def _ping():
+    try:
+        async with httpx.AsyncClient(timeout=2.0) as c:
+            r = await c.get(f"{API_BASE}/health")
+            return r.status_code == 200
+    except Exception:
+        return False
+
+
+async def _keys():
+    try:
+        async with httpx.AsyncClient(timeout=2.0) as c:
+            r = await c.get(f"{API_BASE}/keys")
+            return r.json()
+    except Exception:
+        return {}
+
+
+@st.cache_data(ttl=API_STATUS_TTL, show_spinner=False)
+def api_status() -> Tuple[bool, Dict[str, Any]]:
+    """(API healthy, configured provider keys), checked concurrently"""
+
+    async def check():
+        return await asyncio.gather(_ping(), _keys())
+
+    try:
+        api_ok, keys_data = asyncio.run(check())
+    except Exception:
+        return False, {}
+    return api_ok, keys_data
+
+
+# Initialize database and event bus with strict configuration
+@st.cache_resource
+def get_database_manager():
+    """Initialize database manager with strict configuration"""
+    from database.setup import initialize_database
+    from storage.database_manager import DatabaseManager
+
+    try:
+        database_url = settings.get_database_url()
+        initialize_database()
+        db_manager = DatabaseManager()
+        logger.info(f"✅ Database initialized: {settings.scrub_url(database_url)}")
+        return db_manager
+    except Exception as e:
+        logger.error(f"❌ Database initialization failed: {e}")
+        st.error(f"Database initialization failed: {e}")
+        return None
+
+
+@st.cache_resource
+def initialize_production_bus():
+    """Initialize production bus with fail-fast configuration"""
+    try:
+        from bus import bus
+
+        logger.info(f"✅ Production bus initialized: {type(bus).__name__}")
+        return bus
+
+    except RuntimeError as e:
+        # Redis configured but unreachable - FAIL FAST
+        logger.error(f"❌ Production bus initialization failed: {e}")
+        st.error(f"System initialization failed: {e}")
+        st.stop()
+
+    except Exception as e:
+        logger.error(f"❌ Unexpected error during bus init: {e}")
+        st.error(f"System initialization error: {e}")
+        st.stop()
+
+
+# Safe database access helper - prevents None attribute errors on db
+def get_safe_db():
+    """Returns db if available, otherwise shows error and returns None"""
+    db = get_database_manager()
+    if db is None:
+        st.error("Database unavailable - please check configuration")
+    return db
+
+
+def get_or_create_session_id():
+    """Get or create a unique session ID for database operations"""
+    db = get_database_manager()
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = str(uuid.uuid4())
+
+        # Create project session in database
+        if db is not None:
+            try:
+                project_description = st.session_state.get(
+                    "project_description", "Multi-Agent AI System"
+                )
+                project_type = st.session_state.get("project_type", "AI Development")
+                complexity = st.session_state.get("project_complexity", "Medium")
+
+                db.create_project_session(
+                    session_id=st.session_state.session_id,
+                    project_description=project_description,
+                    project_type=project_type,
+                    complexity=complexity,
+                )
+                logger.info(f"Created database session: {st.session_state.session_id}")
+            except Exception as e:
+                logger.warning(f"Failed to create database session: {e}")
+
+    return st.session_state.session_id
+
+
+def update_status(message):
+    """Update project status with real timestamp - connects to live UI display and database"""
+    db = get_database_manager()
+    # CRITICAL DEBUG: Log all status updates
+    logger.info(f"📢 update_status called with message: {message}")
+
+    if "project_status" not in st.session_state:
+        st.session_state.project_status = []
+        logger.info("📊 Created new project_status array")
+
+    # Clear simulation data and use ONLY real timestamps
+    real_timestamp = datetime.now()
+    current_time = real_timestamp.strftime("%H:%M:%S")
+
+    logger.info(f"⏰ Using REAL timestamp: {current_time}")
+
+    # ONLY add REAL events - NO simulation data
+    status_entry = {
+        "time": current_time,
+        "message": message,
+        "real_timestamp": real_timestamp,
+        "is_real": True,  # Flag to distinguish from simulation
+        "debug_source": "update_status_function",
+        "execution_source": st.session_state.get("execution_source", "unknown"),
+    }
+
+    st.session_state.project_status.append(status_entry)
+
+    logger.info(
+        f"✅ Status added - Total status events: {len(st.session_state.project_status)}"
+    )
+    logger.info(f"🔍 Latest status entry: {status_entry}")
+
+    # Save to database if available
+    if db is not None:
+        try:
+            session_id = get_or_create_session_id()
+            db.save_timeline_event(
+                session_id=session_id,
+                timestamp=current_time,
+                message=message,
+                event_type="status_update",
+            )
+            logger.info("💾 Status saved to database")
+        except Exception as e:
+            logger.warning(f"Failed to save status to database: {e}")
+
+    # Force immediate UI update for real-time display
+    try:
+        st.rerun()
+    except:
+        pass  # Handle case where rerun is called too frequently
+
+
+def add_agent_output(agent_name, content):
+    """Add real agent output from API calls to live display and database"""
+    db = get_database_manager()
+    # CRITICAL DEBUG: Log all agent outputs
+    logger.info(
+        f"🤖 add_agent_output called - Agent: {agent_name}, Content length: {len(str(content))}"
+    )
+
+    if "agent_outputs" not in st.session_state:
+        st.session_state.agent_outputs = []
+        logger.info("📊 Created new agent_outputs array")
+
+    if content and len(str(content).strip()) > 0:  # Only add non-empty REAL outputs
+        real_timestamp = datetime.now()
+        content_str = str(content)
+        word_count = len(content_str.split())
+        current_time = real_timestamp.strftime("%H:%M:%S")
+
+        logger.info(f"⏰ Adding agent output with REAL timestamp: {current_time}")
+        logger.info(f"📝 Content preview: {content_str[:100]}...")
+
+        # ONLY add REAL agent outputs - NO simulation data
+        output_entry = {
+            "agent": agent_name,
+            "content": content_str,
+            "timestamp": real_timestamp,
+            "formatted_time": current_time,
+            "word_count": word_count,
+            "is_real": True,  # Flag to distinguish from simulation
+            "api_generated": True,  # Confirm this is from actual API call
+            "debug_source": "add_agent_output_function",
+            "execution_source": st.session_state.get("execution_source", "unknown"),
+        }
+
+        st.session_state.agent_outputs.append(output_entry)
+
+        logger.info(
+            f"✅ Agent output added - Total outputs: {len(st.session_state.agent_outputs)}"
+        )
+
+        # Save to database if available
+        if db is not None:
+            try:
+                session_id = get_or_create_session_id()
+                # Calculate quality score (simple heuristic based on content length and structure)
+                quality_score = min(0.9, max(0.3, word_count / 500))
+
+                # Save artifact to database
+                artifact_id = db.save_artifact(
+                    project_id=session_id,
+                    artifact_type="agent_output",
+                    title=f"{agent_name} Output",
+                    content=content_str,
+                    agent_name=agent_name,
+                    quality_score=quality_score,
+                )
+
+                logger.info(f"💾 Artifact saved to database with ID: {artifact_id}")
+
+                # Update agent performance
+                db.update_agent_performance(
+                    model_name=agent_name,
+                    task_type="content_generation",
+                    success=True,
+                    quality_score=quality_score,
+                )
+
+                # Save timeline event
+                db.save_timeline_event(
+                    session_id=session_id,
+                    timestamp=real_timestamp.strftime("%H:%M:%S"),
+                    message=f"{agent_name} generated artifact (ID: {artifact_id})",
+                    agent_name=agent_name,
+                    event_type="artifact_created",
+                )
+
+            except Exception as e:
+                logger.warning(f"Failed to save agent output to database: {e}")
+
+        # Update total artifacts counter for live display
+        if "total_artifacts" not in st.session_state:
+            st.session_state.total_artifacts = 0
+        st.session_state.total_artifacts += 1
+
+
+def check_api_connection() -> bool:
+    """Check if OpenAI API key is available"""
+    try:
+        # Check if OpenAI API key is available
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            return False
+
+        # Basic validation - should start with 'sk-' and be reasonable length
+        if api_key.startswith("sk-") and len(api_key) > 20:
+            return True
+
+        return False
+    except Exception as e:
+        logger.error(f"API connection check failed: {e}")
+        return False
+
+
+def init_session_state():
+    """Initialize per-session state
+
+    Shared services come from get_service() when a page needs them; only
+    objects that hold this session's work are created here.
+    """
+
+    if "orchestrator" not in st.session_state:
+        from core.orchestrator import EventSourcedOrchestrator
+
+        st.session_state.orchestrator = EventSourcedOrchestrator("workflow_001")
+
+    if "artifact_handler" not in st.session_state:
+        from core.artifacts import ArtifactHandler
+
+        st.session_state.artifact_handler = ArtifactHandler()
+
+    if "active_workflow" not in st.session_state:
+        st.session_state.active_workflow = None
+
+    if "demo_data" not in st.session_state:
+        st.session_state.demo_data = create_demo_data()
+
+    if "real_time_orchestrator" not in st.session_state:
+        try:
+            st.session_state.real_time_orchestrator = get_service("event_orchestrator")
+        except Exception:
+            st.session_state.real_time_orchestrator = None
+
+    if "api_connected" not in st.session_state:
+        st.session_state.api_connected = check_api_connection()
+
+    if "event_stream" not in st.session_state:
+        st.session_state.event_stream = []
+
+    # Project configuration session state
+    if "project_configured" not in st.session_state:
+        st.session_state.project_configured = False
+
+    if "project_description" not in st.session_state:
+        st.session_state.project_description = "Build a RESTful API for a task management system with user authentication, task CRUD operations, and real-time notifications."
+
+    if "project_type" not in st.session_state:
+        st.session_state.project_type = "api"
+
+    if "complexity_level" not in st.session_state:
+        st.session_state.complexity_level = "Medium"
+
+    if "configuration_step" not in st.session_state:
+        st.session_state.configuration_step = (
+            1  # 1: Configure, 2: Review, 3: Launch, 4: Monitor
+        )
+
+    if "active_live_project" not in st.session_state:
+        st.session_state.active_live_project = None
+
+
+@st.cache_data(ttl=DEMO_DATA_TTL, show_spinner=False)
+def create_demo_data() -> Dict[str, Any]:
+    """Create demonstration data showing the schema system"""
+
+    from schemas.artifacts import ArtifactType, DesignDoc, SpecDoc
+    from schemas.ledgers import TaskLedger
+    from schemas.routing import TaskComplexity
+
+    # Example task ledger with all required parameters
+    from datetime import datetime
+
+    task = TaskLedger(
+        task_id="task_api_development",
+        title="Build E-commerce API",
+        goal="Create comprehensive REST API for e-commerce platform",
+        description="Build scalable API with product catalog, user management, and order processing",
+        acceptance_tests=[
+            {
+                "test_id": "test_001",
+                "description": "All endpoints respond with proper HTTP status codes",
+                "criteria": "200 for successful requests, 404 for not found, 500 for server errors",
+            },
+            {
+                "test_id": "test_002",
+                "description": "API documentation is auto-generated and complete",
+                "criteria": "OpenAPI 3.0 spec covers all endpoints with examples",
+            },
+        ],
+        success_criteria=[
+            "All tests pass with 95% coverage",
+            "API responds within 200ms for 95th percentile",
+            "Comprehensive documentation available",
+        ],
+        assumptions=[
+            "PostgreSQL database is available",
+            "Redis for caching is configured",
+            "Authentication service is external",
+        ],
+        risks=[
+            {
+                "risk_id": "risk_001",
+                "description": "Database performance issues with large product catalogs",
+                "probability": 0.3,
+                "impact": "high",
+            }
+        ],
+        expected_artifacts=[
+            ArtifactType.SPEC_DOC,
+            ArtifactType.DESIGN_DOC,
+            ArtifactType.CODE_PATCH,
+        ],
+        estimated_duration=120,  # minutes
+        actual_duration=0,
+        started_at=datetime.now(),
+        completed_at=None,
+    )
+
+    # Example artifacts
+    spec_doc = SpecDoc(
+        artifact_id="spec_ecommerce_api",
+        created_by="claude_agent",
+        title="E-commerce API Specification",
+        objective="Define comprehensive API for e-commerce platform",
+        requirements=[
+            {
+                "id": "REQ_001",
+                "description": "Product catalog management with CRUD operations",
+                "priority": "high",
+                "category": "functional",
+            },
+            {
+                "id": "REQ_002",
+                "description": "User authentication and authorization",
+                "priority": "high",
+                "category": "security",
+            },
+        ],
+        acceptance_criteria=[
+            "All endpoints documented with OpenAPI spec",
+            "Rate limiting implemented (1000 requests/hour per user)",
+            "Input validation on all endpoints",
+        ],
+    )
+
+    design_doc = DesignDoc(
+        artifact_id="design_ecommerce_api",
+        created_by="gpt4_agent",
+        dependencies=["spec_ecommerce_api"],
+        title="E-commerce API Architecture",
+        overview="Microservices architecture with API Gateway and event-driven updates",
+        components=[
+            {
+                "id": "api_gateway",
+                "name": "API Gateway",
+                "description": "Request routing, authentication, rate limiting",
+                "technology": "FastAPI",
+                "interfaces": ["HTTP REST", "WebSocket"],
+            }
+        ],
+        design_decisions=[
+            {
+                "id": "decision_db",
+                "name": "Database Technology",
+                "description": "PostgreSQL for ACID compliance and complex queries",
+                "alternatives": ["MongoDB", "MySQL"],
+                "rationale": "Strong consistency required for financial transactions",
+            }
+        ],
+    )
+
+    # Example task complexity
+    complexity = TaskComplexity(
+        technical_complexity=0.8,
+        novelty=0.6,
+        safety_risk=0.4,
+        context_requirement=0.7,
+        interdependence=0.5,
+        estimated_tokens=8000,
+        requires_reasoning=True,
+        requires_creativity=False,
+        time_sensitive=False,
+    )
+
+    return {
+        "task": task,
+        "artifacts": {"spec_doc": spec_doc, "design_doc": design_doc},
+        "complexity": complexity,
+    }
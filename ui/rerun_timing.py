@@ -0,0 +1,148 @@
+"""
+Script-run timing for the Streamlit app
+
+Streamlit re-executes app.py on every interaction, so the time of one
+script run is the latency a user feels. The app records each run, per
+page, in a process-wide window shown in the sidebar. Running this module
+replays reruns of every page headlessly and fails if any page's median
+exceeds its budget:
+
+    python -m ui.rerun_timing --reruns 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import streamlit as st
+
+# Median script-run time a page may take once its services are warm
+RERUN_BUDGET_MS = float(os.getenv("CC_RERUN_BUDGET_MS", "150"))
+
+TIMING_WINDOW = 256
+
+APP_SCRIPT = str(Path(__file__).parent.parent / "app.py")
+
+
+@dataclass
+class RerunTiming:
+    """One script run of the app"""
+
+    page: str
+    elapsed_ms: float
+    timestamp: float
+
+
+class RerunTimer:
+    """Recent script-run times, per page"""
+
+    def __init__(self, window: int = TIMING_WINDOW):
+        self._runs: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, page: str, elapsed_seconds: float):
+        with self._lock:
+            self._runs.append(RerunTiming(page, elapsed_seconds * 1000.0, time.time()))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Run count, last, median and worst time in ms per page"""
+        with self._lock:
+            by_page: Dict[str, List[float]] = defaultdict(list)
+            for run in self._runs:
+                by_page[run.page].append(run.elapsed_ms)
+        return {page: summarize(times) for page, times in by_page.items()}
+
+
+def summarize(times_ms: List[float]) -> Dict[str, float]:
+    return {
+        "runs": len(times_ms),
+        "last_ms": round(times_ms[-1], 1),
+        "median_ms": round(statistics.median(times_ms), 1),
+        "max_ms": round(max(times_ms), 1),
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def get_rerun_timer() -> RerunTimer:
+    """Process-wide timer shared by all sessions"""
+    return RerunTimer()
+
+
+def render_timing_sidebar(timer: RerunTimer, page: str):
+    """Previous run times of the current page against the budget"""
+    stats = timer.summary().get(page)
+    if not stats:
+        return
+    status = "✅" if stats["median_ms"] <= RERUN_BUDGET_MS else "⚠️"
+    st.sidebar.caption(
+        f"⏱️ Rerun {stats['last_ms']:.0f} ms · median {stats['median_ms']:.0f} ms "
+        f"over {stats['runs']} · budget {RERUN_BUDGET_MS:.0f} ms {status}"
+    )
+
+
+def benchmark_reruns(
+    script: str = APP_SCRIPT,
+    pages: Optional[Iterable[str]] = None,
+    reruns: int = 5,
+    timeout: float = 120,
+) -> Dict[str, Dict[str, float]]:
+    """Run the app headlessly and time reruns of each page
+
+    The first run of a page (imports, service start-up) is reported as
+    cold_ms and excluded from the rerun statistics. A page that raises is
+    reported with its error instead of timings.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    from ui.app_pages import PAGES
+
+    results = {}
+    app = AppTest.from_file(os.path.abspath(script), default_timeout=timeout)
+    for page in pages or PAGES:
+        app.session_state["page"] = page
+        start = time.perf_counter()
+        app.run()
+        cold_ms = (time.perf_counter() - start) * 1000.0
+        if app.exception:
+            results[page] = {"error": app.exception[0].message}
+            continue
+
+        times = []
+        for _ in range(reruns):
+            start = time.perf_counter()
+            app.run()
+            times.append((time.perf_counter() - start) * 1000.0)
+        results[page] = {"cold_ms": round(cold_ms, 1), **summarize(times)}
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time Streamlit reruns per page")
+    parser.add_argument("--script", default=APP_SCRIPT)
+    parser.add_argument("--reruns", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=RERUN_BUDGET_MS)
+    args = parser.parse_args()
+
+    over_budget = False
+    for page, stats in benchmark_reruns(args.script, reruns=args.reruns).items():
+        if "error" in stats:
+            print(f"{page:32} error: {stats['error'][:80]}")
+            continue
+        over = stats["median_ms"] > args.budget_ms
+        over_budget |= over
+        print(
+            f"{page:32} cold {stats['cold_ms']:8.1f} ms  median {stats['median_ms']:7.1f} ms"
+            f"  max {stats['max_ms']:7.1f} ms{'  OVER BUDGET' if over else ''}"
+        )
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,13 @@ Comprehensive error handling and crash prevention utilities
 
 import logging
 import functools
-from typing import Dict, Any, Callable
+import inspect
+import os
+import threading
+import time
+import concurrent.futures
+from contextvars import ContextVar, copy_context
+from typing import Dict, Any, Callable, Optional
 import streamlit as st
 from datetime import datetime, timedelta
 import traceback
@@ -60,11 +66,176 @@ class APIRateLimiter:
 rate_limiter = APIRateLimiter()
 
 
+# Absolute time.monotonic() deadline of the API call running in this context
+_current_deadline: ContextVar[Optional[float]] = ContextVar(
+    "api_call_deadline", default=None
+)
+
+
+def remaining_timeout(default: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds left before the current safe_api_call deadline.
+
+    HTTP clients called from inside safe_api_call should use this as their
+    request timeout so an abandoned call stops when its caller gives up.
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return default
+    remaining = max(deadline - time.monotonic(), 0.0)
+    return remaining if default is None else min(default, remaining)
+
+
+class APICallExecutor:
+    """
+    Process-wide bounded worker pool for blocking API calls.
+
+    Each service has its own concurrency cap, so one slow provider cannot
+    occupy every worker. Slots are held until the underlying call really
+    finishes, not just until its caller stops waiting.
+    """
+
+    def __init__(self, max_workers: int = 16, default_service_limit: int = 4):
+        self.max_workers = max_workers
+        self.default_service_limit = default_service_limit
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._service_limits: Dict[str, int] = {}
+        self._service_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._metrics = {
+            "in_flight": 0,
+            "queued": 0,
+            "completed": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "rejected": 0,
+            "queue_wait_total_s": 0.0,
+            "queue_wait_max_s": 0.0,
+        }
+
+    def set_service_limit(self, service_name: str, limit: int):
+        """Cap concurrent calls to one service (applies to new slot pools)"""
+        with self._lock:
+            self._service_limits[service_name] = limit
+            self._service_slots.pop(service_name, None)
+
+    def _slots(self, service_name: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slots = self._service_slots.get(service_name)
+            if slots is None:
+                limit = self._service_limits.get(
+                    service_name, self.default_service_limit
+                )
+                slots = self._service_slots[service_name] = threading.BoundedSemaphore(
+                    limit
+                )
+            return slots
+
+    def _pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="api-call"
+                )
+            return self._executor
+
+    def _count(self, name: str, delta=1):
+        with self._lock:
+            self._metrics[name] += delta
+
+    def submit(
+        self,
+        service_name: str,
+        func: Callable,
+        deadline: float,
+        args: tuple = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+    ) -> concurrent.futures.Future:
+        """
+        Queue func for execution before the monotonic ``deadline``.
+
+        Raises TimeoutError if no service slot frees up before the deadline.
+        """
+        submitted_at = time.monotonic()
+        self._count("queued")
+
+        slots = self._slots(service_name)
+        if not slots.acquire(timeout=max(deadline - submitted_at, 0.0)):
+            self._count("queued", -1)
+            self._count("rejected")
+            raise TimeoutError(f"No {service_name} slot available before the deadline")
+
+        def run():
+            started_at = time.monotonic()
+            wait = started_at - submitted_at
+            with self._lock:
+                self._metrics["queued"] -= 1
+                self._metrics["in_flight"] += 1
+                self._metrics["queue_wait_total_s"] += wait
+                self._metrics["queue_wait_max_s"] = max(
+                    self._metrics["queue_wait_max_s"], wait
+                )
+            try:
+                if started_at >= deadline:
+                    raise TimeoutError("Deadline passed while queued")
+                _current_deadline.set(deadline)
+                return func(*args, **(kwargs or {}))
+            finally:
+                self._count("in_flight", -1)
+
+        def release(future: concurrent.futures.Future):
+            slots.release()
+            if future.cancelled():
+                self._count("queued", -1)
+            elif future.exception() is not None:
+                self._count("failed")
+            else:
+                self._count("completed")
+
+        # Run inside a copy of the caller's context so the deadline and any
+        # other context variables propagate to the worker thread
+        future = self._pool().submit(copy_context().run, run)
+        future.add_done_callback(release)
+        return future
+
+    def record_timeout(self):
+        self._count("timed_out")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._metrics)
+
+
+api_executor = APICallExecutor(
+    max_workers=int(os.getenv("CC_API_MAX_WORKERS", "16")),
+    default_service_limit=int(os.getenv("CC_API_SERVICE_CONCURRENCY", "4")),
+)
+
+
+def _accepts_timeout(func: Callable) -> bool:
+    try:
+        return "timeout" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _call_with_remaining_timeout(func: Callable, *args, **kwargs):
+    """Give the provider only the time left once it leaves the queue"""
+    return func(*args, timeout=remaining_timeout(), **kwargs)
+
+
 def safe_api_call(func: Callable, *args, timeout: int = 30, **kwargs) -> Dict[str, Any]:
     """
     Safely execute API calls with comprehensive error handling
+
+    The call runs on the shared api_executor. ``timeout`` is a real deadline:
+    it covers time spent queued for a worker, is passed on as ``timeout`` to
+    functions that accept one (and via remaining_timeout() to anything they
+    call), and the caller returns when it expires instead of waiting for the
+    abandoned call to finish.
     """
     service_name = kwargs.get("service_name", func.__name__)
+    deadline = time.monotonic() + timeout
 
     try:
         # Check rate limiting
@@ -76,26 +247,29 @@ def safe_api_call(func: Callable, *args, timeout: int = 30, **kwargs) -> Dict[st
                 "content": f"Service {service_name} is temporarily unavailable due to rate limiting.",
             }
 
-        # Execute with timeout using ThreadPoolExecutor (Streamlit compatible)
-        import concurrent.futures
+        call = func
+        if _accepts_timeout(func):
+            # Propagate the deadline into the provider's own HTTP timeout
+            call = functools.partial(_call_with_remaining_timeout, func)
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(func, *args, **kwargs)
-            try:
-                result = future.result(timeout=timeout)
-
-                # Record success
-                rate_limiter.record_success(service_name)
+        future = api_executor.submit(service_name, call, deadline, args, kwargs)
+        try:
+            result = future.result(timeout=max(deadline - time.monotonic(), 0.0))
+        except concurrent.futures.TimeoutError:
+            # Drops the call if still queued; a running call is left to hit
+            # its own (deadline-bound) timeout in the background
+            future.cancel()
+            api_executor.record_timeout()
+            raise TimeoutError(f"Operation timed out after {timeout} seconds")
 
-                return {
-                    "success": True,
-                    "data": result,
-                    "content": result if isinstance(result, str) else str(result),
-                }
+        # Record success
+        rate_limiter.record_success(service_name)
 
-            except concurrent.futures.TimeoutError:
-                future.cancel()
-                raise TimeoutError(f"Operation timed out after {timeout} seconds")
+        return {
+            "success": True,
+            "data": result,
+            "content": result if isinstance(result, str) else str(result),
+        }
 
     except TimeoutError as e:
         logger.error(f"Timeout in {service_name}: {str(e)}")
@@ -3,20 +3,84 @@ File management utilities for the multi-agent development system
 """
 
 import os
+import heapq
+import itertools
 import tempfile
 import zipfile
 import io
-from typing import Dict, List, Any, Optional
+from collections import Counter
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
 import json
 import mimetypes
 import hashlib
 import logging
 
+from .zip_stream import iter_zip_chunks
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Length of the largest_files list in analyze_project
+LARGEST_FILES = 10
+
+
+def _decrement(counter: Counter, key: Any, amount: int = 1):
+    counter[key] -= amount
+    if counter[key] <= 0:
+        del counter[key]
+
+
+class _ProjectAnalysis:
+    """Running totals behind analyze_project for one project (or all files)"""
+
+    def __init__(self):
+        self.total_files = 0
+        self.total_size = 0
+        self.file_types: Counter = Counter()
+        self.directory_structure: Counter = Counter()
+        self.language_breakdown: Counter = Counter()
+        self.code_metrics: Counter = Counter()
+        # Min-heap of (size, -insertion order, filepath, lines), at most
+        # LARGEST_FILES long; ties rank earlier files first
+        self.largest: List[Tuple[int, str, int]] = []
+        # Set when a file in the heap shrinks or goes away
+        self.largest_stale = False
+
+    def add(self, filepath: str, order: int, analysis: Dict[str, Any]):
+        self.total_files += 1
+        self.total_size += analysis["size"]
+        self.file_types[analysis["ext"]] += 1
+        if analysis["directory"] is not None:
+            self.directory_structure[analysis["directory"]] += 1
+        if analysis["language"]:
+            self.language_breakdown[analysis["language"]] += 1
+        self.code_metrics["total_lines"] += analysis["lines"]
+        if analysis["category"]:
+            self.code_metrics[analysis["category"]] += 1
+
+        entry = (analysis["size"], -order, filepath, analysis["lines"])
+        if len(self.largest) < LARGEST_FILES:
+            heapq.heappush(self.largest, entry)
+        elif entry > self.largest[0]:
+            heapq.heapreplace(self.largest, entry)
+
+    def remove(self, filepath: str, analysis: Dict[str, Any]):
+        self.total_files -= 1
+        self.total_size -= analysis["size"]
+        _decrement(self.file_types, analysis["ext"])
+        if analysis["directory"] is not None:
+            _decrement(self.directory_structure, analysis["directory"])
+        if analysis["language"]:
+            _decrement(self.language_breakdown, analysis["language"])
+        self.code_metrics["total_lines"] -= analysis["lines"]
+        if analysis["category"]:
+            self.code_metrics[analysis["category"]] -= 1
+
+        if any(entry[2] == filepath for entry in self.largest):
+            self.largest_stale = True
+
 
 class FileManager:
     """Comprehensive file management system for projects"""
@@ -26,6 +90,15 @@ class FileManager:
         self.project_files: Dict[str, Dict[str, Any]] = {}
         self.file_history: List[Dict[str, Any]] = []
 
+        # filepath -> (content hash, per-file analysis)
+        self._file_analyses: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        # Running analysis per project name, and under None for all files
+        self._file_order: Dict[str, int] = {}
+        self._order_counter = itertools.count()
+        self._project_analyses: Dict[Optional[str], _ProjectAnalysis] = {
+            None: _ProjectAnalysis()
+        }
+
     def create_project_structure(
         self, project_name: str, template_type: str = "Custom Project"
     ) -> Dict[str, Any]:
@@ -110,7 +183,9 @@ class FileManager:
         }
 
         # Store in memory
+        self._untrack_file(filepath)
         self.project_files[filepath] = file_info
+        self._track_file(filepath)
 
         # Write to disk if project directory exists
         if project_name:
@@ -151,6 +226,7 @@ class FileManager:
             return {"error": "File not found"}
 
         old_info = self.project_files[filepath].copy()
+        self._untrack_file(filepath)
 
         # Update file info
         self.project_files[filepath].update(
@@ -165,6 +241,7 @@ class FileManager:
 
         if update_metadata:
             self.project_files[filepath]["metadata"].update(update_metadata)
+        self._track_file(filepath)
 
         # Update disk file if it exists
         if "disk_path" in old_info:
@@ -201,7 +278,9 @@ class FileManager:
                 logger.warning(f"Failed to delete file from disk: {e}")
 
         # Remove from memory
+        self._untrack_file(filepath)
         del self.project_files[filepath]
+        self._file_order.pop(filepath, None)
 
         self._log_file_operation("delete_file", filepath, {"size": file_info["size"]})
 
@@ -258,51 +337,55 @@ class FileManager:
     ) -> bytes:
         """Create archive from files"""
 
-        # Use provided files or all project files
-        if files is None:
-            if project_name:
-                files = {
-                    fp: info["content"]
-                    for fp, info in self.project_files.items()
-                    if info.get("project_name") == project_name
-                }
-            else:
-                files = {fp: info["content"] for fp, info in self.project_files.items()}
-
         if format_type.lower() == "zip":
-            return self._create_zip_archive(files, project_name)
+            return self._create_zip_archive(
+                self._archive_files(files, project_name), project_name
+            )
         else:
             raise ValueError(f"Unsupported archive format: {format_type}")
 
+    def _archive_files(
+        self, files: Optional[Dict[str, str]], project_name: Optional[str]
+    ) -> Dict[str, str]:
+        """Use provided files or all project files"""
+        if files is not None:
+            return files
+        if project_name:
+            return {
+                fp: info["content"]
+                for fp, info in self.project_files.items()
+                if info.get("project_name") == project_name
+            }
+        return {fp: info["content"] for fp, info in self.project_files.items()}
+
     def _create_zip_archive(
         self, files: Dict[str, str], project_name: str = None
     ) -> bytes:
         """Create ZIP archive from files"""
-        zip_buffer = io.BytesIO()
+        return b"".join(self._iter_zip_archive(files, project_name))
 
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            # Add files
-            for filepath, content in files.items():
-                # Sanitize filepath for ZIP
-                safe_path = filepath.replace("\\", "/").lstrip("/")
-                zip_file.writestr(safe_path, content)
+    def _iter_zip_archive(
+        self, files: Dict[str, str], project_name: str = None
+    ) -> Iterator[bytes]:
+        """Stream a ZIP archive of files, with sizes counted during the write"""
 
-            # Add metadata
-            metadata = {
+        def metadata(totals: Dict[str, int]) -> Dict[str, Any]:
+            return {
                 "created_by": "CodeCompanion Multi-Agent System",
                 "created_at": datetime.now().isoformat(),
                 "project_name": project_name,
-                "total_files": len(files),
-                "total_size": sum(
-                    len(content.encode("utf-8")) for content in files.values()
-                ),
+                "total_files": totals["total_files"],
+                "total_size": totals["total_size"],
                 "file_list": list(files.keys()),
             }
 
-            zip_file.writestr("_metadata.json", json.dumps(metadata, indent=2))
-
-        zip_buffer.seek(0)
-        archive_data = zip_buffer.getvalue()
+        # Sanitize filepaths for ZIP
+        entries = (
+            (filepath.replace("\\", "/").lstrip("/"), content)
+            for filepath, content in files.items()
+        )
+        stats = {}
+        yield from iter_zip_chunks(entries, "_metadata.json", metadata, stats=stats)
 
         self._log_file_operation(
             "create_archive",
@@ -310,12 +393,10 @@ class FileManager:
             {
                 "format": "zip",
                 "files_count": len(files),
-                "archive_size": len(archive_data),
+                "archive_size": stats["archive_size"],
             },
         )
 
-        return archive_data
-
     def extract_archive(
         self, archive_data: bytes, project_name: str, format_type: str = "zip"
     ) -> Dict[str, Any]:
@@ -335,7 +416,7 @@ class FileManager:
 
         try:
             with zipfile.ZipFile(io.BytesIO(archive_data), "r") as zip_file:
-                for file_info in zip_file.filelist():
+                for file_info in zip_file.infolist():
                     filename = file_info.filename
 
                     # Skip directories
@@ -405,18 +486,18 @@ class FileManager:
             return {"error": "No files found for project"}
 
         try:
-            # Create archive
-            archive_data = self.create_archive(project_files, project_name)
-
-            # Write to backup file
+            # Stream the archive straight to the backup file
+            backup_size = 0
             with open(backup_path, "wb") as f:
-                f.write(archive_data)
+                for chunk in self._iter_zip_archive(project_files, project_name):
+                    f.write(chunk)
+                    backup_size += len(chunk)
 
             backup_info = {
                 "backup_path": backup_path,
                 "project_name": project_name,
                 "files_count": len(project_files),
-                "backup_size": len(archive_data),
+                "backup_size": backup_size,
                 "created_at": datetime.now().isoformat(),
             }
 
@@ -461,82 +542,120 @@ class FileManager:
             logger.error(f"Failed to restore backup: {e}")
             return {"error": str(e)}
 
-    def analyze_project(self, project_name: str = None) -> Dict[str, Any]:
-        """Analyze project files and structure"""
+    def _analyze_file(self, filepath: str, content: str) -> Dict[str, Any]:
+        """Per-file analysis; depends only on the path and content"""
+        if self._is_code_file(filepath):
+            category = "code_files"
+        elif self._is_documentation_file(filepath):
+            category = "documentation_files"
+        elif self._is_configuration_file(filepath):
+            category = "configuration_files"
+        else:
+            category = None
 
-        # Get project files
+        return {
+            "size": len(content.encode("utf-8")),
+            "ext": os.path.splitext(filepath)[1].lower(),
+            "directory": os.path.dirname(filepath) if "/" in filepath else None,
+            "language": self._detect_language(filepath, content),
+            "lines": content.count("\n") + 1,
+            "category": category,
+        }
+
+    def _track_file(self, filepath: str):
+        """Add a stored file to the running project analyses"""
+        file_info = self.project_files[filepath]
+        cached = self._file_analyses.get(filepath)
+        if cached is None or cached[0] != file_info["hash"]:
+            cached = (
+                file_info["hash"],
+                self._analyze_file(filepath, file_info["content"]),
+            )
+            self._file_analyses[filepath] = cached
+
+        analysis = cached[1]
+        order = self._file_order.setdefault(filepath, next(self._order_counter))
+        self._project_analyses[None].add(filepath, order, analysis)
+        project_name = file_info.get("project_name")
         if project_name:
-            files = {
-                fp: info
-                for fp, info in self.project_files.items()
-                if info.get("project_name") == project_name
-            }
-        else:
-            files = self.project_files
+            self._project_analyses.setdefault(project_name, _ProjectAnalysis()).add(
+                filepath, order, analysis
+            )
+
+    def _untrack_file(self, filepath: str):
+        """Remove a stored file from the running project analyses"""
+        file_info = self.project_files.get(filepath)
+        cached = self._file_analyses.get(filepath)
+        if file_info is None or cached is None:
+            return
+
+        self._project_analyses[None].remove(filepath, cached[1])
+        project_name = file_info.get("project_name")
+        if project_name in self._project_analyses:
+            self._project_analyses[project_name].remove(filepath, cached[1])
+
+    def _rebuild_analyses(self):
+        """Recompute running analyses, e.g. after project_files was edited directly"""
+        self._project_analyses = {None: _ProjectAnalysis()}
+        self._file_order = {}
+        self._file_analyses = {
+            fp: cached
+            for fp, cached in self._file_analyses.items()
+            if fp in self.project_files
+        }
+        for filepath in self.project_files:
+            self._track_file(filepath)
 
-        if not files:
+    def analyze_project(self, project_name: str = None) -> Dict[str, Any]:
+        """Analyze project files and structure
+
+        Served from running totals kept by add_file, update_file and
+        delete_file, so the cost does not grow with the number of files.
+        """
+
+        if self._project_analyses[None].total_files != len(self.project_files):
+            self._rebuild_analyses()
+
+        totals = self._project_analyses.get(project_name or None)
+        if totals is None or not totals.total_files:
             return {"error": "No files to analyze"}
 
+        if totals.largest_stale:
+            # A top file shrank or was removed; reselect from cached analyses
+            candidates = (
+                (analysis["size"], -self._file_order[fp], fp, analysis["lines"])
+                for fp, info in self.project_files.items()
+                if not project_name or info.get("project_name") == project_name
+                for analysis in (self._file_analyses[fp][1],)
+            )
+            totals.largest = heapq.nlargest(LARGEST_FILES, candidates)
+            heapq.heapify(totals.largest)
+            totals.largest_stale = False
+
+        code_metrics = {
+            "total_lines": totals.code_metrics["total_lines"],
+            "code_files": totals.code_metrics["code_files"],
+            "documentation_files": totals.code_metrics["documentation_files"],
+            "configuration_files": totals.code_metrics["configuration_files"],
+        }
         analysis = {
-            "total_files": len(files),
-            "total_size": sum(info["size"] for info in files.values()),
-            "file_types": {},
-            "directory_structure": {},
-            "largest_files": [],
-            "language_breakdown": {},
-            "code_metrics": {
-                "total_lines": 0,
-                "code_files": 0,
-                "documentation_files": 0,
-                "configuration_files": 0,
-            },
+            "total_files": totals.total_files,
+            "total_size": totals.total_size,
+            "file_types": dict(totals.file_types),
+            "directory_structure": dict(totals.directory_structure),
+            "largest_files": [
+                {"filepath": filepath, "size": size, "lines": lines}
+                for size, _, filepath, lines in sorted(totals.largest, reverse=True)
+            ],
+            "language_breakdown": dict(totals.language_breakdown),
+            "code_metrics": code_metrics,
         }
 
-        # Analyze each file
-        for filepath, file_info in files.items():
-            # File type analysis
-            ext = os.path.splitext(filepath)[1].lower()
-            analysis["file_types"][ext] = analysis["file_types"].get(ext, 0) + 1
-
-            # Directory structure
-            if "/" in filepath:
-                directory = os.path.dirname(filepath)
-                analysis["directory_structure"][directory] = (
-                    analysis["directory_structure"].get(directory, 0) + 1
-                )
-
-            # Language detection
-            language = self._detect_language(filepath, file_info["content"])
-            if language:
-                analysis["language_breakdown"][language] = (
-                    analysis["language_breakdown"].get(language, 0) + 1
-                )
-
-            # Code metrics
-            lines = len(file_info["content"].split("\n"))
-            analysis["code_metrics"]["total_lines"] += lines
-
-            if self._is_code_file(filepath):
-                analysis["code_metrics"]["code_files"] += 1
-            elif self._is_documentation_file(filepath):
-                analysis["code_metrics"]["documentation_files"] += 1
-            elif self._is_configuration_file(filepath):
-                analysis["code_metrics"]["configuration_files"] += 1
-
-            # Track largest files
-            analysis["largest_files"].append(
-                {"filepath": filepath, "size": file_info["size"], "lines": lines}
-            )
-
-        # Sort largest files
-        analysis["largest_files"].sort(key=lambda x: x["size"], reverse=True)
-        analysis["largest_files"] = analysis["largest_files"][:10]  # Top 10
-
         # Calculate additional metrics
         analysis["average_file_size"] = analysis["total_size"] / analysis["total_files"]
-        analysis["code_to_documentation_ratio"] = analysis["code_metrics"][
-            "code_files"
-        ] / max(analysis["code_metrics"]["documentation_files"], 1)
+        analysis["code_to_documentation_ratio"] = code_metrics["code_files"] / max(
+            code_metrics["documentation_files"], 1
+        )
 
         return analysis
 
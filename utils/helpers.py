@@ -6,12 +6,12 @@ import os
 import json
 import csv
 import re
-import zipfile
-import io
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 import hashlib
 
+from .zip_stream import iter_zip_chunks
+
 
 def validate_email(email: str) -> bool:
     """Validate email address format"""
@@ -161,25 +161,22 @@ def format_code_for_download(project_files: Dict[str, str]) -> str:
 
 def create_project_zip(project_files: Dict[str, str]) -> bytes:
     """Create a ZIP file from project files"""
-    zip_buffer = io.BytesIO()
-
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        for filename, content in project_files.items():
-            # Sanitize filename for ZIP
-            safe_filename = sanitize_filename(filename)
-            zip_file.writestr(safe_filename, content)
 
-        # Add metadata file
-        metadata = {
+    # Add metadata file
+    def metadata(totals: Dict[str, int]) -> Dict[str, Any]:
+        return {
             "created_by": "CodeCompanion Multi-Agent System",
             "created_at": datetime.now().isoformat(),
-            "total_files": len(project_files),
+            "total_files": totals["total_files"],
             "file_list": list(project_files.keys()),
         }
-        zip_file.writestr("project_metadata.json", json.dumps(metadata, indent=2))
 
-    zip_buffer.seek(0)
-    return zip_buffer.getvalue()
+    # Sanitize filenames for ZIP
+    entries = (
+        (sanitize_filename(filename), content)
+        for filename, content in project_files.items()
+    )
+    return b"".join(iter_zip_chunks(entries, "project_metadata.json", metadata))
 
 
 def create_project_template(template_type: str) -> Dict[str, Any]: